@@ -2,8 +2,10 @@
 브리핑 관련 API 라우터
 """
 from fastapi import APIRouter, Query, HTTPException, Path
+from fastapi.responses import FileResponse
 from datetime import datetime
 import logging
+import os
 
 from models.schemas import (
     BriefingCreateRequest,
@@ -11,6 +13,7 @@ from models.schemas import (
     BriefingListResponse,
     SendBriefingRequest,
     SendBriefingResponse,
+    SendJobResponse,
     ErrorResponse
 )
 from services.briefing_service import BriefingService
@@ -22,6 +25,26 @@ router = APIRouter(
 )
 
 
+def _channel_results(items: list) -> list:
+    """아웃박스 항목을 채널별 발송 결과 형식으로 변환"""
+    channel_results = []
+    for item in items:
+        channel_result = {
+            "type": item['channel_type'],
+            "status": item['status'],
+            "sent_at": item['sent_at'],
+            "message_id": item['message_id'],
+            "attempts": item['attempts'],
+            "error": item['last_error']
+        }
+        if item['channel_type'] == "email":
+            channel_result["email"] = item['recipient']
+        else:
+            channel_result["slack_channel"] = item['recipient']
+        channel_results.append(channel_result)
+    return channel_results
+
+
 @router.post(
     "/briefings",
     response_model=BriefingResponse,
@@ -197,6 +220,59 @@ def get_briefings(
         )
 
 
+@router.get(
+    "/briefings/export/history",
+    response_class=FileResponse,
+    responses={
+        200: {"description": "브리핑 종목 이력 Excel 파일"},
+        500: {"model": ErrorResponse, "description": "서버 오류"}
+    },
+    summary="브리핑 종목 이력 Excel 내보내기",
+    description="저장된 모든 브리핑에 포함된 종목을 한 행씩 Excel 파일로 내보냅니다."
+)
+def export_briefing_history(
+    start_date: str = Query(None, description="시작 날짜 (ISO 8601)"),
+    end_date: str = Query(None, description="종료 날짜 (ISO 8601)"),
+    stock_symbol: str = Query(None, description="특정 종목 필터")
+):
+    """
+    ## 브리핑 종목 이력 내보내기 API
+
+    브리핑 수가 많아도 저장소를 배치 단위로 읽어 스트리밍으로 저장하므로 메모리 사용량이 일정합니다.
+
+    **예시 요청:**
+    ```
+    GET /v1/briefings/export/history?start_date=2024-01-01
+    ```
+    """
+    try:
+        output_path = BriefingService.export_history_excel(
+            start_date=start_date,
+            end_date=end_date,
+            stock_symbol=stock_symbol
+        )
+        return FileResponse(
+            output_path,
+            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            filename=os.path.basename(output_path)
+        )
+
+    except Exception as e:
+        logger.error(f"브리핑 이력 내보내기 실패: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "EXPORT_ERROR",
+                    "message": "브리핑 이력 내보내기 실패",
+                    "details": {"error": str(e)},
+                    "timestamp": datetime.now().isoformat()
+                }
+            }
+        )
+
+
 @router.get(
     "/briefings/{briefing_id}",
     response_model=BriefingResponse,
@@ -298,43 +374,60 @@ def send_briefing(
     try:
         logger.info(f"브리핑 발송: {briefing_id}")
 
-        # BriefingService를 통해 발송
+        scheduled_at = None
+        if request.scheduled_at:
+            try:
+                scheduled_at = datetime.fromisoformat(request.scheduled_at)
+            except ValueError:
+                raise HTTPException(
+                    status_code=422,
+                    detail={
+                        "success": False,
+                        "error": {
+                            "code": "INVALID_PARAMETER",
+                            "message": "scheduled_at은 ISO 8601 형식이어야 합니다",
+                            "details": {"scheduled_at": request.scheduled_at},
+                            "timestamp": datetime.now().isoformat()
+                        }
+                    }
+                )
+
+        # BriefingService를 통해 발송 (아웃박스 등록 후 처리)
         result = BriefingService.send_briefing(
             briefing_id=briefing_id,
             channels=[ch.dict() for ch in request.channels],
-            send_immediately=request.send_immediately
+            send_immediately=request.send_immediately,
+            scheduled_at=scheduled_at
         )
 
-        # 채널별 결과 구성
-        channel_results = []
-        for channel in request.channels:
-            channel_result = {
-                "type": channel.type,
-                "status": "sent",
-                "sent_at": datetime.now().isoformat()
-            }
-
-            if channel.type == "email":
-                channel_result["email"] = channel.email
-                channel_result["message_id"] = f"msg_email_{datetime.now().timestamp()}"
-            elif channel.type == "slack":
-                channel_result["slack_channel"] = channel.slack_channel
-                channel_result["message_id"] = f"msg_slack_{datetime.now().timestamp()}"
-
-            channel_results.append(channel_result)
-
         return {
             "success": True,
             "data": {
                 "briefing_id": briefing_id,
                 "send_job_id": result['send_job_id'],
                 "status": result['status'],
-                "channels": channel_results,
+                "channels": _channel_results(result['items']),
                 "total_sent": result['total_sent'],
-                "total_failed": result['total_failed']
+                "total_failed": result['total_failed'],
+                "pending": result['pending'],
+                "duplicates": result['duplicates']
             }
         }
 
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "BRIEFING_NOT_FOUND",
+                    "message": str(e),
+                    "timestamp": datetime.now().isoformat()
+                }
+            }
+        )
     except Exception as e:
         logger.error(f"브리핑 발송 실패: {str(e)}")
         raise HTTPException(
@@ -349,3 +442,68 @@ def send_briefing(
                 }
             }
         )
+
+
+@router.get(
+    "/briefings/send-jobs/{send_job_id}",
+    response_model=SendJobResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "발송 작업을 찾을 수 없음"},
+        500: {"model": ErrorResponse, "description": "서버 오류"}
+    },
+    summary="발송 작업 상태 조회",
+    description="발송 작업의 수신자별 상태(대기/발송 중/완료/실패)와 재시도 횟수를 조회합니다."
+)
+def get_send_job(
+    send_job_id: str = Path(..., description="발송 작업 ID")
+):
+    """
+    ## 발송 작업 상태 조회 API
+
+    재시도 대기 중이거나 예약된 발송의 진행 상황을 확인합니다.
+    """
+    try:
+        job = BriefingService.get_send_job(send_job_id)
+
+        return {
+            "success": True,
+            "data": {
+                "send_job_id": job['job_id'],
+                "briefing_id": job['briefing_id'],
+                "status": job['status'],
+                "created_at": job['created_at'],
+                "channels": _channel_results(job['items']),
+                "total": job['total'],
+                "total_sent": job['sent'],
+                "total_failed": job['failed'],
+                "pending": job['pending'],
+                "duplicates": job['duplicates']
+            }
+        }
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "SEND_JOB_NOT_FOUND",
+                    "message": str(e),
+                    "timestamp": datetime.now().isoformat()
+                }
+            }
+        )
+    except Exception as e:
+        logger.error(f"발송 작업 조회 실패: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "INTERNAL_ERROR",
+                    "message": "발송 작업 조회 실패",
+                    "details": {"error": str(e)},
+                    "timestamp": datetime.now().isoformat()
+                }
+            }
+        )
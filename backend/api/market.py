@@ -0,0 +1,91 @@
+"""
+시장 전체 집계 API 라우터
+"""
+from fastapi import APIRouter, Query, HTTPException
+from datetime import datetime
+import logging
+
+from models.schemas import ErrorResponse
+from services.market_service import MarketService
+from shared_snapshot import SnapshotUnavailable
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    tags=["Market"]
+)
+
+
+@router.get(
+    "/market/sectors",
+    responses={
+        503: {"model": ErrorResponse, "description": "시장 스냅샷 없음"},
+        500: {"model": ErrorResponse, "description": "집계 실패"}
+    },
+    summary="섹터/산업별 시장 집계",
+    description="공유 시장 스냅샷 전체를 섹터(또는 산업)별로 묶어 시가총액 가중 수익률, 거래량, 상승/하락 종목 수, 상위 종목을 계산합니다."
+)
+def get_market_sectors(
+    group_by: str = Query(
+        "sector",
+        description="집계 기준 (sector, industry)",
+        pattern="^(sector|industry)$"
+    ),
+    movers: int = Query(
+        3,
+        ge=0,
+        le=10,
+        description="그룹별 상승/하락 상위 종목 수"
+    )
+):
+    """
+    ## 섹터/산업별 시장 집계 API
+
+    히트맵처럼 시장 전체를 한 번에 그릴 때 사용합니다. 종목별 상세 조회를 반복하지 않아도 됩니다.
+    결과는 스냅샷이 갱신될 때까지 재사용합니다 (`cached`).
+
+    **예시 요청:**
+    ```
+    GET /v1/market/sectors
+    GET /v1/market/sectors?group_by=industry&movers=5
+    ```
+
+    **그룹 필드:** count, market_cap, return_cap_weighted(시가총액 가중 변동률 %), return_equal_weighted,
+    advancers, decliners, unchanged, volume, dollar_volume, top_gainers, top_losers
+    (프로필이 아직 없는 종목은 Unknown, ETF는 ETF로 묶임)
+    """
+    try:
+        data = MarketService.get_sectors(group_by=group_by, movers=movers)
+
+        return {
+            "success": True,
+            "data": data
+        }
+
+    except SnapshotUnavailable as e:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "SNAPSHOT_UNAVAILABLE",
+                    "message": "시장 스냅샷을 사용할 수 없습니다",
+                    "details": {"error": str(e)},
+                    "timestamp": datetime.now().isoformat()
+                }
+            }
+        )
+    except Exception as e:
+        logger.error(f"섹터 집계 실패: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "AGGREGATION_ERROR",
+                    "message": "섹터 집계 실패",
+                    "details": {"error": str(e)},
+                    "timestamp": datetime.now().isoformat()
+                }
+            }
+        )
@@ -0,0 +1,141 @@
+"""
+실시간 시세 WebSocket 라우터
+"""
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime
+import asyncio
+import logging
+
+from quote_stream import QuoteSubscriber, get_quote_hub
+from services.stock_service import StockService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    tags=["Quotes"]
+)
+
+# 연결 1개가 구독할 수 있는 최대 종목 수
+MAX_SYMBOLS_PER_CONNECTION = 50
+
+
+def _error_message(code: str, message: str, details: Optional[Dict] = None) -> Dict:
+    error = {"code": code, "message": message, "timestamp": datetime.now().isoformat()}
+    if details:
+        error["details"] = details
+    return {"type": "error", "success": False, "error": error}
+
+
+def _parse_symbols(symbols: Iterable) -> List[str]:
+    """대문자로 바꾸고 중복 제거 (형식이 틀린 심볼은 ValueError)"""
+    parsed = []
+    for symbol in symbols:
+        symbol = str(symbol).strip().upper()
+        if not symbol:
+            continue
+        if not StockService.validate_symbol(symbol):
+            raise ValueError(symbol)
+        if symbol not in parsed:
+            parsed.append(symbol)
+    return parsed
+
+
+@router.websocket("/ws/quotes")
+async def quotes_websocket(websocket: WebSocket, symbols: Optional[str] = None):
+    """
+    ## 실시간 시세 WebSocket
+
+    서버 폴러 하나가 모든 연결의 구독 종목을 묶어서 조회하고, 바뀐 필드만 보냅니다.
+    수신이 느린 연결에는 밀린 변경을 종목별로 합쳐서 한 번에 보냅니다.
+
+    **연결:**
+    ```
+    ws://localhost:8000/v1/ws/quotes?symbols=AAPL,NVDA
+    ```
+
+    **클라이언트 → 서버:**
+    ```json
+    {"action": "subscribe", "symbols": ["TSLA"]}
+    {"action": "unsubscribe", "symbols": ["AAPL"]}
+    ```
+
+    **서버 → 클라이언트:**
+    ```json
+    {"type": "subscribed", "symbols": ["AAPL", "NVDA", "TSLA"]}
+    {"type": "quotes", "data": {"AAPL": {"price": 195.2, "change_percent": 1.3}}, "timestamp": "..."}
+    {"type": "error", "success": false, "error": {"code": "INVALID_SYMBOL", "message": "...", "timestamp": "..."}}
+    ```
+    처음 구독한 종목은 전체 필드(name, price, change, change_percent, volume, market_cap)를, 이후에는 바뀐 필드만 보냅니다.
+    """
+    await websocket.accept()
+    hub = get_quote_hub()
+    subscriber = QuoteSubscriber()
+    send_lock = asyncio.Lock()
+
+    async def send(message: Dict) -> None:
+        async with send_lock:
+            await websocket.send_json(message)
+
+    async def push_updates() -> None:
+        try:
+            while True:
+                batch = await subscriber.next_batch()
+                await send({"type": "quotes", "data": batch, "timestamp": datetime.now().isoformat()})
+        except (WebSocketDisconnect, RuntimeError):
+            # 연결이 끊김 (수신 루프에서 정리)
+            pass
+
+    async def handle(action: str, requested: Iterable) -> None:
+        try:
+            parsed = _parse_symbols(requested)
+        except ValueError as e:
+            await send(_error_message(
+                "INVALID_SYMBOL", "잘못된 종목 심볼 형식",
+                {"symbol": str(e), "format": "대문자 알파벳, 클래스 구분은 - 또는 . (예: AAPL, BRK-B)"}
+            ))
+            return
+
+        if action == "subscribe":
+            if len(subscriber.symbols | set(parsed)) > MAX_SYMBOLS_PER_CONNECTION:
+                await send(_error_message(
+                    "TOO_MANY_SYMBOLS", f"연결당 최대 {MAX_SYMBOLS_PER_CONNECTION}개 종목까지 구독할 수 있습니다",
+                    {"requested": len(parsed), "subscribed": len(subscriber.symbols)}
+                ))
+                return
+            hub.subscribe(subscriber, parsed)
+        else:
+            hub.unsubscribe(subscriber, parsed)
+        await send({"type": "subscribed", "symbols": sorted(subscriber.symbols)})
+
+    sender = asyncio.create_task(push_updates())
+    try:
+        if symbols:
+            await handle("subscribe", symbols.split(","))
+
+        while True:
+            try:
+                message = await websocket.receive_json()
+            except ValueError:
+                await send(_error_message("INVALID_MESSAGE", "JSON 메시지만 허용됩니다"))
+                continue
+
+            action = message.get("action") if isinstance(message, dict) else None
+            requested = message.get("symbols") if isinstance(message, dict) else None
+            if action not in ("subscribe", "unsubscribe") or not isinstance(requested, list):
+                await send(_error_message(
+                    "INVALID_MESSAGE", "지원하지 않는 메시지",
+                    {"format": '{"action": "subscribe" | "unsubscribe", "symbols": ["AAPL"]}'}
+                ))
+                continue
+            await handle(action, requested)
+
+    except WebSocketDisconnect:
+        pass
+
+    except Exception as e:
+        logger.error(f"시세 WebSocket 오류: {str(e)}")
+
+    finally:
+        hub.unsubscribe(subscriber)
+        sender.cancel()
@@ -0,0 +1,54 @@
+"""
+스케줄러 상태 API 라우터
+"""
+from fastapi import APIRouter, HTTPException, Request
+from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    tags=["Scheduler"]
+)
+
+
+@router.get(
+    "/scheduler/status",
+    summary="스케줄 및 캐시 준비 상태",
+    description="브리핑/사전 준비 작업 스케줄, 마지막 사전 준비 결과, 07:00 실행 전 캐시 준비 상태를 조회합니다."
+)
+def get_scheduler_status(request: Request):
+    """
+    ## 스케줄러 상태 조회 API
+
+    **예시 요청:**
+    ```
+    GET /v1/scheduler/status
+    ```
+    """
+    try:
+        from prewarm_scheduler import get_prewarm_report
+
+        scheduler = getattr(request.app.state, 'scheduler', None)
+        return {
+            "success": True,
+            "data": {
+                "scheduler_running": bool(scheduler and scheduler.running),
+                **get_prewarm_report(scheduler)
+            }
+        }
+
+    except Exception as e:
+        logger.error(f"스케줄러 상태 조회 실패: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "SCHEDULER_STATUS_ERROR",
+                    "message": "스케줄러 상태 조회 실패",
+                    "details": {"error": str(e)},
+                    "timestamp": datetime.now().isoformat()
+                }
+            }
+        )
@@ -0,0 +1,144 @@
+"""
+로컬 스크리너 API 라우터
+"""
+from fastapi import APIRouter, Path, HTTPException
+from typing import Dict, Optional
+from datetime import datetime
+import logging
+
+from models.schemas import ScreenRunRequest, ScreenSaveRequest, ErrorResponse
+from screen_engine import ScreenError
+from services.screen_service import ScreenService
+from shared_snapshot import SnapshotUnavailable
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    tags=["Screens"]
+)
+
+
+def _error(status_code: int, code: str, message: str, details: Optional[Dict] = None) -> HTTPException:
+    error = {"code": code, "message": message, "timestamp": datetime.now().isoformat()}
+    if details:
+        error["details"] = details
+    return HTTPException(status_code=status_code, detail={"success": False, "error": error})
+
+
+def _expression_error(e: ScreenError, expression: Optional[str]) -> HTTPException:
+    return _error(
+        400, "INVALID_EXPRESSION", str(e),
+        {"expression": expression, "position": e.position, "fields": sorted(ScreenService.fields())}
+    )
+
+
+@router.post(
+    "/screens/run",
+    responses={
+        400: {"model": ErrorResponse, "description": "잘못된 조건식"},
+        404: {"model": ErrorResponse, "description": "저장된 스크린 없음"},
+        503: {"model": ErrorResponse, "description": "시장 스냅샷 없음"}
+    },
+    summary="조건식 스크린 실행",
+    description="공유 시장 스냅샷 전체에 조건식을 적용합니다. 외부 API를 호출하지 않습니다."
+)
+def run_screen(request: ScreenRunRequest):
+    """
+    ## 조건식 스크린 실행 API
+
+    **예시 요청:**
+    ```json
+    {"expression": "rel_volume > 2 and change_percent > 5 and market_cap > 1e9", "sort_by": "change_percent", "limit": 20}
+    {"name": "momentum"}
+    ```
+
+    **조건식:** 필드(`GET /v1/screens/fields`), 숫자, `+ - * /`, `< <= > >= == !=`
+    (연쇄 비교 `1e9 < market_cap < 1e11` 가능), `and / or / not`, `abs()`
+    """
+    try:
+        data = ScreenService.run(
+            expression=request.expression,
+            name=request.name,
+            sort_by=request.sort_by,
+            order=request.order,
+            limit=request.limit
+        )
+        return {"success": True, "data": data}
+
+    except ScreenError as e:
+        raise _expression_error(e, request.expression)
+    except LookupError as e:
+        raise _error(404, "SCREEN_NOT_FOUND", str(e), {"name": request.name})
+    except SnapshotUnavailable as e:
+        raise _error(503, "SNAPSHOT_UNAVAILABLE", "시장 스냅샷을 사용할 수 없습니다", {"error": str(e)})
+    except Exception as e:
+        logger.error(f"스크린 실행 실패: {str(e)}")
+        raise _error(500, "SCREEN_ERROR", "스크린 실행 실패", {"error": str(e)})
+
+
+@router.get(
+    "/screens/fields",
+    summary="스크린 필드 목록",
+    description="조건식과 정렬에 쓸 수 있는 필드와 설명"
+)
+def list_screen_fields():
+    """조건식 필드 목록"""
+    return {"success": True, "data": {"fields": ScreenService.fields()}}
+
+
+@router.get(
+    "/screens",
+    summary="저장된 스크린 목록"
+)
+def list_screens():
+    """저장된 스크린 목록 (이름 순)"""
+    screens = ScreenService.list()
+    return {"success": True, "data": {"screens": screens, "count": len(screens)}}
+
+
+@router.get(
+    "/screens/{name}",
+    responses={404: {"model": ErrorResponse, "description": "저장된 스크린 없음"}},
+    summary="저장된 스크린 조회"
+)
+def get_screen(name: str = Path(..., description="스크린 이름")):
+    """저장된 스크린 조회"""
+    screen = ScreenService.get(name)
+    if screen is None:
+        raise _error(404, "SCREEN_NOT_FOUND", f"스크린을 찾을 수 없습니다: {name}", {"name": name})
+    return {"success": True, "data": screen}
+
+
+@router.put(
+    "/screens/{name}",
+    responses={400: {"model": ErrorResponse, "description": "잘못된 이름 또는 조건식"}},
+    summary="스크린 저장",
+    description="조건식을 이름으로 저장합니다 (같은 이름은 덮어씀). 저장 전에 조건식을 검증합니다."
+)
+def save_screen(request: ScreenSaveRequest, name: str = Path(..., description="스크린 이름 (문자, 숫자, _, -)")):
+    """
+    ## 스크린 저장 API
+
+    **예시 요청:**
+    ```
+    PUT /v1/screens/momentum
+    {"expression": "rel_volume > 2 and change_percent > 5", "description": "거래량 급증 + 급등", "sort_by": "rel_volume"}
+    ```
+    """
+    try:
+        screen = ScreenService.save(name, request.expression, request.description, request.sort_by, request.order)
+        return {"success": True, "data": screen}
+    except ScreenError as e:
+        raise _expression_error(e, request.expression)
+
+
+@router.delete(
+    "/screens/{name}",
+    responses={404: {"model": ErrorResponse, "description": "저장된 스크린 없음"}},
+    summary="스크린 삭제"
+)
+def delete_screen(name: str = Path(..., description="스크린 이름")):
+    """저장된 스크린 삭제"""
+    if not ScreenService.delete(name):
+        raise _error(404, "SCREEN_NOT_FOUND", f"스크린을 찾을 수 없습니다: {name}", {"name": name})
+    return {"success": True, "data": {"name": name, "deleted": True}}
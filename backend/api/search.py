@@ -0,0 +1,106 @@
+"""
+브리핑/뉴스 검색 API 라우터
+"""
+from fastapi import APIRouter, Query, HTTPException
+from typing import Optional
+from datetime import datetime
+import logging
+
+from models.schemas import SearchResponse, ErrorResponse
+from services.search_service import SearchService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    tags=["Search"]
+)
+
+
+@router.get(
+    "/search",
+    response_model=SearchResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "잘못된 파라미터"},
+        500: {"model": ErrorResponse, "description": "검색 실패"}
+    },
+    summary="브리핑/뉴스 전문 검색",
+    description="과거 브리핑 본문과 수집된 뉴스 기사를 BM25 관련도 순으로 검색합니다."
+)
+def search_api(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="검색어 (한글/영문, 공백으로 구분된 단어는 모두 포함)",
+        example="엔비디아 Blackwell"
+    ),
+    type: Optional[str] = Query(
+        None,
+        description="문서 유형 (briefing, news)",
+        pattern="^(briefing|news)$"
+    ),
+    symbol: Optional[str] = Query(
+        None,
+        description="종목 심볼 필터",
+        example="NVDA"
+    ),
+    start_date: Optional[str] = Query(
+        None,
+        description="시작일 (YYYY-MM-DD)",
+        pattern=r"^\d{4}-\d{2}-\d{2}$"
+    ),
+    end_date: Optional[str] = Query(
+        None,
+        description="종료일 (YYYY-MM-DD)",
+        pattern=r"^\d{4}-\d{2}-\d{2}$"
+    ),
+    limit: int = Query(
+        20,
+        ge=1,
+        le=100,
+        description="최대 결과 수"
+    ),
+    offset: int = Query(
+        0,
+        ge=0,
+        description="건너뛸 결과 수"
+    )
+):
+    """
+    ## 브리핑/뉴스 전문 검색 API
+
+    **예시 요청:**
+    ```
+    GET /v1/search?q=실적&symbol=NVDA&type=news&start_date=2024-11-01
+    ```
+    """
+    try:
+        data = SearchService.search(
+            query=q,
+            doc_type=type,
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            offset=offset
+        )
+
+        return {
+            "success": True,
+            "data": data
+        }
+
+    except Exception as e:
+        logger.error(f"검색 실패: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "SEARCH_ERROR",
+                    "message": "검색 실패",
+                    "details": {"error": str(e)},
+                    "timestamp": datetime.now().isoformat()
+                }
+            }
+        )
@@ -1,7 +1,7 @@
 """
 화제 종목 관련 API 라우터
 """
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request, Response
 from typing import Optional
 from datetime import datetime
 import logging
@@ -11,6 +11,7 @@ from models.schemas import (
     StockDetailResponse,
     ErrorResponse
 )
+from services.chart_service import ChartService, DEFAULT_POINTS, RANGE_PATTERN
 from services.stock_service import StockService
 from services.trending_stock_service import TrendingStockService
 
@@ -193,7 +194,7 @@ def get_stock_detail(
                         "message": "잘못된 종목 심볼 형식",
                         "details": {
                             "symbol": symbol,
-                            "format": "대문자 알파벳만 허용 (예: AAPL)"
+                            "format": "대문자 알파벳, 클래스 구분은 - 또는 . (예: AAPL, BRK-B)"
                         },
                         "timestamp": datetime.now().isoformat()
                     }
@@ -243,6 +244,136 @@ def get_stock_detail(
         )
 
 
+def _invalid_symbol_error(symbol: str) -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail={
+            "success": False,
+            "error": {
+                "code": "INVALID_SYMBOL",
+                "message": "잘못된 종목 심볼 형식",
+                "details": {
+                    "symbol": symbol,
+                    "format": "대문자 알파벳, 클래스 구분은 - 또는 . (예: AAPL, BRK-B)"
+                },
+                "timestamp": datetime.now().isoformat()
+            }
+        }
+    )
+
+
+def _chart_error(status_code: int, code: str, message: str, details: Optional[dict] = None) -> HTTPException:
+    error = {"code": code, "message": message, "timestamp": datetime.now().isoformat()}
+    if details:
+        error["details"] = details
+    return HTTPException(status_code=status_code, detail={"success": False, "error": error})
+
+
+@router.get(
+    "/stocks/{symbol}/chart",
+    responses={
+        400: {"model": ErrorResponse, "description": "잘못된 종목 심볼"},
+        404: {"model": ErrorResponse, "description": "가격 이력 없음"},
+        500: {"model": ErrorResponse, "description": "데이터 수집 실패"}
+    },
+    summary="종목 차트 데이터 조회",
+    description="가격 이력(OHLCV)을 LTTB로 목표 점 개수까지 줄여서 반환합니다."
+)
+def get_stock_chart(
+    symbol: str,
+    range_: str = Query(
+        "1mo",
+        alias="range",
+        description="구간 (1d, 5d, 1mo, 3mo, 6mo, 1y, 5y)",
+        pattern=RANGE_PATTERN
+    ),
+    points: int = Query(
+        DEFAULT_POINTS,
+        ge=10,
+        le=2000,
+        description="반환할 최대 봉 개수"
+    )
+):
+    """
+    ## 종목 차트 데이터 API
+
+    원본 봉 수가 points보다 많으면 종가 기준 LTTB로 모양을 유지하면서 줄입니다.
+    줄어든 봉은 앞 봉과의 사이 구간을 합친 값입니다 (시가=첫 시가, 고가/저가=최고/최저, 거래량=합계).
+
+    **예시 요청:**
+    ```
+    GET /v1/stocks/AAPL/chart?range=1mo&points=200
+    ```
+    """
+    if not StockService.validate_symbol(symbol):
+        raise _invalid_symbol_error(symbol)
+
+    try:
+        return {
+            "success": True,
+            "data": ChartService.get_chart(symbol, range_, points)
+        }
+
+    except ValueError as e:
+        raise _chart_error(404, "CHART_NOT_FOUND", str(e))
+    except Exception as e:
+        logger.error(f"차트 데이터 조회 실패: {symbol}, {str(e)}")
+        raise _chart_error(500, "DATA_FETCH_ERROR", "차트 데이터 수집 실패", {"error": str(e)})
+
+
+@router.get(
+    "/stocks/{symbol}/sparkline.png",
+    response_class=Response,
+    responses={
+        200: {"content": {"image/png": {}}, "description": "스파크라인 PNG"},
+        304: {"description": "변경 없음 (If-None-Match)"},
+        400: {"model": ErrorResponse, "description": "잘못된 종목 심볼"},
+        404: {"model": ErrorResponse, "description": "가격 이력 없음"},
+        500: {"model": ErrorResponse, "description": "데이터 수집 실패"}
+    },
+    summary="종목 스파크라인 이미지",
+    description="종가 스파크라인 PNG를 반환합니다. (종목, 구간, 크기)별로 캐시되고 새 봉이 들어오면 다시 그립니다."
+)
+def get_stock_sparkline(
+    request: Request,
+    symbol: str,
+    range_: str = Query(
+        "5d",
+        alias="range",
+        description="구간 (1d, 5d, 1mo, 3mo, 6mo, 1y, 5y)",
+        pattern=RANGE_PATTERN
+    ),
+    width: int = Query(240, ge=16, le=1200, description="이미지 폭 (px)"),
+    height: int = Query(64, ge=8, le=600, description="이미지 높이 (px)")
+):
+    """
+    ## 종목 스파크라인 API
+
+    ETag는 마지막 봉의 지문이라서 새 봉이 없으면 If-None-Match 요청에 304를 반환합니다.
+
+    **예시 요청:**
+    ```
+    GET /v1/stocks/AAPL/sparkline.png?range=5d&width=240&height=64
+    ```
+    """
+    if not StockService.validate_symbol(symbol):
+        raise _invalid_symbol_error(symbol)
+
+    try:
+        version, png = ChartService.get_sparkline(symbol, range_, width, height)
+    except ValueError as e:
+        raise _chart_error(404, "CHART_NOT_FOUND", str(e))
+    except Exception as e:
+        logger.error(f"스파크라인 생성 실패: {symbol}, {str(e)}")
+        raise _chart_error(500, "DATA_FETCH_ERROR", "스파크라인 생성 실패", {"error": str(e)})
+
+    etag = f'"{version}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=png, media_type="image/png", headers=headers)
+
+
 @router.get(
     "/top-trending-stock",
     responses={
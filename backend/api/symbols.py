@@ -0,0 +1,84 @@
+"""
+종목 검색(자동완성) API 라우터
+"""
+from fastapi import APIRouter, Query, HTTPException
+from typing import Optional
+from datetime import datetime
+import logging
+
+from models.schemas import SymbolSearchResponse, ErrorResponse
+from services.symbol_service import SymbolService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    tags=["Symbols"]
+)
+
+
+@router.get(
+    "/symbols/search",
+    response_model=SymbolSearchResponse,
+    responses={
+        500: {"model": ErrorResponse, "description": "검색 실패"}
+    },
+    summary="종목 검색 (자동완성)",
+    description="티커 접두어, 회사명, 한글 별칭으로 종목을 찾습니다. 오타도 일부 허용합니다."
+)
+def search_symbols(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="검색어 (티커, 회사명, 한글 별칭)",
+        example="엔비"
+    ),
+    type: Optional[str] = Query(
+        None,
+        description="종목 유형 (EQUITY, ETF)",
+        pattern="^(EQUITY|ETF)$"
+    ),
+    limit: int = Query(
+        10,
+        ge=1,
+        le=50,
+        description="최대 결과 수"
+    )
+):
+    """
+    ## 종목 검색 API
+
+    로컬 종목 마스터(data/symbols.csv)에서 찾으므로 외부 API를 호출하지 않습니다.
+
+    **예시 요청:**
+    ```
+    GET /v1/symbols/search?q=AAP
+    GET /v1/symbols/search?q=테슬라
+    GET /v1/symbols/search?q=nvidai
+    ```
+
+    **match:** symbol(티커 일치), symbol_prefix(티커 접두어), name(이름/별칭 일치),
+    name_prefix(이름/별칭 접두어), fuzzy(오타 허용)
+    """
+    try:
+        data = SymbolService.search(query=q, limit=limit, symbol_type=type)
+
+        return {
+            "success": True,
+            "data": data
+        }
+
+    except Exception as e:
+        logger.error(f"종목 검색 실패: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "SYMBOL_SEARCH_ERROR",
+                    "message": "종목 검색 실패",
+                    "details": {"error": str(e)},
+                    "timestamp": datetime.now().isoformat()
+                }
+            }
+        )
@@ -0,0 +1,5 @@
+"""
+오프라인 벤치마크 (기록된 Yahoo/Exa/Gemini 응답 재생)
+
+실행: backend 디렉토리에서 python -m benchmarks.run
+"""
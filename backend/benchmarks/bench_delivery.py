@@ -0,0 +1,231 @@
+"""
+브리핑 발송 벤치마크 (로컬 SMTP 수신 서버 + 슬랙 웹훅 서버)
+
+DELIVERY_MODE=live 경로(send_briefing_to_channels → DeliveryEngine)로 실제 소켓을 통해 발송합니다.
+- engine: 이메일 10,000건 / 슬랙 500채널 직접 발송 - 초당 발송 수, SMTP 연결 수, 재시도/영구 실패
+- outbox: 같은 수신자를 아웃박스에 등록 후 drain - 처리 시간, dead letter(시도 1회), 재등록 시 중복 건너뛰기
+
+일부러 섞는 실패:
+- SMTP: defer_every번째 메시지마다 451 (재시도), refused.invalid 주소는 550 (재시도 없이 실패)
+- 슬랙: throttle_every번째 요청마다 429 + Retry-After: 0 (재시도), /invalid 웹훅은 404 (재시도 없이 실패)
+- CR/LF가 들어간 주소 (헤더 주입 시도 - 발송 전에 거부, 수신 서버에 도달하지 않아야 함)
+
+발송 속도 제한(EMAIL_RATE_PER_SEC / SLACK_RATE_PER_SEC)은 끄고 엔진 자체 처리량을 잽니다.
+aiosmtpd가 필요합니다 (pip install -r requirements_dev.txt, 없으면 건너뜀).
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_delivery --emails 10000 --slack 500
+"""
+import argparse
+import importlib.util
+import json
+import logging
+import sys
+import time
+from contextlib import ExitStack
+from typing import Dict, List
+from unittest import mock
+
+from benchmarks.stubs import SmtpSink, WebhookStub, isolated_output
+
+BRIEFING = {
+    'title': '오늘의 화제 종목: NVDA',
+    'summary': '엔비디아가 신규 데이터센터 칩 발표 이후 거래량이 급증했습니다.',
+    'sections': [
+        {'title': '시장 동향', 'content': '반도체 업종 전반이 강세를 보였습니다.\n' * 20},
+        {'title': 'NVDA이 화제가 된 이유', 'content': 'Blackwell 출하 일정이 앞당겨졌다는 보도가 나왔습니다.\n' * 10},
+    ],
+}
+
+# 발송 전에 거부되어야 하는 주소 (헤더 주입 시도)
+INJECTED_RECIPIENT = 'injected@bench.local\r\nBcc: evil@bench.local'
+
+
+def _recipients(emails: int, slack: int, stub: WebhookStub):
+    email_recipients = [f"user{index:05d}@bench.local" for index in range(emails)]
+    email_recipients += ['nobody@refused.invalid', INJECTED_RECIPIENT]
+    slack_channels = [
+        {'webhook_url': stub.url(f"hooks/{index:04d}"), 'channel': f"#bench-{index:04d}"}
+        for index in range(slack)
+    ]
+    slack_channels.append({'webhook_url': stub.url('invalid/hook'), 'channel': '#deleted'})
+    return email_recipients, slack_channels
+
+
+def _patch_send_settings(stack: ExitStack, sink: SmtpSink, slack_concurrency: int) -> None:
+    """send_briefing 환경 변수 설정을 로컬 서버로 (live 모드, 속도 제한 없음)"""
+    import send_briefing
+
+    settings = {
+        'DELIVERY_MODE': 'live',
+        'EMAIL_SMTP_SERVER': '127.0.0.1',
+        'EMAIL_SMTP_PORT': sink.port,
+        'EMAIL_USERNAME': '',
+        'EMAIL_PASSWORD': '',
+        'EMAIL_USE_TLS': False,
+        'EMAIL_FROM': 'briefing@bench.local',
+        'EMAIL_RATE_PER_SEC': 0,
+        'SLACK_RATE_PER_SEC': 0,
+        'SLACK_CONCURRENCY': slack_concurrency,
+    }
+    for name, value in settings.items():
+        stack.enter_context(mock.patch.object(send_briefing, name, value))
+
+
+def _summarize_results(results: List[Dict]) -> Dict:
+    failed = [result for result in results if not result.get('success')]
+    return {
+        'sent': len(results) - len(failed),
+        'failed': len(failed),
+        'retried': sum(1 for result in results if result.get('attempts', 0) > 1),
+        'max_attempts': max((result.get('attempts', 0) for result in results), default=0),
+        # 영구 실패는 재시도하지 않아야 함 (attempts 0~1, retryable False)
+        'failed_retryable': sum(1 for result in failed if result.get('retryable')),
+        'failed_attempts': sorted({result.get('attempts', 0) for result in failed}),
+    }
+
+
+def run_engine(emails: int, slack: int, defer_every: int, throttle_every: int, slack_concurrency: int) -> Dict:
+    """send_briefing_to_channels 직접 발송"""
+    from send_briefing import send_briefing_to_channels
+
+    with SmtpSink(defer_every=defer_every) as sink, WebhookStub(throttle_every=throttle_every) as stub, \
+            ExitStack() as stack:
+        _patch_send_settings(stack, sink, slack_concurrency)
+        email_recipients, slack_channels = _recipients(emails, slack, stub)
+
+        started = time.perf_counter()
+        results = send_briefing_to_channels(
+            BRIEFING, email_recipients=email_recipients, slack_channels=slack_channels
+        )
+        elapsed = time.perf_counter() - started
+
+    email = _summarize_results(results['email'])
+    slack_summary = _summarize_results(results['slack'])
+    return {
+        'elapsed_ms': round(elapsed * 1000, 1),
+        'email': {
+            **email,
+            'recipients': len(email_recipients),
+            'received': sum(sink.recipients.values()),
+            'duplicates_received': sum(count - 1 for count in sink.recipients.values() if count > 1),
+            'smtp_connections': sink.connections,
+            'deferred_451': sink.deferred,
+            'refused_550': sink.refused,
+            'injection_reached_server': any('evil@' in address for address in sink.recipients),
+        },
+        'slack': {
+            **slack_summary,
+            'channels': len(slack_channels),
+            'requests': stub.requests,
+            'throttled_429': stub.throttled,
+            'not_found_404': stub.not_found,
+            'duplicates_received': sum(count - 1 for count in stub.delivered.values() if count > 1),
+        },
+    }
+
+
+def run_outbox(emails: int, slack: int, defer_every: int, throttle_every: int, slack_concurrency: int) -> Dict:
+    """아웃박스 등록 → drain → 같은 수신자로 재등록"""
+    from delivery_outbox import DeliveryOutbox
+
+    with SmtpSink(defer_every=defer_every) as sink, WebhookStub(throttle_every=throttle_every) as stub, \
+            isolated_output() as base_dir, ExitStack() as stack:
+        _patch_send_settings(stack, sink, slack_concurrency)
+        email_recipients, slack_channels = _recipients(emails, slack, stub)
+        outbox = DeliveryOutbox(base_dir / 'outbox.db')
+
+        started = time.perf_counter()
+        queued = outbox.enqueue(
+            'briefing_BENCH', BRIEFING, email_recipients=email_recipients, slack_channels=slack_channels
+        )
+        enqueue_elapsed = time.perf_counter() - started
+        job = outbox.drain(queued['job_id'], timeout=600)
+        elapsed = time.perf_counter() - started
+
+        # 같은 브리핑을 다시 등록하면 이미 받은 수신자는 건너뛰고 dead만 다시 시도
+        requeued = outbox.enqueue(
+            'briefing_BENCH', BRIEFING, email_recipients=email_recipients, slack_channels=slack_channels
+        )
+        dead_letters = outbox.dead_letters(limit=100)
+
+    return {
+        'enqueue_ms': round(enqueue_elapsed * 1000, 1),
+        'elapsed_ms': round(elapsed * 1000, 1),
+        'items': queued['total'],
+        'sent': job['sent'],
+        'failed': job['failed'],
+        'pending': job['pending'],
+        'dead_letters': len(dead_letters),
+        'dead_letter_attempts': sorted({letter['attempts'] for letter in dead_letters}),
+        'requeue_duplicates': requeued['duplicates'],
+        'requeue_total': requeued['total'],
+        'smtp_received': sum(sink.recipients.values()),
+        'webhook_delivered': sum(stub.delivered.values()),
+    }
+
+
+def run(
+    emails: int = 10_000,
+    slack: int = 500,
+    defer_every: int = 97,
+    throttle_every: int = 7,
+    slack_concurrency: int = 8,
+    include_outbox: bool = True
+) -> Dict:
+    """
+    발송 벤치마크 실행
+
+    Args:
+        emails: 이메일 수신자 수 (+ 550 거부 주소 1개, 헤더 주입 주소 1개)
+        slack: 슬랙 채널 수 (+ 404 웹훅 1개)
+        defer_every: SMTP 451 주기 (0이면 없음)
+        throttle_every: 웹훅 429 주기 (0이면 없음)
+        slack_concurrency: 슬랙 동시 발송 스레드 수
+        include_outbox: 아웃박스 경로도 측정
+
+    Returns:
+        {'engine': {...}, 'outbox': {...}, 'throughput': {...}}
+    """
+    if importlib.util.find_spec('aiosmtpd') is None:
+        return {'skipped': 'aiosmtpd가 설치되어 있지 않습니다 (pip install -r requirements_dev.txt)'}
+
+    # 발송 건별 로그는 벤치마크 출력에서 제외
+    logging.getLogger('delivery').setLevel(logging.WARNING)
+    logging.getLogger('send_briefing').setLevel(logging.WARNING)
+
+    results = {'config': {
+        'emails': emails, 'slack': slack, 'defer_every': defer_every,
+        'throttle_every': throttle_every, 'slack_concurrency': slack_concurrency,
+    }}
+    results['engine'] = run_engine(emails, slack, defer_every, throttle_every, slack_concurrency)
+    seconds = results['engine']['elapsed_ms'] / 1000
+    results['throughput'] = {
+        'messages_per_sec': round((emails + slack) / seconds, 1) if seconds else 0,
+    }
+    if include_outbox:
+        results['outbox'] = run_outbox(emails, slack, defer_every, throttle_every, slack_concurrency)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='브리핑 발송 벤치마크 (로컬 SMTP/웹훅 서버)')
+    parser.add_argument('--emails', type=int, default=10_000, help='이메일 수신자 수')
+    parser.add_argument('--slack', type=int, default=500, help='슬랙 채널 수')
+    parser.add_argument('--defer-every', type=int, default=97, help='SMTP 451 주기 (0이면 없음)')
+    parser.add_argument('--throttle-every', type=int, default=7, help='웹훅 429 주기 (0이면 없음)')
+    parser.add_argument('--slack-concurrency', type=int, default=8, help='슬랙 동시 발송 스레드 수')
+    parser.add_argument('--no-outbox', action='store_true', help='아웃박스 경로는 측정하지 않음')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    result = run(
+        args.emails, args.slack, args.defer_every, args.throttle_every, args.slack_concurrency,
+        include_outbox=not args.no_outbox
+    )
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
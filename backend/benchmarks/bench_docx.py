@@ -0,0 +1,138 @@
+"""
+DOCX 리포트 벤치마크 (종목 수별 비교 리포트)
+
+- comparison_report: create_stock_comparison_report() 전체 시간 (템플릿 복사 + 표 + 저장)
+- table_bulk: add_table()로 비교 표만 만드는 시간
+- table_cellwise: 같은 표를 python-docx 객체 모델로 셀마다 채우는 시간 (이전 구현 방식, 비교 기준)
+- new_document / new_document_cold: 템플릿 복사 vs Document() + 스타일 설정
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_docx --stocks 50 200 1000
+"""
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.common import summarize
+
+HEADERS = ['순위', '티커', '종목명', '현재가', '등락률', '거래량']
+
+
+def _stocks(count: int) -> List[Dict]:
+    return [
+        {
+            'symbol': f"S{index:04d}",
+            'name': f"Sample Company {index}",
+            'price': round(10 + index * 0.37, 2),
+            'change_percent': ((index % 41) - 20) / 10,
+            'volume': 1_000_000 + index,
+        }
+        for index in range(count)
+    ]
+
+
+def _measure(func: Callable[[int], object], iterations: int) -> Dict:
+    samples = []
+    for index in range(iterations):
+        started = time.perf_counter()
+        func(index)
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarize(samples)
+
+
+def _table_cellwise(doc, stocks: List[Dict]) -> None:
+    """셀마다 cell.text / run.font를 설정하는 방식 (비교 기준)"""
+    from docx.shared import Pt, RGBColor
+
+    table = doc.add_table(rows=len(stocks) + 1, cols=len(HEADERS))
+    table.style = 'Medium Grid 1 Accent 1'
+    for i, header in enumerate(HEADERS):
+        cell = table.rows[0].cells[i]
+        cell.text = header
+        for run in cell.paragraphs[0].runs:
+            run.font.bold = True
+            run.font.size = Pt(11)
+    for i, stock in enumerate(stocks, 1):
+        row = table.rows[i]
+        row.cells[0].text = str(i)
+        row.cells[1].text = stock['symbol']
+        row.cells[2].text = stock['name']
+        row.cells[3].text = f"${stock['price']:.2f}"
+        change = stock['change_percent']
+        row.cells[4].text = f"{change:+.2f}%"
+        for run in row.cells[4].paragraphs[0].runs:
+            run.font.color.rgb = RGBColor(0, 128, 0) if change >= 0 else RGBColor(255, 0, 0)
+            run.font.bold = True
+        row.cells[5].text = f"{stock['volume']:,}"
+
+
+def _table_bulk(doc, stocks: List[Dict]) -> None:
+    from docx_generator import RUN_HEADER, add_table, change_run
+
+    rows = [[(header, RUN_HEADER) for header in HEADERS]]
+    for i, stock in enumerate(stocks, 1):
+        change = stock['change_percent']
+        rows.append([
+            str(i), stock['symbol'], stock['name'], f"${stock['price']:.2f}",
+            (f"{change:+.2f}%", change_run(change)), f"{stock['volume']:,}",
+        ])
+    add_table(doc, rows, style='Medium Grid 1 Accent 1')
+
+
+def run(stock_counts: Optional[List[int]] = None, iterations: int = 5) -> Dict:
+    """
+    DOCX 벤치마크 실행
+
+    Args:
+        stock_counts: 리포트당 종목 수 목록 (기본값: 50, 200, 1000)
+        iterations: 항목별 반복 횟수
+
+    Returns:
+        종목 수별 결과
+    """
+    from docx import Document
+
+    from docx_generator import _apply_styles, create_stock_comparison_report, new_document
+
+    logging.disable(logging.INFO)
+    results = {
+        'new_document': _measure(lambda _: new_document(('Arial', 'Calibri', 24, 11)), iterations),
+        'new_document_cold': _measure(lambda _: _apply_styles(Document(), 'Arial', 'Calibri', 24, 11), iterations),
+    }
+    with tempfile.TemporaryDirectory(prefix='briefing_docx_') as tmp:
+        for count in stock_counts or [50, 200, 1000]:
+            stocks = _stocks(count)
+            # 문서 생성 시간은 빼고 표만 측정
+            docs = [new_document() for _ in range(iterations * 2)]
+            cellwise = _measure(lambda index: _table_cellwise(docs[index], stocks), iterations)
+            bulk = _measure(lambda index: _table_bulk(docs[iterations + index], stocks), iterations)
+            results[f"stocks_{count}"] = {
+                'comparison_report': _measure(
+                    lambda index: create_stock_comparison_report(stocks, str(Path(tmp) / f"comparison_{index}.docx")),
+                    iterations
+                ),
+                'table_bulk': bulk,
+                'table_cellwise': cellwise,
+                'table_speedup': round(cellwise['p50_ms'] / bulk['p50_ms'], 1) if bulk['p50_ms'] else None,
+            }
+    logging.disable(logging.NOTSET)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='DOCX 리포트 벤치마크')
+    parser.add_argument('--stocks', type=int, nargs='+', default=[50, 200, 1000], help='리포트당 종목 수')
+    parser.add_argument('--iterations', type=int, default=5, help='항목별 반복 횟수')
+    args = parser.parse_args(argv)
+
+    print(json.dumps(run(args.stocks, args.iterations), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
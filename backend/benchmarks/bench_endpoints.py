@@ -0,0 +1,90 @@
+"""
+API 엔드포인트 처리량 벤치마크
+
+기록된 응답 재생 환경에서 TestClient로 요청을 보내 요청/초와 지연 분포를 측정합니다.
+- GET  /v1/trending-stocks
+- GET  /v1/briefings, POST /v1/briefings
+- POST /v1/news/stocks/batch
+"""
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from benchmarks.common import summarize
+from benchmarks.stubs import install_stubs, isolated_output
+
+BATCH_TICKERS = ['NVDA', 'TSLA', 'AAPL', 'AMD', 'PLTR']
+
+
+def _measure(call: Callable[[], object], requests: int, concurrency: int) -> Dict:
+    """requests번 호출 (concurrency개 동시) 후 요청/초와 지연 분포"""
+    def timed_call(_):
+        started = time.perf_counter()
+        response = call()
+        elapsed = (time.perf_counter() - started) * 1000
+        return elapsed, response.status_code
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(timed_call, range(requests)))
+    wall = time.perf_counter() - started
+
+    errors = sum(1 for _, status in outcomes if status >= 400)
+    return {
+        **summarize([elapsed for elapsed, _ in outcomes]),
+        'requests_per_sec': round(requests / wall, 2) if wall else 0,
+        'errors': errors,
+        'concurrency': concurrency,
+    }
+
+
+def run(
+    requests: int = 20,
+    concurrency: int = 4,
+    latency_ms: Optional[Dict[str, float]] = None,
+    briefing_requests: int = 3
+) -> Dict:
+    """
+    엔드포인트 벤치마크 실행
+
+    Args:
+        requests: 엔드포인트별 요청 수
+        concurrency: 동시 요청 수
+        latency_ms: 서비스별 지연 시간 (ms)
+        briefing_requests: POST /v1/briefings 요청 수 (전체 워크플로우라 적게)
+
+    Returns:
+        엔드포인트별 결과
+    """
+    # 벤치마크 중에는 발송 워커를 띄우지 않음
+    os.environ.setdefault('OUTBOX_WORKERS', '0')
+    from fastapi.testclient import TestClient
+    from main import app
+
+    results = {}
+    with install_stubs(latency_ms), isolated_output(), TestClient(app) as client:
+        # 목록 조회 대상 브리핑을 먼저 만들어 둠 (POST 측정 겸)
+        results['POST /v1/briefings'] = _measure(
+            lambda: client.post('/v1/briefings', json={}), briefing_requests, 1
+        )
+        results['GET /v1/briefings'] = _measure(
+            lambda: client.get('/v1/briefings', params={'limit': 20}), requests, concurrency
+        )
+        results['GET /v1/trending-stocks'] = _measure(
+            lambda: client.get('/v1/trending-stocks', params={'count': 10, 'limit': 10}), requests, concurrency
+        )
+        results['POST /v1/news/stocks/batch'] = _measure(
+            lambda: client.post('/v1/news/stocks/batch', json=BATCH_TICKERS, params={'limit_per_stock': 3}),
+            requests,
+            concurrency
+        )
+    return results
+
+
+if __name__ == "__main__":
+    import json
+
+    logging.basicConfig(level=logging.WARNING)
+    print(json.dumps(run(), ensure_ascii=False, indent=2))
@@ -0,0 +1,162 @@
+"""
+대용량 Excel 내보내기 벤치마크 (기본 100,000행)
+
+형식별로 새 인터프리터에서 실행해 소요 시간과 최대 메모리(RSS)를 측정합니다.
+- regular: 리스트 입력, 일반 모드 (create_trending_stocks_excel(write_only=False))
+- write_only: generator 입력, write-only 스트리밍 모드
+- history_export: 임시 브리핑 저장소 → iter_stock_rows() → create_briefing_history_excel()
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_excel --rows 100000
+"""
+import argparse
+import json
+import logging
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+MODES = ('regular', 'write_only', 'history_export')
+
+# 이력 내보내기용 임시 저장소의 브리핑 1건당 종목 수
+STOCKS_PER_BRIEFING = 10
+
+
+def _max_rss_mb() -> Optional[float]:
+    """현재 프로세스 최대 RSS (MB, resource 모듈이 없는 Windows에서는 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB
+    return round(rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024, 1)
+
+
+def _stock_rows(rows: int) -> Iterator[Dict]:
+    for index in range(rows):
+        yield {
+            'symbol': f"S{index:06d}",
+            'name': f"Sample Company {index}",
+            'price': round(10 + (index % 5000) * 0.37, 2),
+            'change_percent': ((index % 41) - 20) / 1000,
+            'volume': 1_000_000 + index,
+        }
+
+
+def _fill_store(db_path: Path, rows: int) -> None:
+    """rows개 종목이 들어간 임시 브리핑 저장소 생성 (브리핑 1건당 STOCKS_PER_BRIEFING개)"""
+    from briefing_store import BriefingStore
+
+    store = BriefingStore(db_path=db_path, legacy_dir=db_path.parent)
+    conn = store._connect()
+    stocks = _stock_rows(rows)
+    with conn:
+        for index in range((rows + STOCKS_PER_BRIEFING - 1) // STOCKS_PER_BRIEFING):
+            batch = [
+                {**stock, 'change_percent': stock['change_percent'] * 100}
+                for _, stock in zip(range(STOCKS_PER_BRIEFING), stocks)
+            ]
+            conn.execute(
+                """
+                INSERT INTO briefings (briefing_id, stock_symbol, generated_at, title, stocks_json, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    f"briefing_BENCH_{index:07d}",
+                    batch[0]['symbol'],
+                    (datetime(2024, 1, 1) + timedelta(minutes=index)).isoformat(),
+                    '벤치마크 브리핑',
+                    json.dumps(batch, ensure_ascii=False),
+                    '2024-01-01T00:00:00',
+                )
+            )
+    store.close()
+
+
+def _worker(mode: str, rows: int, output_dir: Path) -> Dict:
+    """한 가지 형식 실행 (새 인터프리터 안에서 호출)"""
+    from excel_generator import create_briefing_history_excel, create_trending_stocks_excel
+
+    logging.disable(logging.INFO)
+    baseline_rss = _max_rss_mb()
+
+    if mode == 'history_export':
+        from briefing_store import BriefingStore
+
+        db_path = output_dir / 'bench_briefings.db'
+        _fill_store(db_path, rows)
+        started = time.perf_counter()
+        path = create_briefing_history_excel(
+            BriefingStore(db_path=db_path, legacy_dir=output_dir).iter_stock_rows(),
+            output_dir=str(output_dir),
+            filename='history.xlsx'
+        )
+    elif mode == 'regular':
+        stocks = list(_stock_rows(rows))
+        started = time.perf_counter()
+        path = create_trending_stocks_excel(stocks, output_dir=str(output_dir), filename='regular.xlsx', write_only=False)
+    else:
+        started = time.perf_counter()
+        path = create_trending_stocks_excel(_stock_rows(rows), output_dir=str(output_dir), filename='write_only.xlsx')
+
+    elapsed = time.perf_counter() - started
+    peak_rss = _max_rss_mb()
+    return {
+        'total_ms': round(elapsed * 1000, 2),
+        'rows_per_sec': round(rows / elapsed, 1) if elapsed else 0,
+        'peak_rss_mb': peak_rss,
+        'rss_growth_mb': round(peak_rss - baseline_rss, 1) if peak_rss is not None else None,
+        'file_mb': round(Path(path).stat().st_size / (1024 * 1024), 2),
+    }
+
+
+def run(rows: int = 100_000, modes: Optional[List[str]] = None) -> Dict:
+    """
+    Excel 벤치마크 실행
+
+    Args:
+        rows: 파일당 데이터 행 수
+        modes: 실행할 형식 (기본값: MODES 전체)
+
+    Returns:
+        형식별 결과
+    """
+    results = {'rows': rows}
+    with tempfile.TemporaryDirectory(prefix='briefing_excel_') as tmp:
+        for mode in modes or MODES:
+            proc = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_excel', '--worker', mode, '--rows', str(rows), '--output-dir', tmp],
+                cwd=BACKEND_DIR, capture_output=True, text=True
+            )
+            if proc.returncode != 0:
+                results[mode] = {'error': proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f'exit {proc.returncode}'}
+                continue
+            results[mode] = json.loads(proc.stdout.strip().splitlines()[-1])
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='대용량 Excel 내보내기 벤치마크')
+    parser.add_argument('--rows', type=int, default=100_000, help='파일당 데이터 행 수')
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES), help='실행할 형식')
+    parser.add_argument('--worker', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--output-dir', type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(_worker(args.worker, args.rows, args.output_dir)))
+        return 0
+
+    print(json.dumps(run(args.rows, args.modes), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
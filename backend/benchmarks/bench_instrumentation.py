@@ -0,0 +1,119 @@
+"""
+타이밍 계측 확인 (span / Server-Timing)
+
+기록된 응답 재생 환경에서 계측이 빠지지 않았는지 확인합니다.
+- 워크플로우 1회 실행에 yahoo.* / exa.* / gemini.* / workflow.* span이 모두 기록되는지
+- API 요청 응답에 Server-Timing 헤더(외부 호출 stage + total)가 붙는지
+
+확인만 할 때 (backend 디렉토리에서):
+    python -m benchmarks.bench_instrumentation --check
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+from typing import Dict, Optional
+
+from benchmarks.stubs import install_stubs, isolated_output
+
+# 워크플로우 1회 실행에 반드시 있어야 하는 stage 접두어
+REQUIRED_WORKFLOW_PREFIXES = ('yahoo.', 'exa.', 'gemini.', 'workflow.')
+
+# Server-Timing을 확인할 엔드포인트와 헤더에 있어야 하는 stage 접두어
+SERVER_TIMING_ENDPOINT = '/v1/trending-stocks'
+REQUIRED_HEADER_PREFIXES = ('yahoo.',)
+
+
+def check_workflow_spans() -> Dict:
+    """워크플로우 1회 실행의 stage별 (호출 수, 합계 ms)와 빠진 접두어"""
+    from daily_briefing_workflow import run_daily_briefing_workflow
+    from instrumentation import collect_spans, summarize_spans
+
+    with isolated_output(), collect_spans() as spans:
+        result = run_daily_briefing_workflow()
+
+    stages = summarize_spans(spans)
+    missing = [prefix for prefix in REQUIRED_WORKFLOW_PREFIXES if not any(stage.startswith(prefix) for stage in stages)]
+    return {
+        'success': bool(result.get('success')),
+        'error': result.get('error'),
+        'stages': {stage: {**entry, 'total_ms': round(entry['total_ms'], 2)} for stage, entry in stages.items()},
+        'missing': missing,
+    }
+
+
+def check_server_timing() -> Dict:
+    """엔드포인트 요청 1회의 Server-Timing 헤더와 빠진 항목"""
+    # 확인 중에는 발송 워커를 띄우지 않음
+    os.environ.setdefault('OUTBOX_WORKERS', '0')
+    from fastapi.testclient import TestClient
+    from main import app
+
+    with isolated_output(), TestClient(app) as client:
+        response = client.get(SERVER_TIMING_ENDPOINT, params={'count': 5, 'limit': 5})
+
+    header = response.headers.get('server-timing', '')
+    names = [entry.split(';', 1)[0].strip() for entry in header.split(',') if entry.strip()]
+    missing = [prefix for prefix in REQUIRED_HEADER_PREFIXES if not any(name.startswith(prefix) for name in names)]
+    if 'total' not in names:
+        missing.append('total')
+    return {
+        'endpoint': SERVER_TIMING_ENDPOINT,
+        'status_code': response.status_code,
+        'server_timing': header,
+        'missing': missing,
+    }
+
+
+def run(latency_ms: Optional[Dict[str, float]] = None) -> Dict:
+    """
+    계측 확인 실행
+
+    Args:
+        latency_ms: 서비스별 지연 시간 (ms, 기본값: 지연 없음 - 기록 여부만 확인)
+
+    Returns:
+        {'workflow': {...}, 'server_timing': {...}, 'violations': [...]}
+    """
+    from benchmarks.stubs import DEFAULT_LATENCY_MS
+
+    if latency_ms is None:
+        latency_ms = {provider: 0 for provider in DEFAULT_LATENCY_MS}
+
+    with install_stubs(latency_ms):
+        workflow = check_workflow_spans()
+        server_timing = check_server_timing()
+
+    violations = []
+    if not workflow['success']:
+        violations.append(f"워크플로우 실패: {workflow['error']}")
+    for prefix in workflow['missing']:
+        violations.append(f"워크플로우 span 누락: {prefix}*")
+    if server_timing['status_code'] >= 400:
+        violations.append(f"{SERVER_TIMING_ENDPOINT}: 응답 코드 {server_timing['status_code']}")
+    if not server_timing['server_timing']:
+        violations.append(f"{SERVER_TIMING_ENDPOINT}: Server-Timing 헤더 없음")
+    else:
+        for prefix in server_timing['missing']:
+            violations.append(f"{SERVER_TIMING_ENDPOINT}: Server-Timing 항목 누락 ({prefix})")
+
+    return {'workflow': workflow, 'server_timing': server_timing, 'violations': violations}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='span / Server-Timing 계측 확인')
+    parser.add_argument('--check', action='store_true', help='누락 시 종료 코드 1')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    result = run()
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    for violation in result['violations']:
+        print(f"계측 누락: {violation}", file=sys.stderr)
+    return 1 if args.check and result['violations'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
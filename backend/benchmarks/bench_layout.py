@@ -0,0 +1,136 @@
+"""
+텍스트 레이아웃 벤치마크 (5,000자 섹션)
+
+- wrap_prefix: 늘어나는 접두어(line + word)를 매번 textbbox로 재는 방식 (이전 구현, 비교 기준)
+- wrap_layout: text_layout.wrap_text (토큰 폭 캐시 + 한 번 훑기, wrap_layout_cold_ms는 빈 캐시에서 1회)
+- pillow_image: 5,000자 섹션 3개짜리 generate_briefing_image_with_pillow() 전체 (캔버스 높이 포함)
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_layout --chars 5000
+"""
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from benchmarks.common import summarize
+
+MAX_WIDTH = 1100
+
+_SAMPLES = {
+    'ko': "엔비디아가 AI 반도체 시장에서의 강력한 입지를 바탕으로 주가가 급등했습니다. "
+          "데이터센터 수요 증가로 실적 전망이 크게 개선되었고, 주요 투자은행들은 목표가를 상향 조정했습니다. ",
+    'ko_nospace': "엔비디아가AI반도체시장에서의강력한입지를바탕으로주가가급등했습니다.",
+    'en': "NVIDIA shares jumped after the company reported record data center revenue "
+          "and raised its outlook, while analysts lifted their price targets. ",
+}
+
+
+def _section(kind: str, chars: int) -> str:
+    sample = _SAMPLES[kind]
+    return (sample * (chars // len(sample) + 1))[:chars]
+
+
+def _measure(func: Callable[[], object], iterations: int) -> Dict:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarize(samples)
+
+
+def _wrap_prefix(draw, text: str, font) -> List[str]:
+    """접두어를 매번 다시 재는 줄바꿈 (공백 기준)"""
+    lines, line = [], ""
+    for word in text.split():
+        test_line = line + word + " "
+        bbox = draw.textbbox((0, 0), test_line, font=font)
+        if bbox[2] - bbox[0] < MAX_WIDTH:
+            line = test_line
+        else:
+            lines.append(line)
+            line = word + " "
+    if line:
+        lines.append(line)
+    return lines
+
+
+def run(chars: int = 5000, iterations: int = 5) -> Dict:
+    """
+    텍스트 레이아웃 벤치마크 실행
+
+    Args:
+        chars: 섹션 1개의 글자 수
+        iterations: 항목별 반복 횟수
+
+    Returns:
+        항목별 결과
+    """
+    from PIL import Image, ImageDraw
+
+    from gemini_briefing import generate_briefing_image_with_pillow
+    from text_layout import _advances, load_font, wrap_text
+
+    font = load_font(24)
+    draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+
+    results = {'chars': chars}
+    for kind in _SAMPLES:
+        text = _section(kind, chars)
+        _advances.pop(font, None)
+        started = time.perf_counter()
+        lines = wrap_text(text, font, MAX_WIDTH)
+        cold_ms = (time.perf_counter() - started) * 1000
+        results[kind] = {
+            'wrap_layout_cold_ms': round(cold_ms, 2),
+            'wrap_layout': _measure(lambda: wrap_text(text, font, MAX_WIDTH), iterations),
+            'lines': len(lines),
+            'overflow_lines': sum(1 for line in lines if font.getlength(line) > MAX_WIDTH),
+        }
+        if kind != 'ko_nospace':
+            prefix = _measure(lambda: _wrap_prefix(draw, text, font), iterations)
+            results[kind]['wrap_prefix'] = prefix
+            results[kind]['speedup'] = round(prefix['p50_ms'] / results[kind]['wrap_layout']['p50_ms'], 1)
+        else:
+            results[kind]['prefix_overflow_lines'] = sum(
+                1 for line in _wrap_prefix(draw, text, font) if font.getlength(line) > MAX_WIDTH
+            )
+
+    briefing_text = {
+        'title': '오늘의 화제 종목 브리핑',
+        'summary': _section('ko', 300),
+        'sections': [
+            {'title': f"섹션 {index + 1}", 'content': _section(kind, chars)}
+            for index, kind in enumerate(('ko', 'ko_nospace', 'en'))
+        ],
+    }
+    stock = {'symbol': 'NVDA', 'name': 'NVIDIA Corporation', 'price': 495.5, 'change_percent': 7.25}
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory(prefix='briefing_layout_') as tmp:
+        output_path = str(Path(tmp) / 'image.png')
+        results['pillow_image'] = _measure(
+            lambda: generate_briefing_image_with_pillow(briefing_text, stock, 'ko', output_path), iterations
+        )
+        with Image.open(output_path) as image:
+            results['pillow_image']['height_px'] = image.height
+    logging.disable(logging.NOTSET)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='텍스트 레이아웃 벤치마크')
+    parser.add_argument('--chars', type=int, default=5000, help='섹션 1개의 글자 수')
+    parser.add_argument('--iterations', type=int, default=5, help='항목별 반복 횟수')
+    args = parser.parse_args(argv)
+
+    print(json.dumps(run(args.chars, args.iterations), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+실시간 시세 팬아웃 벤치마크 (가짜 시세 소스 + 모의 구독자 1,000명)
+
+- upstream_requests: 공용 폴러가 보낸 다종목 요청 수 (naive_requests = 구독자마다 틱마다 따로 조회했을 때)
+- fast / slow: 바로 받는 구독자와 메시지마다 slow_ms씩 늦게 받는 구독자의 수신 메시지 수, 지연 시간
+- coalesced: 느린 구독자에게 보내기 전에 합쳐진 변경 수
+- consistent: 마지막 메시지까지 적용한 구독자 상태가 허브의 최종 스냅샷과 같은지
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_quotes --clients 1000 --symbols 300
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Dict, List
+
+from benchmarks.common import summarize
+from benchmarks.stubs import FakeQuoteSource
+
+
+async def _run(clients: int, symbols: int, ticks: int, interval_ms: float, slow_ratio: float, slow_ms: float) -> Dict:
+    from quote_stream import QuoteHub, QuoteSubscriber
+
+    published: List[float] = []
+
+    class TimedHub(QuoteHub):
+        async def poll_once(self) -> int:
+            changed = await super().poll_once()
+            published.append(time.perf_counter())
+            return changed
+
+    source = FakeQuoteSource(latency_ms=5)
+    hub = TimedHub(source, interval=interval_ms / 1000, min_gap=interval_ms / 1000)
+    rng = random.Random(1)
+    universe = [f"S{index:04d}" for index in range(symbols)]
+    # 인기 종목에 구독이 몰리도록 (앞쪽 종목일수록 자주 선택)
+    weights = [1 / (index + 1) for index in range(symbols)]
+
+    states: List[Dict[str, Dict]] = []
+    latencies = {'fast': [], 'slow': []}
+    received = {'fast': 0, 'slow': 0}
+    subscribers: List[QuoteSubscriber] = []
+
+    async def consume(subscriber: QuoteSubscriber, state: Dict[str, Dict], kind: str) -> None:
+        while True:
+            batch = await subscriber.next_batch()
+            if published:
+                latencies[kind].append((time.perf_counter() - published[-1]) * 1000)
+            received[kind] += 1
+            for symbol, changes in batch.items():
+                state.setdefault(symbol, {}).update(changes)
+            if kind == 'slow':
+                await asyncio.sleep(slow_ms / 1000)
+
+    tasks = []
+    slow_clients = int(clients * slow_ratio)
+    for index in range(clients):
+        subscriber = QuoteSubscriber()
+        state: Dict[str, Dict] = {}
+        kind = 'slow' if index < slow_clients else 'fast'
+        hub.subscribe(subscriber, set(rng.choices(universe, weights=weights, k=rng.randint(5, 20))))
+        subscribers.append(subscriber)
+        states.append(state)
+        tasks.append(asyncio.create_task(consume(subscriber, state, kind)))
+
+    started = time.perf_counter()
+    while hub.stats['polls'] < ticks:
+        await asyncio.sleep(interval_ms / 1000 / 4)
+    elapsed = time.perf_counter() - started
+    await hub.close()
+
+    # 느린 구독자가 남은 변경을 다 받을 때까지
+    await asyncio.sleep(slow_ms / 1000 * 2 + 0.05)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    # 폴러를 멈춘 시점에 마지막으로 보낸 스냅샷과 비교
+    latest = hub._snapshots
+    consistent = all(
+        state.get(symbol) == latest[symbol]
+        for subscriber, state in zip(subscribers, states)
+        for symbol in subscriber.symbols
+    )
+    return {
+        'clients': clients,
+        'slow_clients': slow_clients,
+        'symbols_subscribed': len(hub.symbols),
+        'ticks': hub.stats['polls'],
+        'elapsed_s': round(elapsed, 2),
+        'upstream_requests': hub.stats['upstream_requests'],
+        'naive_requests': clients * hub.stats['polls'],
+        'published_changes': hub.stats['published'],
+        'fast': {'messages': received['fast'], 'latency': summarize(latencies['fast'])},
+        'slow': {'messages': received['slow'], 'latency': summarize(latencies['slow'])},
+        'coalesced': sum(subscriber.coalesced for subscriber in subscribers),
+        'consistent': consistent,
+    }
+
+
+def run(clients: int = 1000, symbols: int = 300, ticks: int = 20, interval_ms: float = 100,
+        slow_ratio: float = 0.1, slow_ms: float = 350) -> Dict:
+    """
+    시세 팬아웃 벤치마크 실행
+
+    Args:
+        clients: 모의 구독자 수
+        symbols: 종목 풀 크기 (구독자마다 5~20개 선택)
+        ticks: 폴링 횟수
+        interval_ms: 폴링 간격 (ms)
+        slow_ratio: 느린 구독자 비율
+        slow_ms: 느린 구독자가 메시지 하나를 처리하는 시간 (ms)
+
+    Returns:
+        측정 결과
+    """
+    return asyncio.run(_run(clients, symbols, ticks, interval_ms, slow_ratio, slow_ms))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='실시간 시세 팬아웃 벤치마크')
+    parser.add_argument('--clients', type=int, default=1000, help='모의 구독자 수')
+    parser.add_argument('--symbols', type=int, default=300, help='종목 풀 크기')
+    parser.add_argument('--ticks', type=int, default=20, help='폴링 횟수')
+    parser.add_argument('--interval-ms', type=float, default=100, help='폴링 간격 (ms)')
+    parser.add_argument('--slow-ratio', type=float, default=0.1, help='느린 구독자 비율')
+    parser.add_argument('--slow-ms', type=float, default=350, help='느린 구독자의 메시지당 처리 시간 (ms)')
+    args = parser.parse_args(argv)
+
+    print(json.dumps(
+        run(args.clients, args.symbols, args.ticks, args.interval_ms, args.slow_ratio, args.slow_ms),
+        ensure_ascii=False, indent=2
+    ))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+렌더링 처리량 벤치마크 (브리핑 카드 / DOCX / Excel)
+
+기록된 스크리너 응답으로 입력을 만들고 파일 1개당 소요 시간과 초당 생성 수를 측정합니다.
+briefing_card_sizes는 OG / 모바일 / 썸네일 3가지 크기를 한 번에 만드는 시간입니다.
+sparkline_png / lttb_100k_to_500은 차트 이미지 1개, 10만 개 봉 OHLCV 축소 시간입니다.
+"""
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+from benchmarks.common import summarize
+from benchmarks.stubs import load_fixture
+
+
+def _measure(render: Callable[[int], object], iterations: int) -> Dict:
+    samples = []
+    for index in range(iterations):
+        started = time.perf_counter()
+        render(index)
+        samples.append((time.perf_counter() - started) * 1000)
+    total = sum(samples) / 1000
+    return {
+        **summarize(samples),
+        'renders_per_sec': round(iterations / total, 2) if total else 0,
+    }
+
+
+def _sample_inputs() -> Dict:
+    from get_trending_stocks import format_stock_data
+
+    quotes = load_fixture('screener')['most_actives']['quotes']
+    stocks = [format_stock_data(quote) for quote in quotes]
+    top = stocks[0]
+    briefing_text = {
+        'title': '오늘의 화제 종목 브리핑',
+        'summary': '기술주 중심으로 거래가 활발했습니다. AI 관련 종목의 거래량이 크게 늘었습니다.',
+        'sections': [
+            {
+                'stock_symbol': stock['symbol'],
+                'title': f"{stock['name']} ({stock['symbol']})",
+                'content': f"{stock['name']}는 전일 대비 {stock['change_percent']:+.2f}% 변동했습니다.",
+            }
+            for stock in stocks[:5]
+        ],
+    }
+    return {'stocks': stocks, 'top': top, 'briefing_text': briefing_text}
+
+
+def run(iterations: int = 20, excel_rows: int = 500) -> Dict:
+    """
+    렌더링 벤치마크 실행
+
+    Args:
+        iterations: 형식별 반복 횟수
+        excel_rows: Excel 1개당 행 수
+
+    Returns:
+        형식별 결과
+    """
+    import numpy as np
+
+    from charts import downsample_ohlcv, render_sparkline
+    from docx_generator import create_briefing_report
+    from excel_generator import create_trending_stocks_excel
+    from gemini_briefing import generate_briefing_image_with_pillow
+    from generate_briefing_card import BriefingCardGenerator
+
+    inputs = _sample_inputs()
+    top = inputs['top']
+    stocks = inputs['stocks']
+    excel_stocks = [
+        {**stocks[index % len(stocks)], 'change_percent': stocks[index % len(stocks)]['change_percent'] / 100}
+        for index in range(excel_rows)
+    ]
+    # 5분봉 1개월치 정도의 종가 / 10만 개 봉 OHLCV
+    rng = np.random.default_rng(0)
+    closes = 100 + np.cumsum(rng.normal(size=1_600))
+    series = 100 + np.cumsum(rng.normal(size=100_000))
+    bars_100k = {
+        't': np.arange(100_000, dtype=np.int64) * 60,
+        'open': series, 'high': series + 1, 'low': series - 1, 'close': series,
+        'volume': np.ones(100_000),
+    }
+    docx_data = {
+        'date': time.strftime('%Y-%m-%d'),
+        'title': inputs['briefing_text']['title'],
+        'summary': inputs['briefing_text']['summary'],
+        'stocks': [{**stock, 'news_summary': '실적 상회와 목표가 상향 소식이 이어졌습니다.'} for stock in stocks[:5]],
+    }
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='briefing_render_') as tmp:
+        out = Path(tmp)
+        card_generator = BriefingCardGenerator()
+
+        results['briefing_card'] = _measure(
+            lambda index: card_generator.create_briefing_card(
+                title=inputs['briefing_text']['title'],
+                summary=inputs['briefing_text']['summary'],
+                stock_symbol=top['symbol'],
+                stock_name=top['name'],
+                current_price=top['price'],
+                change_percent=top['change_percent'],
+                highlights=[section['content'] for section in inputs['briefing_text']['sections'][:3]],
+                output_path=str(out / f"card_{index}.png")
+            ),
+            iterations
+        )
+        results['briefing_card_sizes'] = _measure(
+            lambda index: card_generator.create_briefing_cards(
+                title=inputs['briefing_text']['title'],
+                summary=inputs['briefing_text']['summary'],
+                stock_symbol=top['symbol'],
+                stock_name=top['name'],
+                current_price=top['price'],
+                change_percent=top['change_percent'],
+                highlights=[section['content'] for section in inputs['briefing_text']['sections'][:3]],
+                output_dir=str(out / f"cards_{index}")
+            ),
+            iterations
+        )
+        results['briefing_image_pillow'] = _measure(
+            lambda index: generate_briefing_image_with_pillow(
+                inputs['briefing_text'], top, 'ko', str(out / f"image_{index}.png")
+            ),
+            iterations
+        )
+        results['docx_briefing_report'] = _measure(
+            lambda index: create_briefing_report(docx_data, str(out / f"report_{index}.docx")),
+            iterations
+        )
+        results['sparkline_png'] = _measure(
+            lambda index: render_sparkline(closes, 480, 120),
+            iterations
+        )
+        results['lttb_100k_to_500'] = _measure(
+            lambda index: downsample_ohlcv(bars_100k, 500),
+            iterations
+        )
+        results['excel_trending_stocks'] = {
+            **_measure(
+                lambda index: create_trending_stocks_excel(excel_stocks, output_dir=tmp, filename=f"trending_{index}.xlsx"),
+                iterations
+            ),
+            'rows': excel_rows,
+        }
+    return results
+
+
+if __name__ == "__main__":
+    import json
+
+    logging.basicConfig(level=logging.WARNING)
+    print(json.dumps(run(), ensure_ascii=False, indent=2))
@@ -0,0 +1,111 @@
+"""
+로컬 스크리너 벤치마크 (공유 메모리 스냅샷 + 조건식)
+
+- compile: 조건식 파싱/컴파일 시간 (캐시 없이)
+- evaluate: 스냅샷 rows개 종목에 마스크 적용 + 정렬 + 상위 limit개 행 꺼내기
+- python_loop: 비교용, 같은 조건을 종목 dict 목록에 파이썬 반복문으로 적용
+- matched: 조건식별 일치 종목 수 (두 방식이 같아야 함)
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_screens --rows 5000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.common import summarize
+
+# 조건식 → 같은 조건의 파이썬 함수 (비교용)
+EXPRESSIONS: Dict[str, Callable[[Dict], bool]] = {
+    'rel_volume > 2 and change_percent > 5 and market_cap > 1e9': lambda row: (
+        row['avg_volume'] > 0 and row['volume'] / row['avg_volume'] > 2
+        and row['change_percent'] > 5 and row['market_cap'] > 1e9
+    ),
+    '1e9 < market_cap < 1e11 and not (price < 10)': lambda row: 1e9 < row['market_cap'] < 1e11 and not row['price'] < 10,
+    'abs(change_percent) >= 4 or price * volume > 1e10': lambda row: (
+        abs(row['change_percent']) >= 4 or row['price'] * row['volume'] > 1e10
+    ),
+}
+
+
+def _rows(count: int) -> List[Dict]:
+    rng = random.Random(7)
+    return [
+        {
+            'symbol': f"S{index:05d}", 'name': f"Company {index}",
+            'price': rng.uniform(1, 800), 'change': 0.0, 'change_percent': rng.gauss(0, 3),
+            'volume': rng.randint(0, 100_000_000), 'avg_volume': rng.choice([0, rng.randint(1, 20_000_000)]),
+            'market_cap': rng.randint(10_000_000, 3_000_000_000_000), 'score': rng.uniform(0, 100),
+        }
+        for index in range(count)
+    ]
+
+
+def _measure(func: Callable[[], object], iterations: int) -> Dict:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarize(samples)
+
+
+def run(rows: int = 5000, iterations: int = 50, limit: int = 50) -> Dict:
+    """
+    스크리너 벤치마크 실행
+
+    Args:
+        rows: 스냅샷 종목 수
+        iterations: 조건식별 반복 횟수
+        limit: 결과 행 수
+
+    Returns:
+        측정 결과
+    """
+    from screen_engine import compile_screen, evaluate_screen
+    from shared_snapshot import MarketSnapshot
+
+    data = _rows(rows)
+    snapshot = MarketSnapshot.create(f"syr_bench_screens_{os.getpid()}", capacity=max(rows, 16))
+    try:
+        snapshot.publish(data)
+        results = {'rows': rows, 'limit': limit, 'expressions': {}}
+        for expression, predicate in EXPRESSIONS.items():
+            compiled = compile_screen(expression)
+            matched = snapshot.read(lambda view: evaluate_screen(compiled, view, 'score', True, limit))['matched']
+            results['expressions'][expression] = {
+                'compile': _measure(lambda: compile_screen.__wrapped__(expression), iterations),
+                'evaluate': _measure(
+                    lambda: snapshot.read(lambda view: evaluate_screen(compiled, view, 'score', True, limit)),
+                    iterations
+                ),
+                'python_loop': _measure(
+                    lambda: sorted((row for row in data if predicate(row)), key=lambda row: -row['score'])[:limit],
+                    iterations
+                ),
+                'matched': matched,
+                'python_matched': sum(1 for row in data if predicate(row)),
+            }
+        return results
+    finally:
+        snapshot.close()
+        snapshot.unlink()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='로컬 스크리너 벤치마크')
+    parser.add_argument('--rows', type=int, default=5000, help='스냅샷 종목 수')
+    parser.add_argument('--iterations', type=int, default=50, help='조건식별 반복 횟수')
+    parser.add_argument('--limit', type=int, default=50, help='결과 행 수')
+    args = parser.parse_args(argv)
+
+    print(json.dumps(run(args.rows, args.iterations, args.limit), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
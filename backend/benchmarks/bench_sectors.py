@@ -0,0 +1,122 @@
+"""
+섹터 집계 벤치마크 (공유 메모리 스냅샷 + 종목 프로필)
+
+- profile_table: 종목 프로필 dict → 정렬된 심볼/그룹 코드 배열 (프로필을 다시 읽을 때 1번)
+- aggregate: 스냅샷 rows개 종목을 섹터/산업별로 집계 (bincount, 그룹별 상승/하락 상위 종목 포함, 스냅샷 버전당 1번)
+- python_loop: 비교용, 종목 dict 목록을 파이썬 반복문으로 묶어서 같은 값을 계산
+- consistent: 두 방식의 그룹별 종목 수, 상승 종목 수, 시가총액 가중 수익률이 같은지
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_sectors --rows 5000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.bench_screens import _rows
+from benchmarks.common import summarize
+
+SECTORS = (
+    'Technology', 'Healthcare', 'Financial Services', 'Consumer Cyclical', 'Communication Services', 'Industrials',
+    'Consumer Defensive', 'Energy', 'Utilities', 'Real Estate', 'Basic Materials',
+)
+
+
+def _profiles(rows: List[Dict], coverage: float = 0.95) -> Dict[str, Tuple[str, str]]:
+    rng = random.Random(11)
+    profiles = {}
+    for row in rows[:int(len(rows) * coverage)]:
+        sector = rng.choice(SECTORS)
+        profiles[row['symbol']] = (sector, f"{sector} {rng.randint(1, 6)}")
+    return profiles
+
+
+def _python_groupby(rows: List[Dict], profiles: Dict[str, Tuple[str, str]], movers: int) -> Dict[str, Dict]:
+    groups: Dict[str, Dict] = {}
+    for row in rows:
+        sector = profiles.get(row['symbol'], ('Unknown', 'Unknown'))[0]
+        group = groups.setdefault(sector, {'count': 0, 'advancers': 0, 'weighted': 0.0, 'cap': 0.0, 'members': []})
+        group['count'] += 1
+        group['advancers'] += row['change_percent'] > 0
+        if row['market_cap'] > 0:
+            group['weighted'] += row['market_cap'] * row['change_percent']
+            group['cap'] += row['market_cap']
+        group['members'].append(row)
+    for group in groups.values():
+        ordered = sorted(group.pop('members'), key=lambda row: -row['change_percent'])
+        group['top_gainers'] = ordered[:movers]
+        group['top_losers'] = ordered[::-1][:movers]
+        group['return_cap_weighted'] = group['weighted'] / group['cap'] if group['cap'] else None
+    return groups
+
+
+def _measure(func: Callable[[], object], iterations: int) -> Dict:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarize(samples)
+
+
+def run(rows: int = 5000, iterations: int = 30, movers: int = 3) -> Dict:
+    """
+    섹터 집계 벤치마크 실행
+
+    Args:
+        rows: 스냅샷 종목 수
+        iterations: 반복 횟수
+        movers: 그룹별 상승/하락 상위 종목 수
+
+    Returns:
+        측정 결과
+    """
+    from market_sectors import ProfileTable, aggregate_sectors
+    from shared_snapshot import MarketSnapshot
+
+    data = _rows(rows)
+    profiles = _profiles(data)
+    snapshot = MarketSnapshot.create(f"syr_bench_sectors_{os.getpid()}", capacity=max(rows, 16))
+    try:
+        snapshot.publish(data)
+        table = ProfileTable(profiles)
+        results = {'rows': rows, 'profiled': len(profiles)}
+        results['profile_table'] = _measure(lambda: ProfileTable(profiles), iterations)
+        for group_by in ('sector', 'industry'):
+            results[f'aggregate_{group_by}'] = _measure(
+                lambda: snapshot.read(lambda view: aggregate_sectors(view, table, group_by, movers)), iterations
+            )
+        results['python_loop'] = _measure(lambda: _python_groupby(data, profiles, movers), iterations)
+
+        overview = snapshot.read(lambda view: aggregate_sectors(view, table, 'sector', movers))
+        expected = _python_groupby(data, profiles, movers)
+        results['groups'] = len(overview['groups'])
+        results['consistent'] = all(
+            group['count'] == expected[group['sector']]['count']
+            and group['advancers'] == expected[group['sector']]['advancers']
+            and abs(group['return_cap_weighted'] - round(expected[group['sector']]['return_cap_weighted'], 4)) < 1e-3
+            for group in overview['groups']
+        )
+        return results
+    finally:
+        snapshot.close()
+        snapshot.unlink()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='섹터 집계 벤치마크')
+    parser.add_argument('--rows', type=int, default=5000, help='스냅샷 종목 수')
+    parser.add_argument('--iterations', type=int, default=30, help='반복 횟수')
+    parser.add_argument('--movers', type=int, default=3, help='그룹별 상승/하락 상위 종목 수')
+    args = parser.parse_args(argv)
+
+    print(json.dumps(run(args.rows, args.iterations, args.movers), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+공유 메모리 시장 스냅샷 벤치마크
+
+- publish: 종목 rows개 기록 시간 (갱신 프로세스)
+- read_zero_copy: 공유 메모리 뷰에서 바로 조건 계산 vs read_unpickle: 워커별 캐시(직렬화된 dict 목록)를 풀어서 계산
+- concurrent: 기록 프로세스가 쉬지 않고 갱신하는 동안 읽기 프로세스 readers개가 읽은 횟수,
+  seqlock 검증 후 찢어진 읽기(torn, 0이어야 함), 검증 없이 읽었을 때 찢어진 읽기(raw_torn), 재시도 초과
+  (10번에 1번은 컬럼 사이에 SLOW_READ_SECONDS만큼 쉬는 느린 읽기)
+- memory: 세그먼트 크기 (워커 수와 관계없이 1벌)
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_snapshot --rows 5000 --readers 4
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.common import summarize
+
+# 느린 읽기 (10번에 1번) 중간에 쉬는 시간
+SLOW_READ_SECONDS = 0.05
+
+
+def _rows(count: int, value: float = 1.0) -> List[Dict]:
+    return [
+        {
+            'symbol': f"S{index:05d}", 'name': f"Company {index} 주식회사",
+            'price': value, 'change': value, 'change_percent': value,
+            'volume': int(value), 'avg_volume': int(value), 'market_cap': value, 'score': value,
+            'rank_most_actives': index % 100,
+        }
+        for index in range(count)
+    ]
+
+
+def _measure(func: Callable[[], object], iterations: int) -> Dict:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarize(samples)
+
+
+def _consistent(view) -> bool:
+    """한 버전의 행은 모든 숫자 컬럼이 같은 값"""
+    price = view['price']
+    if len(price) == 0:
+        return True
+    value = price[0]
+    return bool((price == value).all() and (view['score'] == value).all() and (view['volume'] == int(value)).all())
+
+
+def _slow_consistent(view) -> bool:
+    """같은 확인을 컬럼 사이에 쉬면서 (갱신 2번보다 오래 걸리는 읽기)"""
+    price = view['price'].copy()
+    time.sleep(SLOW_READ_SECONDS)
+    score = view['score'].copy()
+    return len(price) == 0 or bool((price == price[0]).all() and (score == price[0]).all())
+
+
+def _reader(name: str, duration: float, queue) -> None:
+    from shared_snapshot import MarketSnapshot, SnapshotUnavailable, SnapshotView
+
+    snapshot = MarketSnapshot.attach(name)
+    reads = torn = busy = raw_reads = raw_torn = 0
+    deadline = time.time() + duration
+    iteration = 0
+    while time.time() < deadline:
+        iteration += 1
+        check = _slow_consistent if iteration % 10 == 0 else _consistent
+        try:
+            ok = snapshot.read(check)
+            reads += 1
+            torn += not ok
+        except SnapshotUnavailable:
+            busy += 1
+
+        # 비교용: seq 검증 없이 활성 슬롯을 바로 읽기
+        header = snapshot._header
+        active = int(header['active'])
+        count = int(header['count'][active])
+        views = snapshot._read_views[active]
+        raw_reads += 1
+        raw_torn += not check(SnapshotView({key: view[:count] for key, view in views.items()}, 0, 0))
+    queue.put({'reads': reads, 'torn': torn, 'retries_exhausted': busy, 'raw_reads': raw_reads, 'raw_torn': raw_torn})
+    snapshot.close()
+
+
+def run(rows: int = 5000, readers: int = 4, duration: float = 2.0, iterations: int = 20) -> Dict:
+    """
+    공유 스냅샷 벤치마크 실행
+
+    Args:
+        rows: 종목 수
+        readers: 읽기 프로세스 수
+        duration: 동시 읽기/쓰기 시간 (초)
+        iterations: 단일 프로세스 측정 반복 횟수
+
+    Returns:
+        측정 결과
+    """
+    from cache_db import pack, unpack
+    from shared_snapshot import MarketSnapshot, segment_size
+
+    name = f"syr_bench_{os.getpid()}"
+    snapshot = MarketSnapshot.create(name, capacity=max(rows, 16))
+    try:
+        results = {'rows': rows, 'readers': readers}
+        data = _rows(rows)
+        results['publish'] = _measure(lambda: snapshot.publish(data), iterations)
+
+        packed = pack(data)
+        results['read_zero_copy'] = _measure(
+            lambda: snapshot.read(lambda view: int(((view['volume'] > 0) & (view['change_percent'] > 0.5)).sum())),
+            iterations
+        )
+        results['read_unpickle'] = _measure(
+            lambda: sum(1 for row in unpack(packed) if row['volume'] > 0 and row['change_percent'] > 0.5),
+            iterations
+        )
+
+        context = multiprocessing.get_context('spawn')
+        queue = context.Queue()
+        processes = [context.Process(target=_reader, args=(name, duration, queue)) for _ in range(readers)]
+        for process in processes:
+            process.start()
+
+        # 읽기 프로세스가 연결할 때까지 잠깐 기다린 뒤 쉬지 않고 갱신
+        time.sleep(0.5)
+        datasets = [_rows(rows, float(value)) for value in range(1, 11)]
+        versions = 0
+        deadline = time.time() + duration
+        while time.time() < deadline:
+            snapshot.publish(datasets[versions % len(datasets)])
+            versions += 1
+
+        totals: Dict[str, int] = {}
+        for _ in processes:
+            for key, value in queue.get(timeout=duration + 30).items():
+                totals[key] = totals.get(key, 0) + value
+        for process in processes:
+            process.join()
+
+        results['concurrent'] = {'versions_published': versions, **totals}
+        results['memory'] = {'segment_bytes': segment_size(snapshot.capacity)}
+        return results
+    finally:
+        snapshot.close()
+        snapshot.unlink()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='공유 메모리 시장 스냅샷 벤치마크')
+    parser.add_argument('--rows', type=int, default=5000, help='종목 수')
+    parser.add_argument('--readers', type=int, default=4, help='읽기 프로세스 수')
+    parser.add_argument('--duration', type=float, default=2.0, help='동시 읽기/쓰기 시간 (초)')
+    args = parser.parse_args(argv)
+
+    print(json.dumps(run(args.rows, args.readers, args.duration), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
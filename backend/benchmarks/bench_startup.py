@@ -0,0 +1,150 @@
+"""
+콜드 스타트 벤치마크 (python -X importtime)
+
+모듈별로 새 인터프리터를 띄워 import 시간을 재고, 무거운 SDK가 import 시점에 올라오지 않는지 확인합니다.
+MCP 서버는 Claude Desktop 세션마다 새로 뜨기 때문에 import 비용이 그대로 응답 지연이 됩니다.
+
+예산 확인만 할 때 (backend 디렉토리에서):
+    python -m benchmarks.bench_startup --check
+"""
+import argparse
+import importlib.util
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# 처음 사용할 때 불러와야 하는 SDK (import 시점에 올라오면 예산 위반)
+HEAVY_MODULES = ('google.genai', 'yahooquery', 'pandas', 'numpy', 'openpyxl', 'docx', 'PIL')
+
+# 모듈별 import 예산 (ms, 누적 import 시간의 중앙값 기준, 결과 JSON에는 'budget'으로 기록)
+BUDGETS_MS = {
+    'main': 1000,
+    'daily_briefing_workflow': 400,
+    'get_trending_stocks': 150,
+    'gemini_briefing': 150,
+    'mcp_servers.stocks_server': 600,
+    'mcp_servers.briefing_server': 600,
+}
+
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """-X importtime 출력 → [(모듈, 누적 시간 us, 깊이)] (출력 순서: 하위 모듈이 상위 모듈보다 먼저)"""
+    entries = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            entries.append((match.group(4), int(match.group(2)), len(match.group(3)) // 2))
+    return entries
+
+
+def _direct_children(entries: List[Tuple[str, int, int]], module: str) -> List[Tuple[str, int]]:
+    """module이 직접 import한 모듈 (인터프리터 시작 시 올라온 site 등은 제외)"""
+    index = next((i for i, (name, _, _) in enumerate(entries) if name == module), None)
+    if index is None:
+        return []
+    depth = entries[index][2]
+    children = []
+    for name, cumulative, child_depth in reversed(entries[:index]):
+        if child_depth <= depth:
+            break
+        if child_depth == depth + 1:
+            children.append((name, cumulative))
+    return children
+
+
+def measure_import(module: str) -> Dict:
+    """
+    새 인터프리터에서 module을 import하고 소요 시간 측정
+
+    Returns:
+        import_ms: module 누적 import 시간, heavy_modules: 함께 올라온 무거운 SDK,
+        top: module이 직접 import한 모듈 중 누적 시간이 큰 5개
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=BACKEND_DIR, capture_output=True, text=True, timeout=120
+    )
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f'exit {proc.returncode}'
+        return {'error': error}
+
+    entries = _parse_importtime(proc.stderr)
+    loaded = {name for name, _, _ in entries}
+    children = sorted(_direct_children(entries, module), key=lambda item: item[1], reverse=True)
+    return {
+        'import_ms': round(next((us for name, us, _ in entries if name == module), 0) / 1000, 2),
+        'heavy_modules': sorted(
+            name for name in HEAVY_MODULES
+            if name in loaded or any(other.startswith(name + '.') for other in loaded)
+        ),
+        'top': {name: round(us / 1000, 2) for name, us in children[:5]},
+    }
+
+
+def run(repeat: int = 3, modules: Optional[List[str]] = None) -> Dict:
+    """
+    콜드 스타트 벤치마크 실행
+
+    Args:
+        repeat: 모듈별 반복 횟수 (중앙값 사용)
+        modules: 측정할 모듈 (기본값: BUDGETS_MS 전체, 설치되지 않은 mcp 패키지가 필요한 모듈은 제외)
+
+    Returns:
+        모듈별 결과와 예산 위반 목록
+    """
+    if modules is None:
+        has_mcp = importlib.util.find_spec('mcp') is not None
+        modules = [module for module in BUDGETS_MS if has_mcp or not module.startswith('mcp_servers.')]
+
+    results = {}
+    violations = []
+    for module in modules:
+        samples = [measure_import(module) for _ in range(repeat)]
+        failed = next((sample for sample in samples if 'error' in sample), None)
+        if failed:
+            results[module] = failed
+            violations.append(f"{module}: import 실패 ({failed['error']})")
+            continue
+
+        times = sorted(sample['import_ms'] for sample in samples)
+        median = times[len(times) // 2]
+        budget = BUDGETS_MS.get(module)
+        heavy = samples[-1]['heavy_modules']
+        results[module] = {
+            'import_ms': median,
+            'min_ms': times[0],
+            'budget': budget,
+            'heavy_modules': heavy,
+            'top': samples[-1]['top'],
+        }
+        if budget is not None and median > budget:
+            violations.append(f"{module}: {median:.0f}ms > 예산 {budget}ms")
+        if heavy:
+            violations.append(f"{module}: import 시점에 무거운 SDK 로드 ({', '.join(heavy)})")
+
+    return {'modules': results, 'violations': violations}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='import 시간 벤치마크')
+    parser.add_argument('modules', nargs='*', help='측정할 모듈 (기본값: 예산이 정해진 모듈 전체)')
+    parser.add_argument('--repeat', type=int, default=3, help='모듈별 반복 횟수')
+    parser.add_argument('--check', action='store_true', help='예산 위반 시 종료 코드 1')
+    args = parser.parse_args(argv)
+
+    result = run(args.repeat, args.modules or None)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    for violation in result['violations']:
+        print(f"예산 위반: {violation}", file=sys.stderr)
+    return 1 if args.check and result['violations'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+종목 마스터 검색 벤치마크
+
+- load: data/symbols.csv 로드 + 인덱스 생성 시간
+- search: 검색어 종류별(티커 접두어, 영문/한글 이름, 오타) 조회 시간과 1위 결과
+- scan: 비교용, 전 종목의 티커/이름/별칭을 문자열 포함 여부로 훑는 방식
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_symbols --iterations 1000
+"""
+import argparse
+import json
+import sys
+import time
+from typing import Callable, Dict
+
+from benchmarks.common import summarize
+
+QUERIES = {
+    'ticker_prefix': ['A', 'AAP', 'NV', 'brk.b'],
+    'name': ['apple', 'micro', 'bank of america', 'nvidia'],
+    'korean': ['애플', '엔비', '테슬라', '버크셔'],
+    'typo': ['nvidai', 'microsfot', '테슬러', '엔비디야'],
+}
+
+
+def _measure(func: Callable[[], object], iterations: int) -> Dict:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarize(samples)
+
+
+def _scan(master, query: str):
+    """인덱스 없이 전 종목을 훑는 검색 (오타는 찾지 못함)"""
+    text = query.lower()
+    return [
+        listing.symbol for listing in master.listings
+        if listing.symbol.lower().startswith(text)
+        or text in listing.name.lower()
+        or any(text in alias.lower() for alias in listing.aliases)
+    ]
+
+
+def run(iterations: int = 1000) -> Dict:
+    """
+    종목 검색 벤치마크 실행
+
+    Args:
+        iterations: 검색어별 반복 횟수
+
+    Returns:
+        측정 결과
+    """
+    from symbol_master import SymbolMaster
+
+    started = time.perf_counter()
+    master = SymbolMaster.load()
+    results = {
+        'listings': len(master.listings),
+        'load_ms': round((time.perf_counter() - started) * 1000, 2),
+        'search': {},
+        'scan': {},
+        'top_hits': {},
+    }
+
+    for kind, queries in QUERIES.items():
+        results['search'][kind] = _measure(
+            lambda: [master.search(query, limit=10) for query in queries], iterations
+        )
+        results['scan'][kind] = _measure(lambda: [_scan(master, query) for query in queries], iterations)
+        for query in queries:
+            hits = master.search(query, limit=1)
+            results['top_hits'][query] = f"{hits[0]['symbol']} ({hits[0]['match']})" if hits else None
+
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='종목 마스터 검색 벤치마크')
+    parser.add_argument('--iterations', type=int, default=1000, help='검색어별 반복 횟수')
+    args = parser.parse_args(argv)
+
+    print(json.dumps(run(args.iterations), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+전체 워크플로우(run_daily_briefing_workflow) 종단 간 소요 시간 벤치마크
+
+기록된 응답 + 설정한 지연 시간으로 Step 1~4를 실행하고 stage별 시간을 함께 기록합니다.
+- cold: 반복마다 빈 캐시/저장소 (07:00 첫 실행)
+- warm: 같은 디렉토리에서 반복 (사전 준비 이후 또는 재실행)
+"""
+import logging
+import time
+from typing import Dict, Optional
+
+from benchmarks.common import summarize
+from benchmarks.stubs import install_stubs, isolated_output
+
+
+def _stage_totals(spans) -> Dict[str, float]:
+    from instrumentation import summarize_spans
+
+    return {stage: entry['total_ms'] for stage, entry in summarize_spans(spans).items()}
+
+
+def run(iterations: int = 3, latency_ms: Optional[Dict[str, float]] = None) -> Dict:
+    """
+    워크플로우 벤치마크 실행
+
+    Args:
+        iterations: 모드별 반복 횟수
+        latency_ms: 서비스별 지연 시간 (ms)
+
+    Returns:
+        {'cold': {...}, 'warm': {...}, 'upstream_calls': {...}}
+    """
+    from daily_briefing_workflow import run_daily_briefing_workflow
+    from instrumentation import collect_spans
+
+    results = {}
+    with install_stubs(latency_ms) as latency:
+        for mode in ('cold', 'warm'):
+            samples = []
+            stages: Dict[str, list] = {}
+            calls_before = dict(latency.calls)
+
+            with isolated_output() as shared_dir:
+                for _ in range(iterations):
+                    with isolated_output(None if mode == 'cold' else shared_dir), collect_spans() as spans:
+                        started = time.perf_counter()
+                        result = run_daily_briefing_workflow()
+                        samples.append((time.perf_counter() - started) * 1000)
+                    if not result.get('success'):
+                        raise RuntimeError(f"워크플로우 실패: {result.get('error')}")
+                    for stage, total_ms in _stage_totals(spans).items():
+                        stages.setdefault(stage, []).append(total_ms)
+
+            results[mode] = {
+                **summarize(samples),
+                'stages': {stage: summarize(values) for stage, values in stages.items()},
+                'upstream_calls_per_run': {
+                    provider: round((count - calls_before.get(provider, 0)) / iterations, 2)
+                    for provider, count in latency.calls.items()
+                },
+            }
+        results['latency_ms'] = latency.latency_ms
+    return results
+
+
+if __name__ == "__main__":
+    import json
+
+    logging.basicConfig(level=logging.WARNING)
+    print(json.dumps(run(), ensure_ascii=False, indent=2))
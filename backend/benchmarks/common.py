@@ -0,0 +1,112 @@
+"""
+벤치마크 공통 유틸리티 (통계, 결과 저장, 이전 결과와 비교)
+"""
+import json
+import platform
+import statistics
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+RESULTS_DIR = Path(__file__).parent / 'results'
+
+# 비교 시 회귀로 보는 기준 (이전 대비 변화율)
+REGRESSION_THRESHOLD = 0.10
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    """소요 시간 샘플 요약 (ms)"""
+    if not samples_ms:
+        return {'n': 0}
+    ordered = sorted(samples_ms)
+
+    def percentile(q: float) -> float:
+        index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+        return round(ordered[index], 2)
+
+    return {
+        'n': len(ordered),
+        'mean_ms': round(statistics.fmean(ordered), 2),
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'min_ms': round(ordered[0], 2),
+        'max_ms': round(ordered[-1], 2),
+    }
+
+
+def environment() -> Dict[str, str]:
+    """결과 비교에 필요한 실행 환경 정보"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, timeout=5, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ''
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'commit': commit,
+    }
+
+
+def write_results(results: Dict, output_path: Optional[Path] = None) -> Path:
+    """
+    결과 JSON 저장
+
+    Args:
+        results: 벤치마크 결과
+        output_path: 저장 경로 (기본값: results/bench_YYYYMMDD_HHMMSS.json)
+
+    Returns:
+        저장한 파일 경로
+    """
+    if output_path is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        output_path = RESULTS_DIR / f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    return output_path
+
+
+def _flatten(results: Dict, prefix: str = '') -> Dict[str, float]:
+    """비교 대상 지표만 평탄화 (*_ms, *_per_sec)"""
+    flat = {}
+    for key, value in results.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(_flatten(value, path))
+        elif isinstance(value, (int, float)) and (key.endswith('_ms') or key.endswith('_per_sec')):
+            flat[path] = float(value)
+    return flat
+
+
+def compare(current: Dict, baseline: Dict, threshold: float = REGRESSION_THRESHOLD) -> List[Dict]:
+    """
+    이전 결과와 지표별 비교
+
+    *_ms는 커지면, *_per_sec는 작아지면 나빠진 것으로 봅니다.
+
+    Returns:
+        [{'metric', 'baseline', 'current', 'change', 'regression'}]
+    """
+    current_flat = _flatten(current.get('benchmarks', {}))
+    baseline_flat = _flatten(baseline.get('benchmarks', {}))
+    rows = []
+    for metric in sorted(current_flat.keys() & baseline_flat.keys()):
+        before, after = baseline_flat[metric], current_flat[metric]
+        if before == 0:
+            continue
+        change = (after - before) / before
+        worse = change > threshold if metric.endswith('_ms') else change < -threshold
+        rows.append({
+            'metric': metric,
+            'baseline': before,
+            'current': after,
+            'change': round(change, 4),
+            'regression': worse,
+        })
+    return rows
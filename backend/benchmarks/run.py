@@ -0,0 +1,149 @@
+"""
+벤치마크 실행기
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.run                        # 전체 실행, results/에 JSON 저장
+    python -m benchmarks.run --only workflow render
+    python -m benchmarks.run --latency exa=300 gemini=0
+    python -m benchmarks.run --compare benchmarks/results/baseline.json
+    python -m benchmarks.run --only startup instrumentation   # 예산/계측 확인만 (위반 시 종료 코드 1)
+"""
+import argparse
+import json
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+from benchmarks import (
+    bench_delivery, bench_docx, bench_endpoints, bench_excel, bench_instrumentation, bench_layout, bench_quotes,
+    bench_render, bench_screens, bench_sectors, bench_snapshot, bench_startup, bench_symbols, bench_workflow
+)
+from benchmarks.common import compare, environment, write_results
+from benchmarks.stubs import DEFAULT_LATENCY_MS
+
+SUITES = ('workflow', 'endpoints', 'render', 'startup', 'excel', 'docx', 'layout', 'quotes', 'snapshot', 'symbols',
+          'screens', 'sectors', 'instrumentation', 'delivery')
+
+
+def _parse_latency(values) -> Dict[str, float]:
+    latency = {}
+    for value in values or []:
+        provider, _, ms = value.partition('=')
+        if provider not in DEFAULT_LATENCY_MS or not ms:
+            raise argparse.ArgumentTypeError(
+                f"지연 시간 형식: provider=ms (provider: {', '.join(DEFAULT_LATENCY_MS)})"
+            )
+        latency[provider] = float(ms)
+    return latency
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='기록된 응답으로 실행하는 오프라인 벤치마크')
+    parser.add_argument('--only', nargs='+', choices=SUITES, default=list(SUITES), help='실행할 벤치마크')
+    parser.add_argument('--latency', nargs='*', metavar='PROVIDER=MS', help='서비스별 지연 시간 (ms)')
+    parser.add_argument('--latency-scale', type=float, default=1.0, help='모든 지연 시간에 곱할 배율 (0이면 지연 없음)')
+    parser.add_argument('--iterations', type=int, default=3, help='워크플로우 반복 횟수')
+    parser.add_argument('--requests', type=int, default=20, help='엔드포인트별 요청 수')
+    parser.add_argument('--concurrency', type=int, default=4, help='동시 요청 수')
+    parser.add_argument('--render-iterations', type=int, default=20, help='렌더링 형식별 반복 횟수')
+    parser.add_argument('--excel-rows', type=int, default=100_000, help='Excel 벤치마크 파일당 행 수')
+    parser.add_argument('--delivery-emails', type=int, default=10_000, help='발송 벤치마크 이메일 수신자 수')
+    parser.add_argument('--delivery-slack', type=int, default=500, help='발송 벤치마크 슬랙 채널 수')
+    parser.add_argument('--output', type=Path, default=None, help='결과 JSON 경로')
+    parser.add_argument('--compare', type=Path, default=None, help='비교할 이전 결과 JSON')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    latency = {
+        provider: ms * args.latency_scale
+        for provider, ms in {**DEFAULT_LATENCY_MS, **_parse_latency(args.latency)}.items()
+    }
+
+    results = {
+        'generated_at': datetime.now().isoformat(),
+        'environment': environment(),
+        'config': {
+            'latency_ms': latency,
+            'iterations': args.iterations,
+            'requests': args.requests,
+            'concurrency': args.concurrency,
+            'render_iterations': args.render_iterations,
+            'excel_rows': args.excel_rows,
+            'delivery_emails': args.delivery_emails,
+            'delivery_slack': args.delivery_slack,
+        },
+        'benchmarks': {},
+    }
+
+    if 'workflow' in args.only:
+        print('워크플로우 벤치마크 실행 중...', file=sys.stderr)
+        results['benchmarks']['workflow'] = bench_workflow.run(args.iterations, latency)
+    if 'endpoints' in args.only:
+        print('엔드포인트 벤치마크 실행 중...', file=sys.stderr)
+        results['benchmarks']['endpoints'] = bench_endpoints.run(args.requests, args.concurrency, latency)
+    if 'render' in args.only:
+        print('렌더링 벤치마크 실행 중...', file=sys.stderr)
+        results['benchmarks']['render'] = bench_render.run(args.render_iterations)
+    if 'startup' in args.only:
+        print('콜드 스타트 벤치마크 실행 중...', file=sys.stderr)
+        results['benchmarks']['startup'] = bench_startup.run()
+    if 'excel' in args.only:
+        print('대용량 Excel 벤치마크 실행 중...', file=sys.stderr)
+        results['benchmarks']['excel'] = bench_excel.run(args.excel_rows)
+    if 'docx' in args.only:
+        print('DOCX 리포트 벤치마크 실행 중...', file=sys.stderr)
+        results['benchmarks']['docx'] = bench_docx.run()
+    if 'layout' in args.only:
+        print('텍스트 레이아웃 벤치마크 실행 중...', file=sys.stderr)
+        results['benchmarks']['layout'] = bench_layout.run()
+    if 'quotes' in args.only:
+        print('실시간 시세 팬아웃 벤치마크 실행 중...', file=sys.stderr)
+        results['benchmarks']['quotes'] = bench_quotes.run()
+    if 'snapshot' in args.only:
+        print('공유 메모리 스냅샷 벤치마크 실행 중...', file=sys.stderr)
+        results['benchmarks']['snapshot'] = bench_snapshot.run()
+    if 'symbols' in args.only:
+        print('종목 검색 벤치마크 실행 중...', file=sys.stderr)
+        results['benchmarks']['symbols'] = bench_symbols.run()
+    if 'screens' in args.only:
+        print('로컬 스크리너 벤치마크 실행 중...', file=sys.stderr)
+        results['benchmarks']['screens'] = bench_screens.run()
+    if 'sectors' in args.only:
+        print('섹터 집계 벤치마크 실행 중...', file=sys.stderr)
+        results['benchmarks']['sectors'] = bench_sectors.run()
+    if 'instrumentation' in args.only:
+        print('span / Server-Timing 계측 확인 중...', file=sys.stderr)
+        results['benchmarks']['instrumentation'] = bench_instrumentation.run()
+    if 'delivery' in args.only:
+        print('발송 벤치마크 실행 중...', file=sys.stderr)
+        results['benchmarks']['delivery'] = bench_delivery.run(args.delivery_emails, args.delivery_slack)
+
+    output_path = write_results(results, args.output)
+    print(f"결과 저장: {output_path}", file=sys.stderr)
+
+    exit_code = 0
+    for violation in results['benchmarks'].get('startup', {}).get('violations', []):
+        print(f"예산 위반: {violation}", file=sys.stderr)
+        exit_code = 1
+    for violation in results['benchmarks'].get('instrumentation', {}).get('violations', []):
+        print(f"계측 누락: {violation}", file=sys.stderr)
+        exit_code = 1
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = compare(results, baseline)
+        for row in rows:
+            marker = '  <-- 회귀' if row['regression'] else ''
+            print(f"{row['metric']:<70} {row['baseline']:>10.2f} -> {row['current']:>10.2f} ({row['change']:+.1%}){marker}")
+        if any(row['regression'] for row in rows):
+            exit_code = 1
+
+    print(json.dumps(results['benchmarks'], ensure_ascii=False, indent=2))
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,418 @@
+"""
+기록된 응답을 재생하는 외부 서비스 대역 (Yahoo / Exa / Gemini)
+
+fixtures/ 아래 JSON(실제 응답 형식)을 그대로 돌려주고, 호출마다 설정한 지연 시간만큼 기다립니다.
+install_stubs()로 감싼 구간에서만 모듈 속성을 바꾸고 끝나면 원래대로 되돌립니다.
+발송 벤치마크용 로컬 SMTP 수신 서버(SmtpSink)와 슬랙 웹훅 서버(WebhookStub)도 여기에 둡니다.
+"""
+import json
+import tempfile
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+from unittest import mock
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+# 기본 지연 시간 (ms) - 실제 서비스 응답 시간 중앙값 수준
+DEFAULT_LATENCY_MS = {
+    'yahoo_screener': 350,
+    'yahoo_ticker': 120,
+    'exa': 900,
+    'gemini': 1200,
+}
+
+
+def load_fixture(name: str) -> Dict:
+    with open(FIXTURES_DIR / f"{name}.json", encoding='utf-8') as f:
+        return json.load(f)
+
+
+class _Latency:
+    def __init__(self, latency_ms: Dict[str, float]):
+        self.latency_ms = {**DEFAULT_LATENCY_MS, **latency_ms}
+        self.calls: Dict[str, int] = {}
+
+    def wait(self, provider: str) -> None:
+        self.calls[provider] = self.calls.get(provider, 0) + 1
+        delay = self.latency_ms.get(provider, 0)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+
+# ============================================================================
+# Yahoo (yahooquery Screener / Ticker)
+# ============================================================================
+
+def _make_screener(latency: _Latency, screeners: Dict):
+    class FakeScreener:
+        def get_screeners(self, screen_ids, count=25):
+            latency.wait('yahoo_screener')
+            if isinstance(screen_ids, str):
+                screen_ids = screen_ids.split()
+            return {
+                screen_id: {**screeners[screen_id], 'quotes': screeners[screen_id]['quotes'][:count]}
+                for screen_id in screen_ids if screen_id in screeners
+            }
+
+    return FakeScreener
+
+
+def _make_ticker(latency: _Latency, modules: Dict):
+    def module_property(module: str):
+        def getter(self):
+            latency.wait('yahoo_ticker')
+            return {
+                symbol: modules[symbol][module] if symbol in modules else f"Quote not found for ticker symbol: {symbol}"
+                for symbol in self.symbols
+            }
+        return property(getter)
+
+    class FakeTicker:
+        def __init__(self, symbols, **kwargs):
+            self.symbols = symbols.split() if isinstance(symbols, str) else list(symbols)
+
+        quotes = module_property('quotes')
+        summary_detail = module_property('summary_detail')
+        summary_profile = module_property('summary_profile')
+        financial_data = module_property('financial_data')
+
+    return FakeTicker
+
+
+# ============================================================================
+# Exa (requests.post)
+# ============================================================================
+
+class _FakeResponse:
+    def __init__(self, payload: Dict):
+        self._payload = payload
+        self.status_code = 200
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> Dict:
+        return self._payload
+
+
+def _make_exa_requests(latency: _Latency, recorded: Dict, modules: Dict):
+    import requests
+
+    class RequestsProxy:
+        """exa_news가 쓰는 requests 모듈 대역 (post만 재생, 나머지는 실제 모듈)"""
+
+        def __getattr__(self, name):
+            return getattr(requests, name)
+
+        @staticmethod
+        def post(url, headers=None, json=None, timeout=None):
+            latency.wait('exa')
+            query = (json or {}).get('query', '')
+            symbol = query.split()[0] if query else 'AAPL'
+            name = modules.get(symbol, {}).get('quotes', {}).get('shortName', symbol)
+            now = datetime.now()
+            results = []
+            for item in recorded['results'][:(json or {}).get('num_results', 10)]:
+                results.append({
+                    'title': item['title'].format(symbol=symbol, name=name),
+                    'url': item['url'].format(symbol=symbol.lower()),
+                    'publishedDate': (now - timedelta(days=item['daysAgo'], hours=1)).strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+                    'author': item['author'],
+                    'text': item['text'].format(symbol=symbol, name=name),
+                })
+            return _FakeResponse({'results': results, 'requestId': recorded.get('requestId', '')})
+
+    return RequestsProxy()
+
+
+# ============================================================================
+# Gemini (genai.Client)
+# ============================================================================
+
+def _make_gemini_client(latency: _Latency, recorded: Dict):
+    class FakeResponse:
+        def __init__(self, text: str):
+            self.text = text
+
+    class FakeModels:
+        @staticmethod
+        def generate_content(model, contents, **kwargs):
+            latency.wait('gemini')
+            prompt = contents if isinstance(contents, str) else str(contents)
+            for rule in recorded['rules']:
+                if rule['match'] in prompt:
+                    return FakeResponse(rule['text'])
+            return FakeResponse(recorded['default'])
+
+    class FakeClient:
+        models = FakeModels()
+
+    return FakeClient()
+
+
+# ============================================================================
+# 실시간 시세 (quote_stream.QuoteSource)
+# ============================================================================
+
+class FakeQuoteSource:
+    """
+    무작위 보행 시세 (quote_stream.QuoteHub 대역)
+
+    fetch()마다 change_ratio 비율의 종목만 가격/거래량이 바뀝니다.
+    """
+
+    def __init__(self, latency_ms: float = 0, change_ratio: float = 0.3, seed: int = 0):
+        import random
+
+        self.latency_ms = latency_ms
+        self.change_ratio = change_ratio
+        self.calls = 0
+        self.symbols_requested = 0
+        self._random = random.Random(seed)
+        self._quotes: Dict[str, Dict] = {}
+
+    def fetch(self, symbols):
+        self.calls += 1
+        self.symbols_requested += len(symbols)
+        if self.latency_ms > 0:
+            time.sleep(self.latency_ms / 1000)
+
+        result = {}
+        for symbol in symbols:
+            quote = self._quotes.get(symbol)
+            if quote is None:
+                price = round(self._random.uniform(10, 500), 2)
+                quote = {
+                    'name': f"{symbol} Inc.", 'price': price, 'change': 0.0, 'change_percent': 0.0,
+                    'volume': self._random.randint(100_000, 50_000_000), 'market_cap': int(price * 1e9),
+                    'previous_close': price,
+                }
+            elif self._random.random() < self.change_ratio:
+                price = round(max(0.01, quote['price'] * (1 + self._random.gauss(0, 0.002))), 2)
+                change = round(price - quote['previous_close'], 2)
+                quote = {
+                    **quote, 'price': price, 'change': change,
+                    'change_percent': round(change / quote['previous_close'] * 100, 4),
+                    'volume': quote['volume'] + self._random.randint(100, 100_000),
+                }
+            self._quotes[symbol] = quote
+            result[symbol] = {key: value for key, value in quote.items() if key != 'previous_close'}
+        return result
+
+
+# ============================================================================
+# 발송 (SMTP 수신 서버 / 슬랙 웹훅 서버)
+# ============================================================================
+
+def _free_port() -> int:
+    import socket
+
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class SmtpSink:
+    """
+    메일을 저장하지 않고 세기만 하는 로컬 SMTP 서버 (aiosmtpd)
+
+    - refused_domain 주소는 RCPT 단계에서 550 (영구 오류)
+    - defer_every번째 메시지마다 DATA 단계에서 451 (임시 오류 → 재시도)
+    """
+
+    def __init__(self, defer_every: int = 0, refused_domain: str = 'refused.invalid'):
+        self.defer_every = defer_every
+        self.refused_domain = refused_domain
+        self.port = 0
+        self.connections = 0
+        self.data_commands = 0
+        self.deferred = 0
+        self.refused = 0
+        self.recipients: Dict[str, int] = {}
+        self._controller = None
+
+    # aiosmtpd 핸들러 훅
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.connections += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.lower().endswith('@' + self.refused_domain):
+            self.refused += 1
+            return '550 5.1.1 No such user'
+        envelope.rcpt_tos.append(address)
+        return '250 OK'
+
+    async def handle_DATA(self, server, session, envelope):
+        self.data_commands += 1
+        if self.defer_every and self.data_commands % self.defer_every == 0:
+            self.deferred += 1
+            return '451 4.3.0 Try again later'
+        for address in envelope.rcpt_tos:
+            self.recipients[address] = self.recipients.get(address, 0) + 1
+        return '250 Message accepted'
+
+    def __enter__(self) -> 'SmtpSink':
+        from aiosmtpd.controller import Controller
+
+        self.port = _free_port()
+        self._controller = Controller(self, hostname='127.0.0.1', port=self.port)
+        self._controller.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._controller.stop()
+
+
+class WebhookStub:
+    """
+    슬랙 웹훅 흉내 HTTP 서버 (keep-alive)
+
+    - /invalid... 경로는 404 (삭제된 웹훅 - 영구 오류)
+    - throttle_every번째 요청마다 429 + Retry-After: 0 (임시 오류 → 재시도)
+    """
+
+    def __init__(self, throttle_every: int = 0):
+        self.throttle_every = throttle_every
+        self.port = 0
+        self.requests = 0
+        self.throttled = 0
+        self.not_found = 0
+        self.delivered: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.port}/{path.lstrip('/')}"
+
+    def _respond(self, path: str, body: bytes):
+        with self._lock:
+            self.requests += 1
+            if path.startswith('/invalid'):
+                self.not_found += 1
+                return 404, {}, b'no_service'
+            if self.throttle_every and self.requests % self.throttle_every == 0:
+                self.throttled += 1
+                return 429, {'Retry-After': '0'}, b'rate_limited'
+            channel = json.loads(body).get('channel', '')
+            self.delivered[channel] = self.delivered.get(channel, 0) + 1
+            return 200, {'X-Slack-Req-Id': f"req-{self.requests}"}, b'ok'
+
+    def __enter__(self) -> 'WebhookStub':
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                status, headers, payload = stub._respond(self.path, body)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='webhook-stub', daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+# ============================================================================
+# 설치 / 격리
+# ============================================================================
+
+@contextmanager
+def install_stubs(latency_ms: Optional[Dict[str, float]] = None) -> Iterator[_Latency]:
+    """
+    Yahoo / Exa / Gemini 호출을 기록된 응답 재생으로 바꿉니다.
+
+    Args:
+        latency_ms: 서비스별 지연 시간 (ms) - 키: yahoo_screener, yahoo_ticker, exa, gemini
+
+    Yields:
+        호출 수(calls)를 담은 지연 설정 객체
+    """
+    import yahooquery
+    import exa_news
+    import gemini_briefing
+
+    latency = _Latency(latency_ms or {})
+    screener_cls = _make_screener(latency, load_fixture('screener'))
+    modules = load_fixture('ticker_modules')
+    ticker_cls = _make_ticker(latency, modules)
+    gemini_client = _make_gemini_client(latency, load_fixture('gemini'))
+
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.object(yahooquery, 'Screener', screener_cls))
+        stack.enter_context(mock.patch.object(yahooquery, 'Ticker', ticker_cls))
+        stack.enter_context(mock.patch.object(exa_news, 'requests', _make_exa_requests(latency, load_fixture('exa_search'), modules)))
+        stack.enter_context(mock.patch.object(exa_news, 'EXA_API_KEY', 'benchmark'))
+        stack.enter_context(mock.patch.object(gemini_briefing, 'initialize_client', lambda api_key=None: gemini_client))
+        yield latency
+
+
+@contextmanager
+def isolated_output(base_dir: Optional[Path] = None) -> Iterator[Path]:
+    """
+    저장소/캐시/체크포인트/아웃박스 경로를 임시 디렉토리로 바꿉니다.
+    (실제 output/ 데이터를 건드리지 않고, 매번 빈 캐시에서 측정)
+
+    Args:
+        base_dir: 사용할 디렉토리 (기본값: 새 임시 디렉토리, 종료 시 삭제)
+    """
+    import briefing_store
+    import cache_db
+    import daily_briefing_workflow
+    import delivery_outbox
+    import get_trending_stocks
+    import llm_cache
+    import news_cache
+    import search_index
+    import workflow_checkpoint
+    from services import briefing_service
+
+    with ExitStack() as stack:
+        if base_dir is None:
+            base_dir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix='briefing_bench_')))
+        base_dir.mkdir(parents=True, exist_ok=True)
+
+        patches = [
+            (cache_db, 'CACHE_DB_PATH', base_dir / 'cache.db'),
+            (briefing_store, 'OUTPUT_DIR', base_dir),
+            (briefing_store, 'DB_PATH', base_dir / 'briefings.db'),
+            (search_index, 'INDEX_PATH', base_dir / 'search_index.db'),
+            (workflow_checkpoint, 'CHECKPOINT_DIR', base_dir / 'checkpoints'),
+            (daily_briefing_workflow, 'OUTPUT_DIR', base_dir),
+            (briefing_service, 'OUTPUT_DIR', base_dir),
+            (delivery_outbox, 'OUTBOX_DB_PATH', base_dir / 'outbox.db'),
+            # 싱글톤은 새 경로로 다시 만들어지도록 비움
+            (briefing_store, '_default_store', None),
+            (search_index, '_default_index', None),
+            (news_cache, '_default_cache', None),
+            (llm_cache, '_default_cache', None),
+            (delivery_outbox, '_default_outbox', None),
+            (get_trending_stocks, '_snapshot_schema_ready', False),
+        ]
+        for module, attr, value in patches:
+            stack.enter_context(mock.patch.object(module, attr, value))
+        yield base_dir
@@ -0,0 +1,491 @@
+"""
+브리핑 영구 저장소 (SQLite)
+
+output/ 폴더의 브리핑 JSON 파일을 대체하는 내장 SQLite 저장소입니다.
+- 필터에 사용하는 컬럼(종목, 생성 시각, 상태)은 인덱스 컬럼으로 저장
+- 섹션, 뉴스 등 큰 데이터는 zlib 압축 JSON 블롭으로 저장
+- 기존 briefing_*.json 파일은 마이그레이션으로 한 번 가져옴
+"""
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from cache_db import pack, unpack
+from instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+# 저장소 경로 설정
+OUTPUT_DIR = Path(__file__).parent / 'output'
+DB_PATH = OUTPUT_DIR / 'briefings.db'
+
+
+# ============================================================================
+# 스키마 마이그레이션
+# ============================================================================
+
+def _migration_001_create_schema(conn: sqlite3.Connection, store: 'BriefingStore') -> None:
+    """briefings 테이블 및 필터용 인덱스 생성"""
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS briefings (
+            briefing_id   TEXT PRIMARY KEY,
+            stock_symbol  TEXT NOT NULL DEFAULT '',
+            generated_at  TEXT NOT NULL,
+            status        TEXT NOT NULL DEFAULT 'completed',
+            language      TEXT NOT NULL DEFAULT 'ko',
+            title         TEXT NOT NULL DEFAULT '',
+            summary       TEXT NOT NULL DEFAULT '',
+            image_path    TEXT,
+            stocks_json   TEXT NOT NULL DEFAULT '[]',
+            briefing_blob BLOB,
+            sections_blob BLOB,
+            stock_blob    BLOB,
+            news_blob     BLOB,
+            created_at    TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_briefings_generated_at
+            ON briefings (generated_at);
+        CREATE INDEX IF NOT EXISTS idx_briefings_symbol_generated_at
+            ON briefings (stock_symbol, generated_at);
+        CREATE INDEX IF NOT EXISTS idx_briefings_status_generated_at
+            ON briefings (status, generated_at);
+    """)
+
+
+def _migration_002_import_json_files(conn: sqlite3.Connection, store: 'BriefingStore') -> None:
+    """기존 output/briefing_*.json 파일 가져오기"""
+    imported = store.import_json_files(store.legacy_dir, conn=conn)
+    if imported:
+        logger.info(f"기존 브리핑 JSON {imported}개를 저장소로 가져왔습니다.")
+
+
+# PRAGMA user_version 기준으로 순서대로 적용
+MIGRATIONS = [
+    _migration_001_create_schema,
+    _migration_002_import_json_files,
+]
+
+
+class BriefingStore:
+    """브리핑 저장소 (Repository)"""
+
+    def __init__(self, db_path: Optional[Path] = None, legacy_dir: Optional[Path] = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본값: output/briefings.db)
+            legacy_dir: 마이그레이션 시 가져올 JSON 파일 디렉토리 (기본값: output/)
+        """
+        self.db_path = Path(db_path) if db_path else DB_PATH
+        self.legacy_dir = Path(legacy_dir) if legacy_dir else self.db_path.parent
+        self._local = threading.local()
+        self._migrate_lock = threading.Lock()
+        self._migrated = False
+
+    # ========================================================================
+    # 연결 관리
+    # ========================================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 반환 (FastAPI 스레드풀에서 안전하게 사용)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+
+        if not self._migrated:
+            self._migrate(conn)
+        return conn
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """미적용 마이그레이션 실행"""
+        with self._migrate_lock:
+            if self._migrated:
+                return
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            for index, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+                logger.info(f"브리핑 저장소 마이그레이션 적용: {index} ({migration.__name__})")
+                with conn:
+                    migration(conn, self)
+                    conn.execute(f'PRAGMA user_version = {index}')
+            self._migrated = True
+
+    def close(self) -> None:
+        """현재 스레드의 연결 종료"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ========================================================================
+    # 쓰기
+    # ========================================================================
+
+    @staticmethod
+    def generate_briefing_id(stock_symbol: str, generated_at: Optional[datetime] = None) -> str:
+        """브리핑 ID 생성 (기존 JSON 파일명과 같은 형식)"""
+        timestamp = (generated_at or datetime.now()).strftime('%Y%m%d_%H%M%S')
+        return f"briefing_{stock_symbol or 'UNKNOWN'}_{timestamp}"
+
+    @timed('serialize.briefing_store')
+    def save(
+        self,
+        briefing_data: Dict,
+        stock_data: Dict,
+        briefing_id: Optional[str] = None,
+        created_at: Optional[str] = None,
+        status: str = 'completed',
+        conn: Optional[sqlite3.Connection] = None
+    ) -> str:
+        """
+        브리핑 저장 (같은 ID가 있으면 덮어씀)
+
+        Args:
+            briefing_data: 브리핑 데이터 (title, summary, sections 등)
+            stock_data: 종목 데이터 (news_articles 포함 가능)
+            briefing_id: 브리핑 ID (없으면 생성)
+            created_at: 저장 시각 (ISO 8601)
+            status: 브리핑 상태
+            conn: 사용할 연결 (마이그레이션 중 내부 사용)
+
+        Returns:
+            저장된 브리핑 ID
+        """
+        briefing_data = briefing_data or {}
+        stock_data = stock_data or {}
+        created_at = created_at or datetime.now().isoformat()
+
+        stock_symbol = (stock_data.get('symbol') or briefing_data.get('stock_symbol') or '').upper()
+        briefing_id = briefing_id or self.generate_briefing_id(stock_symbol)
+        generated_at = briefing_data.get('generated_at') or created_at
+
+        stocks_included = []
+        if stock_data:
+            stocks_included.append({
+                "symbol": stock_data.get('symbol', ''),
+                "name": stock_data.get('name', ''),
+                "price": stock_data.get('price', 0),
+                "change_percent": stock_data.get('change_percent', 0),
+                "volume": stock_data.get('volume', 0)
+            })
+
+        briefing_rest = {k: v for k, v in briefing_data.items() if k != 'sections'}
+        stock_rest = {k: v for k, v in stock_data.items() if k != 'news_articles'}
+
+        row = (
+            briefing_id,
+            stock_symbol,
+            generated_at,
+            status,
+            briefing_data.get('language', 'ko'),
+            briefing_data.get('title', ''),
+            briefing_data.get('summary', ''),
+            briefing_data.get('image_path'),
+            json.dumps(stocks_included, ensure_ascii=False),
+            pack(briefing_rest),
+            pack(briefing_data.get('sections', [])),
+            pack(stock_rest),
+            pack(stock_data.get('news_articles', [])),
+            created_at,
+        )
+
+        target = conn or self._connect()
+        with target:
+            target.execute(
+                """
+                INSERT OR REPLACE INTO briefings (
+                    briefing_id, stock_symbol, generated_at, status, language,
+                    title, summary, image_path, stocks_json,
+                    briefing_blob, sections_blob, stock_blob, news_blob, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                row
+            )
+
+        return briefing_id
+
+    def delete(self, briefing_id: str) -> bool:
+        """브리핑 삭제 (검색 인덱스의 해당 브리핑 문서도 함께 삭제)"""
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute('DELETE FROM briefings WHERE briefing_id = ?', (briefing_id,))
+        if cursor.rowcount > 0:
+            try:
+                from search_index import get_search_index
+                get_search_index().remove_briefing(briefing_id)
+            except Exception as e:
+                logger.warning(f"검색 인덱스 삭제 실패: {briefing_id}, 오류: {str(e)}")
+        return cursor.rowcount > 0
+
+    # ========================================================================
+    # 읽기
+    # ========================================================================
+
+    @staticmethod
+    def _row_to_summary(row: sqlite3.Row) -> Dict:
+        """목록용 레코드 (압축 블롭 중 섹션만 해제)"""
+        return {
+            'briefing_id': row['briefing_id'],
+            'stock_symbol': row['stock_symbol'],
+            'generated_at': row['generated_at'],
+            'status': row['status'],
+            'language': row['language'],
+            'title': row['title'],
+            'summary': row['summary'],
+            'image_path': row['image_path'],
+            'stocks': json.loads(row['stocks_json']),
+            'sections': unpack(row['sections_blob'], []),
+            'created_at': row['created_at'],
+        }
+
+    def get(self, briefing_id: str) -> Optional[Dict]:
+        """
+        브리핑 단건 조회 (기본키 인덱스 사용)
+
+        Returns:
+            {'briefing_id', 'briefing', 'stock_data', 'generated_at', 'status', 'created_at', ...}
+            또는 None
+        """
+        row = self._connect().execute(
+            'SELECT * FROM briefings WHERE briefing_id = ?', (briefing_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        record = self._row_to_summary(row)
+
+        briefing = unpack(row['briefing_blob'], {})
+        briefing['sections'] = record['sections']
+        stock_data = unpack(row['stock_blob'], {})
+        news_articles = unpack(row['news_blob'], [])
+        if news_articles:
+            stock_data['news_articles'] = news_articles
+
+        record['briefing'] = briefing
+        record['stock_data'] = stock_data
+        return record
+
+    def list(
+        self,
+        page: int = 1,
+        limit: int = 20,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        stock_symbol: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Tuple[List[Dict], int]:
+        """
+        브리핑 목록 조회 (최신순, 인덱스 컬럼으로 필터링)
+
+        Returns:
+            (브리핑 레코드 리스트, 전체 개수)
+        """
+        conditions = []
+        params: List[Any] = []
+
+        if stock_symbol:
+            conditions.append('stock_symbol = ?')
+            params.append(stock_symbol.upper())
+        if status:
+            conditions.append('status = ?')
+            params.append(status)
+        if start_date:
+            conditions.append('generated_at >= ?')
+            params.append(start_date)
+        if end_date:
+            conditions.append('generated_at <= ?')
+            params.append(end_date)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        conn = self._connect()
+
+        total = conn.execute(f'SELECT COUNT(*) FROM briefings {where}', params).fetchone()[0]
+        rows = conn.execute(
+            f"""
+            SELECT briefing_id, stock_symbol, generated_at, status, language, title,
+                   summary, image_path, stocks_json, sections_blob, created_at
+            FROM briefings {where}
+            ORDER BY generated_at DESC
+            LIMIT ? OFFSET ?
+            """,
+            params + [limit, (page - 1) * limit]
+        ).fetchall()
+
+        return [self._row_to_summary(row) for row in rows], total
+
+    def iter_all(self, batch_size: int = 500):
+        """모든 브리핑 레코드를 오래된 순으로 순회 (전체 내보내기/색인용)"""
+        last_key = ('', '')
+        conn = self._connect()
+        while True:
+            rows = conn.execute(
+                """
+                SELECT briefing_id FROM briefings
+                WHERE (generated_at, briefing_id) > (?, ?)
+                ORDER BY generated_at, briefing_id
+                LIMIT ?
+                """,
+                (last_key[0], last_key[1], batch_size)
+            ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                record = self.get(row['briefing_id'])
+                if record:
+                    last_key = (record['generated_at'], record['briefing_id'])
+                    yield record
+
+    def iter_stock_rows(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        stock_symbol: Optional[str] = None,
+        batch_size: int = 1000
+    ):
+        """
+        모든 브리핑에 포함된 종목을 한 행씩 오래된 순으로 순회 (이력 내보내기용)
+        stock_symbol을 주면 그 종목의 브리핑에서 그 종목 행만 내보냅니다.
+
+        압축 블롭은 읽지 않고 stocks_json만 배치 단위로 가져오므로 브리핑 수와 관계없이 메모리 사용량이 일정합니다.
+
+        Yields:
+            {'generated_at', 'briefing_id', 'title', 'symbol', 'name', 'price', 'change_percent', 'volume'}
+        """
+        conditions = ['(generated_at, briefing_id) > (?, ?)']
+        params: List[Any] = []
+        symbol = stock_symbol.upper() if stock_symbol else None
+        if symbol:
+            conditions.append('stock_symbol = ?')
+            params.append(symbol)
+        if start_date:
+            conditions.append('generated_at >= ?')
+            params.append(start_date)
+        if end_date:
+            conditions.append('generated_at <= ?')
+            params.append(end_date)
+
+        last_key = ('', '')
+        conn = self._connect()
+        while True:
+            rows = conn.execute(
+                f"""
+                SELECT briefing_id, generated_at, title, stocks_json FROM briefings
+                WHERE {' AND '.join(conditions)}
+                ORDER BY generated_at, briefing_id
+                LIMIT ?
+                """,
+                (*last_key, *params, batch_size)
+            ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                for stock in json.loads(row['stocks_json']):
+                    # 종목 필터는 브리핑 선택뿐 아니라 행에도 적용 (같은 브리핑의 다른 종목 제외)
+                    if symbol and str(stock.get('symbol') or '').upper() != symbol:
+                        continue
+                    yield {
+                        'generated_at': row['generated_at'],
+                        'briefing_id': row['briefing_id'],
+                        'title': row['title'],
+                        **stock,
+                    }
+            last_key = (rows[-1]['generated_at'], rows[-1]['briefing_id'])
+
+    def count(self) -> int:
+        """저장된 브리핑 수"""
+        return self._connect().execute('SELECT COUNT(*) FROM briefings').fetchone()[0]
+
+    # ========================================================================
+    # 마이그레이션 (기존 JSON 파일 가져오기)
+    # ========================================================================
+
+    def import_json_files(
+        self,
+        directory: Optional[Path] = None,
+        conn: Optional[sqlite3.Connection] = None
+    ) -> int:
+        """
+        briefing_*.json 파일을 저장소로 가져옵니다. 파일명(확장자 제외)이 브리핑 ID가 됩니다.
+
+        Args:
+            directory: JSON 파일 디렉토리 (기본값: legacy_dir)
+            conn: 사용할 연결
+
+        Returns:
+            가져온 파일 수
+        """
+        directory = Path(directory) if directory else self.legacy_dir
+        if not directory.exists():
+            return 0
+
+        from search_index import get_search_index
+
+        imported = 0
+        for json_file in sorted(directory.glob('briefing_*.json')):
+            try:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+
+                briefing_id = self.save(
+                    briefing_data=data.get('briefing', {}),
+                    stock_data=data.get('stock_data', {}),
+                    briefing_id=json_file.stem,
+                    created_at=data.get('created_at') or datetime.fromtimestamp(
+                        json_file.stat().st_mtime
+                    ).isoformat(),
+                    conn=conn
+                )
+                imported += 1
+            except Exception as e:
+                logger.warning(f"브리핑 JSON 가져오기 실패: {json_file.name}, 오류: {str(e)}")
+                continue
+
+            # 가져온 브리핑도 바로 검색되도록 색인 (실패해도 가져오기 결과에는 영향 없음)
+            try:
+                get_search_index().index_briefing(briefing_id, data.get('briefing', {}), data.get('stock_data', {}))
+            except Exception as e:
+                logger.warning(f"검색 인덱스 갱신 실패: {briefing_id}, 오류: {str(e)}")
+
+        return imported
+
+
+# 기본 저장소 인스턴스 (지연 생성)
+_default_store: Optional[BriefingStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_briefing_store() -> BriefingStore:
+    """기본 브리핑 저장소 반환"""
+    global _default_store
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = BriefingStore()
+    return _default_store
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='브리핑 저장소 관리')
+    parser.add_argument(
+        '--import-json',
+        metavar='DIR',
+        help='지정한 디렉토리의 briefing_*.json 파일을 가져오기'
+    )
+    args = parser.parse_args()
+
+    store = get_briefing_store()
+    if args.import_json:
+        count = store.import_json_files(Path(args.import_json))
+        print(f"가져온 브리핑: {count}개")
+    print(f"저장된 브리핑: {store.count()}개 ({store.db_path})")
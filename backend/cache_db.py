@@ -0,0 +1,62 @@
+"""
+로컬 캐시 공용 SQLite 데이터베이스 (output/cache.db)
+
+뉴스 검색, LLM 응답 등 재계산 가능한 외부 API 결과를 보관합니다.
+삭제해도 다음 요청에서 다시 채워지므로 백업 대상이 아닙니다.
+"""
+import json
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Optional
+
+# 캐시 DB 경로 설정
+CACHE_DB_PATH = Path(__file__).parent / 'output' / 'cache.db'
+
+_local = threading.local()
+
+
+def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """
+    스레드별 캐시 DB 연결 반환
+
+    Args:
+        db_path: DB 파일 경로 (기본값: output/cache.db)
+
+    Returns:
+        sqlite3 연결 (WAL 모드, Row 팩토리)
+    """
+    path = Path(db_path) if db_path else CACHE_DB_PATH
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    conn = connections.get(path)
+    if conn is None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        connections[path] = conn
+    return conn
+
+
+# ============================================================================
+# 압축 블롭 헬퍼 (캐시 테이블과 브리핑 저장소가 같은 형식을 사용)
+# ============================================================================
+
+def pack(value: Any) -> Optional[bytes]:
+    """JSON 직렬화 후 zlib 압축 (None은 NULL 컬럼용으로 그대로 None)"""
+    if value is None:
+        return None
+    payload = json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=str)
+    return zlib.compress(payload.encode('utf-8'), 6)
+
+
+def unpack(blob: Optional[bytes], default: Any = None) -> Any:
+    """zlib 압축 해제 후 JSON 역직렬화 (NULL이면 default)"""
+    if blob is None:
+        return default
+    return json.loads(zlib.decompress(blob).decode('utf-8'))
@@ -0,0 +1,475 @@
+"""
+주가 차트 데이터 / 스파크라인 이미지
+
+- Yahoo Finance 가격 이력(OHLCV)을 구간별로 받아 cache.db에 보관
+- LTTB(Largest-Triangle-Three-Buckets)로 목표 점 개수까지 줄여서 API로 제공
+- 카드 / DOCX 리포트용 스파크라인 PNG를 (종목, 구간, 크기)별로 캐시
+
+캐시는 마지막 봉(시각 + 종가)을 지문으로 사용합니다. 새 봉이 들어오거나 진행 중인 봉의 종가가 바뀌면
+지문이 달라져서 해당 종목/구간의 이미지를 다시 그립니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import resilience
+from cache_db import get_connection, pack, unpack
+from instrumentation import span, timed
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 구간 → (yahoo interval, 가격 이력 캐시 유지 시간(초))
+RANGES: Dict[str, Tuple[str, int]] = {
+    '1d': ('5m', 60),
+    '5d': ('15m', 5 * 60),
+    '1mo': ('1h', 15 * 60),
+    '3mo': ('1d', 60 * 60),
+    '6mo': ('1d', 60 * 60),
+    '1y': ('1d', 60 * 60),
+    '5y': ('1wk', 6 * 60 * 60),
+}
+
+DEFAULT_RANGE = '1mo'
+
+# OHLCV 열 순서 (가격 이력 배열)
+FIELDS = ('t', 'open', 'high', 'low', 'close', 'volume')
+
+# 스파크라인 색상 (상승 / 하락)
+UP_COLOR = (34, 197, 94)
+DOWN_COLOR = (239, 68, 68)
+
+# 스파크라인 크기 제한 (px)
+MAX_SPARKLINE_SIZE = (1200, 600)
+
+# DOCX 리포트 / 브리핑 카드에 넣을 스파크라인 파일 저장 위치
+CHARTS_DIR = Path(__file__).parent / 'output' / 'charts'
+
+
+class ChartDataNotFound(ValueError):
+    """가격 이력이 없는 종목/구간"""
+
+
+# ============================================================================
+# LTTB 다운샘플링
+# ============================================================================
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets로 남길 점의 인덱스 선택
+
+    첫 점과 마지막 점은 항상 남기고, 나머지를 (threshold - 2)개 버킷으로 나눠 버킷마다
+    (앞에서 고른 점, 현재 점, 다음 버킷 평균)이 이루는 삼각형 넓이가 가장 큰 점을 고릅니다.
+    버킷 경계와 다음 버킷 평균은 한 번에 계산하고, 버킷 안의 넓이 계산도 배열 연산으로 처리합니다
+    (앞 점에 의존하는 부분만 버킷 수만큼 반복).
+
+    Args:
+        x: 가로축 값 (오름차순)
+        y: 세로축 값
+        threshold: 남길 점 개수 (3 이상)
+
+    Returns:
+        오름차순 인덱스 배열 (길이 min(threshold, len(x)))
+    """
+    import numpy as np
+
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # 첫/마지막 점을 뺀 가운데 점들을 버킷으로 나눔
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+
+    # 버킷별 평균 (누적합으로 한 번에), 마지막 버킷의 "다음 평균"은 마지막 점
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+    counts = ends - starts
+    avg_x = np.append((cum_x[ends] - cum_x[starts]) / counts, x[-1])[1:]
+    avg_y = np.append((cum_y[ends] - cum_y[starts]) / counts, y[-1])[1:]
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for bucket, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        ax, ay = x[a], y[a]
+        # 삼각형 넓이의 2배 (절댓값 비교만 하므로 1/2 생략)
+        area = np.abs((ax - avg_x[bucket]) * (y[start:end] - ay) - (ax - x[start:end]) * (avg_y[bucket] - ay))
+        a = start + int(area.argmax())
+        selected[bucket + 1] = a
+    return selected
+
+
+def downsample_ohlcv(bars: Dict[str, np.ndarray], points: int) -> Dict[str, np.ndarray]:
+    """
+    OHLCV 배열을 points개 봉으로 축소
+
+    종가 기준 LTTB로 고른 봉을 경계로 구간을 나누고, 구간마다 시가=첫 시가, 고가=최고, 저가=최저,
+    종가=경계 봉의 종가, 거래량=합계로 합칩니다. 고른 봉이 구간의 마지막 봉이므로 OHLC가 서로 맞습니다.
+
+    Args:
+        bars: FIELDS 키를 가진 같은 길이의 배열
+        points: 목표 봉 개수
+
+    Returns:
+        같은 키의 축소된 배열 (원래 봉 수가 points 이하이면 그대로)
+    """
+    import numpy as np
+
+    n = len(bars['t'])
+    if points >= n or points < 3:
+        return bars
+
+    selected = lttb_indices(bars['t'], bars['close'], points)
+    # 구간 시작 인덱스: 첫 구간은 0, 이후는 앞 경계 + 1
+    starts = np.concatenate(([0], selected[:-1] + 1))
+    return {
+        't': bars['t'][selected],
+        'open': bars['open'][starts],
+        'high': np.maximum.reduceat(bars['high'], starts),
+        'low': np.minimum.reduceat(bars['low'], starts),
+        'close': bars['close'][selected],
+        'volume': np.add.reduceat(bars['volume'], starts),
+    }
+
+
+def bars_fingerprint(bars: Dict[str, np.ndarray]) -> str:
+    """마지막 봉(시각 + 종가) 지문 (새 봉 / 진행 중인 봉의 가격 변화 감지)"""
+    if not len(bars['t']):
+        return 'empty'
+    raw = f"{int(bars['t'][-1])}:{float(bars['close'][-1]):.6f}:{len(bars['t'])}"
+    return hashlib.sha1(raw.encode('ascii')).hexdigest()[:16]
+
+
+def to_records(bars: Dict[str, np.ndarray]) -> List[Dict]:
+    """배열 → API 응답용 봉 목록 (date는 UTC ISO 8601)"""
+    import numpy as np
+
+    dates = np.datetime_as_string(bars['t'].astype('datetime64[s]'), unit='s', timezone='UTC')
+    columns = [bars[field].tolist() for field in FIELDS[1:]]
+    return [
+        {
+            'date': date,
+            'open': round(open_, 4),
+            'high': round(high, 4),
+            'low': round(low, 4),
+            'close': round(close, 4),
+            'volume': int(volume),
+        }
+        for date, open_, high, low, close, volume in zip(dates.tolist(), *columns)
+    ]
+
+
+# ============================================================================
+# 스파크라인
+# ============================================================================
+
+@timed('render.sparkline')
+def render_sparkline(
+    closes: np.ndarray,
+    width: int,
+    height: int,
+    background: Optional[Tuple[int, int, int]] = None
+) -> bytes:
+    """
+    종가 스파크라인 PNG
+
+    폭(px)만큼 LTTB로 줄인 뒤 2배 크기로 그려서 축소합니다 (계단 현상 완화).
+    마지막 종가가 첫 종가 이상이면 녹색, 아니면 빨간색입니다.
+
+    Args:
+        closes: 종가 배열 (시간순)
+        width: 이미지 폭 (px)
+        height: 이미지 높이 (px)
+        background: 배경색 (None이면 투명)
+
+    Returns:
+        PNG 바이트
+    """
+    import numpy as np
+    from PIL import Image, ImageDraw
+
+    scale = 2
+    w, h = width * scale, height * scale
+    pad = 2 * scale
+    mode, fill = ('RGB', background) if background else ('RGBA', (0, 0, 0, 0))
+    image = Image.new(mode, (w, h), fill)
+
+    closes = np.asarray(closes, dtype=np.float64)
+    closes = closes[~np.isnan(closes)]
+    if len(closes) >= 2:
+        index = np.arange(len(closes), dtype=np.float64)
+        keep = lttb_indices(index, closes, max(3, width))
+        xs = index[keep] / (len(closes) - 1) * (w - 2 * pad) + pad
+        low, high = closes.min(), closes.max()
+        value_range = (high - low) or 1.0
+        ys = (h - pad) - (closes[keep] - low) / value_range * (h - 2 * pad)
+
+        color = UP_COLOR if closes[-1] >= closes[0] else DOWN_COLOR
+        points = list(zip(xs.tolist(), ys.tolist()))
+        draw = ImageDraw.Draw(image, 'RGBA')
+        # 선 아래 옅은 영역
+        draw.polygon(points + [(xs[-1], h - pad), (xs[0], h - pad)], fill=color + (40,))
+        draw.line(points, fill=color + (255,), width=2 * scale, joint='curve')
+
+    image = image.reduce(scale)
+    buffer = BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+# ============================================================================
+# 가격 이력 조회 + 캐시
+# ============================================================================
+
+def _fetch_history(symbol: str, range_: str) -> Dict[str, np.ndarray]:
+    """yahooquery Ticker.history → OHLCV 배열"""
+    import numpy as np
+
+    from yahooquery import Ticker
+
+    interval = RANGES[range_][0]
+    ticker = Ticker(symbol)
+    with span('yahoo.ticker.history'):
+        frame = resilience.call('yahoo', lambda: ticker.history(period=range_, interval=interval), hedge=True)
+
+    # 오류면 dict, 데이터가 없으면 빈 DataFrame
+    if isinstance(frame, dict) or getattr(frame, 'empty', True):
+        raise ChartDataNotFound(f"차트 데이터를 찾을 수 없습니다: {symbol} ({range_})")
+
+    import pandas as pd
+
+    frame = frame.reset_index()
+    frame = frame.dropna(subset=['close'])
+    timestamps = pd.to_datetime(frame['date'], utc=True).to_numpy(dtype='datetime64[s]').astype(np.int64)
+    order = np.argsort(timestamps, kind='stable')
+    bars = {'t': timestamps[order]}
+    for field in FIELDS[1:]:
+        column = frame[field] if field in frame else frame['close']
+        bars[field] = column.to_numpy(dtype=np.float64)[order]
+    bars['volume'] = np.nan_to_num(bars['volume'])
+    return bars
+
+
+class ChartCache:
+    """종목/구간별 가격 이력과 스파크라인 PNG 캐시 (SQLite)"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Args:
+            db_path: 캐시 DB 경로 (기본값: output/cache.db)
+        """
+        self.db_path = db_path
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = get_connection(self.db_path)
+        if not self._schema_ready:
+            with conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS chart_bars (
+                        symbol      TEXT NOT NULL,
+                        range       TEXT NOT NULL,
+                        fetched_at  REAL NOT NULL,
+                        fingerprint TEXT NOT NULL,
+                        bars        BLOB NOT NULL,
+                        PRIMARY KEY (symbol, range)
+                    )
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS chart_images (
+                        symbol      TEXT NOT NULL,
+                        range       TEXT NOT NULL,
+                        width       INTEGER NOT NULL,
+                        height      INTEGER NOT NULL,
+                        fingerprint TEXT NOT NULL,
+                        created_at  REAL NOT NULL,
+                        png         BLOB NOT NULL,
+                        PRIMARY KEY (symbol, range, width, height)
+                    )
+                """)
+            self._schema_ready = True
+        return conn
+
+    def get_bars(self, symbol: str, range_: str, max_age: float) -> Optional[Tuple[str, Dict[str, np.ndarray]]]:
+        """max_age초 안에 받은 가격 이력 (지문, 배열), 없으면 None"""
+        import numpy as np
+
+        try:
+            row = self._connect().execute(
+                'SELECT fingerprint, bars FROM chart_bars WHERE symbol = ? AND range = ? AND fetched_at >= ?',
+                (symbol, range_, time.time() - max_age)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"차트 캐시 조회 실패: {str(e)}")
+            return None
+        if row is None:
+            return None
+        data = unpack(row['bars'])
+        bars = {field: np.asarray(data[field], dtype=np.int64 if field == 't' else np.float64) for field in FIELDS}
+        return row['fingerprint'], bars
+
+    def put_bars(self, symbol: str, range_: str, bars: Dict[str, np.ndarray]) -> str:
+        """
+        가격 이력 저장
+
+        지문이 바뀌었으면 (새 봉) 해당 종목/구간의 스파크라인도 지웁니다.
+
+        Returns:
+            새 지문
+        """
+        new_fingerprint = bars_fingerprint(bars)
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO chart_bars VALUES (?, ?, ?, ?, ?)',
+                    (symbol, range_, time.time(), new_fingerprint, pack({k: v.tolist() for k, v in bars.items()}))
+                )
+                conn.execute(
+                    'DELETE FROM chart_images WHERE symbol = ? AND range = ? AND fingerprint != ?',
+                    (symbol, range_, new_fingerprint)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"차트 캐시 저장 실패: {str(e)}")
+        return new_fingerprint
+
+    def get_image(self, symbol: str, range_: str, width: int, height: int, fingerprint: str) -> Optional[bytes]:
+        """지문이 같은 스파크라인 PNG (없으면 None)"""
+        try:
+            row = self._connect().execute(
+                """
+                SELECT png FROM chart_images
+                WHERE symbol = ? AND range = ? AND width = ? AND height = ? AND fingerprint = ?
+                """,
+                (symbol, range_, width, height, fingerprint)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"스파크라인 캐시 조회 실패: {str(e)}")
+            return None
+        return row['png'] if row else None
+
+    def put_image(self, symbol: str, range_: str, width: int, height: int, fingerprint: str, png: bytes) -> None:
+        """스파크라인 PNG 저장"""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO chart_images VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (symbol, range_, width, height, fingerprint, time.time(), png)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"스파크라인 캐시 저장 실패: {str(e)}")
+
+    def purge_expired(self, max_age: float = 7 * 24 * 60 * 60) -> int:
+        """오래된 가격 이력과 스파크라인 삭제"""
+        cutoff = time.time() - max_age
+        conn = self._connect()
+        with conn:
+            deleted = conn.execute('DELETE FROM chart_bars WHERE fetched_at < ?', (cutoff,)).rowcount
+            deleted += conn.execute('DELETE FROM chart_images WHERE created_at < ?', (cutoff,)).rowcount
+        return deleted
+
+
+# 기본 캐시 인스턴스
+_default_cache: Optional[ChartCache] = None
+
+
+def get_chart_cache() -> ChartCache:
+    """기본 차트 캐시 반환"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ChartCache()
+    return _default_cache
+
+
+def get_bars(symbol: str, range_: str = DEFAULT_RANGE, refresh: bool = False) -> Tuple[str, Dict[str, np.ndarray]]:
+    """
+    가격 이력 조회 (구간별 유지 시간 안이면 캐시 사용)
+
+    Args:
+        symbol: 종목 심볼
+        range_: RANGES의 구간
+        refresh: 캐시를 무시하고 다시 받기
+
+    Returns:
+        (마지막 봉 지문, OHLCV 배열)
+
+    Raises:
+        ValueError: 지원하지 않는 구간
+        ChartDataNotFound: 가격 이력이 없음
+    """
+    if range_ not in RANGES:
+        raise ValueError(f"지원하지 않는 구간: {range_} (가능: {', '.join(RANGES)})")
+
+    cache = get_chart_cache()
+    if not refresh:
+        cached = cache.get_bars(symbol, range_, RANGES[range_][1])
+        if cached is not None:
+            return cached
+
+    bars = _fetch_history(symbol, range_)
+    return cache.put_bars(symbol, range_, bars), bars
+
+
+def get_sparkline(symbol: str, range_: str, width: int, height: int) -> Tuple[str, bytes]:
+    """
+    스파크라인 PNG (마지막 봉이 같으면 캐시된 이미지)
+
+    Returns:
+        (마지막 봉 지문, PNG 바이트)
+    """
+    if not (1 <= width <= MAX_SPARKLINE_SIZE[0] and 1 <= height <= MAX_SPARKLINE_SIZE[1]):
+        raise ValueError(f"스파크라인 크기는 최대 {MAX_SPARKLINE_SIZE[0]}x{MAX_SPARKLINE_SIZE[1]}입니다.")
+
+    fingerprint, bars = get_bars(symbol, range_)
+    cache = get_chart_cache()
+    png = cache.get_image(symbol, range_, width, height, fingerprint)
+    if png is None:
+        png = render_sparkline(bars['close'], width, height)
+        cache.put_image(symbol, range_, width, height, fingerprint, png)
+    return fingerprint, png
+
+
+def sparkline_file(symbol: str, range_: str = DEFAULT_RANGE, width: int = 480, height: int = 120) -> Optional[str]:
+    """
+    DOCX 리포트 / 브리핑 카드에 넣을 스파크라인 파일 경로
+
+    파일명에 마지막 봉 지문이 들어가므로 새 봉이 들어오면 새 파일을 만들고 이전 파일은 지웁니다.
+    가격 이력을 가져오지 못하면 None (리포트/카드는 차트 없이 생성).
+
+    Returns:
+        PNG 파일 경로 또는 None
+    """
+    try:
+        fingerprint, png = get_sparkline(symbol, range_, width, height)
+    except Exception as e:
+        logger.warning(f"스파크라인 생성 실패: {symbol} ({range_}), {str(e)}")
+        return None
+
+    prefix = f"{symbol}_{range_}_{width}x{height}_"
+    path = CHARTS_DIR / f"{prefix}{fingerprint}.png"
+    if not path.exists():
+        CHARTS_DIR.mkdir(parents=True, exist_ok=True)
+        # 다른 요청이 읽는 중에 덮어쓰지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(png)
+        tmp_path.replace(path)
+        # 이전 봉 기준 파일 정리
+        for old in CHARTS_DIR.glob(f"{prefix}*.png"):
+            if old != path:
+                old.unlink(missing_ok=True)
+    return str(path)
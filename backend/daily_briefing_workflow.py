@@ -3,10 +3,11 @@
 """
 import logging
 import os
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, List
-import json
+from typing import Any, Callable, Dict, Optional, List
 
 # 로깅 설정
 logging.basicConfig(
@@ -18,6 +19,7 @@ logger = logging.getLogger(__name__)
 # 모듈 임포트
 from get_trending_stocks import get_top_trending_stock, format_stock_data
 from exa_news import search_stock_news, get_news_summary
+from news_dedup import dedup_report
 from gemini_briefing import (
     generate_briefing_text,
     generate_briefing_image,
@@ -25,10 +27,13 @@ from gemini_briefing import (
     generate_stock_analysis
 )
 from send_briefing import send_briefing_to_channels
+from briefing_store import get_briefing_store
+from search_index import get_search_index
+from workflow_checkpoint import CheckpointStore, compute_input_hash, prune_checkpoints
+from instrumentation import span
 
-# 출력 디렉토리 설정
+# 출력 디렉토리 설정 (import 시점에는 만들지 않고 처음 쓸 때 생성)
 OUTPUT_DIR = Path(__file__).parent / 'output'
-OUTPUT_DIR.mkdir(exist_ok=True)
 
 
 def step1_collect_trending_stocks() -> Optional[Dict]:
@@ -96,7 +101,12 @@ def step2_collect_stock_info(stock_data: Dict) -> Dict:
         )
         
         stock_data['news_articles'] = news_articles
-        logger.info(f"뉴스 {len(news_articles)}개 수집 완료")
+        stock_data['news_dedup'] = dedup_report(news_articles)
+        logger.info(
+            f"뉴스 {len(news_articles)}개 수집 완료 "
+            f"(중복 {stock_data['news_dedup']['articles_removed']}개 제거, "
+            f"토큰 약 {stock_data['news_dedup']['estimated_tokens_saved']}개 절감)"
+        )
         
         # 뉴스 요약 생성
         if news_articles:
@@ -133,12 +143,13 @@ def step2_collect_stock_info(stock_data: Dict) -> Dict:
         return stock_data
 
 
-def step3_generate_briefing(stock_data: Dict) -> Dict:
+def step3_generate_briefing(stock_data: Dict, started: Optional[float] = None) -> Dict:
     """
     Step 3: 브리핑 콘텐츠 생성 (텍스트 + 이미지)
     
     Args:
         stock_data: 종목 데이터
+        started: 워크플로우 시작 시각 (time.perf_counter, generation_time_ms 기준, 기본값: 이 단계 시작)
     
     Returns:
         브리핑 데이터 딕셔너리
@@ -146,6 +157,7 @@ def step3_generate_briefing(stock_data: Dict) -> Dict:
     logger.info("=" * 60)
     logger.info("Step 3: 브리핑 콘텐츠 생성 시작")
     logger.info("=" * 60)
+    started = time.perf_counter() if started is None else started
     
     try:
         # 브리핑 텍스트 생성
@@ -168,6 +180,7 @@ def step3_generate_briefing(stock_data: Dict) -> Dict:
         logger.info("브리핑 이미지 생성 중...")
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         image_filename = f"briefing_{stock_data['symbol']}_{timestamp}.png"
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         image_path = OUTPUT_DIR / image_filename
         
         image_result = generate_briefing_image(
@@ -188,6 +201,8 @@ def step3_generate_briefing(stock_data: Dict) -> Dict:
         briefing_text['generated_at'] = datetime.now().isoformat()
         briefing_text['stock_symbol'] = stock_data['symbol']
         briefing_text['stock_name'] = stock_data.get('name', '')
+        # Step 1~3 소요 시간 (Step 3 체크포인트에 함께 저장되어 재실행 시 그대로 유지)
+        briefing_text['generation_time_ms'] = round((time.perf_counter() - started) * 1000)
         
         return briefing_text
     
@@ -196,16 +211,25 @@ def step3_generate_briefing(stock_data: Dict) -> Dict:
         return {}
 
 
-def step4_send_briefing(briefing_data: Dict, config: Optional[Dict] = None) -> Dict:
+def step4_send_briefing(
+    briefing_data: Dict,
+    config: Optional[Dict] = None,
+    briefing_id: Optional[str] = None
+) -> Dict:
     """
     Step 4: 브리핑 자동 발송 (샘플)
+
+    발송 아웃박스에 등록한 뒤 바로 처리합니다. 같은 브리핑을 이미 받은 수신자는
+    건너뛰므로 재실행해도 중복 발송되지 않고, 제한 시간 안에 끝나지 않은 재시도는
+    아웃박스 워커가 이어서 처리합니다.
     
     Args:
         briefing_data: 브리핑 데이터
-        config: 발송 설정 (선택)
+        config: 발송 설정 (선택, send_timeout: 대기 시간 초)
+        briefing_id: 저장된 브리핑 ID (멱등 키 기준, 없으면 즉시 발송)
     
     Returns:
-        발송 결과 딕셔너리
+        발송 결과 딕셔너리 (send_job_id, total_sent, total_failed, pending)
     """
     logger.info("=" * 60)
     logger.info("Step 4: 브리핑 자동 발송 시작")
@@ -219,15 +243,39 @@ def step4_send_briefing(briefing_data: Dict, config: Optional[Dict] = None) -> D
         }
     
     try:
-        # 발송 실행 (샘플)
-        send_results = send_briefing_to_channels(
-            briefing_data,
-            image_path=briefing_data.get('image_path'),
-            email_recipients=config.get('email_recipients', []),
-            slack_channels=config.get('slack_channels', [])
-        )
+        if not briefing_id:
+            # 저장에 실패한 브리핑은 멱등 키를 만들 수 없으므로 바로 발송
+            send_results = send_briefing_to_channels(
+                briefing_data,
+                image_path=briefing_data.get('image_path'),
+                email_recipients=config.get('email_recipients', []),
+                slack_channels=config.get('slack_channels', [])
+            )
+            send_results['pending'] = 0
+        else:
+            from delivery_outbox import get_outbox
+
+            outbox = get_outbox()
+            queued = outbox.enqueue(
+                briefing_id,
+                briefing_data,
+                image_path=briefing_data.get('image_path'),
+                email_recipients=config.get('email_recipients', []),
+                slack_channels=config.get('slack_channels', [])
+            )
+            job = outbox.drain(queued['job_id'], timeout=config.get('send_timeout', 120))
+            send_results = {
+                'send_job_id': queued['job_id'],
+                'total_sent': job['sent'],
+                'total_failed': job['failed'],
+                'pending': job['pending'],
+                'duplicates': queued['duplicates'],
+            }
         
-        logger.info(f"발송 완료: 성공 {send_results['total_sent']}개, 실패 {send_results['total_failed']}개")
+        logger.info(
+            f"발송 완료: 성공 {send_results['total_sent']}개, 실패 {send_results['total_failed']}개, "
+            f"재시도 대기 {send_results['pending']}개"
+        )
         return send_results
     
     except Exception as e:
@@ -237,50 +285,135 @@ def step4_send_briefing(briefing_data: Dict, config: Optional[Dict] = None) -> D
 
 def save_briefing_data(briefing_data: Dict, stock_data: Dict) -> str:
     """
-    브리핑 데이터를 JSON 파일로 저장
+    브리핑 데이터를 브리핑 저장소(SQLite)에 저장
     
     Args:
         briefing_data: 브리핑 데이터
         stock_data: 종목 데이터
     
     Returns:
-        저장된 파일 경로
+        저장된 브리핑 ID (실패 시 빈 문자열)
     """
     try:
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"briefing_{stock_data['symbol']}_{timestamp}.json"
-        filepath = OUTPUT_DIR / filename
+        store = get_briefing_store()
+        briefing_id = store.save(briefing_data, stock_data)
         
-        data_to_save = {
-            'briefing': briefing_data,
-            'stock_data': stock_data,
-            'created_at': datetime.now().isoformat()
-        }
+        logger.info(f"브리핑 데이터 저장 완료: {briefing_id}")
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data_to_save, f, ensure_ascii=False, indent=2)
+        # 검색 인덱스 증분 갱신 (실패해도 저장 결과에는 영향 없음)
+        try:
+            get_search_index().index_briefing(briefing_id, briefing_data, stock_data)
+        except Exception as e:
+            logger.warning(f"검색 인덱스 갱신 실패: {str(e)}")
         
-        logger.info(f"브리핑 데이터 저장 완료: {filepath}")
-        return str(filepath)
+        return briefing_id
     
     except Exception as e:
         logger.error(f"브리핑 데이터 저장 실패: {str(e)}")
         return ''
 
 
-def run_daily_briefing_workflow(config: Optional[Dict] = None) -> Dict:
+def _run_checkpointed_step(
+    store: Optional[CheckpointStore],
+    step_name: str,
+    inputs: Any,
+    func: Callable,
+    *args,
+    is_valid: Optional[Callable[[Any], bool]] = None,
+    resume: bool = False
+) -> Any:
+    """
+    체크포인트를 고려하여 단계를 실행합니다.
+
+    Args:
+        store: 체크포인트 저장소 (None이면 체크포인트 없이 실행)
+        step_name: 단계명
+        inputs: 체크포인트 키에 사용할 입력값
+        func: 단계 함수
+        is_valid: 출력이 성공한 결과인지 판별하는 함수 (성공한 출력만 저장)
+        resume: True이면 저장된 체크포인트를 재사용
+
+    Returns:
+        단계 출력 (체크포인트가 있으면 저장된 출력)
+    """
+    is_valid = is_valid or bool
+
+    if store is None:
+        with span(f'workflow.{step_name}'):
+            return func(*args)
+
+    input_hash = compute_input_hash(inputs)
+    if resume:
+        cached = store.load(step_name, input_hash)
+        if cached is not None and is_valid(cached):
+            logger.info(f"체크포인트 사용: {step_name} ({input_hash}) - 단계를 건너뜁니다.")
+            return cached
+
+    with span(f'workflow.{step_name}'):
+        output = func(*args)
+    if is_valid(output):
+        store.save(step_name, input_hash, output)
+    else:
+        logger.warning(f"{step_name} 결과가 유효하지 않아 체크포인트를 저장하지 않습니다.")
+    return output
+
+
+def _is_stock_info_complete(stock_data: Optional[Dict]) -> bool:
+    """Step 2 결과가 중간 실패 없이 완료되었는지 확인"""
+    return bool(stock_data) and 'why_trending' in stock_data
+
+
+def _is_briefing_complete(briefing_data: Optional[Dict]) -> bool:
+    """Step 3 결과가 유효한지 확인 (이미지가 지워졌으면 다시 생성)"""
+    if not briefing_data:
+        return False
+    image_path = briefing_data.get('image_path')
+    return not image_path or Path(image_path).exists()
+
+
+def _is_send_complete(send_results: Optional[Dict]) -> bool:
+    """Step 4 결과에 실패/대기가 없는지 확인 (있으면 재실행 시 남은 수신자에게만 다시 발송)"""
+    return (
+        bool(send_results)
+        and send_results.get('total_failed', 1) == 0
+        and send_results.get('pending', 0) == 0
+    )
+
+
+class WorkflowCancelled(Exception):
+    """취소 신호를 받아 다음 단계를 실행하지 않음"""
+
+
+def _check_cancelled(cancel_event: Optional[threading.Event], next_step: str) -> None:
+    if cancel_event is not None and cancel_event.is_set():
+        raise WorkflowCancelled(f"워크플로우 취소됨 ({next_step} 실행 전)")
+
+
+def run_daily_briefing_workflow(
+    config: Optional[Dict] = None,
+    resume: bool = False,
+    run_date: Optional[str] = None,
+    cancel_event: Optional[threading.Event] = None
+) -> Dict:
     """
     전체 워크플로우 실행
-    
+
     Args:
         config: 설정 딕셔너리 (선택)
-    
+        resume: 재실행 모드. True이면 같은 날짜에 입력이 동일한 단계의
+            체크포인트를 재사용하고 실패했거나 무효화된 단계만 다시 계산합니다.
+        run_date: 체크포인트 실행 날짜 (YYYY-MM-DD, 기본값: 오늘)
+        cancel_event: 설정되면 다음 단계부터 실행하지 않음 (완료된 단계의 체크포인트는 남아
+            resume으로 이어서 실행 가능)
+
     Returns:
         실행 결과 딕셔너리
     """
     logger.info("=" * 80)
     logger.info("매일 아침 브리핑 워크플로우 시작")
     logger.info(f"실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    if resume:
+        logger.info("재실행 모드: 완료된 단계는 체크포인트를 사용합니다.")
     logger.info("=" * 80)
     
     result = {
@@ -290,35 +423,90 @@ def run_daily_briefing_workflow(config: Optional[Dict] = None) -> Dict:
         'stock_data': None,
         'briefing_data': None,
         'send_results': None,
+        'briefing_id': None,
+        'generation_time_ms': 0,
         'error': None
     }
+    started = time.perf_counter()
+
+    # 체크포인트는 항상 저장하고, resume일 때만 읽어서 재사용
+    store = CheckpointStore(run_date=run_date)
+    prune_checkpoints()
     
     try:
         # Step 1: 화제 종목 수집
-        stock_data = step1_collect_trending_stocks()
+        _check_cancelled(cancel_event, 'step1_collect_trending_stocks')
+        stock_data = _run_checkpointed_step(
+            store,
+            'step1_collect_trending_stocks',
+            {'screener_types': ['most_actives', 'day_gainers'], 'count': 5},
+            step1_collect_trending_stocks,
+            resume=resume
+        )
         if not stock_data:
             result['error'] = '화제 종목을 찾을 수 없습니다.'
+            result['steps_failed'].append('step1_collect_trending_stocks')
             return result
         result['steps_completed'].append('step1_collect_trending_stocks')
         result['stock_data'] = stock_data
         
         # Step 2: 종목 정보 수집
-        stock_data = step2_collect_stock_info(stock_data)
+        _check_cancelled(cancel_event, 'step2_collect_stock_info')
+        stock_data = _run_checkpointed_step(
+            store,
+            'step2_collect_stock_info',
+            stock_data,
+            step2_collect_stock_info,
+            dict(stock_data),
+            is_valid=_is_stock_info_complete,
+            resume=resume
+        )
         result['steps_completed'].append('step2_collect_stock_info')
         
         # Step 3: 브리핑 콘텐츠 생성
-        briefing_data = step3_generate_briefing(stock_data)
+        _check_cancelled(cancel_event, 'step3_generate_briefing')
+        briefing_data = _run_checkpointed_step(
+            store,
+            'step3_generate_briefing',
+            stock_data,
+            step3_generate_briefing,
+            stock_data,
+            started,
+            is_valid=_is_briefing_complete,
+            resume=resume
+        )
         if not briefing_data:
             result['error'] = '브리핑 콘텐츠 생성 실패'
+            result['steps_failed'].append('step3_generate_briefing')
             return result
         result['steps_completed'].append('step3_generate_briefing')
         result['briefing_data'] = briefing_data
         
-        # 브리핑 데이터 저장
-        save_briefing_data(briefing_data, stock_data)
+        # 브리핑 데이터 저장 (재실행 시 중복 저장 방지)
+        _check_cancelled(cancel_event, 'save_briefing_data')
+        result['briefing_id'] = _run_checkpointed_step(
+            store,
+            'save_briefing_data',
+            {'briefing': briefing_data, 'stock_data': stock_data},
+            save_briefing_data,
+            briefing_data,
+            stock_data,
+            resume=resume
+        )
         
-        # Step 4: 브리핑 발송 (샘플)
-        send_results = step4_send_briefing(briefing_data, config)
+        # Step 4: 브리핑 발송 (샘플) - 이미 발송에 성공한 경우 재발송하지 않음
+        _check_cancelled(cancel_event, 'step4_send_briefing')
+        send_results = _run_checkpointed_step(
+            store,
+            'step4_send_briefing',
+            {'briefing': briefing_data, 'config': config, 'briefing_id': result['briefing_id']},
+            step4_send_briefing,
+            briefing_data,
+            config,
+            result['briefing_id'],
+            is_valid=_is_send_complete,
+            resume=resume
+        )
         result['steps_completed'].append('step4_send_briefing')
         result['send_results'] = send_results
         
@@ -327,15 +515,34 @@ def run_daily_briefing_workflow(config: Optional[Dict] = None) -> Dict:
         logger.info("워크플로우 완료!")
         logger.info("=" * 80)
         
+    except WorkflowCancelled as e:
+        logger.warning(str(e))
+        result['error'] = str(e)
     except Exception as e:
         logger.error(f"워크플로우 실행 중 오류 발생: {str(e)}")
         result['error'] = str(e)
         result['steps_failed'].append('workflow_execution')
     
+    result['generation_time_ms'] = round((time.perf_counter() - started) * 1000)
     return result
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='매일 아침 브리핑 워크플로우')
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='완료된 단계는 체크포인트를 사용하고 실패한 단계부터 다시 실행'
+    )
+    parser.add_argument(
+        '--run-date',
+        default=None,
+        help='체크포인트 실행 날짜 (YYYY-MM-DD, 기본값: 오늘)'
+    )
+    args = parser.parse_args()
+
     # 직접 실행 시 테스트
     print("=" * 80)
     print("매일 아침 브리핑 워크플로우 테스트")
@@ -348,7 +555,7 @@ if __name__ == "__main__":
     }
     
     # 워크플로우 실행
-    result = run_daily_briefing_workflow(test_config)
+    result = run_daily_briefing_workflow(test_config, resume=args.resume, run_date=args.run_date)
     
     # 결과 출력
     print("\n" + "=" * 80)
@@ -0,0 +1,431 @@
+"""
+브리핑 다채널 발송 엔진
+
+- 이메일: 배치 전체에서 인증된 SMTP 연결 1개를 재사용 (끊기면 재연결)
+- 슬랙: 커넥션 풀을 쓰는 requests.Session으로 웹훅 동시 발송
+- 지수 백오프 + full jitter 재시도, 채널별 토큰 버킷 발송 속도 제한
+- 수신자별 발송 결과 반환
+"""
+import logging
+import random
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.headerregistry import Address
+from email.message import EmailMessage
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Union
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class TransientDeliveryError(Exception):
+    """재시도하면 성공할 수 있는 발송 오류 (429, 5xx, 연결 끊김 등)"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class RawEmail:
+    """직렬화가 끝난 발송용 메일 (수신자별 헤더 + 공통 본문 바이트)"""
+    from_addr: str
+    to_addrs: List[str]
+    data: bytes
+    message_id: str = ''
+
+
+def parse_email_address(value: str) -> Address:
+    """
+    수신자 주소 검증 (addr-spec 1개만 허용)
+
+    Args:
+        value: 이메일 주소
+
+    Returns:
+        Address (헤더에는 str(address), SMTP RCPT에는 address.addr_spec 사용)
+
+    Raises:
+        ValueError: 주소 형식이 아니거나 CR/LF 등 주소 뒤에 다른 내용이 붙은 경우 (헤더 주입 방지)
+    """
+    if not value or '\r' in value or '\n' in value:
+        raise ValueError(f"잘못된 이메일 주소: {value!r}")
+    try:
+        address = Address(addr_spec=value.strip())
+    except Exception as e:
+        raise ValueError(f"잘못된 이메일 주소: {value!r}") from e
+    if not address.username or not address.domain:
+        raise ValueError(f"잘못된 이메일 주소: {value!r}")
+    return address
+
+
+# ============================================================================
+# 속도 제한 / 재시도
+# ============================================================================
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (초당 rate개, 최대 burst개 누적)"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """토큰 1개를 얻을 때까지 대기"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+@dataclass
+class RetryPolicy:
+    """지수 백오프 + full jitter 재시도 정책"""
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """attempt번째 실패 후 대기 시간 (서버가 Retry-After를 주면 그 값 이상)"""
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+        return max(backoff, retry_after or 0)
+
+
+def _with_retry(send: Callable[[], Dict], policy: RetryPolicy) -> Dict:
+    """TransientDeliveryError는 정책에 따라 재시도, 그 외 예외는 즉시 실패 처리"""
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            result = send()
+            result['attempts'] = attempt
+            return result
+        except TransientDeliveryError as e:
+            if attempt >= policy.max_attempts:
+                # 나중에 다시 시도하면 성공할 수 있음 (발송 큐가 재시도 여부 판단에 사용)
+                return {'success': False, 'message': f'재시도 한도 초과: {str(e)}', 'attempts': attempt, 'retryable': True}
+            time.sleep(policy.delay(attempt, e.retry_after))
+        except Exception as e:
+            return {'success': False, 'message': str(e), 'attempts': attempt, 'retryable': False}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더 → 대기 초 (RFC 9110: 초 숫자 또는 HTTP-date)
+
+    Returns:
+        대기 초 (이미 지난 시각이면 0, 해석할 수 없으면 None)
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# ============================================================================
+# 이메일 (SMTP 연결 재사용)
+# ============================================================================
+
+@dataclass
+class SmtpConfig:
+    """SMTP 접속 설정"""
+    host: str
+    port: int = 587
+    username: str = ''
+    password: str = ''
+    use_tls: bool = True
+    timeout: float = 30.0
+    # 서버의 연결당 메시지 수 제한에 걸리지 않도록 주기적으로 재연결 (0이면 무제한)
+    max_messages_per_connection: int = 500
+
+
+class SmtpBatchSender:
+    """인증된 SMTP 연결 1개로 여러 메시지를 발송"""
+
+    def __init__(self, config: SmtpConfig):
+        self.config = config
+        self._server: Optional[smtplib.SMTP] = None
+        self._sent_on_connection = 0
+        self.connections_opened = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        if self._server is None:
+            server = smtplib.SMTP(self.config.host, self.config.port, timeout=self.config.timeout)
+            if self.config.use_tls:
+                server.starttls()
+            if self.config.username:
+                server.login(self.config.username, self.config.password)
+            self._server = server
+            self._sent_on_connection = 0
+            self.connections_opened += 1
+        return self._server
+
+    def _disconnect(self) -> None:
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except smtplib.SMTPException:
+                pass
+            except OSError:
+                pass
+            self._server = None
+
+    def send(self, message: Union[EmailMessage, RawEmail]) -> Dict:
+        """
+        메시지 1건 발송 (RawEmail은 재직렬화 없이 그대로 전송)
+
+        Raises:
+            TransientDeliveryError: 연결 끊김, 4xx 임시 오류
+        """
+        limit = self.config.max_messages_per_connection
+        if limit and self._sent_on_connection >= limit:
+            self._disconnect()
+
+        try:
+            server = self._connect()
+            if isinstance(message, RawEmail):
+                refused = server.sendmail(message.from_addr, message.to_addrs, message.data)
+                message_id = message.message_id
+            else:
+                refused = server.send_message(message)
+                message_id = message.get('Message-ID')
+        except smtplib.SMTPServerDisconnected as e:
+            self._server = None
+            raise TransientDeliveryError(f"SMTP 연결 끊김: {str(e)}")
+        except smtplib.SMTPRecipientsRefused as e:
+            # 수신자 전원 거부 (SMTPException은 OSError 하위 클래스라 아래 네트워크 오류보다 먼저 처리)
+            codes = [code for code, _ in e.recipients.values()]
+            if codes and all(400 <= code < 500 for code in codes):
+                raise TransientDeliveryError(f"SMTP 수신자 임시 거부: {e.recipients}")
+            return {'success': False, 'message': f'수신 거부: {e.recipients}', 'retryable': False}
+        except smtplib.SMTPResponseException as e:
+            if 400 <= e.smtp_code < 500:
+                raise TransientDeliveryError(f"SMTP 임시 오류 {e.smtp_code}")
+            raise
+        except OSError as e:
+            self._disconnect()
+            raise TransientDeliveryError(f"SMTP 네트워크 오류: {str(e)}")
+
+        self._sent_on_connection += 1
+        if refused:
+            return {'success': False, 'message': f'수신 거부: {refused}', 'retryable': False}
+        return {'success': True, 'message': '이메일 발송 완료', 'message_id': message_id}
+
+    def close(self) -> None:
+        self._disconnect()
+
+    def __enter__(self) -> 'SmtpBatchSender':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ============================================================================
+# 슬랙 (웹훅 동시 발송)
+# ============================================================================
+
+class SlackWebhookSender:
+    """커넥션 풀을 공유하는 슬랙 웹훅 발송기"""
+
+    def __init__(self, pool_size: int = 16, timeout: float = 10.0):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def send(self, webhook_url: str, payload: Union[Dict, bytes]) -> Dict:
+        """
+        웹훅 1건 발송 (bytes payload는 미리 직렬화된 JSON으로 그대로 전송)
+
+        Raises:
+            TransientDeliveryError: 429, 5xx, 연결 오류
+        """
+        import requests
+
+        try:
+            if isinstance(payload, bytes):
+                response = self.session.post(
+                    webhook_url,
+                    data=payload,
+                    headers={'Content-Type': 'application/json; charset=utf-8'},
+                    timeout=self.timeout
+                )
+            else:
+                response = self.session.post(webhook_url, json=payload, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            raise TransientDeliveryError(f"슬랙 네트워크 오류: {str(e)}")
+
+        if response.status_code == 429:
+            raise TransientDeliveryError(
+                '슬랙 발송 속도 제한 (429)',
+                retry_after=parse_retry_after(response.headers.get('Retry-After'))
+            )
+        if response.status_code >= 500:
+            raise TransientDeliveryError(f"슬랙 서버 오류 ({response.status_code})")
+        if response.status_code >= 400:
+            return {
+                'success': False,
+                'message': f'슬랙 발송 실패 ({response.status_code}): {response.text[:200]}',
+                'retryable': False
+            }
+        return {'success': True, 'message': '슬랙 발송 완료', 'message_ts': response.headers.get('X-Slack-Req-Id', '')}
+
+    def close(self) -> None:
+        self.session.close()
+
+
+# ============================================================================
+# 발송 엔진
+# ============================================================================
+
+class DeliveryEngine:
+    """
+    이메일/슬랙 배치 발송 엔진
+
+    Example:
+        >>> engine = DeliveryEngine(smtp_config=SmtpConfig('smtp.example.com', username='u', password='p'))
+        >>> results = engine.deliver(build_email, build_slack_payload, ['a@example.com'], [{'webhook_url': url, 'channel': '#x'}])
+    """
+
+    def __init__(
+        self,
+        smtp_config: Optional[SmtpConfig] = None,
+        email_rate: float = 10.0,
+        slack_rate: float = 1.0,
+        slack_workers: int = 8,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        """
+        Args:
+            smtp_config: SMTP 설정 (None이면 이메일 발송 불가)
+            email_rate: SMTP 연결의 초당 최대 발송 수 (0이면 무제한)
+            slack_rate: 웹훅 호스트+경로(채널)별 초당 최대 발송 수 (슬랙 권장: 1)
+            slack_workers: 슬랙 동시 발송 스레드 수
+            retry_policy: 재시도 정책
+        """
+        self.smtp_config = smtp_config
+        self.email_rate = email_rate
+        self.slack_rate = slack_rate
+        self.slack_workers = slack_workers
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._slack_buckets: Dict[str, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+
+    def _slack_bucket(self, webhook_url: str) -> TokenBucket:
+        parts = urlsplit(webhook_url)
+        key = f"{parts.netloc}{parts.path}"
+        with self._buckets_lock:
+            if key not in self._slack_buckets:
+                self._slack_buckets[key] = TokenBucket(self.slack_rate)
+            return self._slack_buckets[key]
+
+    def send_emails(
+        self,
+        recipients: List[str],
+        build_message: Callable[[str], Union[EmailMessage, RawEmail]]
+    ) -> List[Dict]:
+        """
+        이메일 배치 발송 (SMTP 연결 1개 재사용)
+
+        Args:
+            recipients: 수신자 이메일 리스트
+            build_message: 수신자별 EmailMessage 또는 RawEmail 생성 함수
+
+        Returns:
+            수신자별 결과 리스트 {recipient, success, message, message_id, attempts}
+        """
+        if not recipients:
+            return []
+        if self.smtp_config is None:
+            return [{'recipient': r, 'success': False, 'message': 'SMTP 설정 없음', 'attempts': 0, 'retryable': False} for r in recipients]
+
+        bucket = TokenBucket(self.email_rate)
+        results = []
+        with SmtpBatchSender(self.smtp_config) as sender:
+            for recipient in recipients:
+                try:
+                    message = build_message(recipient)
+                except ValueError as e:
+                    # 잘못된 주소는 재시도해도 실패하므로 발송하지 않음
+                    results.append({'recipient': recipient, 'success': False, 'message': str(e),
+                                    'attempts': 0, 'retryable': False})
+                    continue
+                bucket.acquire()
+                result = _with_retry(lambda: sender.send(message), self.retry_policy)
+                result['recipient'] = recipient
+                results.append(result)
+            logger.info(f"이메일 {len(recipients)}건 발송 (SMTP 연결 {sender.connections_opened}회)")
+        return results
+
+    def send_slack(
+        self,
+        channels: List[Dict[str, str]],
+        build_payload: Callable[[Dict[str, str]], Union[Dict, bytes]]
+    ) -> List[Dict]:
+        """
+        슬랙 웹훅 동시 발송
+
+        Args:
+            channels: [{'webhook_url': str, 'channel': str}]
+            build_payload: 채널별 웹훅 payload (dict 또는 직렬화된 JSON bytes) 생성 함수
+
+        Returns:
+            채널별 결과 리스트 (입력 순서 유지) {channel, success, message, message_ts, attempts}
+        """
+        if not channels:
+            return []
+
+        sender = SlackWebhookSender(pool_size=self.slack_workers)
+
+        def deliver_one(channel_info: Dict[str, str]) -> Dict:
+            webhook_url = channel_info.get('webhook_url', '')
+            if not webhook_url:
+                result = {'success': False, 'message': '웹훅 URL 없음', 'attempts': 0, 'retryable': False}
+            else:
+                payload = build_payload(channel_info)
+                bucket = self._slack_bucket(webhook_url)
+
+                def send_once() -> Dict:
+                    bucket.acquire()
+                    return sender.send(webhook_url, payload)
+
+                result = _with_retry(send_once, self.retry_policy)
+            result['channel'] = channel_info.get('channel', '')
+            return result
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.slack_workers, thread_name_prefix='slack') as executor:
+                return list(executor.map(deliver_one, channels))
+        finally:
+            sender.close()
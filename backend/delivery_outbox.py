@@ -0,0 +1,542 @@
+"""
+브리핑 발송 아웃박스 (SQLite 영구 큐)
+
+발송 요청을 먼저 outbox 테이블에 기록한 뒤 워커 스레드가 꺼내서 발송합니다.
+- (브리핑, 채널, 수신자)별 멱등 키로 같은 브리핑을 같은 수신자에게 두 번 보내지 않음
+- 실패 시 지수 백오프(+jitter)로 재시도, 한도 초과 또는 영구 오류는 dead_letters로 이동
+- 처리 중 프로세스가 죽어도 lease가 만료되면 다른 워커가 다시 가져감
+"""
+import hashlib
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from cache_db import pack, unpack
+
+logger = logging.getLogger(__name__)
+
+# 아웃박스 DB 경로 설정
+OUTBOX_DB_PATH = Path(__file__).parent / 'output' / 'outbox.db'
+
+# 재시도 설정
+MAX_ATTEMPTS = 6
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 60 * 60
+CLAIM_LEASE_SECONDS = 300
+CLAIM_BATCH_SIZE = 500
+# 한 번에 발송하고 결과를 기록하는 단위 (단위마다 남은 항목의 lease 연장)
+DISPATCH_CHUNK_SIZE = 100
+
+# 항목 상태
+ITEM_PENDING = 'pending'
+ITEM_SENDING = 'sending'
+ITEM_SENT = 'sent'
+ITEM_DEAD = 'dead'
+
+# 작업 상태
+JOB_QUEUED = 'queued'
+JOB_SENDING = 'sending'
+JOB_COMPLETED = 'completed'
+JOB_PARTIAL = 'partial'
+JOB_FAILED = 'failed'
+
+
+def generate_send_job_id() -> str:
+    """발송 작업 ID 생성 (같은 초에 여러 요청이 와도 충돌하지 않음)"""
+    return f"job_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+
+def make_idempotency_key(
+    briefing_id: str,
+    channel_type: str,
+    recipient: str,
+    webhook_url: Optional[str] = None
+) -> str:
+    """
+    (브리핑, 채널, 수신자) 멱등 키
+
+    슬랙은 웹훅 URL까지 수신자로 봅니다 (워크스페이스가 달라도 채널 이름은 '#general'로 같을 수 있음).
+    """
+    raw = f"{briefing_id}\x00{channel_type}\x00{recipient.strip().lower()}"
+    if webhook_url:
+        raw += f"\x00{webhook_url.strip()}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def backoff_seconds(attempts: int) -> float:
+    """attempts회 실패 후 다음 시도까지 대기 시간 (지수 백오프 + jitter)"""
+    delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** (attempts - 1)))
+    return delay * random.uniform(0.5, 1.0)
+
+
+class DeliveryOutbox:
+    """SQLite 기반 발송 아웃박스"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Args:
+            db_path: 아웃박스 DB 경로 (기본값: output/outbox.db)
+        """
+        self.db_path = Path(db_path) if db_path else OUTBOX_DB_PATH
+        self.owner = f"{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._local = threading.local()
+        self._workers: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+
+    # ========================================================================
+    # 연결 / 스키마
+    # ========================================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS send_jobs (
+                    job_id      TEXT PRIMARY KEY,
+                    briefing_id TEXT NOT NULL,
+                    created_at  TEXT NOT NULL,
+                    updated_at  TEXT NOT NULL,
+                    total       INTEGER NOT NULL,
+                    duplicates  INTEGER NOT NULL DEFAULT 0,
+                    payload     BLOB NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS outbox (
+                    id              INTEGER PRIMARY KEY,
+                    idempotency_key TEXT NOT NULL UNIQUE,
+                    job_id          TEXT NOT NULL,
+                    briefing_id     TEXT NOT NULL,
+                    channel_type    TEXT NOT NULL,
+                    recipient       TEXT NOT NULL,
+                    webhook_url     TEXT,
+                    status          TEXT NOT NULL,
+                    attempts        INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    locked_by       TEXT,
+                    locked_until    REAL,
+                    last_error      TEXT,
+                    message_id      TEXT,
+                    sent_at         TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (status, next_attempt_at);
+                CREATE INDEX IF NOT EXISTS idx_outbox_job ON outbox (job_id);
+                CREATE TABLE IF NOT EXISTS dead_letters (
+                    id           INTEGER PRIMARY KEY,
+                    outbox_id    INTEGER NOT NULL,
+                    job_id       TEXT NOT NULL,
+                    briefing_id  TEXT NOT NULL,
+                    channel_type TEXT NOT NULL,
+                    recipient    TEXT NOT NULL,
+                    attempts     INTEGER NOT NULL,
+                    last_error   TEXT,
+                    failed_at    TEXT NOT NULL
+                );
+            """)
+            self._local.conn = conn
+        return conn
+
+    # ========================================================================
+    # 등록
+    # ========================================================================
+
+    def enqueue(
+        self,
+        briefing_id: str,
+        briefing_data: Dict,
+        image_path: Optional[str] = None,
+        email_recipients: Optional[List[str]] = None,
+        slack_channels: Optional[List[Dict[str, str]]] = None,
+        not_before: Optional[float] = None
+    ) -> Dict:
+        """
+        발송 작업 등록
+
+        이미 같은 브리핑을 받은(또는 대기 중인) 수신자는 건너뛰고,
+        이전에 최종 실패(dead)한 수신자는 이 작업으로 다시 시도합니다.
+
+        Args:
+            briefing_id: 브리핑 ID
+            briefing_data: 발송할 브리핑 데이터 (작업과 함께 저장)
+            image_path: 브리핑 이미지 경로
+            email_recipients: 이메일 수신자 리스트
+            slack_channels: [{'webhook_url': str, 'channel': str}]
+            not_before: 예약 발송 시각 (epoch 초, 기본값: 즉시)
+
+        Returns:
+            {'job_id', 'total', 'duplicates'}
+        """
+        items = [('email', recipient, None) for recipient in (email_recipients or []) if recipient]
+        items += [
+            ('slack', info.get('channel') or '#general', info.get('webhook_url'))
+            for info in (slack_channels or [])
+        ]
+
+        job_id = generate_send_job_id()
+        now = datetime.now().isoformat()
+        due = not_before or time.time()
+
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            inserted = 0
+            for channel_type, recipient, webhook_url in items:
+                cursor = conn.execute(
+                    """
+                    INSERT INTO outbox
+                        (idempotency_key, job_id, briefing_id, channel_type, recipient, webhook_url,
+                         status, next_attempt_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (idempotency_key) DO UPDATE SET
+                        job_id = excluded.job_id, webhook_url = excluded.webhook_url,
+                        status = excluded.status, attempts = 0, next_attempt_at = excluded.next_attempt_at,
+                        last_error = NULL
+                    WHERE outbox.status = ?
+                    """,
+                    (make_idempotency_key(briefing_id, channel_type, recipient, webhook_url), job_id, briefing_id,
+                     channel_type, recipient, webhook_url, ITEM_PENDING, due, ITEM_DEAD)
+                )
+                inserted += cursor.rowcount
+            conn.execute(
+                'INSERT INTO send_jobs VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (job_id, briefing_id, now, now, inserted, len(items) - inserted,
+                 pack({'briefing_data': briefing_data, 'image_path': image_path}))
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        if len(items) > inserted:
+            logger.info(f"이미 발송(대기)된 수신자 {len(items) - inserted}명은 건너뜁니다: {briefing_id}")
+        logger.info(f"발송 작업 등록: {job_id} ({inserted}건)")
+        self._wakeup.set()
+        return {'job_id': job_id, 'total': inserted, 'duplicates': len(items) - inserted}
+
+    # ========================================================================
+    # 처리
+    # ========================================================================
+
+    def _claim(self, job_id: Optional[str] = None, limit: int = CLAIM_BATCH_SIZE) -> List[sqlite3.Row]:
+        """발송할 때가 된 항목을 lease와 함께 가져옴 (다른 워커/프로세스와 겹치지 않음)"""
+        conn = self._connect()
+        now = time.time()
+        job_filter = 'AND job_id = ?' if job_id else ''
+        params = [ITEM_PENDING, now, ITEM_SENDING, now] + ([job_id] if job_id else []) + [limit]
+
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            rows = conn.execute(
+                f"""
+                SELECT * FROM outbox
+                WHERE ((status = ? AND next_attempt_at <= ?) OR (status = ? AND locked_until < ?)) {job_filter}
+                ORDER BY job_id, channel_type, id
+                LIMIT ?
+                """,
+                params
+            ).fetchall()
+            if rows:
+                conn.executemany(
+                    'UPDATE outbox SET status = ?, locked_by = ?, locked_until = ? WHERE id = ?',
+                    [(ITEM_SENDING, self.owner, now + CLAIM_LEASE_SECONDS, row['id']) for row in rows]
+                )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return rows
+
+    def _load_payload(self, job_id: str) -> Dict:
+        row = self._connect().execute('SELECT payload FROM send_jobs WHERE job_id = ?', (job_id,)).fetchone()
+        return unpack(row['payload']) if row else {}
+
+    def _renew_lease(self, rows: List[sqlite3.Row]) -> List[sqlite3.Row]:
+        """
+        아직 이 워커가 잡고 있는 항목의 lease를 연장합니다.
+
+        Returns:
+            lease를 연장한 항목 (lease가 만료되어 다른 워커가 가져간 항목은 제외)
+        """
+        conn = self._connect()
+        locked_until = time.time() + CLAIM_LEASE_SECONDS
+        kept = []
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for row in rows:
+                cursor = conn.execute(
+                    'UPDATE outbox SET locked_until = ? WHERE id = ? AND status = ? AND locked_by = ?',
+                    (locked_until, row['id'], ITEM_SENDING, self.owner)
+                )
+                if cursor.rowcount:
+                    kept.append(row)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        if len(kept) < len(rows):
+            logger.warning(f"lease 만료로 다른 워커가 가져간 항목 {len(rows) - len(kept)}개는 발송하지 않음")
+        return kept
+
+    def _dispatch(self, job_id: str, rows: List[sqlite3.Row]) -> None:
+        """
+        같은 작업의 항목을 DISPATCH_CHUNK_SIZE개씩 발송하고 단위마다 결과 기록
+
+        발송 전에 남은 항목의 lease를 연장하므로 큰 배치가 lease 시간을 넘겨도
+        다른 워커가 발송 중인 항목을 다시 가져가지 않고, 중간에 죽어도 기록된 항목은 재발송되지 않습니다.
+        """
+        payload = self._load_payload(job_id)
+        remaining = list(rows)
+        while remaining:
+            remaining = self._renew_lease(remaining)
+            chunk, remaining = remaining[:DISPATCH_CHUNK_SIZE], remaining[DISPATCH_CHUNK_SIZE:]
+            if chunk:
+                self._record(self._send_chunk(job_id, payload, chunk))
+
+    def _send_chunk(self, job_id: str, payload: Dict, rows: List[sqlite3.Row]) -> List:
+        """항목 묶음을 발송하고 (항목, 결과) 리스트 반환"""
+        from send_briefing import send_briefing_to_channels
+
+        emails = [row for row in rows if row['channel_type'] == 'email']
+        slacks = [row for row in rows if row['channel_type'] == 'slack']
+
+        try:
+            results = send_briefing_to_channels(
+                payload.get('briefing_data', {}),
+                image_path=payload.get('image_path'),
+                email_recipients=[row['recipient'] for row in emails],
+                slack_channels=[{'webhook_url': row['webhook_url'], 'channel': row['recipient']} for row in slacks]
+            )
+            return list(zip(emails, results['email'])) + list(zip(slacks, results['slack']))
+        except Exception as e:
+            logger.error(f"발송 실행 오류: {job_id} ({str(e)})")
+            return [(row, {'success': False, 'message': str(e), 'retryable': True}) for row in rows]
+
+    def _record(self, outcomes: List) -> None:
+        """
+        발송 결과 기록 (lease를 잃은 항목은 다른 워커의 결과를 덮어쓰지 않도록 건너뜀)
+        """
+        conn = self._connect()
+        now = time.time()
+        now_iso = datetime.now().isoformat()
+        lost = 0
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for row, result in outcomes:
+                attempts = row['attempts'] + 1
+                if result.get('success'):
+                    cursor = conn.execute(
+                        """
+                        UPDATE outbox SET status = ?, attempts = ?, sent_at = ?, message_id = ?,
+                            last_error = NULL, locked_by = NULL, locked_until = NULL
+                        WHERE id = ? AND locked_by = ?
+                        """,
+                        (ITEM_SENT, attempts, now_iso,
+                         result.get('message_id') or result.get('message_ts'), row['id'], self.owner)
+                    )
+                # TransientDeliveryError(429/5xx/연결 오류)로 표시된 실패만 재시도, 나머지는 바로 dead
+                elif result.get('retryable', False) and attempts < MAX_ATTEMPTS:
+                    cursor = conn.execute(
+                        """
+                        UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?,
+                            locked_by = NULL, locked_until = NULL
+                        WHERE id = ? AND locked_by = ?
+                        """,
+                        (ITEM_PENDING, attempts, now + backoff_seconds(attempts), result.get('message'),
+                         row['id'], self.owner)
+                    )
+                else:
+                    cursor = conn.execute(
+                        """
+                        UPDATE outbox SET status = ?, attempts = ?, last_error = ?,
+                            locked_by = NULL, locked_until = NULL
+                        WHERE id = ? AND locked_by = ?
+                        """,
+                        (ITEM_DEAD, attempts, result.get('message'), row['id'], self.owner)
+                    )
+                    if cursor.rowcount:
+                        conn.execute(
+                            """
+                            INSERT INTO dead_letters
+                                (outbox_id, job_id, briefing_id, channel_type, recipient, attempts, last_error, failed_at)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                            """,
+                            (row['id'], row['job_id'], row['briefing_id'], row['channel_type'],
+                             row['recipient'], attempts, result.get('message'), now_iso)
+                        )
+                if not cursor.rowcount:
+                    lost += 1
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        if lost:
+            logger.warning(f"lease를 잃은 항목 {lost}개의 결과는 기록하지 않음")
+
+    def process_due(self, job_id: Optional[str] = None) -> int:
+        """
+        발송할 때가 된 항목을 한 번 처리합니다.
+
+        Args:
+            job_id: 특정 작업만 처리 (기본값: 전체)
+
+        Returns:
+            처리한 항목 수
+        """
+        rows = self._claim(job_id)
+        by_job: Dict[str, List[sqlite3.Row]] = {}
+        for row in rows:
+            by_job.setdefault(row['job_id'], []).append(row)
+        for claimed_job_id, job_rows in by_job.items():
+            self._dispatch(claimed_job_id, job_rows)
+        return len(rows)
+
+    def drain(self, job_id: str, timeout: float = 60.0) -> Dict:
+        """
+        현재 스레드에서 작업을 처리하며 끝날 때까지(또는 timeout까지) 기다립니다.
+        백오프 대기 중인 항목은 timeout이 지나면 워커/다음 실행에 맡깁니다.
+
+        Returns:
+            get_job() 결과
+        """
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            self.process_due(job_id)
+            job = self.get_job(job_id)
+            if job is None or job['pending'] == 0:
+                return job
+            next_due = self._connect().execute(
+                'SELECT MIN(next_attempt_at) FROM outbox WHERE job_id = ? AND status = ?',
+                (job_id, ITEM_PENDING)
+            ).fetchone()[0]
+            wait = (next_due or time.time() + 1) - time.time()
+            if wait > deadline - time.time():
+                break
+            time.sleep(max(0.05, min(wait, 1.0)))
+        return self.get_job(job_id)
+
+    # ========================================================================
+    # 워커
+    # ========================================================================
+
+    def start_workers(self, count: int = 2, poll_interval: float = 2.0) -> None:
+        """백그라운드 워커 스레드 시작"""
+        if self._workers:
+            return
+        self._stop.clear()
+
+        def worker_loop() -> None:
+            while not self._stop.is_set():
+                try:
+                    processed = self.process_due()
+                except Exception as e:
+                    logger.error(f"아웃박스 워커 오류: {str(e)}")
+                    processed = 0
+                if not processed:
+                    self._wakeup.wait(poll_interval)
+                    self._wakeup.clear()
+
+        for index in range(count):
+            thread = threading.Thread(target=worker_loop, name=f"outbox-worker-{index}", daemon=True)
+            thread.start()
+            self._workers.append(thread)
+        logger.info(f"아웃박스 워커 {count}개 시작")
+
+    def stop_workers(self, timeout: float = 10.0) -> None:
+        """워커 스레드 종료 (처리 중인 배치는 끝까지 처리)"""
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._workers:
+            thread.join(timeout)
+        self._workers = []
+
+    @property
+    def workers_running(self) -> bool:
+        return any(thread.is_alive() for thread in self._workers)
+
+    # ========================================================================
+    # 조회
+    # ========================================================================
+
+    def get_job(self, job_id: str, include_items: bool = False) -> Optional[Dict]:
+        """
+        발송 작업 상태 조회
+
+        Returns:
+            작업 정보 (status, total, sent, failed, pending, duplicates[, items]) 또는 None
+        """
+        conn = self._connect()
+        job = conn.execute(
+            'SELECT job_id, briefing_id, created_at, total, duplicates FROM send_jobs WHERE job_id = ?',
+            (job_id,)
+        ).fetchone()
+        if job is None:
+            return None
+
+        counts = {
+            row['status']: row['count']
+            for row in conn.execute(
+                'SELECT status, COUNT(*) AS count FROM outbox WHERE job_id = ? GROUP BY status', (job_id,)
+            )
+        }
+        sent = counts.get(ITEM_SENT, 0)
+        failed = counts.get(ITEM_DEAD, 0)
+        pending = counts.get(ITEM_PENDING, 0) + counts.get(ITEM_SENDING, 0)
+
+        if pending:
+            status = JOB_SENDING if sent or failed or counts.get(ITEM_SENDING) else JOB_QUEUED
+        elif failed:
+            status = JOB_PARTIAL if sent else JOB_FAILED
+        else:
+            status = JOB_COMPLETED
+
+        result = {
+            **dict(job),
+            'status': status,
+            'sent': sent,
+            'failed': failed,
+            'pending': pending,
+        }
+        if include_items:
+            result['items'] = [
+                dict(row) for row in conn.execute(
+                    """
+                    SELECT channel_type, recipient, status, attempts, last_error, message_id, sent_at
+                    FROM outbox WHERE job_id = ? ORDER BY id
+                    """,
+                    (job_id,)
+                )
+            ]
+        return result
+
+    def dead_letters(self, limit: int = 100) -> List[Dict]:
+        """최근 dead letter 목록"""
+        rows = self._connect().execute(
+            'SELECT * FROM dead_letters ORDER BY id DESC LIMIT ?', (limit,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+
+# 기본 아웃박스 인스턴스
+_default_outbox: Optional[DeliveryOutbox] = None
+_default_outbox_lock = threading.Lock()
+
+
+def get_outbox() -> DeliveryOutbox:
+    """기본 아웃박스 반환"""
+    global _default_outbox
+    if _default_outbox is None:
+        with _default_outbox_lock:
+            if _default_outbox is None:
+                _default_outbox = DeliveryOutbox()
+    return _default_outbox
@@ -0,0 +1,207 @@
+"""
+브리핑 발송 템플릿 (한 번 렌더링, 여러 번 발송)
+
+브리핑 1건당 이메일 MIME 본문과 슬랙 블록 JSON을 한 번만 만들고,
+수신자별로는 To/Date/Message-ID 헤더와 슬랙 채널 필드만 덧붙입니다.
+첨부 이미지 바이트는 (경로, 수정 시각, 크기) 기준으로 캐시합니다.
+"""
+import html
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email import policy
+from email.message import EmailMessage
+from email.utils import formatdate, make_msgid
+from typing import Dict, List, Optional, Tuple
+
+from delivery import RawEmail, parse_email_address
+from instrumentation import timed
+
+# 이미지 캐시 최대 항목 수
+IMAGE_CACHE_SIZE = 16
+
+_image_cache: 'OrderedDict[str, Tuple[Tuple[int, int], bytes]]' = OrderedDict()
+_image_cache_lock = threading.Lock()
+
+
+def load_image_bytes(image_path: Optional[str]) -> Optional[bytes]:
+    """
+    이미지 파일 바이트 (경로/수정 시각/크기가 같으면 캐시 사용)
+
+    Args:
+        image_path: 이미지 파일 경로
+
+    Returns:
+        파일 바이트 또는 None (경로 없음/파일 없음)
+    """
+    if not image_path:
+        return None
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        return None
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _image_cache_lock:
+        cached = _image_cache.get(image_path)
+        if cached is not None and cached[0] == signature:
+            _image_cache.move_to_end(image_path)
+            return cached[1]
+
+    with open(image_path, 'rb') as f:
+        data = f.read()
+
+    with _image_cache_lock:
+        _image_cache[image_path] = (signature, data)
+        _image_cache.move_to_end(image_path)
+        while len(_image_cache) > IMAGE_CACHE_SIZE:
+            _image_cache.popitem(last=False)
+    return data
+
+
+# ============================================================================
+# 본문 렌더링
+# ============================================================================
+
+def create_html_body(briefing_data: Dict, has_image: bool = False) -> str:
+    """
+    이메일 HTML 본문 생성
+
+    Args:
+        briefing_data: 브리핑 데이터 (title, summary, sections)
+        has_image: 인라인 이미지(cid:briefing_image) 포함 여부
+
+    Returns:
+        HTML 문자열
+    """
+    parts = [
+        '<html><body style="font-family: sans-serif; max-width: 640px; margin: 0 auto;">',
+        f"<h1>{html.escape(briefing_data.get('title', '주식 브리핑'))}</h1>",
+        f"<p>{html.escape(briefing_data.get('summary', ''))}</p>",
+    ]
+    if has_image:
+        parts.append('<img src="cid:briefing_image" alt="브리핑 이미지" style="width: 100%;">')
+    for section in briefing_data.get('sections', []):
+        parts.append(f"<h2>{html.escape(section.get('title', ''))}</h2>")
+        content = html.escape(section.get('content', '')).replace('\n', '<br>')
+        parts.append(f"<p>{content}</p>")
+    parts.append('</body></html>')
+    return '\n'.join(parts)
+
+
+def create_slack_blocks(briefing_data: Dict) -> List[Dict]:
+    """
+    슬랙 Block Kit 블록 생성
+
+    Args:
+        briefing_data: 브리핑 데이터
+
+    Returns:
+        블록 리스트
+    """
+    blocks = [
+        {
+            'type': 'header',
+            'text': {'type': 'plain_text', 'text': briefing_data.get('title', '주식 브리핑')[:150]}
+        },
+        {
+            'type': 'section',
+            'text': {'type': 'mrkdwn', 'text': briefing_data.get('summary', '') or ' '}
+        },
+    ]
+    for section in briefing_data.get('sections', []):
+        blocks.append({'type': 'divider'})
+        blocks.append({
+            'type': 'section',
+            # 슬랙 section 텍스트 최대 3000자
+            'text': {'type': 'mrkdwn', 'text': f"*{section.get('title', '')}*\n{section.get('content', '')}"[:3000]}
+        })
+    return blocks
+
+
+# ============================================================================
+# 렌더링 결과
+# ============================================================================
+
+@dataclass
+class RenderedBriefing:
+    """한 번 렌더링된 브리핑 메시지"""
+    from_addr: str
+    # 수신자와 무관한 헤더 + MIME 본문 (CRLF, 수신자 헤더 앞에 붙여 완성)
+    email_static: bytes
+    # 슬랙 payload에서 channel을 뺀 나머지 JSON 조각 ('"blocks": [...]')
+    slack_fragment: str
+    message_domain: str = 'briefing.local'
+    _slack_cache: Dict[str, bytes] = field(default_factory=dict, repr=False)
+
+    def email_for(self, recipient: str) -> RawEmail:
+        """
+        수신자 헤더만 덧붙인 발송용 메일
+
+        헤더는 email.policy.SMTP로 인코딩/폴딩합니다 (문자열을 그대로 이어 붙이지 않음).
+
+        Raises:
+            ValueError: 이메일 주소 형식이 아닌 수신자 (CR/LF 헤더 주입 포함)
+        """
+        address = parse_email_address(recipient)
+        message_id = make_msgid(domain=self.message_domain)
+        headers = ''.join(
+            policy.SMTP.fold(name, value)
+            for name, value in (
+                ('To', str(address)),
+                ('Date', formatdate(localtime=True)),
+                ('Message-ID', message_id),
+            )
+        ).encode('ascii')
+        return RawEmail(
+            from_addr=self.from_addr,
+            to_addrs=[address.addr_spec],
+            data=headers + self.email_static,
+            message_id=message_id
+        )
+
+    def slack_payload_for(self, channel: str) -> bytes:
+        """채널 필드만 덧붙인 웹훅 payload (채널별 1회 직렬화)"""
+        payload = self._slack_cache.get(channel)
+        if payload is None:
+            payload = f'{{"channel": {json.dumps(channel, ensure_ascii=False)}, {self.slack_fragment}}}'.encode('utf-8')
+            self._slack_cache[channel] = payload
+        return payload
+
+
+@timed('render.delivery_message')
+def render_briefing(
+    briefing_data: Dict,
+    image_path: Optional[str] = None,
+    from_addr: str = ''
+) -> RenderedBriefing:
+    """
+    브리핑 1건의 이메일/슬랙 메시지를 한 번 렌더링합니다.
+
+    Args:
+        briefing_data: 브리핑 데이터
+        image_path: 인라인 첨부할 이미지 경로
+        from_addr: 발신자 주소
+
+    Returns:
+        RenderedBriefing (수신자별 email_for(), 채널별 slack_payload_for() 제공)
+    """
+    image_bytes = load_image_bytes(image_path)
+
+    msg = EmailMessage()
+    msg['From'] = from_addr
+    msg['Subject'] = briefing_data.get('title', '주식 브리핑')
+    msg.set_content(briefing_data.get('summary', ''))
+    msg.add_alternative(create_html_body(briefing_data, has_image=image_bytes is not None), subtype='html')
+    if image_bytes is not None:
+        msg.get_payload()[1].add_related(image_bytes, 'image', 'png', cid='<briefing_image>')
+
+    slack_blocks = json.dumps(create_slack_blocks(briefing_data), ensure_ascii=False)
+
+    return RenderedBriefing(
+        from_addr=from_addr,
+        email_static=msg.as_bytes(policy=policy.SMTP),
+        slack_fragment=f'"blocks": {slack_blocks}'
+    )
@@ -17,16 +17,169 @@ Usage:
 """
 
 from docx import Document
+from docx.document import Document as DocumentObject
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
 from docx.shared import Pt, RGBColor, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.table import Table
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from xml.sax.saxutils import escape
 import logging
+import re
+
+from instrumentation import timed
 
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# 템플릿 문서
+# ============================================================================
+
+# (제목 폰트, 본문 폰트, 제목 크기, 본문 크기)
+StyleKey = Tuple[str, str, int, int]
+
+
+def _apply_styles(doc: DocumentObject, title_font: str, body_font: str, title_size: int, body_size: int):
+    """문서 스타일 설정 (Heading 1~3, Normal)"""
+    # Heading 1 스타일
+    style = doc.styles['Heading 1']
+    font = style.font
+    font.name = title_font
+    font.size = Pt(title_size)
+    font.bold = True
+    font.color.rgb = RGBColor(0, 51, 102)  # 다크 블루
+
+    # Heading 2 스타일
+    style = doc.styles['Heading 2']
+    font = style.font
+    font.name = title_font
+    font.size = Pt(18)
+    font.bold = True
+    font.color.rgb = RGBColor(37, 99, 235)  # 블루
+
+    # Heading 3 스타일
+    style = doc.styles['Heading 3']
+    font = style.font
+    font.name = title_font
+    font.size = Pt(14)
+    font.bold = True
+
+    # Normal 스타일
+    style = doc.styles['Normal']
+    font = style.font
+    font.name = body_font
+    font.size = Pt(body_size)
+
+
+@lru_cache(maxsize=8)
+def _template_bytes(styles: Optional[StyleKey] = None) -> bytes:
+    """스타일을 적용한 빈 문서를 한 번만 만들어 .docx 바이트로 보관 (styles가 None이면 기본 스타일)"""
+    doc = Document()
+    if styles is not None:
+        _apply_styles(doc, *styles)
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def new_document(styles: Optional[StyleKey] = None) -> DocumentObject:
+    """
+    템플릿 문서의 복사본 생성
+
+    기본 템플릿을 열고 스타일을 다시 설정하는 대신 준비된 템플릿 바이트를 메모리에서 엽니다.
+
+    Args:
+        styles: (제목 폰트, 본문 폰트, 제목 크기, 본문 크기), None이면 python-docx 기본 스타일
+
+    Returns:
+        새 Document
+    """
+    return Document(BytesIO(_template_bytes(styles)))
+
+
+# ============================================================================
+# 표 일괄 생성
+# ============================================================================
+
+# 셀 텍스트 서식 (w:rPr 내용)
+RUN_BOLD = '<w:b/>'
+RUN_HEADER = '<w:b/><w:sz w:val="22"/>'  # 굵게, 11pt
+RUN_UP = '<w:b/><w:color w:val="008000"/>'  # 굵게, 녹색
+RUN_DOWN = '<w:b/><w:color w:val="FF0000"/>'  # 굵게, 빨간색
+
+# 셀 값: 텍스트 또는 (텍스트, w:rPr 내용)
+Cell = Union[str, Tuple[str, str]]
+
+_RUN_BREAKS = re.compile(r'([\t\n\r])')
+
+
+def change_run(change: float) -> str:
+    """등락률 셀 서식 (상승/보합 녹색, 하락 빨간색)"""
+    return RUN_UP if change >= 0 else RUN_DOWN
+
+
+def _run_xml(text: str, run_props: str) -> str:
+    """텍스트 → w:r (cell.text와 같이 탭은 w:tab, 줄바꿈은 w:br)"""
+    parts = []
+    for piece in _RUN_BREAKS.split(text):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece in ('\n', '\r'):
+            parts.append('<w:br/>')
+        elif piece:
+            parts.append(f'<w:t xml:space="preserve">{escape(piece)}</w:t>')
+    rpr = f'<w:rPr>{run_props}</w:rPr>' if run_props else ''
+    return f'<w:r>{rpr}{"".join(parts)}</w:r>'
+
+
+def add_table(doc: DocumentObject, rows: Sequence[Sequence[Cell]], style: Optional[str] = None) -> Table:
+    """
+    표를 XML로 한 번에 만들어 문서 끝에 추가
+
+    cell.text / run.font 를 셀마다 호출하면 셀당 수십 번의 XML 탐색이 생겨서 행이 많은 표가 느립니다.
+    행 XML을 문자열로 이어 붙여 한 번만 파싱합니다.
+
+    Args:
+        doc: 대상 문서
+        rows: 행 목록 (행마다 열 수가 같아야 함), 셀은 텍스트 또는 (텍스트, RUN_* 서식)
+        style: 표 스타일 이름 (예: 'Light Grid Accent 1')
+
+    Returns:
+        추가된 표
+    """
+    cols = len(rows[0]) if rows else 0
+    table = doc.add_table(rows=0, cols=cols)
+    if style:
+        table.style = style
+
+    # add_table과 같은 열 너비 (본문 폭 / 열 수)
+    widths = [grid_col.w for grid_col in table._tbl.tblGrid.gridCol_lst]
+    tc_prs = [f'<w:tcPr><w:tcW w:type="dxa" w:w="{width.twips}"/></w:tcPr>' for width in widths]
+
+    xml = []
+    for row in rows:
+        xml.append('<w:tr>')
+        for tc_pr, cell in zip(tc_prs, row):
+            text, run_props = (cell, '') if isinstance(cell, str) else cell
+            run = _run_xml(text, run_props) if text else ''
+            xml.append(f'<w:tc>{tc_pr}<w:p>{run}</w:p></w:tc>')
+        xml.append('</w:tr>')
+
+    fragment = parse_xml(f'<w:tbl {nsdecls("w")}>{"".join(xml)}</w:tbl>')
+    table._tbl.extend(list(fragment))
+    return table
+
+
+# ============================================================================
+# 리포트 생성기
+# ============================================================================
+
 class BriefingReportGenerator:
     """브리핑 리포트 생성기"""
 
@@ -39,43 +192,12 @@ class BriefingReportGenerator:
             title_size: 제목 크기
             body_size: 본문 크기
         """
-        self.doc = Document()
         self.title_font = title_font
         self.body_font = body_font
         self.title_size = title_size
         self.body_size = body_size
-        self._setup_styles()
-
-    def _setup_styles(self):
-        """문서 스타일 설정"""
-        # Heading 1 스타일
-        style = self.doc.styles['Heading 1']
-        font = style.font
-        font.name = self.title_font
-        font.size = Pt(self.title_size)
-        font.bold = True
-        font.color.rgb = RGBColor(0, 51, 102)  # 다크 블루
-
-        # Heading 2 스타일
-        style = self.doc.styles['Heading 2']
-        font = style.font
-        font.name = self.title_font
-        font.size = Pt(18)
-        font.bold = True
-        font.color.rgb = RGBColor(37, 99, 235)  # 블루
-
-        # Heading 3 스타일
-        style = self.doc.styles['Heading 3']
-        font = style.font
-        font.name = self.title_font
-        font.size = Pt(14)
-        font.bold = True
-
-        # Normal 스타일
-        style = self.doc.styles['Normal']
-        font = style.font
-        font.name = self.body_font
-        font.size = Pt(self.body_size)
+        # 폰트 설정별로 스타일을 적용한 템플릿을 한 번만 만들고 복사해서 사용
+        self.doc = new_document((title_font, body_font, title_size, body_size))
 
     def add_title_section(self, title: str, date: str):
         """제목 섹션 추가"""
@@ -115,39 +237,14 @@ class BriefingReportGenerator:
             level=3
         )
 
-        # 종목 정보 표
-        table = self.doc.add_table(rows=4, cols=2)
-        table.style = 'Light Grid Accent 1'
-
-        # 현재가
-        cells = table.rows[0].cells
-        cells[0].text = '현재가'
-        cells[1].text = f"${stock.get('price', 0):.2f}"
-
-        # 등락률
-        cells = table.rows[1].cells
-        cells[0].text = '등락률'
+        # 종목 정보 표 (현재가, 등락률, 거래량, 뉴스 요약)
         change = stock.get('change_percent', 0)
-        cells[1].text = f"{change:+.2f}%"
-
-        # 등락률 색상 설정
-        for paragraph in cells[1].paragraphs:
-            for run in paragraph.runs:
-                if change >= 0:
-                    run.font.color.rgb = RGBColor(0, 128, 0)  # 녹색
-                else:
-                    run.font.color.rgb = RGBColor(255, 0, 0)  # 빨간색
-                run.font.bold = True
-
-        # 거래량
-        cells = table.rows[2].cells
-        cells[0].text = '거래량'
-        cells[1].text = f"{stock.get('volume', 0):,}"
-
-        # 뉴스 요약
-        cells = table.rows[3].cells
-        cells[0].text = '뉴스 요약'
-        cells[1].text = stock.get('news_summary', 'N/A')
+        add_table(self.doc, [
+            ['현재가', f"${stock.get('price', 0):.2f}"],
+            ['등락률', (f"{change:+.2f}%", change_run(change))],
+            ['거래량', f"{stock.get('volume', 0):,}"],
+            ['뉴스 요약', stock.get('news_summary', 'N/A')],
+        ], style='Light Grid Accent 1')
 
         # 차트 이미지 삽입 (있는 경우)
         if include_chart:
@@ -179,6 +276,7 @@ class BriefingReportGenerator:
         footer_run.font.size = Pt(9)
         footer_run.font.color.rgb = RGBColor(150, 150, 150)
 
+    @timed('render.docx_save')
     def save(self, output_path: str) -> str:
         """
         문서 저장
@@ -196,10 +294,12 @@ class BriefingReportGenerator:
         return output_path
 
 
+@timed('render.docx_briefing_report')
 def create_briefing_report(
     briefing_data: Dict,
     output_path: str,
-    include_charts: bool = True
+    include_charts: bool = True,
+    chart_range: Optional[str] = None
 ) -> str:
     """
     브리핑 리포트 생성
@@ -212,6 +312,7 @@ def create_briefing_report(
             - stocks: 종목 리스트
         output_path: 저장 경로
         include_charts: 차트 이미지 포함 여부
+        chart_range: 차트 이미지가 없는 종목에 넣을 스파크라인 구간 (예: '1mo', None이면 만들지 않음)
 
     Returns:
         생성된 문서 경로
@@ -252,6 +353,9 @@ def create_briefing_report(
         # 종목 섹션
         generator.doc.add_heading('🔥 화제 종목 TOP 5', level=2)
         for i, stock in enumerate(briefing_data.get('stocks', [])[:5], 1):
+            if include_charts and chart_range and not stock.get('chart_image_path') and stock.get('symbol'):
+                from charts import sparkline_file
+                stock = {**stock, 'chart_image_path': sparkline_file(stock['symbol'], chart_range)}
             generator.add_stock_section(stock, rank=i, include_chart=include_charts)
 
         # 푸터 섹션
@@ -265,6 +369,7 @@ def create_briefing_report(
         raise
 
 
+@timed('render.docx_stock_comparison')
 def create_stock_comparison_report(stocks: List[Dict], output_path: str) -> str:
     """
     종목 비교 리포트 생성
@@ -284,7 +389,7 @@ def create_stock_comparison_report(stocks: List[Dict], output_path: str) -> str:
         create_stock_comparison_report(stocks, 'output/comparison.docx')
     """
     try:
-        doc = Document()
+        doc = new_document()
 
         # 제목
         title = doc.add_heading('종목 비교 분석', level=1)
@@ -292,41 +397,20 @@ def create_stock_comparison_report(stocks: List[Dict], output_path: str) -> str:
 
         doc.add_paragraph()
 
-        # 비교 표 생성
-        table = doc.add_table(rows=len(stocks) + 1, cols=6)
-        table.style = 'Medium Grid 1 Accent 1'
-
-        # 헤더
+        # 비교 표 (헤더 + 종목별 1행)
         headers = ['순위', '티커', '종목명', '현재가', '등락률', '거래량']
-        for i, header in enumerate(headers):
-            cell = table.rows[0].cells[i]
-            cell.text = header
-            for paragraph in cell.paragraphs:
-                for run in paragraph.runs:
-                    run.font.bold = True
-                    run.font.size = Pt(11)
-
-        # 데이터 입력
+        rows: List[List[Cell]] = [[(header, RUN_HEADER) for header in headers]]
         for i, stock in enumerate(stocks, 1):
-            row = table.rows[i]
-            row.cells[0].text = str(i)
-            row.cells[1].text = stock.get('symbol', 'N/A')
-            row.cells[2].text = stock.get('name', 'N/A')
-            row.cells[3].text = f"${stock.get('price', 0):.2f}"
-
-            # 등락률 (색상 적용)
             change = stock.get('change_percent', 0)
-            change_cell = row.cells[4]
-            change_cell.text = f"{change:+.2f}%"
-            for paragraph in change_cell.paragraphs:
-                for run in paragraph.runs:
-                    if change >= 0:
-                        run.font.color.rgb = RGBColor(0, 128, 0)
-                    else:
-                        run.font.color.rgb = RGBColor(255, 0, 0)
-                    run.font.bold = True
-
-            row.cells[5].text = f"{stock.get('volume', 0):,}"
+            rows.append([
+                str(i),
+                stock.get('symbol', 'N/A'),
+                stock.get('name', 'N/A'),
+                f"${stock.get('price', 0):.2f}",
+                (f"{change:+.2f}%", change_run(change)),
+                f"{stock.get('volume', 0):,}",
+            ])
+        add_table(doc, rows, style='Medium Grid 1 Accent 1')
 
         # 저장
         output_file = Path(output_path)
@@ -341,6 +425,7 @@ def create_stock_comparison_report(stocks: List[Dict], output_path: str) -> str:
         raise
 
 
+@timed('render.docx_news_summary')
 def create_news_summary_report(news_items: List[Dict], output_path: str) -> str:
     """
     뉴스 요약 리포트 생성
@@ -366,7 +451,7 @@ def create_news_summary_report(news_items: List[Dict], output_path: str) -> str:
         create_news_summary_report(news_items, 'output/news.docx')
     """
     try:
-        doc = Document()
+        doc = new_document()
 
         # 제목
         doc.add_heading('📰 주요 뉴스 요약', level=1)
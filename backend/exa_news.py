@@ -6,7 +6,10 @@ from typing import List, Dict, Optional
 import logging
 import os
 from pathlib import Path
-from datetime import datetime, timedelta
+from news_dedup import deduplicate_articles
+import resilience
+from instrumentation import span
+from news_cache import get_news_cache, normalize_window
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -26,6 +29,9 @@ except ImportError:
 EXA_API_KEY = os.getenv('EXA_API_KEY', '')
 EXA_API_BASE_URL = 'https://api.exa.ai'
 
+# 중복 제거 후에도 요청 개수를 채우기 위한 초과 요청 배수
+DEDUP_OVERFETCH_FACTOR = 2
+
 
 def initialize_exa_client(api_key: Optional[str] = None) -> Dict[str, str]:
     """
@@ -73,41 +79,53 @@ def search_stock_news(
         api_key: Exa API 키 (선택)
 
     Returns:
-        뉴스 기사 리스트 (title, url, published_date 포함)
+        중복 제거된 뉴스 기사 리스트 (title, url, published_date, source_count 포함)
     """
     try:
+        # 날짜 단위 검색 창으로 정규화 (같은 날의 반복 요청은 같은 캐시 키)
+        window = normalize_window(days_back)
+        news_cache = get_news_cache()
+        cached = news_cache.get(stock_symbol, window, limit)
+        if cached is not None:
+            return cached
+
         client_config = initialize_exa_client(api_key)
 
         # 검색 쿼리 생성
         query = f"{stock_symbol} stock news"
 
-        # 날짜 범위 설정 (ISO 8601 형식)
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_back)
-
         # Exa API 요청
         url = f"{client_config['base_url']}/search"
 
+        # 재배포 사본 제거 후에도 limit개를 채울 수 있도록 초과 요청 (API 제한: 최대 100)
+        num_results = min(limit * DEDUP_OVERFETCH_FACTOR, 100)
+
         payload = {
             'query': query,
-            'num_results': min(limit, 100),  # API 제한: 최대 100
-            'start_published_date': start_date.strftime('%Y-%m-%d'),
-            'end_published_date': end_date.strftime('%Y-%m-%d'),
+            'num_results': num_results,
+            'start_published_date': window[0],
+            'end_published_date': window[1],
             'type': 'auto',  # auto, neural, keyword 중 선택
             'use_autoprompt': True,  # 자동 프롬프트 개선
         }
 
         logger.info(f"Exa API 요청: {query} (최근 {days_back}일)")
 
-        response = requests.post(
-            url,
-            headers=client_config['headers'],
-            json=payload,
-            timeout=30
-        )
+        timeout = resilience.get_timeout('exa')
 
-        response.raise_for_status()
-        data = response.json()
+        def _search():
+            response = requests.post(
+                url,
+                headers=client_config['headers'],
+                json=payload,
+                timeout=timeout
+            )
+            response.raise_for_status()
+            return response.json()
+
+        with span('exa.search'):
+            # 브레이커가 열려 있으면 호출 없이 CircuitOpenError (빈 결과로 처리)
+            data = resilience.call('exa', _search, hedge=True, timeout=timeout)
 
         # 결과 파싱
         news_articles = []
@@ -123,14 +141,24 @@ def search_stock_news(
                 }
                 news_articles.append(article)
 
+        exhausted = len(news_articles) < num_results
+
+        # 재배포/유사 기사 클러스터링 후 대표 기사만 유지
+        news_articles, _ = deduplicate_articles(news_articles)
+        news_cache.put(stock_symbol, window, news_articles, requested=num_results, exhausted=exhausted)
+        news_articles = news_articles[:limit]
+
         logger.info(f"{stock_symbol} 관련 뉴스 {len(news_articles)}개 수집 완료")
         return news_articles
 
     except requests.exceptions.HTTPError as e:
         logger.error(f"Exa API HTTP 오류 ({e.response.status_code}): {e.response.text if e.response else str(e)}")
         return []
-    except requests.exceptions.Timeout:
-        logger.error("Exa API 요청 시간 초과 (30초)")
+    except (requests.exceptions.Timeout, resilience.UpstreamTimeoutError):
+        logger.error("Exa API 요청 시간 초과")
+        return []
+    except resilience.CircuitOpenError as e:
+        logger.warning(f"Exa API 호출 생략: {e}")
         return []
     except requests.exceptions.RequestException as e:
         logger.error(f"Exa API 네트워크 오류: {str(e)}")
@@ -3,25 +3,169 @@ Excel 파일 생성 모듈
 화제 종목 데이터를 Excel 파일로 생성
 """
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
+from typing import Dict, Iterable, Optional, Sequence, Tuple
 import logging
 
+from instrumentation import timed
+
 logger = logging.getLogger(__name__)
 
+# 이 행 수를 넘으면 write-only(스트리밍) 모드로 저장 (행 수를 알 수 없는 generator도 스트리밍)
+WRITE_ONLY_THRESHOLD = 2000
+
+# ============================================================================
+# 스타일 (셀마다 Font/Alignment/Border를 만들지 않고 NamedStyle을 한 번만 등록)
+# ============================================================================
+
+_THIN = Side(border_style='thin', color='000000')
+_BORDER = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+_CENTER = Alignment(horizontal='center', vertical='center')
+_RIGHT = Alignment(horizontal='right', vertical='center')
+
+# 이름: (font, fill, alignment, number_format, border)
+_STYLE_SPECS = {
+    'briefing_title': (Font(size=14, bold=True), None, Alignment(horizontal='center'), 'General', False),
+    'briefing_header': (
+        Font(bold=True, color='FFFFFF'),
+        PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid'),
+        _CENTER, 'General', True
+    ),
+    'briefing_rank': (None, None, _CENTER, 'General', True),
+    'briefing_text': (None, None, None, 'General', True),
+    'briefing_price': (None, None, _RIGHT, '$#,##0.00', True),
+    'briefing_change': (None, None, _RIGHT, '0.00%', True),
+    'briefing_change_up': (Font(color='00B050', bold=True), None, _RIGHT, '0.00%', True),  # 녹색
+    'briefing_change_down': (Font(color='FF0000', bold=True), None, _RIGHT, '0.00%', True),  # 빨간색
+    'briefing_volume': (None, None, _RIGHT, '#,##0', True),
+}
+
+
+def _register_styles(wb: Workbook) -> None:
+    """워크북에 NamedStyle 등록 (파일당 한 번)"""
+    for name, (font, fill, alignment, number_format, bordered) in _STYLE_SPECS.items():
+        style = NamedStyle(name=name, number_format=number_format)
+        if font is not None:
+            style.font = font
+        if fill is not None:
+            style.fill = fill
+        if alignment is not None:
+            style.alignment = alignment
+        if bordered:
+            style.border = _BORDER
+        wb.add_named_style(style)
+
+
+def _change_style(change_percent) -> str:
+    if isinstance(change_percent, (int, float)):
+        if change_percent > 0:
+            return 'briefing_change_up'
+        if change_percent < 0:
+            return 'briefing_change_down'
+    return 'briefing_change'
+
+
+class _StyledCells:
+    """
+    스타일 이름별 셀 생성기
+
+    cell.style = '이름'은 셀마다 NamedStyle 목록을 이름으로 찾으므로, 이름별로 한 번만 찾아 둔
+    스타일 배열을 새 셀에 그대로 붙입니다 (셀 스타일은 저장 전까지 바꾸지 않음).
+    """
+
+    def __init__(self, sheet):
+        self._sheet = sheet
+        self._arrays = {}
+
+    def __call__(self, value, style: str) -> WriteOnlyCell:
+        cell = WriteOnlyCell(self._sheet, value=value)
+        array = self._arrays.get(style)
+        if array is None:
+            cell.style = style
+            self._arrays[style] = cell._style
+        else:
+            cell._style = array
+        return cell
+
+
+def _resolve_output_path(output_dir: Optional[str], filename: str) -> Path:
+    if output_dir is None:
+        output_dir = Path(__file__).parent / 'output' / 'data'
+    else:
+        output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir / filename
+
 
+def _write_table(
+    sheet_title: str,
+    title: str,
+    columns: Sequence[Tuple[str, float]],
+    rows: Iterable[Sequence[Tuple[object, str]]],
+    write_only: bool,
+    output_path: Path
+) -> int:
+    """
+    제목 + 헤더 + 데이터 행으로 된 시트 하나를 저장
+
+    Args:
+        sheet_title: 시트 이름
+        title: 1행 제목
+        columns: (헤더, 열 너비) 목록
+        rows: 행 iterable (각 행은 (값, 스타일 이름) 목록)
+        write_only: write-only(스트리밍) 모드 여부
+        output_path: 저장 경로
+
+    Returns:
+        데이터 행 수
+    """
+    wb = Workbook(write_only=write_only)
+    if write_only:
+        sheet = wb.create_sheet(sheet_title)
+    else:
+        sheet = wb.active
+        sheet.title = sheet_title
+    _register_styles(wb)
+
+    # 열 너비/행 높이는 write-only 모드에서 첫 행을 쓰기 전에 설정해야 함
+    for index, (_, width) in enumerate(columns):
+        sheet.column_dimensions[chr(ord('A') + index)].width = width
+    sheet.row_dimensions[1].height = 25
+    sheet.row_dimensions[2].height = 20
+
+    cell = _StyledCells(sheet)
+    last_column = chr(ord('A') + len(columns) - 1)
+    sheet.append([cell(title, 'briefing_title')])
+    if write_only:
+        sheet.merged_cells.add(f'A1:{last_column}1')
+    else:
+        sheet.merge_cells(f'A1:{last_column}1')
+    sheet.append([cell(header, 'briefing_header') for header, _ in columns])
+
+    count = 0
+    for row in rows:
+        sheet.append([cell(value, style) for value, style in row])
+        count += 1
+
+    wb.save(str(output_path))
+    return count
+
+
+@timed('render.excel_trending_stocks')
 def create_trending_stocks_excel(
-    stocks: List[Dict],
+    stocks: Iterable[Dict],
     output_dir: str = None,
-    filename: str = None
+    filename: str = None,
+    write_only: Optional[bool] = None
 ) -> str:
     """
     화제 종목 데이터를 Excel 파일로 생성
     
     Args:
-        stocks: 종목 데이터 리스트
+        stocks: 종목 데이터 리스트 또는 generator
             각 항목은 다음 키를 포함해야 함:
             - symbol: 종목 심볼 (예: 'AAPL')
             - name: 종목명 (예: 'Apple Inc.')
@@ -29,109 +173,46 @@ def create_trending_stocks_excel(
             - change_percent: 등락률 (소수점, 예: 0.05 = 5%)
         output_dir: 출력 디렉토리 (기본값: backend/output/data)
         filename: 파일명 (기본값: trending_YYYY-MM-DD.xlsx)
+        write_only: 스트리밍 모드 (기본값: WRITE_ONLY_THRESHOLD행 초과 또는 generator이면 사용)
     
     Returns:
         생성된 Excel 파일 경로
     """
     try:
-        # 출력 경로 설정
-        if output_dir is None:
-            script_dir = Path(__file__).parent
-            output_dir = script_dir / 'output' / 'data'
-        else:
-            output_dir = Path(output_dir)
-        
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
         if filename is None:
             date_str = datetime.now().strftime('%Y-%m-%d')
             filename = f'trending_{date_str}.xlsx'
-        
-        output_path = output_dir / filename
-        
-        # Workbook 생성
-        wb = Workbook()
-        sheet = wb.active
-        sheet.title = "Trending Stocks"
-        
-        # 제목 행
-        title = f'화제 종목 TOP {len(stocks)} - {datetime.now().strftime("%Y.%m.%d")}'
-        sheet['A1'] = title
-        sheet['A1'].font = Font(size=14, bold=True)
-        sheet['A1'].alignment = Alignment(horizontal='center')
-        sheet.merge_cells(f'A1:E1')
-        
-        # 헤더
-        headers = ['순위', '티커', '종목명', '주가', '등락률']
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=2, column=col)
-            cell.value = header
-            cell.font = Font(bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-        
-        # 테두리 스타일
-        thin = Side(border_style='thin', color='000000')
-        border = Border(left=thin, right=thin, top=thin, bottom=thin)
-        
-        # 데이터 입력
-        for idx, stock in enumerate(stocks, 1):
-            row_idx = idx + 2  # 헤더 다음 행부터
-            
-            # 데이터 추출
-            symbol = stock.get('symbol', 'N/A')
-            name = stock.get('name', 'N/A')
-            price = stock.get('price', 0)
-            change_percent = stock.get('change_percent', 0)
-            
-            # 데이터 입력
-            sheet.cell(row=row_idx, column=1).value = idx  # 순위
-            sheet.cell(row=row_idx, column=2).value = symbol  # 티커
-            sheet.cell(row=row_idx, column=3).value = name  # 종목명
-            sheet.cell(row=row_idx, column=4).value = price  # 주가
-            sheet.cell(row=row_idx, column=5).value = change_percent  # 등락률
-            
-            # 셀 스타일 적용
-            for col_idx in range(1, 6):
-                cell = sheet.cell(row=row_idx, column=col_idx)
-                cell.border = border
-                
-                # 순위 - 중앙 정렬
-                if col_idx == 1:
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-                
-                # 주가 - 통화 형식, 우측 정렬
-                if col_idx == 4:
-                    cell.number_format = '$#,##0.00'
-                    cell.alignment = Alignment(horizontal='right', vertical='center')
-                
-                # 등락률 - 퍼센트 형식, 색상 적용
-                if col_idx == 5:
-                    cell.number_format = '0.00%'
-                    cell.alignment = Alignment(horizontal='right', vertical='center')
-                    if change_percent > 0:
-                        cell.font = Font(color='00B050', bold=True)  # 녹색
-                    elif change_percent < 0:
-                        cell.font = Font(color='FF0000', bold=True)  # 빨간색
-        
-        # 헤더 테두리 추가
-        for col in range(1, 6):
-            sheet.cell(row=2, column=col).border = border
-        
-        # 열 너비 설정
-        sheet.column_dimensions['A'].width = 8
-        sheet.column_dimensions['B'].width = 10
-        sheet.column_dimensions['C'].width = 20
-        sheet.column_dimensions['D'].width = 12
-        sheet.column_dimensions['E'].width = 12
-        
-        # 행 높이 설정
-        sheet.row_dimensions[1].height = 25
-        sheet.row_dimensions[2].height = 20
-        
-        # 파일 저장
-        wb.save(str(output_path))
-        logger.info(f"Excel 파일 생성 완료: {output_path}")
+        output_path = _resolve_output_path(output_dir, filename)
+
+        sized = hasattr(stocks, '__len__')
+        if write_only is None:
+            write_only = not sized or len(stocks) > WRITE_ONLY_THRESHOLD
+
+        if sized:
+            title = f'화제 종목 TOP {len(stocks)} - {datetime.now().strftime("%Y.%m.%d")}'
+        else:
+            title = f'화제 종목 - {datetime.now().strftime("%Y.%m.%d")}'
+
+        def rows():
+            for idx, stock in enumerate(stocks, 1):
+                change_percent = stock.get('change_percent', 0)
+                yield (
+                    (idx, 'briefing_rank'),  # 순위
+                    (stock.get('symbol', 'N/A'), 'briefing_text'),  # 티커
+                    (stock.get('name', 'N/A'), 'briefing_text'),  # 종목명
+                    (stock.get('price', 0), 'briefing_price'),  # 주가
+                    (change_percent, _change_style(change_percent)),  # 등락률
+                )
+
+        count = _write_table(
+            "Trending Stocks",
+            title,
+            [('순위', 8), ('티커', 10), ('종목명', 20), ('주가', 12), ('등락률', 12)],
+            rows(),
+            write_only,
+            output_path
+        )
+        logger.info(f"Excel 파일 생성 완료: {output_path} ({count}행{', 스트리밍' if write_only else ''})")
         
         return str(output_path)
         
@@ -140,6 +221,64 @@ def create_trending_stocks_excel(
         raise
 
 
+@timed('render.excel_briefing_history')
+def create_briefing_history_excel(
+    rows: Optional[Iterable[Dict]] = None,
+    output_dir: str = None,
+    filename: str = None
+) -> str:
+    """
+    저장된 모든 브리핑의 종목 이력을 Excel 파일로 생성 (항상 스트리밍, 메모리 사용량 일정)
+
+    Args:
+        rows: 이력 행 iterable (기본값: BriefingStore.iter_stock_rows())
+            각 항목: generated_at, briefing_id, symbol, name, price, change_percent (%), volume
+        output_dir: 출력 디렉토리 (기본값: backend/output/data)
+        filename: 파일명 (기본값: briefing_history_YYYY-MM-DD.xlsx)
+
+    Returns:
+        생성된 Excel 파일 경로
+    """
+    try:
+        if rows is None:
+            from briefing_store import get_briefing_store
+            rows = get_briefing_store().iter_stock_rows()
+        if filename is None:
+            filename = f"briefing_history_{datetime.now().strftime('%Y-%m-%d')}.xlsx"
+        output_path = _resolve_output_path(output_dir, filename)
+
+        def table_rows():
+            for row in rows:
+                change_percent = row.get('change_percent') or 0
+                # 저장소의 등락률은 % 단위 → 셀 서식(0.00%)에 맞춰 비율로 변환
+                ratio = change_percent / 100 if isinstance(change_percent, (int, float)) else change_percent
+                yield (
+                    ((row.get('generated_at') or '')[:19].replace('T', ' '), 'briefing_text'),
+                    (row.get('briefing_id', ''), 'briefing_text'),
+                    (row.get('symbol', ''), 'briefing_text'),
+                    (row.get('name', ''), 'briefing_text'),
+                    (row.get('price', 0), 'briefing_price'),
+                    (ratio, _change_style(ratio)),
+                    (row.get('volume', 0), 'briefing_volume'),
+                )
+
+        count = _write_table(
+            "Briefing History",
+            f'브리핑 종목 이력 - {datetime.now().strftime("%Y.%m.%d")}',
+            [('생성 시각', 20), ('브리핑 ID', 34), ('티커', 10), ('종목명', 24), ('주가', 12), ('등락률', 12), ('거래량', 16)],
+            table_rows(),
+            True,
+            output_path
+        )
+        logger.info(f"브리핑 이력 Excel 생성 완료: {output_path} ({count}행)")
+
+        return str(output_path)
+
+    except Exception as e:
+        logger.error(f"브리핑 이력 Excel 생성 실패: {str(e)}")
+        raise
+
+
 if __name__ == '__main__':
     # 테스트 데이터
     test_stocks = [
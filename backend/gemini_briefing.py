@@ -1,8 +1,10 @@
 """
 Google Gemini API를 사용하여 브리핑 텍스트와 뉴스 요약을 생성하는 모듈
 """
-from google import genai
-from typing import List, Dict, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Dict, Optional
+import importlib.util
 import logging
 import os
 from datetime import datetime
@@ -10,15 +12,20 @@ from pathlib import Path
 import base64
 from io import BytesIO
 
+import resilience
+from llm_cache import get_llm_cache
+from instrumentation import span, timed
+
+if TYPE_CHECKING:
+    from google import genai
+
 # 로깅 설정 (모듈 최상단에서 초기화)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-try:
-    from PIL import Image, ImageDraw, ImageFont
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+# google-genai와 Pillow는 import 비용이 커서 처음 사용할 때 불러옴 (설치 여부만 미리 확인)
+PIL_AVAILABLE = importlib.util.find_spec('PIL') is not None
+if not PIL_AVAILABLE:
     logger.warning("Pillow가 설치되지 않았습니다. 이미지 생성 기능이 제한될 수 있습니다.")
 
 # .env 파일에서 API 키 로드 (python-dotenv 사용)
@@ -35,6 +42,13 @@ except ImportError:
 # 환경 변수에서 API 키 가져오기
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
 
+# 텍스트 생성 모델
+TEXT_MODEL = 'gemini-2.0-flash-exp'
+
+# Pillow 브리핑 이미지 폭 / 최소 높이 (높이는 내용에 맞춰 늘어남)
+PILLOW_IMAGE_WIDTH = 1200
+PILLOW_IMAGE_MIN_HEIGHT = 630
+
 
 def initialize_client(api_key: Optional[str] = None) -> genai.Client:
     """
@@ -54,9 +68,42 @@ def initialize_client(api_key: Optional[str] = None) -> genai.Client:
             "환경 변수 GEMINI_API_KEY를 설정하거나 api_key 파라미터를 제공하세요."
         )
     
+    from google import genai
     return genai.Client(api_key=api_key)
 
 
+def _generate_text(client: genai.Client, prompt: str, model: str = TEXT_MODEL) -> str:
+    """
+    텍스트 생성 (LLM 캐시 우선 조회)
+    
+    Gemini 브레이커가 열려 있으면 호출하지 않고 CircuitOpenError를 던지며,
+    호출하는 쪽의 except 블록이 기존 대체 문구를 반환합니다.
+    
+    Args:
+        client: Gemini API 클라이언트
+        prompt: 프롬프트
+        model: 모델명
+    
+    Returns:
+        생성된 텍스트
+    """
+    cache = get_llm_cache()
+    cached = cache.get(model, prompt)
+    if cached is not None:
+        return cached
+    
+    with span('gemini.generate_content', model=model):
+        response = resilience.call(
+            'gemini',
+            lambda: client.models.generate_content(model=model, contents=prompt)
+        )
+        text = response.text
+    if text:
+        cache.put(model, prompt, text)
+    return text
+
+
+@timed('gemini.translate_news_to_korean')
 def translate_news_to_korean(news_articles: List[Dict], api_key: Optional[str] = None) -> List[Dict]:
     """
     뉴스 제목과 요약을 한국어로 번역합니다.
@@ -90,12 +137,7 @@ def translate_news_to_korean(news_articles: List[Dict], api_key: Optional[str] =
 번역된 제목만 출력하고, 다른 설명은 생략하세요."""
 
             # Gemini API 호출
-            response = client.models.generate_content(
-                model='gemini-2.0-flash-exp',
-                contents=prompt
-            )
-            
-            translated_title = response.text.strip()
+            translated_title = _generate_text(client, prompt).strip()
             
             # 요약이 있으면 번역 (너무 짧거나 없으면 건너뛰기)
             translated_summary = summary
@@ -107,11 +149,7 @@ def translate_news_to_korean(news_articles: List[Dict], api_key: Optional[str] =
 번역된 요약만 출력하고, 다른 설명은 생략하세요."""
                 
                 try:
-                    summary_response = client.models.generate_content(
-                        model='gemini-2.0-flash-exp',
-                        contents=summary_prompt
-                    )
-                    translated_summary = summary_response.text.strip()
+                    translated_summary = _generate_text(client, summary_prompt).strip()
                 except Exception as e:
                     logger.warning(f"요약 번역 실패: {str(e)}")
             
@@ -133,6 +171,7 @@ def translate_news_to_korean(news_articles: List[Dict], api_key: Optional[str] =
         return news_articles
 
 
+@timed('gemini.generate_briefing_text')
 def generate_briefing_text(
     stocks: List[Dict],
     language: str = 'ko',
@@ -190,13 +229,8 @@ JSON 형식으로 반환해주세요:
 }}
 """
         
-        response = client.models.generate_content(
-            model="gemini-2.0-flash-exp",
-            contents=prompt,
-        )
-        
         # 응답 파싱 (실제로는 JSON 파싱이 필요할 수 있음)
-        result_text = response.text
+        result_text = _generate_text(client, prompt)
         
         # 간단한 파싱 (실제로는 더 정교한 JSON 파싱 필요)
         # 여기서는 기본 구조만 반환
@@ -233,6 +267,7 @@ JSON 형식으로 반환해주세요:
         }
 
 
+@timed('gemini.summarize_news')
 def summarize_news(
     news_articles: List[Dict],
     language: str = 'ko',
@@ -268,18 +303,14 @@ def summarize_news(
 요약:
 """
         
-        response = client.models.generate_content(
-            model="gemini-2.0-flash-exp",
-            contents=prompt,
-        )
-        
-        return response.text
+        return _generate_text(client, prompt)
     
     except Exception as e:
         logger.error(f"뉴스 요약 실패: {str(e)}")
         return "뉴스 요약을 생성할 수 없습니다."
 
 
+@timed('gemini.generate_stock_analysis')
 def generate_stock_analysis(
     stock_symbol: str,
     stock_data: Dict,
@@ -315,18 +346,14 @@ def generate_stock_analysis(
 2-3문장으로 핵심 내용을 요약해주세요:
 """
         
-        response = client.models.generate_content(
-            model="gemini-2.0-flash-exp",
-            contents=prompt,
-        )
-        
-        return response.text
+        return _generate_text(client, prompt)
     
     except Exception as e:
         logger.error(f"종목 분석 생성 실패: {str(e)}")
         return f"{stock_symbol}에 대한 분석을 생성할 수 없습니다."
 
 
+@timed('gemini.generate_briefing_image')
 def generate_briefing_image(
     briefing_text: Dict[str, str],
     stock_data: Dict,
@@ -388,6 +415,7 @@ def generate_briefing_image(
         return None
 
 
+@timed('render.briefing_image_pillow')
 def generate_briefing_image_with_pillow(
     briefing_text: Dict[str, str],
     stock_data: Dict,
@@ -410,80 +438,58 @@ def generate_briefing_image_with_pillow(
         logger.error("Pillow가 설치되지 않아 이미지를 생성할 수 없습니다.")
         return None
     
+    from PIL import Image, ImageDraw
+
+    from text_layout import load_font, wrap_text
+    
     try:
-        # 이미지 크기 설정
-        width, height = 1200, 1600
-        image = Image.new('RGB', (width, height), color='white')
-        draw = ImageDraw.Draw(image)
+        # 폭은 고정, 높이는 내용에 맞춤
+        width = PILLOW_IMAGE_WIDTH
+        margin = 50
+        text_width = width - margin * 2
         
-        # 폰트 설정 (시스템 기본 폰트 사용)
-        try:
-            title_font = ImageFont.truetype("arial.ttf", 48)
-            subtitle_font = ImageFont.truetype("arial.ttf", 32)
-            body_font = ImageFont.truetype("arial.ttf", 24)
-        except:
-            # 폰트를 찾을 수 없으면 기본 폰트 사용
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
-            body_font = ImageFont.load_default()
+        title_font = load_font(48)
+        subtitle_font = load_font(32)
+        body_font = load_font(24)
         
+        # 배치: (y, 텍스트, 색, 폰트) 목록을 먼저 만들고 캔버스 높이를 정한 뒤 그림
+        draws = []
         y_position = 50
         
-        # 제목 그리기
-        title = briefing_text.get('title', '주식 브리핑')
-        draw.text((50, y_position), title, fill='black', font=title_font)
-        y_position += 80
+        def add_block(text: str, fill: str, font, line_height: int, after: int) -> None:
+            nonlocal y_position
+            for line in wrap_text(text, font, text_width):
+                draws.append((y_position, line, fill, font))
+                y_position += line_height
+            y_position += after
         
-        # 요약 그리기
-        summary = briefing_text.get('summary', '')
-        draw.text((50, y_position), summary, fill='gray', font=body_font)
-        y_position += 100
+        # 제목
+        add_block(briefing_text.get('title', '주식 브리핑'), 'black', title_font, 60, 20)
         
-        # 종목 정보 그리기
+        # 요약
+        add_block(briefing_text.get('summary', ''), 'gray', body_font, 35, 65)
+        
+        # 종목 정보
         symbol = stock_data.get('symbol', 'N/A')
         name = stock_data.get('name', 'N/A')
         price = stock_data.get('price', 0)
         change_percent = stock_data.get('change_percent', 0)
         
-        stock_info = f"{symbol} - {name}"
-        draw.text((50, y_position), stock_info, fill='blue', font=subtitle_font)
-        y_position += 60
+        add_block(f"{symbol} - {name}", 'blue', subtitle_font, 45, 15)
+        add_block(f"현재가: ${price:.2f}", 'black', body_font, 40, 0)
+        change_color = 'green' if change_percent >= 0 else 'red'
+        add_block(f"변동률: {change_percent:+.2f}%", change_color, body_font, 40, 20)
         
-        price_text = f"현재가: ${price:.2f}"
-        draw.text((50, y_position), price_text, fill='black', font=body_font)
-        y_position += 40
+        # 섹션 (최대 3개)
+        for section in briefing_text.get('sections', [])[:3]:
+            add_block(section.get('title', ''), 'darkblue', subtitle_font, 45, 5)
+            add_block(section.get('content', ''), 'black', body_font, 35, 35)
         
-        change_color = 'green' if change_percent >= 0 else 'red'
-        change_text = f"변동률: {change_percent:+.2f}%"
-        draw.text((50, y_position), change_text, fill=change_color, font=body_font)
-        y_position += 60
-        
-        # 섹션 그리기
-        sections = briefing_text.get('sections', [])
-        for section in sections[:3]:  # 최대 3개 섹션만
-            section_title = section.get('title', '')
-            section_content = section.get('content', '')
-            
-            draw.text((50, y_position), section_title, fill='darkblue', font=subtitle_font)
-            y_position += 50
-            
-            # 긴 텍스트는 줄바꿈 처리
-            words = section_content.split()
-            line = ""
-            for word in words:
-                test_line = line + word + " "
-                bbox = draw.textbbox((0, 0), test_line, font=body_font)
-                if bbox[2] - bbox[0] < width - 100:
-                    line = test_line
-                else:
-                    draw.text((50, y_position), line, fill='black', font=body_font)
-                    y_position += 35
-                    line = word + " "
-            if line:
-                draw.text((50, y_position), line, fill='black', font=body_font)
-                y_position += 50
-            
-            y_position += 20
+        height = max(PILLOW_IMAGE_MIN_HEIGHT, y_position + margin)
+        image = Image.new('RGB', (width, height), color='white')
+        draw = ImageDraw.Draw(image)
+        for y, line, fill, font in draws:
+            draw.text((margin, y), line, fill=fill, font=font)
         
         # 이미지 저장 또는 반환
         if output_path:
@@ -503,6 +509,7 @@ def generate_briefing_image_with_pillow(
         return None
 
 
+@timed('gemini.analyze_why_trending')
 def analyze_why_trending(
     stock_symbol: str,
     stock_data: Dict,
@@ -548,12 +555,7 @@ def analyze_why_trending(
 뉴스 내용, 가격 변동, 거래량 등을 종합하여 설명해주세요.
 """
         
-        response = client.models.generate_content(
-            model="gemini-2.0-flash-exp",
-            contents=prompt,
-        )
-        
-        return response.text
+        return _generate_text(client, prompt)
     
     except Exception as e:
         logger.error(f"화제 원인 분석 실패: {str(e)}")
@@ -2,11 +2,46 @@
 브리핑 카드 이미지 생성 스크립트
 
 실제 브리핑 데이터를 사용하여 시각적인 브리핑 카드를 생성합니다.
+
+카드마다 바뀌지 않는 부분(배경, 헤더 바, 로고, 날짜, 카드 테두리, 섹션 제목, 푸터 구분선/브랜딩)은
+정적 레이어로 테마/크기/날짜별 한 번만 그려 캐시하고, 카드마다 레이어 복사본 위에 종목 정보만 그립니다.
 """
 
 from PIL import Image, ImageDraw, ImageFont
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+import threading
+
+from instrumentation import timed
+from text_layout import load_font, wrap_text
+
+# 출력 크기 (모두 OG 이미지와 같은 비율, 큰 크기 하나를 그린 뒤 축소)
+CARD_SIZES = {
+    'og': (1200, 630),
+    'mobile': (800, 420),
+    'thumbnail': (400, 210),
+}
+
+# PNG 압축 수준 (기본값 6보다 인코딩이 30%가량 빠르고 파일은 조금 커짐)
+PNG_COMPRESS_LEVEL = 3
+
+# 정적 레이어 캐시 최대 개수 (테마 x 크기 x 날짜 x 하이라이트 유무)
+MAX_STATIC_LAYERS = 16
+
+_static_layers: "OrderedDict[Tuple, Image.Image]" = OrderedDict()
+_static_layers_lock = threading.Lock()
+
+
+def _downscale(image: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    """축소 (정수배면 reduce(), 아니면 LANCZOS)"""
+    if image.size == size:
+        return image
+    factor, remainder = divmod(image.width, size[0])
+    if remainder == 0 and image.height == size[1] * factor:
+        return image.reduce(factor)
+    return image.resize(size, Image.LANCZOS, reducing_gap=2.0)
 
 
 class BriefingCardGenerator:
@@ -27,6 +62,7 @@ class BriefingCardGenerator:
             'danger': (239, 68, 68),         # red-500
         }
 
+    @timed('render.briefing_card')
     def create_briefing_card(
         self,
         title: str,
@@ -36,7 +72,8 @@ class BriefingCardGenerator:
         current_price: float,
         change_percent: float,
         highlights: list = None,
-        output_path: str = None
+        output_path: str = None,
+        sparkline_path: Optional[str] = None
     ):
         """
         브리핑 카드 이미지 생성
@@ -50,6 +87,7 @@ class BriefingCardGenerator:
             change_percent: 변동률
             highlights: 주요 포인트 리스트
             output_path: 저장 경로
+            sparkline_path: 종목 정보 카드에 넣을 스파크라인 PNG (charts.sparkline_file)
         """
         if output_path is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -58,28 +96,128 @@ class BriefingCardGenerator:
         # 출력 디렉토리 생성
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-        # 이미지 생성
-        img = Image.new('RGB', (self.width, self.height), self.colors['background'])
+        img = self.render_card(
+            title, summary, stock_symbol, stock_name, current_price, change_percent, highlights,
+            sparkline_path
+        )
+
+        # 저장
+        img.save(output_path, compress_level=PNG_COMPRESS_LEVEL)
+        print(f"Briefing card created: {output_path}")
+
+        return output_path
+
+    @timed('render.briefing_card_sizes')
+    def create_briefing_cards(
+        self,
+        title: str,
+        summary: str,
+        stock_symbol: str,
+        stock_name: str,
+        current_price: float,
+        change_percent: float,
+        highlights: list = None,
+        output_dir: str = 'output',
+        sizes: Iterable[str] = tuple(CARD_SIZES),
+        sparkline_path: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        여러 크기의 브리핑 카드를 한 번에 생성 (가장 큰 크기로 한 번 그린 뒤 축소)
+
+        Args:
+            title ~ highlights, sparkline_path: create_briefing_card()와 같음
+            output_dir: 저장 디렉토리
+            sizes: CARD_SIZES의 이름 ('og', 'mobile', 'thumbnail')
+
+        Returns:
+            {크기 이름: 저장 경로}
+        """
+        sizes = list(sizes)
+        unknown = [name for name in sizes if name not in CARD_SIZES]
+        if unknown:
+            raise ValueError(f"지원하지 않는 카드 크기: {', '.join(unknown)} (가능: {', '.join(CARD_SIZES)})")
+
+        master = self.render_card(
+            title, summary, stock_symbol, stock_name, current_price, change_percent, highlights,
+            sparkline_path
+        )
+
+        directory = Path(output_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        paths = {}
+        for name in sizes:
+            size = CARD_SIZES[name]
+            image = _downscale(master, size)
+            path = directory / f"briefing_card_{stock_symbol}_{timestamp}_{name}.png"
+            image.save(path, compress_level=PNG_COMPRESS_LEVEL)
+            paths[name] = str(path)
+        return paths
+
+    def render_card(
+        self,
+        title: str,
+        summary: str,
+        stock_symbol: str,
+        stock_name: str,
+        current_price: float,
+        change_percent: float,
+        highlights: Optional[list] = None,
+        sparkline_path: Optional[str] = None
+    ) -> Image.Image:
+        """
+        브리핑 카드를 메모리에 그리기 (정적 레이어 복사본 + 종목별 내용)
+
+        Returns:
+            self.width x self.height RGB 이미지
+        """
+        img = self._static_layer(datetime.now().strftime('%Y년 %m월 %d일'), bool(highlights)).copy()
         draw = ImageDraw.Draw(img)
 
         # 각 섹션 그리기
         self._draw_header(draw, title)
         self._draw_stock_info_card(draw, stock_symbol, stock_name, current_price, change_percent)
+        if sparkline_path:
+            self._paste_sparkline(img, sparkline_path)
         self._draw_summary(draw, summary)
 
         if highlights:
             self._draw_highlights(draw, highlights)
 
         self._draw_footer(draw)
-
-        # 저장
-        img.save(output_path, quality=95)
-        print(f"Briefing card created: {output_path}")
-
-        return output_path
-
-    def _draw_header(self, draw: ImageDraw, title: str):
-        """헤더 그리기"""
+        return img
+
+    # ========================================================================
+    # 정적 레이어
+    # ========================================================================
+
+    def _static_layer(self, date_text: str, with_highlights: bool) -> Image.Image:
+        """테마/크기/날짜별 정적 레이어 (캐시, 호출한 쪽에서 copy() 후 사용)"""
+        key = (self.width, self.height, tuple(sorted(self.colors.items())), date_text, with_highlights)
+        with _static_layers_lock:
+            layer = _static_layers.get(key)
+            if layer is not None:
+                _static_layers.move_to_end(key)
+                return layer
+
+        layer = Image.new('RGB', (self.width, self.height), self.colors['background'])
+        draw = ImageDraw.Draw(layer)
+        self._draw_header_static(draw, date_text)
+        self._draw_stock_info_frame(draw)
+        self._draw_section_title(draw, 290, "📊 브리핑 요약", 24)
+        if with_highlights:
+            self._draw_section_title(draw, 480, "✨ 주요 포인트", 22)
+        self._draw_footer_static(draw)
+
+        with _static_layers_lock:
+            _static_layers[key] = layer
+            while len(_static_layers) > MAX_STATIC_LAYERS:
+                _static_layers.popitem(last=False)
+        return layer
+
+    def _draw_header_static(self, draw: ImageDraw, date_text: str):
+        """헤더 배경, 로고, 날짜"""
         # 헤더 배경
         draw.rectangle([0, 0, self.width, 100], fill=self.colors['accent'])
 
@@ -93,7 +231,6 @@ class BriefingCardGenerator:
         )
 
         # 날짜
-        date_text = datetime.now().strftime('%Y년 %m월 %d일')
         draw.text(
             (self.width - 250, 25),
             date_text,
@@ -101,7 +238,52 @@ class BriefingCardGenerator:
             font=logo_font
         )
 
-        # 타이틀
+    def _draw_stock_info_frame(self, draw: ImageDraw):
+        """종목 정보 카드 배경"""
+        card_y = 120
+        card_height = 140
+
+        draw.rectangle(
+            [30, card_y, self.width - 30, card_y + card_height],
+            fill=self.colors['card'],
+            outline=self.colors['accent'],
+            width=3
+        )
+
+    def _draw_section_title(self, draw: ImageDraw, y: int, text: str, size: int):
+        """섹션 타이틀"""
+        draw.text(
+            (50, y),
+            text,
+            fill=self.colors['accent'],
+            font=self._get_font(size, bold=True)
+        )
+
+    def _draw_footer_static(self, draw: ImageDraw):
+        """푸터 구분선, 브랜딩"""
+        footer_y = self.height - 40
+
+        # 구분선
+        draw.line(
+            [40, footer_y - 10, self.width - 40, footer_y - 10],
+            fill=self.colors['accent'],
+            width=2
+        )
+
+        # 브랜딩
+        draw.text(
+            (self.width - 300, footer_y),
+            "Powered by Claude & Gemini",
+            fill=self.colors['text_secondary'],
+            font=self._get_font(14)
+        )
+
+    # ========================================================================
+    # 카드별 내용
+    # ========================================================================
+
+    def _draw_header(self, draw: ImageDraw, title: str):
+        """헤더 타이틀 그리기"""
         title_font = self._get_font(28, bold=True)
         draw.text(
             (40, 60),
@@ -118,17 +300,8 @@ class BriefingCardGenerator:
         price: float,
         change: float
     ):
-        """종목 정보 카드 그리기"""
+        """종목 정보 카드 내용 그리기"""
         card_y = 120
-        card_height = 140
-
-        # 카드 배경
-        draw.rectangle(
-            [30, card_y, self.width - 30, card_y + card_height],
-            fill=self.colors['card'],
-            outline=self.colors['accent'],
-            width=3
-        )
 
         # 종목 심볼 (큰 글씨)
         symbol_font = self._get_font(48, bold=True)
@@ -182,25 +355,28 @@ class BriefingCardGenerator:
             font=change_font
         )
 
+    def _paste_sparkline(self, img: Image.Image, sparkline_path: str):
+        """종목명과 현재가 사이에 스파크라인 붙이기 (투명 배경 PNG)"""
+        box = (self.width - 800, 140, self.width - 480, 230)
+        size = (box[2] - box[0], box[3] - box[1])
+        try:
+            with Image.open(sparkline_path) as sparkline:
+                sparkline = sparkline.convert('RGBA')
+                if sparkline.size != size:
+                    sparkline = sparkline.resize(size, Image.LANCZOS)
+                img.paste(sparkline, box[:2], sparkline)
+        except OSError as e:
+            print(f"Sparkline skipped: {e}")
+
     def _draw_summary(self, draw: ImageDraw, summary: str):
-        """요약 그리기"""
+        """요약 텍스트 그리기"""
         summary_y = 290
 
-        # 섹션 타이틀
-        section_font = self._get_font(24, bold=True)
-        draw.text(
-            (50, summary_y),
-            "📊 브리핑 요약",
-            fill=self.colors['accent'],
-            font=section_font
-        )
-
-        # 요약 텍스트
         summary_font = self._get_font(20)
-        lines = self._wrap_text(summary, summary_font, self.width - 100)
+        lines = wrap_text(summary, summary_font, self.width - 100, max_lines=5)  # 최대 5줄
 
         y_position = summary_y + 45
-        for line in lines[:5]:  # 최대 5줄
+        for line in lines:
             draw.text(
                 (50, y_position),
                 line,
@@ -210,18 +386,9 @@ class BriefingCardGenerator:
             y_position += 35
 
     def _draw_highlights(self, draw: ImageDraw, highlights: list):
-        """주요 포인트 그리기"""
+        """주요 포인트 목록 그리기"""
         highlights_y = 480
 
-        # 섹션 타이틀
-        section_font = self._get_font(22, bold=True)
-        draw.text(
-            (50, highlights_y),
-            "✨ 주요 포인트",
-            fill=self.colors['accent'],
-            font=section_font
-        )
-
         # 하이라이트 리스트
         bullet_font = self._get_font(18)
         y_position = highlights_y + 40
@@ -243,17 +410,9 @@ class BriefingCardGenerator:
             y_position += 30
 
     def _draw_footer(self, draw: ImageDraw):
-        """푸터 그리기"""
+        """푸터 생성 정보 그리기"""
         footer_y = self.height - 40
 
-        # 구분선
-        draw.line(
-            [40, footer_y - 10, self.width - 40, footer_y - 10],
-            fill=self.colors['accent'],
-            width=2
-        )
-
-        # 생성 정보
         footer_font = self._get_font(14)
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M KST')
 
@@ -264,56 +423,13 @@ class BriefingCardGenerator:
             font=footer_font
         )
 
-        # 브랜딩
-        draw.text(
-            (self.width - 300, footer_y),
-            "Powered by Claude & Gemini",
-            fill=self.colors['text_secondary'],
-            font=footer_font
-        )
-
     def _get_font(self, size: int, bold: bool = False):
-        """폰트 로드"""
-        font_paths = [
-            "C:/Windows/Fonts/malgun.ttf",
-            "C:/Windows/Fonts/arial.ttf",
-            "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-        ]
-
-        for font_path in font_paths:
-            try:
-                return ImageFont.truetype(font_path, size)
-            except:
-                continue
-
-        return ImageFont.load_default()
+        """폰트 로드 (크기별로 한 번만 열고 재사용)"""
+        return load_font(size)
 
     def _wrap_text(self, text: str, font: ImageFont, max_width: int) -> list:
-        """텍스트 줄바꿈"""
-        lines = []
-        words = text.split()
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + word + " "
-
-            try:
-                bbox = font.getbbox(test_line)
-                width = bbox[2] - bbox[0]
-            except:
-                width = len(test_line) * 10
-
-            if width <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line.strip())
-                current_line = word + " "
-
-        if current_line:
-            lines.append(current_line.strip())
-
-        return lines
+        """텍스트 줄바꿈 (공백과 한글 글자 경계에서 나눔)"""
+        return wrap_text(text, font, max_width)
 
 
 # 실행 예제
@@ -114,10 +114,12 @@ def main():
 
     # Word 문서 생성
     logger.info(f"Word 문서 생성 중: {output_path}")
+    # 종목별 1개월 스파크라인 포함 (가격 이력을 못 가져온 종목은 차트 없이)
     result_path = create_briefing_report(
         docx_data,
         str(output_path),
-        include_charts=False
+        include_charts=True,
+        chart_range='1mo'
     )
 
     print("\n" + "=" * 80)
@@ -1,15 +1,148 @@
 """
 Yahoo Finance를 사용하여 화제 종목을 가져오는 모듈
 """
-from yahooquery import Screener
 from typing import List, Dict, Optional
 import logging
+import sqlite3
+import time
 from datetime import datetime
 
+from cache_db import get_connection, pack, unpack
+from instrumentation import span
+import resilience
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 스크리너 스냅샷 유효 시간 (초): 사전 준비 작업이 20분 간격으로 갱신
+SCREENER_SNAPSHOT_TTL = 15 * 60
+
+_snapshot_schema_ready = False
+
+
+def _screener():
+    """yahooquery Screener (pandas 등 import 비용이 커서 처음 조회할 때 불러옴)"""
+    from yahooquery import Screener
+    return Screener()
+
+
+def _snapshot_connection() -> sqlite3.Connection:
+    """스크리너 스냅샷 테이블이 준비된 캐시 DB 연결"""
+    global _snapshot_schema_ready
+    conn = get_connection()
+    if not _snapshot_schema_ready:
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS screener_snapshots (
+                    screener_type TEXT PRIMARY KEY,
+                    count         INTEGER NOT NULL,
+                    fetched_at    REAL NOT NULL,
+                    quotes        BLOB NOT NULL
+                )
+            """)
+        _snapshot_schema_ready = True
+    return conn
+
+
+def get_screener_snapshot(
+    screener_types: List[str],
+    count: int = 10,
+    max_age: Optional[float] = SCREENER_SNAPSHOT_TTL
+) -> Dict[str, List[Dict]]:
+    """
+    스크리너 결과를 캐시된 스냅샷에서 가져오고, 없거나 오래된 타입만 새로 조회합니다.
+    
+    Args:
+        screener_types: 스크리너 타입 리스트
+        count: 각 스크리너에서 필요한 종목 수
+        max_age: 스냅샷 최대 허용 나이 (초, None이면 항상 새로 조회)
+    
+    Returns:
+        스크리너 타입별 quote 리스트 (최대 count개)
+    """
+    result = {}
+    try:
+        conn = _snapshot_connection()
+        if max_age is not None:
+            placeholders = ','.join('?' * len(screener_types))
+            rows = conn.execute(
+                f"""
+                SELECT screener_type, quotes FROM screener_snapshots
+                WHERE screener_type IN ({placeholders}) AND count >= ? AND fetched_at >= ?
+                """,
+                (*screener_types, count, time.time() - max_age)
+            ).fetchall()
+            result = {row['screener_type']: unpack(row['quotes'])[:count] for row in rows}
+    except sqlite3.Error as e:
+        logger.warning(f"스크리너 스냅샷 조회 실패: {str(e)}")
+        conn = None
+    
+    missing = [screener_type for screener_type in screener_types if screener_type not in result]
+    if not missing:
+        return result
+    
+    try:
+        with span('yahoo.screener'):
+            screeners = resilience.call(
+                'yahoo', lambda: _screener().get_screeners(missing, count=count), hedge=True
+            )
+    except Exception as e:
+        # 장애/브레이커 열림: 오래된 스냅샷이라도 있으면 그대로 사용
+        stale = _load_stale_snapshots(conn, missing, count)
+        if len(stale) < len(missing):
+            raise
+        logger.warning(f"스크리너 조회 실패, 저장된 스냅샷 사용 ({', '.join(missing)}): {str(e)}")
+        result.update(stale)
+        return result
+    fetched_at = time.time()
+    for screener_type in missing:
+        data = screeners.get(screener_type)
+        quotes = data.get('quotes', []) if isinstance(data, dict) else []
+        result[screener_type] = quotes
+        if conn is not None and quotes:
+            try:
+                with conn:
+                    conn.execute(
+                        'INSERT OR REPLACE INTO screener_snapshots VALUES (?, ?, ?, ?)',
+                        (screener_type, count, fetched_at, pack(quotes))
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"스크리너 스냅샷 저장 실패: {str(e)}")
+    
+    return result
+
+
+def _load_stale_snapshots(conn, screener_types: List[str], count: int) -> Dict[str, List[Dict]]:
+    """나이와 관계없이 저장된 스냅샷 조회 (업스트림 장애 시 대체용)"""
+    if conn is None:
+        return {}
+    placeholders = ','.join('?' * len(screener_types))
+    try:
+        rows = conn.execute(
+            f"""
+            SELECT screener_type, quotes FROM screener_snapshots
+            WHERE screener_type IN ({placeholders}) AND count >= ?
+            """,
+            (*screener_types, count)
+        ).fetchall()
+    except sqlite3.Error as e:
+        logger.warning(f"스크리너 스냅샷 조회 실패: {str(e)}")
+        return {}
+    return {row['screener_type']: unpack(row['quotes'])[:count] for row in rows}
+
+
+def get_snapshot_ages() -> Dict[str, float]:
+    """스크리너 타입별 스냅샷 나이 (초)"""
+    try:
+        rows = _snapshot_connection().execute(
+            'SELECT screener_type, fetched_at FROM screener_snapshots'
+        ).fetchall()
+    except sqlite3.Error:
+        return {}
+    now = time.time()
+    return {row['screener_type']: round(now - row['fetched_at'], 1) for row in rows}
+
 
 def get_trending_stocks(
     screener_types: List[str] = ['most_actives', 'day_gainers'],
@@ -26,14 +159,13 @@ def get_trending_stocks(
         스크리너 타입별 종목 리스트를 담은 딕셔너리
     """
     try:
-        screener = Screener()
-        screeners = screener.get_screeners(screener_types, count=count)
+        screeners = get_screener_snapshot(screener_types, count=count)
         
         result = {}
-        for screener_type, data in screeners.items():
-            if 'quotes' in data and len(data['quotes']) > 0:
-                result[screener_type] = data['quotes']
-                logger.info(f"{screener_type}: {len(data['quotes'])}개 종목 수집 완료")
+        for screener_type, quotes in screeners.items():
+            if len(quotes) > 0:
+                result[screener_type] = quotes
+                logger.info(f"{screener_type}: {len(quotes)}개 종목 수집 완료")
             else:
                 logger.warning(f"{screener_type}: 데이터 없음")
                 result[screener_type] = []
@@ -61,27 +193,20 @@ def get_top_trending_stock(
     """
     try:
         # most_actives를 우선적으로 사용
-        screener = Screener()
-        
-        # most_actives에서 상위 종목 가져오기
         if 'most_actives' in screener_types:
-            data = screener.get_screeners('most_actives', count=count)
-            if 'most_actives' in data and 'quotes' in data['most_actives']:
-                quotes = data['most_actives']['quotes']
-                if len(quotes) > 0:
-                    top_stock = quotes[0]
-                    logger.info(f"TOP 1 종목 선정: {top_stock.get('symbol')}")
-                    return top_stock
+            quotes = get_screener_snapshot(['most_actives'], count=count)['most_actives']
+            if len(quotes) > 0:
+                top_stock = quotes[0]
+                logger.info(f"TOP 1 종목 선정: {top_stock.get('symbol')}")
+                return top_stock
         
         # most_actives가 없으면 day_gainers 사용
         if 'day_gainers' in screener_types:
-            data = screener.get_screeners('day_gainers', count=count)
-            if 'day_gainers' in data and 'quotes' in data['day_gainers']:
-                quotes = data['day_gainers']['quotes']
-                if len(quotes) > 0:
-                    top_stock = quotes[0]
-                    logger.info(f"TOP 1 종목 선정: {top_stock.get('symbol')}")
-                    return top_stock
+            quotes = get_screener_snapshot(['day_gainers'], count=count)['day_gainers']
+            if len(quotes) > 0:
+                top_stock = quotes[0]
+                logger.info(f"TOP 1 종목 선정: {top_stock.get('symbol')}")
+                return top_stock
         
         logger.warning("화제 종목을 찾을 수 없습니다.")
         return None
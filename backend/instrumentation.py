@@ -0,0 +1,265 @@
+"""
+요청 단위 타이밍 계측 (span → 히스토그램, Server-Timing 헤더)
+
+- span(stage): 외부 호출/렌더링 구간의 소요 시간을 stage별 히스토그램에 기록
+- 요청 처리 중이면 같은 구간을 요청별 목록에도 남겨 Server-Timing 헤더로 응답
+- render_prometheus(): /metrics 용 Prometheus 텍스트 형식 출력
+"""
+import bisect
+import functools
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Server-Timing 헤더에 넣을 최대 stage 수 (헤더 크기 제한)
+MAX_SERVER_TIMING_ENTRIES = 30
+
+# 현재 요청의 span 목록 [(stage, 소요 초)] (요청 밖에서는 None)
+_request_spans: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar('request_spans', default=None)
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus histogram 형식)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """이름 + 라벨 조합별 히스토그램/카운터 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[Tuple[Tuple[str, str], ...], Histogram]] = {}
+        self._counters: Dict[str, Dict[Tuple[Tuple[str, str], ...], float]] = {}
+        self._help: Dict[str, str] = {}
+
+    def describe(self, name: str, help_text: str) -> None:
+        self._help[name] = help_text
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(value)
+
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """stage별 요약 (count, 평균/합계 ms)"""
+        with self._lock:
+            return {
+                name: {
+                    ','.join(f"{k}={v}" for k, v in key): {
+                        'count': histogram.count,
+                        'sum_ms': round(histogram.sum * 1000, 1),
+                        'avg_ms': round(histogram.sum * 1000 / histogram.count, 1) if histogram.count else 0,
+                    }
+                    for key, histogram in series.items()
+                }
+                for name, series in self._histograms.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식 (version 0.0.4)"""
+        lines = []
+        with self._lock:
+            for name in sorted(self._histograms):
+                lines.append(f"# HELP {name} {self._help.get(name, name)}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + (float('inf'),), histogram.counts):
+                        cumulative += count
+                        le = '+Inf' if bound == float('inf') else repr(bound)
+                        lines.append(f"{name}_bucket{_format_labels(key + (('le', le),))} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {histogram.sum!r}")
+                    lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+            for name in sorted(self._counters):
+                lines.append(f"# HELP {name} {self._help.get(name, name)}")
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {value!r}")
+        return '\n'.join(lines) + '\n'
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape_label(value)}"' for key, value in labels) + '}'
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+# 기본 레지스트리
+registry = MetricsRegistry()
+registry.describe('briefing_stage_duration_seconds', '외부 호출/렌더링 구간별 소요 시간')
+registry.describe('briefing_stage_errors_total', '예외로 끝난 구간 수')
+registry.describe('http_request_duration_seconds', 'API 요청 처리 시간')
+
+
+# ============================================================================
+# span
+# ============================================================================
+
+@contextmanager
+def span(stage: str, **labels: str) -> Iterator[None]:
+    """
+    구간 소요 시간 기록
+
+    Args:
+        stage: 구간 이름 (예: 'exa.search', 'gemini.generate_content', 'render.docx')
+        **labels: 추가 라벨 (값 종류가 적은 것만 - 예: model)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        registry.inc('briefing_stage_errors_total', stage=stage, **labels)
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        registry.observe('briefing_stage_duration_seconds', elapsed, stage=stage, **labels)
+        spans = _request_spans.get()
+        if spans is not None:
+            spans.append((stage, elapsed))
+
+
+def timed(stage: str) -> Callable:
+    """함수 전체를 span으로 감싸는 데코레이터"""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def collect_spans() -> Iterator[List[Tuple[str, float]]]:
+    """이 블록 안에서 기록된 span 목록 수집 (요청 처리/벤치마크용)"""
+    spans: List[Tuple[str, float]] = []
+    token = _request_spans.set(spans)
+    try:
+        yield spans
+    finally:
+        _request_spans.reset(token)
+
+
+def summarize_spans(spans: List[Tuple[str, float]]) -> Dict[str, Dict]:
+    """stage별 (호출 수, 합계 ms) - 등장 순서 유지"""
+    summary: Dict[str, Dict] = {}
+    for stage, elapsed in spans:
+        entry = summary.setdefault(stage, {'count': 0, 'total_ms': 0.0})
+        entry['count'] += 1
+        entry['total_ms'] += elapsed * 1000
+    return summary
+
+
+_TOKEN_INVALID = re.compile(r"[^A-Za-z0-9!#$%&'*+.^_`|~-]")
+
+
+def format_server_timing(spans: List[Tuple[str, float]], total: Optional[float] = None) -> str:
+    """
+    Server-Timing 헤더 값 생성 (같은 stage는 합산)
+
+    Args:
+        spans: [(stage, 소요 초)]
+        total: 전체 처리 시간 (초)
+
+    Returns:
+        예: 'exa.search;dur=412.3;desc="x3", total;dur=530.1'
+    """
+    entries = []
+    for stage, entry in list(summarize_spans(spans).items())[:MAX_SERVER_TIMING_ENTRIES]:
+        value = f"{_TOKEN_INVALID.sub('_', stage)};dur={entry['total_ms']:.1f}"
+        if entry['count'] > 1:
+            value += f';desc="x{entry["count"]}"'
+        entries.append(value)
+    if total is not None:
+        entries.append(f"total;dur={total * 1000:.1f}")
+    return ', '.join(entries)
+
+
+# ============================================================================
+# ASGI 미들웨어
+# ============================================================================
+
+class ServerTimingMiddleware:
+    """요청별 span을 모아 Server-Timing 헤더로 응답하고 요청 시간 히스토그램 기록"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                header = format_server_timing(spans, total=time.perf_counter() - started)
+                message = {
+                    **message,
+                    'headers': list(message.get('headers', [])) + [(b'server-timing', header.encode('latin-1'))],
+                }
+            await send(message)
+
+        with collect_spans() as spans:
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                registry.observe(
+                    'http_request_duration_seconds',
+                    time.perf_counter() - started,
+                    method=scope['method'],
+                    route=_route_template(scope),
+                    status=str(status_code)
+                )
+
+
+def _route_template(scope) -> str:
+    """라우트 템플릿 경로 (경로 파라미터별로 시계열이 늘어나지 않도록)"""
+    # 최신 FastAPI는 include_router prefix가 붙은 경로를 effective_route_context에 보관
+    context = scope.get('effective_route_context')
+    route = scope.get('route')
+    return getattr(context, 'path', None) or getattr(route, 'path', None) or 'unmatched'
+
+
+def render_prometheus() -> str:
+    """기본 레지스트리의 Prometheus 텍스트 출력"""
+    return registry.render_prometheus()
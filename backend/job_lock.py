@@ -0,0 +1,407 @@
+"""
+예약 작업 분산 잠금 (lease 기반)
+
+여러 uvicorn 워커/레플리카가 ENABLE_SCHEDULER=true로 실행되면 각 프로세스의 스케줄러가
+같은 시각에 같은 작업을 실행합니다. 예약 실행 1회(run key)마다 lease를 획득한 프로세스 하나만
+작업을 실행하고, 나머지 프로세스는 저장된 결과를 조회합니다.
+- 실행 중인 프로세스는 lease를 주기적으로 갱신하고, 프로세스가 죽어 lease가 만료되면
+  대기 중인 다른 프로세스가 이어받습니다.
+- 백엔드는 JOB_LOCK_BACKEND 환경 변수로 선택합니다.
+  sqlite (기본값, output/jobs.db), file (output/locks/), 또는 'module:ClassName' (사용자 구현)
+"""
+import importlib
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 기본 경로 설정
+OUTPUT_DIR = Path(__file__).parent / 'output'
+JOBS_DB_PATH = OUTPUT_DIR / 'jobs.db'
+LOCK_DIR = OUTPUT_DIR / 'locks'
+
+DEFAULT_LEASE_SECONDS = 120
+
+STATUS_RUNNING = 'running'
+STATUS_COMPLETED = 'completed'
+STATUS_FAILED = 'failed'
+
+# 현재 프로세스 식별자
+PROCESS_OWNER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class JobLockBackend(ABC):
+    """작업 잠금 저장소 인터페이스 (다른 저장소는 이 클래스를 구현하여 연결)"""
+
+    @abstractmethod
+    def acquire(self, run_key: str, job_name: str, owner: str, lease_seconds: int) -> bool:
+        """
+        run key의 lease 획득 시도
+
+        아직 실행된 적 없거나, 실행 중이던 소유자의 lease가 만료된 경우에만 성공합니다.
+        완료/실패로 기록된 run key는 다시 획득할 수 없습니다.
+        """
+
+    @abstractmethod
+    def renew(self, run_key: str, owner: str, lease_seconds: int) -> bool:
+        """lease 연장 (소유자가 바뀌었으면 False)"""
+
+    @abstractmethod
+    def complete(self, run_key: str, owner: str, status: str, result: Any) -> None:
+        """실행 결과 기록 및 lease 해제"""
+
+    @abstractmethod
+    def get(self, run_key: str) -> Optional[Dict]:
+        """run key 상태 조회 (job_name, owner, status, lease_expires, started_at, finished_at, result)"""
+
+    @abstractmethod
+    def recent(self, limit: int = 20) -> List[Dict]:
+        """최근 실행 기록 (결과 제외)"""
+
+
+# ============================================================================
+# SQLite 백엔드
+# ============================================================================
+
+class SQLiteJobLockBackend(JobLockBackend):
+    """SQLite 파일 기반 잠금 (같은 호스트 또는 공유 볼륨의 프로세스 간)"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else JOBS_DB_PATH
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # 자동 커밋 모드에서 BEGIN IMMEDIATE로 획득/연장을 원자적으로 처리
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_runs (
+                    run_key       TEXT PRIMARY KEY,
+                    job_name      TEXT NOT NULL,
+                    owner         TEXT NOT NULL,
+                    status        TEXT NOT NULL,
+                    lease_expires REAL NOT NULL,
+                    started_at    TEXT NOT NULL,
+                    finished_at   TEXT,
+                    result        TEXT
+                )
+            """)
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_job_runs_started_at ON job_runs (started_at)')
+            self._local.conn = conn
+        return conn
+
+    def acquire(self, run_key: str, job_name: str, owner: str, lease_seconds: int) -> bool:
+        conn = self._connect()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute(
+                'SELECT status, lease_expires FROM job_runs WHERE run_key = ?', (run_key,)
+            ).fetchone()
+            if row is not None and (row['status'] != STATUS_RUNNING or row['lease_expires'] > now):
+                conn.execute('COMMIT')
+                return False
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO job_runs
+                    (run_key, job_name, owner, status, lease_expires, started_at, finished_at, result)
+                VALUES (?, ?, ?, ?, ?, ?, NULL, NULL)
+                """,
+                (run_key, job_name, owner, STATUS_RUNNING, now + lease_seconds, datetime.now().isoformat())
+            )
+            conn.execute('COMMIT')
+            return True
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def renew(self, run_key: str, owner: str, lease_seconds: int) -> bool:
+        cursor = self._connect().execute(
+            'UPDATE job_runs SET lease_expires = ? WHERE run_key = ? AND owner = ? AND status = ?',
+            (time.time() + lease_seconds, run_key, owner, STATUS_RUNNING)
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, run_key: str, owner: str, status: str, result: Any) -> None:
+        self._connect().execute(
+            """
+            UPDATE job_runs SET status = ?, finished_at = ?, lease_expires = 0, result = ?
+            WHERE run_key = ? AND owner = ?
+            """,
+            (status, datetime.now().isoformat(),
+             json.dumps(result, ensure_ascii=False, default=str), run_key, owner)
+        )
+
+    def get(self, run_key: str) -> Optional[Dict]:
+        row = self._connect().execute(
+            'SELECT * FROM job_runs WHERE run_key = ?', (run_key,)
+        ).fetchone()
+        if row is None:
+            return None
+        record = dict(row)
+        record['result'] = json.loads(record['result']) if record['result'] else None
+        return record
+
+    def recent(self, limit: int = 20) -> List[Dict]:
+        rows = self._connect().execute(
+            """
+            SELECT run_key, job_name, owner, status, started_at, finished_at
+            FROM job_runs ORDER BY started_at DESC LIMIT ?
+            """,
+            (limit,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+
+# ============================================================================
+# 파일 백엔드
+# ============================================================================
+
+class FileJobLockBackend(JobLockBackend):
+    """
+    파일 기반 잠금 (run key당 파일 1개)
+
+    최초 획득은 O_EXCL 생성으로 원자적이며, 만료된 lease 인계는 교체 후 재확인하는
+    best-effort 방식입니다. 같은 호스트의 로컬 개발 환경용입니다.
+    """
+
+    def __init__(self, lock_dir: Optional[Path] = None):
+        self.lock_dir = Path(lock_dir) if lock_dir else LOCK_DIR
+
+    def _path(self, run_key: str) -> Path:
+        safe_key = ''.join(ch if ch.isalnum() or ch in '-_' else '_' for ch in run_key)
+        return self.lock_dir / f"{safe_key}.json"
+
+    def _read(self, path: Path) -> Optional[Dict]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path: Path, record: Dict) -> None:
+        tmp_path = path.with_suffix(f".{uuid.uuid4().hex[:8]}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+
+    def acquire(self, run_key: str, job_name: str, owner: str, lease_seconds: int) -> bool:
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(run_key)
+        record = {
+            'run_key': run_key,
+            'job_name': job_name,
+            'owner': owner,
+            'status': STATUS_RUNNING,
+            'lease_expires': time.time() + lease_seconds,
+            'started_at': datetime.now().isoformat(),
+            'finished_at': None,
+            'result': None,
+        }
+
+        try:
+            fd = os.open(str(path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(record, f, ensure_ascii=False)
+            return True
+        except FileExistsError:
+            pass
+
+        current = self._read(path)
+        if current is None or current['status'] != STATUS_RUNNING or current['lease_expires'] > time.time():
+            return False
+
+        # 만료된 lease 인계: 교체 후 다시 읽어 다른 프로세스가 먼저 가져갔는지 확인
+        self._write(path, record)
+        time.sleep(0.05)
+        current = self._read(path)
+        return current is not None and current['owner'] == owner
+
+    def renew(self, run_key: str, owner: str, lease_seconds: int) -> bool:
+        path = self._path(run_key)
+        current = self._read(path)
+        if current is None or current['owner'] != owner or current['status'] != STATUS_RUNNING:
+            return False
+        current['lease_expires'] = time.time() + lease_seconds
+        self._write(path, current)
+        return True
+
+    def complete(self, run_key: str, owner: str, status: str, result: Any) -> None:
+        path = self._path(run_key)
+        current = self._read(path)
+        if current is None or current['owner'] != owner:
+            return
+        current.update({
+            'status': status,
+            'lease_expires': 0,
+            'finished_at': datetime.now().isoformat(),
+            'result': json.loads(json.dumps(result, ensure_ascii=False, default=str)),
+        })
+        self._write(path, current)
+
+    def get(self, run_key: str) -> Optional[Dict]:
+        return self._read(self._path(run_key))
+
+    def recent(self, limit: int = 20) -> List[Dict]:
+        if not self.lock_dir.exists():
+            return []
+        records = []
+        for path in self.lock_dir.glob('*.json'):
+            record = self._read(path)
+            if record:
+                record.pop('result', None)
+                record.pop('lease_expires', None)
+                records.append(record)
+        records.sort(key=lambda record: record['started_at'], reverse=True)
+        return records[:limit]
+
+
+# ============================================================================
+# 백엔드 선택
+# ============================================================================
+
+_BUILTIN_BACKENDS = {
+    'sqlite': SQLiteJobLockBackend,
+    'file': FileJobLockBackend,
+}
+
+_default_backend: Optional[JobLockBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_job_lock_backend() -> JobLockBackend:
+    """
+    JOB_LOCK_BACKEND 환경 변수에 따른 잠금 백엔드 반환
+
+    Returns:
+        sqlite / file / 'module:ClassName'으로 지정한 JobLockBackend 구현체
+    """
+    global _default_backend
+    if _default_backend is None:
+        with _backend_lock:
+            if _default_backend is None:
+                name = os.getenv('JOB_LOCK_BACKEND', 'sqlite').strip()
+                if name in _BUILTIN_BACKENDS:
+                    _default_backend = _BUILTIN_BACKENDS[name]()
+                elif ':' in name:
+                    module_name, class_name = name.split(':', 1)
+                    backend_class = getattr(importlib.import_module(module_name), class_name)
+                    _default_backend = backend_class()
+                else:
+                    raise ValueError(
+                        f"지원하지 않는 JOB_LOCK_BACKEND: {name} "
+                        f"(sqlite, file 또는 'module:ClassName')"
+                    )
+                logger.info(f"작업 잠금 백엔드: {type(_default_backend).__name__}")
+    return _default_backend
+
+
+# ============================================================================
+# 단일 실행 래퍼
+# ============================================================================
+
+def make_run_key(job_name: str, now: Optional[datetime] = None, granularity_minutes: int = 5) -> str:
+    """
+    예약 실행 1회를 식별하는 키
+
+    프로세스마다 실행 시각이 몇 초씩 어긋나도 같은 키가 되도록 가장 가까운
+    granularity_minutes 단위로 반올림합니다. (예: 06:59:58 → 07:00)
+    """
+    now = now or datetime.now()
+    step = granularity_minutes * 60
+    rounded = datetime.fromtimestamp(round(now.timestamp() / step) * step)
+    return f"{job_name}@{rounded.strftime('%Y-%m-%dT%H:%M')}"
+
+
+class _LeaseHeartbeat(threading.Thread):
+    """작업 실행 중 lease를 주기적으로 연장하는 스레드"""
+
+    def __init__(self, backend: JobLockBackend, run_key: str, owner: str, lease_seconds: int):
+        super().__init__(name=f"lease-{run_key}", daemon=True)
+        self.backend = backend
+        self.run_key = run_key
+        self.owner = owner
+        self.lease_seconds = lease_seconds
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.lease_seconds / 3):
+            try:
+                if not self.backend.renew(self.run_key, self.owner, self.lease_seconds):
+                    logger.warning(f"lease 연장 실패 (소유권 상실): {self.run_key}")
+                    return
+            except Exception as e:
+                logger.warning(f"lease 연장 오류: {self.run_key} ({str(e)})")
+
+
+def run_exclusive(
+    job_name: str,
+    func: Callable,
+    *args,
+    run_key: Optional[str] = None,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    wait_timeout: float = 0,
+    poll_interval: float = 5.0,
+    backend: Optional[JobLockBackend] = None,
+    **kwargs
+) -> Optional[Any]:
+    """
+    여러 프로세스 중 하나만 작업을 실행합니다.
+
+    Args:
+        job_name: 작업 이름
+        func: 실행할 함수 (반환값은 JSON 직렬화 가능해야 결과 공유 가능)
+        run_key: 예약 실행 식별 키 (기본값: make_run_key(job_name))
+        lease_seconds: lease 유효 시간 (실행 중 1/3 주기로 연장)
+        wait_timeout: lease를 얻지 못했을 때 다른 프로세스의 결과를 기다릴 최대 시간 (초)
+                      기다리는 동안 소유 프로세스의 lease가 만료되면 작업을 이어받습니다.
+        poll_interval: 결과 확인 주기 (초)
+        backend: 잠금 백엔드 (기본값: get_job_lock_backend())
+
+    Returns:
+        직접 실행한 경우 func의 반환값, 다른 프로세스가 실행한 경우 저장된 결과
+        (대기 시간 안에 끝나지 않았으면 None)
+    """
+    backend = backend or get_job_lock_backend()
+    run_key = run_key or make_run_key(job_name)
+    deadline = time.time() + wait_timeout
+
+    while True:
+        if backend.acquire(run_key, job_name, PROCESS_OWNER, lease_seconds):
+            logger.info(f"작업 잠금 획득: {run_key} ({PROCESS_OWNER})")
+            heartbeat = _LeaseHeartbeat(backend, run_key, PROCESS_OWNER, lease_seconds)
+            heartbeat.start()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                backend.complete(run_key, PROCESS_OWNER, STATUS_FAILED, {'error': str(e)})
+                raise
+            finally:
+                heartbeat.stopped.set()
+            backend.complete(run_key, PROCESS_OWNER, STATUS_COMPLETED, result)
+            return result
+
+        record = backend.get(run_key) or {}
+        if record.get('status') in (STATUS_COMPLETED, STATUS_FAILED):
+            logger.info(f"다른 프로세스가 실행한 결과 사용: {run_key} ({record.get('owner')}, {record['status']})")
+            return record.get('result')
+
+        if time.time() >= deadline:
+            logger.info(f"다른 프로세스가 실행 중이므로 건너뜀: {run_key} ({record.get('owner')})")
+            return None
+
+        time.sleep(poll_interval)
@@ -0,0 +1,117 @@
+"""
+LLM 응답 캐시
+
+같은 모델에 같은 프롬프트를 보내면 저장된 응답을 재사용합니다.
+프롬프트에 가격/뉴스 등 입력 데이터가 모두 들어가므로, 입력이 바뀌면 키도 바뀝니다.
+사전 준비(pre-warm) 작업이 미리 채운 번역/분석 결과를 07:00 브리핑이 그대로 읽습니다.
+"""
+import hashlib
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+from cache_db import get_connection
+
+logger = logging.getLogger(__name__)
+
+# 기본 유효 시간 (초)
+DEFAULT_TTL = 24 * 60 * 60
+
+
+class LLMCache:
+    """프롬프트 해시 기반 LLM 응답 캐시 (SQLite)"""
+
+    def __init__(self, db_path: Optional[Path] = None, ttl: int = DEFAULT_TTL):
+        """
+        Args:
+            db_path: 캐시 DB 경로 (기본값: output/cache.db)
+            ttl: 응답 유효 시간 (초)
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self._schema_ready = False
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = get_connection(self.db_path)
+        if not self._schema_ready:
+            with conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS llm_cache (
+                        cache_key  TEXT PRIMARY KEY,
+                        model      TEXT NOT NULL,
+                        created_at REAL NOT NULL,
+                        response   TEXT NOT NULL
+                    )
+                """)
+            self._schema_ready = True
+        return conn
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """(모델, 프롬프트) 캐시 키"""
+        return hashlib.sha256(f"{model}\x00{prompt}".encode('utf-8')).hexdigest()
+
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        """캐시된 응답 조회 (없거나 만료되면 None)"""
+        try:
+            row = self._connect().execute(
+                'SELECT response FROM llm_cache WHERE cache_key = ? AND created_at >= ?',
+                (self.make_key(model, prompt), time.time() - self.ttl)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM 캐시 조회 실패: {str(e)}")
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row['response']
+
+    def contains(self, model: str, prompt: str) -> bool:
+        """적중 통계에 반영하지 않고 캐시 여부만 확인"""
+        try:
+            row = self._connect().execute(
+                'SELECT 1 FROM llm_cache WHERE cache_key = ? AND created_at >= ?',
+                (self.make_key(model, prompt), time.time() - self.ttl)
+            ).fetchone()
+        except sqlite3.Error:
+            return False
+        return row is not None
+
+    def put(self, model: str, prompt: str, response: str) -> None:
+        """응답 저장"""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?)',
+                    (self.make_key(model, prompt), model, time.time(), response)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"LLM 캐시 저장 실패: {str(e)}")
+
+    def purge_expired(self) -> int:
+        """만료된 응답 삭제"""
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                'DELETE FROM llm_cache WHERE created_at < ?', (time.time() - self.ttl,)
+            )
+        return cursor.rowcount
+
+
+# 기본 캐시 인스턴스
+_default_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    """기본 LLM 캐시 반환"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = LLMCache()
+    return _default_cache
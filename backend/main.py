@@ -3,10 +3,14 @@
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
-from api import stocks, briefings, auth
+from api import stocks, briefings, auth, search, scheduler, quotes, symbols, screens, market
 from routers import news
+from instrumentation import ServerTimingMiddleware, render_prometheus
+from resilience import get_breaker_states
+from shared_snapshot import get_snapshot
 from pathlib import Path
 import logging
 
@@ -14,6 +18,8 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+OUTPUT_DIR = Path(__file__).parent / 'output'
+
 
 # Lifespan 이벤트 관리
 @asynccontextmanager
@@ -22,29 +28,56 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 FastAPI 서버 시작")
     logger.info("📖 API 문서: http://localhost:8000/docs")
 
+    # 출력 디렉토리 생성 (import 시점이 아닌 서버 시작 시점에)
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
     # 스케줄러 시작 (선택사항 - 환경 변수로 제어)
     import os
     if os.getenv('ENABLE_SCHEDULER', 'false').lower() == 'true':
         try:
             from apscheduler.schedulers.background import BackgroundScheduler
             from apscheduler.triggers.cron import CronTrigger
-            from scheduler import run_briefing_job
+            from scheduler import run_briefing_job_exclusive
+            from prewarm_scheduler import register_prewarm_jobs
 
+            # 여러 워커/레플리카가 스케줄러를 켜도 작업 잠금으로 한 프로세스만 실행
             scheduler = BackgroundScheduler(timezone='Asia/Seoul')
             scheduler.add_job(
-                func=run_briefing_job,
+                func=run_briefing_job_exclusive,
                 trigger=CronTrigger(hour=7, minute=0),
                 id='daily_briefing_job',
                 name='매일 아침 브리핑 생성'
             )
+            register_prewarm_jobs(scheduler)
             scheduler.start()
-            logger.info("📅 스케줄러 시작: 매일 오전 7시 브리핑 자동 생성")
+            app.state.scheduler = scheduler
+            logger.info("📅 스케줄러 시작: 매일 오전 7시 브리핑 자동 생성 (05:10~06:50 캐시 사전 준비)")
         except Exception as e:
             logger.warning(f"스케줄러 시작 실패: {str(e)}")
 
+    # 워커 간 공유 시장 스냅샷 (기록은 잠금을 잡은 워커 하나만, 나머지는 공유 메모리에서 읽기)
+    snapshot_refresher = None
+    if os.getenv('ENABLE_MARKET_SNAPSHOT', 'false').lower() == 'true':
+        from shared_snapshot import start_refresher
+        from symbol_master import get_symbol_master
+        # 스크리너 종목 + 종목 마스터 전체
+        snapshot_refresher = start_refresher(symbols=lambda: get_symbol_master().symbols)
+
+    # 발송 아웃박스 워커 시작 (재시도/예약 발송 처리, OUTBOX_WORKERS=0이면 비활성화)
+    outbox_workers = int(os.getenv('OUTBOX_WORKERS', '2'))
+    if outbox_workers > 0:
+        from delivery_outbox import get_outbox
+        get_outbox().start_workers(outbox_workers)
+
     yield
 
     # Shutdown
+    from quote_stream import close_quote_hub
+    await close_quote_hub()
+    if snapshot_refresher is not None:
+        snapshot_refresher.stop()
+    if outbox_workers > 0:
+        get_outbox().stop_workers()
     logger.info("🛑 FastAPI 서버 종료")
 
 
@@ -67,25 +100,45 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 Server-Timing 헤더 및 요청 시간 히스토그램
+app.add_middleware(ServerTimingMiddleware)
+
 # 라우터 등록
 app.include_router(stocks.router, prefix="/v1")
 app.include_router(briefings.router, prefix="/v1")
 app.include_router(auth.router, prefix="/v1/auth")
 app.include_router(news.router, prefix="/v1")  # Exa 뉴스 API
+app.include_router(search.router, prefix="/v1")  # 브리핑/뉴스 검색
+app.include_router(scheduler.router, prefix="/v1")  # 스케줄러 상태
+app.include_router(quotes.router, prefix="/v1")  # 실시간 시세 WebSocket
+app.include_router(symbols.router, prefix="/v1")  # 종목 검색 (자동완성)
+app.include_router(screens.router, prefix="/v1")  # 로컬 스크리너 (조건식)
+app.include_router(market.router, prefix="/v1")  # 섹터/산업별 시장 집계
 
-# 정적 파일 서빙 (브리핑 이미지 및 문서)
-output_dir = Path(__file__).parent / 'output'
-output_dir.mkdir(exist_ok=True)
-app.mount("/api/briefings/files", StaticFiles(directory=str(output_dir)), name="briefings")
+# 정적 파일 서빙 (브리핑 이미지 및 문서, 디렉토리는 lifespan에서 생성)
+app.mount("/api/briefings/files", StaticFiles(directory=str(OUTPUT_DIR), check_dir=False), name="briefings")
 
 # 헬스체크 엔드포인트
 @app.get("/health", tags=["Health"])
 def health_check():
-    """서버 상태 확인"""
-    return {
-        "status": "healthy",
-        "version": "1.0.0"
+    """서버 상태 확인 (외부 서비스 서킷 브레이커 상태, 공유 시장 스냅샷 버전/나이 포함)"""
+    upstreams = get_breaker_states()
+    degraded = any(state["state"] != "closed" for state in upstreams.values())
+    result = {
+        "status": "degraded" if degraded else "healthy",
+        "version": "1.0.0",
+        "upstreams": upstreams
     }
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        result["market_snapshot"] = snapshot.info()
+    return result
+
+# 메트릭 엔드포인트 (Prometheus 텍스트 형식)
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+def metrics():
+    """구간별 소요 시간 히스토그램"""
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
 # 루트 엔드포인트
 @app.get("/", tags=["Root"])
@@ -0,0 +1,403 @@
+"""
+섹터/산업별 시장 집계 (공유 시장 스냅샷 + 종목 프로필 캐시)
+
+- 종목 프로필(섹터, 산업)은 거의 바뀌지 않으므로 cache.db의 stock_profiles에 PROFILE_TTL 동안 보관
+  (스냅샷 갱신 프로세스가 기록 직전에 없는/오래된 종목만 다종목 summary_profile로 채움)
+- 스냅샷 심볼 컬럼과 프로필은 정렬된 심볼 배열에 searchsorted로 한 번에 조인하고,
+  집계는 스냅샷 한 버전에 대해 NumPy bincount 한 번씩으로 계산 (시가총액 가중 수익률, 거래량, 상승/하락 종목 수)
+- 결과는 스냅샷 버전이 바뀔 때까지 재사용
+
+사용 예:
+    overview = get_sector_overview(group_by='sector', movers=3)
+"""
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from cache_db import get_connection
+from shared_snapshot import MAX_AGE, SnapshotUnavailable, SnapshotView, read_snapshot
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 프로필 보관 시간 (초) - 지나면 다음 스냅샷 갱신 때 다시 조회
+PROFILE_TTL = 7 * 24 * 60 * 60
+
+# summary_profile 다종목 요청 1번에 넣을 종목 수 / 갱신 1번에 새로 조회할 최대 종목 수
+PROFILE_BATCH_SIZE = 100
+MAX_PROFILE_FETCH = 500
+
+# 프로필이 없는 종목 / ETF의 섹터 이름
+UNKNOWN_SECTOR = 'Unknown'
+ETF_SECTOR = 'ETF'
+
+GROUP_BY = ('sector', 'industry')
+
+# 그룹별 상승/하락 상위 종목 수 상한
+MAX_MOVERS = 10
+
+MOVER_FIELDS = ('symbol', 'name', 'price', 'change_percent', 'volume', 'market_cap')
+
+
+# ============================================================================
+# 종목 프로필 캐시
+# ============================================================================
+
+class ProfileCache:
+    """종목별 섹터/산업 캐시 (output/cache.db)"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본값: output/cache.db)
+        """
+        self.db_path = db_path
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = get_connection(self.db_path)
+        if not self._schema_ready:
+            with conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS stock_profiles (
+                        symbol     TEXT PRIMARY KEY,
+                        sector     TEXT NOT NULL,
+                        industry   TEXT NOT NULL,
+                        fetched_at REAL NOT NULL
+                    )
+                """)
+            self._schema_ready = True
+        return conn
+
+    def all(self) -> Dict[str, Tuple[str, str]]:
+        """저장된 전체 프로필 (기간과 관계없이, 종목 → (섹터, 산업))"""
+        try:
+            rows = self._connect().execute('SELECT symbol, sector, industry FROM stock_profiles').fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"종목 프로필 캐시 조회 실패: {str(e)}")
+            return {}
+        return {row['symbol']: (row['sector'], row['industry']) for row in rows}
+
+    def generation(self) -> Tuple[int, float]:
+        """저장된 프로필 상태 (종목 수, 마지막 저장 시각) - 바뀌었을 때만 ProfileTable을 다시 만들기 위함"""
+        try:
+            row = self._connect().execute('SELECT COUNT(*), MAX(fetched_at) FROM stock_profiles').fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"종목 프로필 캐시 조회 실패: {str(e)}")
+            return 0, 0.0
+        return row[0], row[1] or 0.0
+
+    def missing(self, symbols: Iterable[str], max_age: float = PROFILE_TTL) -> List[str]:
+        """프로필이 없거나 max_age보다 오래된 종목"""
+        symbols = list(dict.fromkeys(symbols))
+        try:
+            fresh = {
+                row['symbol'] for row in self._connect().execute(
+                    'SELECT symbol FROM stock_profiles WHERE fetched_at >= ?', (time.time() - max_age,)
+                )
+            }
+        except sqlite3.Error as e:
+            logger.warning(f"종목 프로필 캐시 조회 실패: {str(e)}")
+            return symbols
+        return [symbol for symbol in symbols if symbol not in fresh]
+
+    def put_many(self, profiles: Dict[str, Tuple[str, str]]) -> None:
+        """프로필 저장"""
+        if not profiles:
+            return
+        fetched_at = time.time()
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO stock_profiles VALUES (?, ?, ?, ?)',
+                    [(symbol, sector, industry, fetched_at) for symbol, (sector, industry) in profiles.items()]
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"종목 프로필 캐시 저장 실패: {str(e)}")
+
+
+_default_cache: Optional[ProfileCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_profile_cache() -> ProfileCache:
+    """기본 종목 프로필 캐시 반환"""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = ProfileCache()
+    return _default_cache
+
+
+def _fetch_profiles(symbols: List[str]) -> Dict[str, Tuple[str, str]]:
+    """다종목 summary_profile (섹터가 없는 종목은 UNKNOWN_SECTOR)"""
+    import resilience
+    from instrumentation import span
+    from yahooquery import Ticker
+
+    ticker = Ticker(symbols)
+    with span('yahoo.ticker.summary_profile_batch'):
+        modules = resilience.call('yahoo', lambda: ticker.summary_profile, hedge=True)
+    if not isinstance(modules, dict):
+        return {}
+
+    profiles = {}
+    for symbol, profile in modules.items():
+        # 오류가 난 종목은 문자열이 옴 (다음 갱신 때 다시 시도)
+        if isinstance(profile, dict):
+            profiles[symbol] = (profile.get('sector') or UNKNOWN_SECTOR, profile.get('industry') or UNKNOWN_SECTOR)
+    return profiles
+
+
+def refresh_profiles(symbols: Iterable[str], limit: int = MAX_PROFILE_FETCH) -> int:
+    """
+    없거나 오래된 종목 프로필 조회 후 저장 (스냅샷 갱신 프로세스에서 호출)
+
+    ETF는 조회하지 않고 ETF_SECTOR로 저장합니다 (종목 마스터 기준).
+
+    Args:
+        symbols: 스냅샷 종목
+        limit: 이번에 새로 조회할 최대 종목 수 (나머지는 다음 갱신 때)
+
+    Returns:
+        저장한 프로필 수
+    """
+    from symbol_master import get_symbol_master
+
+    cache = get_profile_cache()
+    missing = cache.missing(symbols)[:limit]
+    if not missing:
+        return 0
+
+    master = get_symbol_master()
+    etfs = {}
+    for symbol in missing:
+        listing = master.get(symbol)
+        if listing is not None and listing.type == 'ETF':
+            etfs[symbol] = (ETF_SECTOR, ETF_SECTOR)
+    cache.put_many(etfs)
+
+    saved = len(etfs)
+    pending = [symbol for symbol in missing if symbol not in etfs]
+    for start in range(0, len(pending), PROFILE_BATCH_SIZE):
+        batch = pending[start:start + PROFILE_BATCH_SIZE]
+        try:
+            profiles = _fetch_profiles(batch)
+        except Exception as e:
+            logger.warning(f"종목 프로필 조회 실패 ({len(batch)}개): {str(e)}")
+            continue
+        cache.put_many(profiles)
+        saved += len(profiles)
+    return saved
+
+
+# ============================================================================
+# 집계
+# ============================================================================
+
+class ProfileTable:
+    """
+    종목 프로필을 정렬된 심볼 배열 + 그룹 코드 배열로 변환
+
+    스냅샷 심볼 컬럼과 searchsorted로 한 번에 조인합니다 (종목마다 dict 조회하지 않음).
+    """
+
+    def __init__(self, profiles: Dict[str, Tuple[str, str]]):
+        import numpy as np
+
+        symbols = sorted(profiles)
+        self.symbols = np.array([symbol.encode('utf-8') for symbol in symbols], dtype='S16')
+        self.labels: Dict[str, List[str]] = {}
+        self.codes: Dict[str, 'np.ndarray'] = {}
+        for position, group_by in enumerate(GROUP_BY):
+            names: Dict[str, int] = {UNKNOWN_SECTOR: 0}
+            codes = [names.setdefault(profiles[symbol][position], len(names)) for symbol in symbols]
+            self.codes[group_by] = np.array(codes, dtype=np.intp)
+            self.labels[group_by] = list(names)
+        # 산업 → 섹터
+        self.sectors = {industry: sector for sector, industry in profiles.values()}
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def lookup(self, symbols: 'np.ndarray', group_by: str) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        스냅샷 심볼 컬럼 → (그룹 코드, 프로필 존재 여부), 코드 0은 UNKNOWN_SECTOR
+
+        Returns:
+            (codes, found)
+        """
+        import numpy as np
+
+        if not len(self.symbols):
+            return np.zeros(len(symbols), dtype=np.intp), np.zeros(len(symbols), dtype=bool)
+        position = np.minimum(np.searchsorted(self.symbols, symbols), len(self.symbols) - 1)
+        found = self.symbols[position] == symbols
+        return np.where(found, self.codes[group_by][position], 0), found
+
+
+def aggregate_sectors(
+    view: SnapshotView,
+    profiles: ProfileTable,
+    group_by: str = 'sector',
+    movers: int = 3
+) -> Dict:
+    """
+    스냅샷 뷰 하나를 섹터(또는 산업)별로 집계
+
+    Args:
+        view: 스냅샷 뷰
+        profiles: 종목 프로필 (ProfileTable)
+        group_by: sector / industry
+        movers: 그룹별 상승/하락 상위 종목 수
+
+    Returns:
+        groups(시가총액 순), universe, profiled(프로필이 있는 종목 수), snapshot_version, snapshot_updated_at
+    """
+    import numpy as np
+
+    codes, found = profiles.lookup(view['symbol'], group_by)
+    labels = profiles.labels[group_by]
+    count = len(labels)
+
+    change_percent = np.asarray(view['change_percent'], dtype='f8')
+    market_cap = np.asarray(view['market_cap'], dtype='f8')
+    volume = np.asarray(view['volume'], dtype='f8')
+    price = np.asarray(view['price'], dtype='f8')
+
+    def group_sum(weights) -> 'np.ndarray':
+        return np.bincount(codes, weights=weights, minlength=count)
+
+    # 시가총액이 있는 종목만 가중 수익률에 반영
+    weight = np.where(market_cap > 0, market_cap, 0.0)
+    weight_total = group_sum(weight)
+    weighted_return = np.divide(
+        group_sum(weight * change_percent), weight_total, out=np.full(count, np.nan), where=weight_total > 0
+    )
+    members = np.bincount(codes, minlength=count)
+    equal_return = group_sum(change_percent) / np.maximum(members, 1)
+    advancers = np.bincount(codes[change_percent > 0], minlength=count)
+    decliners = np.bincount(codes[change_percent < 0], minlength=count)
+    total_volume = group_sum(volume)
+    dollar_volume = group_sum(price * volume)
+
+    # 그룹 안에서 변동률 내림차순 → 앞쪽이 상승 상위, 뒤쪽이 하락 상위
+    order = np.lexsort((-change_percent, codes))
+    bounds = np.searchsorted(codes[order], np.arange(count + 1))
+    picks = []
+    for code in range(count):
+        group = order[bounds[code]:bounds[code + 1]]
+        gainers = group[:movers][change_percent[group[:movers]] > 0]
+        losers = group[::-1][:movers][change_percent[group[::-1][:movers]] < 0]
+        picks.append((gainers, losers))
+    mover_indices = np.concatenate([np.concatenate(pair) for pair in picks]) if picks else np.array([], dtype=np.intp)
+    records = {
+        int(index): {field: record[field] for field in MOVER_FIELDS}
+        for index, record in zip(mover_indices.tolist(), view.records(mover_indices))
+    }
+
+    groups = []
+    for code, label in enumerate(labels):
+        if not members[code]:
+            continue
+        gainers, losers = picks[code]
+        group = {group_by: label}
+        if group_by == 'industry':
+            # 산업별 집계에는 소속 섹터도 표시
+            group['sector'] = profiles.sectors.get(label, UNKNOWN_SECTOR)
+        groups.append({
+            **group,
+            'count': int(members[code]),
+            'market_cap': int(weight_total[code]),
+            'return_cap_weighted': None if np.isnan(weighted_return[code]) else round(float(weighted_return[code]), 4),
+            'return_equal_weighted': round(float(equal_return[code]), 4),
+            'advancers': int(advancers[code]),
+            'decliners': int(decliners[code]),
+            'unchanged': int(members[code] - advancers[code] - decliners[code]),
+            'volume': int(total_volume[code]),
+            'dollar_volume': round(float(dollar_volume[code]), 2),
+            'top_gainers': [records[index] for index in gainers.tolist()],
+            'top_losers': [records[index] for index in losers.tolist()],
+        })
+    groups.sort(key=lambda group: -group['market_cap'])
+
+    return {
+        'group_by': group_by,
+        'groups': groups,
+        'universe': len(view),
+        'profiled': int(found.sum()),
+        'snapshot_version': view.version,
+        'snapshot_updated_at': datetime.fromtimestamp(view.updated_at).isoformat(),
+    }
+
+
+# (group_by, movers) → ((스냅샷 버전, 갱신 시각), 결과)
+_memo: Dict[Tuple[str, int], Tuple[Tuple[int, float], Dict]] = {}
+_memo_lock = threading.Lock()
+
+# (프로필 상태, ProfileTable)
+_profile_table: Optional[Tuple[Tuple[int, float], ProfileTable]] = None
+
+
+def _load_profile_table() -> ProfileTable:
+    """프로필 캐시가 바뀌었을 때만 ProfileTable 다시 생성"""
+    global _profile_table
+    cache = get_profile_cache()
+    generation = cache.generation()
+    current = _profile_table
+    if current is not None and current[0] == generation:
+        return current[1]
+    table = ProfileTable(cache.all())
+    _profile_table = (generation, table)
+    return table
+
+
+def get_sector_overview(group_by: str = 'sector', movers: int = 3, max_age: float = MAX_AGE) -> Dict:
+    """
+    섹터/산업별 시장 집계 (스냅샷 버전이 바뀔 때까지 결과 재사용)
+
+    Args:
+        group_by: sector / industry
+        movers: 그룹별 상승/하락 상위 종목 수
+        max_age: 허용할 스냅샷 나이 (초)
+
+    Returns:
+        aggregate_sectors 결과 + cached (재사용 여부)
+
+    Raises:
+        ValueError: 지원하지 않는 group_by
+        SnapshotUnavailable: 스냅샷이 없거나 max_age보다 오래됨
+    """
+    if group_by not in GROUP_BY:
+        raise ValueError(f"group_by는 {', '.join(GROUP_BY)} 중 하나여야 합니다: {group_by}")
+    movers = max(0, min(movers, MAX_MOVERS))
+    unavailable = "시장 스냅샷이 없거나 오래되었습니다 (ENABLE_MARKET_SNAPSHOT=true 또는 shared_snapshot.py 갱신 프로세스 필요)"
+
+    key = read_snapshot(lambda view: (view.version, view.updated_at), max_age=max_age)
+    if key is None:
+        raise SnapshotUnavailable(unavailable)
+    with _memo_lock:
+        memo = _memo.get((group_by, movers))
+    if memo is not None and memo[0] == key:
+        return {**memo[1], 'cached': True}
+
+    profiles = _load_profile_table()
+    result = read_snapshot(
+        lambda view: ((view.version, view.updated_at), aggregate_sectors(view, profiles, group_by, movers)),
+        max_age=max_age
+    )
+    if result is None:
+        raise SnapshotUnavailable(unavailable)
+
+    key, overview = result
+    with _memo_lock:
+        _memo[(group_by, movers)] = (key, overview)
+    return {**overview, 'cached': False}
@@ -11,11 +11,14 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
+from mcp.types import Tool, TextContent, ImageContent
 import logging
 from datetime import datetime
 import base64
 
+import resilience
+from mcp_servers.tool_runtime import check_cancelled, current_cancel_event, get_runner
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,6 +26,9 @@ logger = logging.getLogger(__name__)
 # MCP 서버 생성
 app = Server("briefing-server")
 
+# 같은 인자로 다시 호출된 분석/뉴스 도구의 결과 재사용 시간 (초)
+TOOL_RESULT_TTL = float(os.getenv('MCP_TOOL_RESULT_TTL', '300'))
+
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
@@ -62,7 +68,9 @@ async def list_tools() -> list[Tool]:
             }
         ),
         Tool(
-            name="get_stock_news": {
+            name="get_stock_news",
+            description="Exa API를 사용하여 특정 종목의 최신 뉴스를 수집하고 요약합니다.",
+            inputSchema={
                 "type": "object",
                 "properties": {
                     "symbol": {
@@ -76,181 +84,204 @@ async def list_tools() -> list[Tool]:
                     }
                 },
                 "required": ["symbol"]
-            },
-            description="Exa API를 사용하여 특정 종목의 최신 뉴스를 수집하고 요약합니다."
-        }
+            }
+        )
     ]
 
 
+def _get_quote(symbol: str) -> dict:
+    """종목 시세 (API와 같은 Yahoo 서킷 브레이커 사용, 없으면 빈 dict)"""
+    from yahooquery import Ticker
+
+    ticker = Ticker(symbol)
+    quotes = resilience.call('yahoo', lambda: ticker.quotes, hedge=True)
+    if not isinstance(quotes, dict) or not isinstance(quotes.get(symbol), dict):
+        return {}
+    return quotes[symbol]
+
+
+def _daily_briefing_contents(include_image: bool) -> list:
+    """전체 브리핑 워크플로우 실행 (취소되면 다음 단계부터 건너뜀)"""
+    from daily_briefing_workflow import run_daily_briefing_workflow
+
+    result = run_daily_briefing_workflow(cancel_event=current_cancel_event())
+    check_cancelled()
+
+    if not result or not result.get('briefing_data'):
+        return [TextContent(type="text", text="브리핑 생성에 실패했습니다.")]
+
+    briefing_data = result['briefing_data']
+    top_stock = result.get('stock_data') or {}
+
+    # 텍스트 브리핑
+    text_content = f"# 🌙 당신이 잠든 사이 - 오늘의 브리핑\n\n"
+    text_content += f"**생성 시간**: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M:%S')}\n\n"
+
+    if top_stock:
+        text_content += f"## 📈 오늘의 화제 종목\n\n"
+        text_content += f"### {top_stock.get('symbol')} - {top_stock.get('name')}\n"
+        text_content += f"- **현재가**: ${top_stock.get('price', 0):.2f}\n"
+        text_content += f"- **변동률**: {top_stock.get('change_percent', 0):.2f}%\n"
+        text_content += f"- **거래량**: {top_stock.get('volume', 0):,}\n\n"
+
+    # 브리핑 내용
+    if briefing_data.get('title') or briefing_data.get('summary'):
+        text_content += f"## 📝 {briefing_data.get('title', '브리핑 내용')}\n\n"
+        text_content += f"{briefing_data.get('summary', '')}\n\n"
+    for section in briefing_data.get('sections', []):
+        text_content += f"### {section.get('title', '')}\n\n{section.get('content', '')}\n\n"
+
+    # 분석 결과
+    if top_stock.get('analysis'):
+        text_content += f"## 🔍 종목 분석\n\n"
+        text_content += top_stock['analysis']
+
+    contents = [TextContent(type="text", text=text_content)]
+
+    # 이미지 포함
+    if include_image and briefing_data.get('image_path'):
+        try:
+            image_path = briefing_data['image_path']
+            if os.path.exists(image_path):
+                with open(image_path, 'rb') as f:
+                    image_data = base64.b64encode(f.read()).decode('utf-8')
+                contents.append(ImageContent(
+                    type="image",
+                    data=image_data,
+                    mimeType="image/png"
+                ))
+                logger.info(f"브리핑 이미지 포함됨: {image_path}")
+        except Exception as e:
+            logger.error(f"이미지 로드 실패: {str(e)}")
+
+    return contents
+
+
+def _trending_reason_text(symbol: str, include_news: bool) -> str:
+    """화제 원인 분석 (뉴스/LLM 응답은 API와 같은 캐시 사용)"""
+    from exa_news import search_stock_news, get_news_summary
+    from gemini_briefing import analyze_why_trending
+
+    # 종목 정보 가져오기
+    stock_data = _get_quote(symbol)
+    if not stock_data:
+        return f"종목 {symbol}을(를) 찾을 수 없습니다."
+
+    # 뉴스 수집
+    news_articles = []
+    news_summary = ""
+    if include_news:
+        check_cancelled()
+        try:
+            news_articles = search_stock_news(symbol, stock_name=stock_data.get('shortName'), limit=5)
+            if news_articles:
+                check_cancelled()
+                news_summary = get_news_summary(news_articles)
+        except Exception as e:
+            logger.error(f"뉴스 수집 실패: {str(e)}")
+            news_summary = "뉴스를 가져올 수 없습니다."
+
+    # AI 분석 (실패 시 analyze_why_trending이 대체 문구 반환)
+    check_cancelled()
+    analysis = analyze_why_trending(symbol, stock_data, news_articles)
+
+    # 결과 포맷팅
+    result_text = f"# {symbol} - 화제 원인 분석\n\n"
+    result_text += f"## 📊 종목 정보\n"
+    result_text += f"- **회사명**: {stock_data.get('shortName', '')}\n"
+    result_text += f"- **현재가**: ${stock_data.get('regularMarketPrice', 0):.2f}\n"
+    result_text += f"- **변동률**: {stock_data.get('regularMarketChangePercent', 0):.2f}%\n"
+    result_text += f"- **거래량**: {stock_data.get('regularMarketVolume', 0):,}\n\n"
+
+    if news_summary:
+        result_text += f"## 📰 관련 뉴스 요약\n\n{news_summary}\n\n"
+
+    result_text += f"## 🔍 AI 분석 결과\n\n{analysis}\n"
+    return result_text
+
+
+def _stock_news_text(symbol: str, limit: int) -> str:
+    """종목 뉴스 목록과 요약 (뉴스/LLM 응답은 API와 같은 캐시 사용)"""
+    from exa_news import search_stock_news, get_news_summary
+
+    # 회사명 가져오기
+    quote = _get_quote(symbol)
+    if not quote:
+        return f"종목 {symbol}을(를) 찾을 수 없습니다."
+    company_name = quote.get('shortName', symbol)
+
+    # 뉴스 검색
+    check_cancelled()
+    articles = search_stock_news(symbol, stock_name=company_name, limit=limit)
+    if not articles:
+        return f"{symbol}에 대한 뉴스를 찾을 수 없습니다."
+
+    check_cancelled()
+    summary = get_news_summary(articles)
+
+    result_text = f"# {symbol} - 최신 뉴스\n\n"
+    result_text += f"**검색어**: {company_name}\n"
+    result_text += f"**수집 뉴스 수**: {len(articles)}개\n\n"
+
+    if summary:
+        result_text += f"## 📝 뉴스 요약\n\n{summary}\n\n"
+
+    result_text += f"## 📰 뉴스 목록\n\n"
+    for idx, article in enumerate(articles, 1):
+        result_text += f"### {idx}. {article.get('title', '제목 없음')}\n"
+        result_text += f"- **출처**: {article.get('url', '')}\n"
+        if article.get('published_date'):
+            result_text += f"- **날짜**: {article.get('published_date')}\n"
+        if article.get('summary'):
+            result_text += f"- **내용**: {article.get('summary')[:200]}...\n"
+        result_text += "\n"
+
+    return result_text
+
+
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent | ImageContent]:
-    """도구 실행"""
+    """
+    도구 실행
+
+    블로킹 작업은 도구 실행기 스레드 풀에서 실행하므로 여러 도구 호출이 동시에 처리됩니다.
+    클라이언트가 취소하면 진행 중인 작업은 다음 단계부터 중단됩니다.
+    """
+    runner = get_runner()
     try:
         if name == "generate_daily_briefing":
-            from daily_briefing_workflow import run_daily_briefing_workflow
-
             include_image = arguments.get("include_image", True)
 
             logger.info(f"브리핑 생성 시작: include_image={include_image}")
 
-            result = run_daily_briefing_workflow()
-
-            if not result or not result.get('briefing_data'):
-                return [TextContent(type="text", text="브리핑 생성에 실패했습니다.")]
-
-            briefing_data = result['briefing_data']
-            top_stock = result.get('top_stock', {})
-
-            # 텍스트 브리핑
-            text_content = f"# 🌙 당신이 잠든 사이 - 오늘의 브리핑\n\n"
-            text_content += f"**생성 시간**: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M:%S')}\n\n"
-
-            if top_stock:
-                text_content += f"## 📈 오늘의 화제 종목\n\n"
-                text_content += f"### {top_stock.get('symbol')} - {top_stock.get('name')}\n"
-                text_content += f"- **현재가**: ${top_stock.get('price', 0):.2f}\n"
-                text_content += f"- **변동률**: {top_stock.get('change_percent', 0):.2f}%\n"
-                text_content += f"- **거래량**: {top_stock.get('volume', 0):,}\n\n"
-
-            # 브리핑 내용
-            if briefing_data.get('text_content'):
-                text_content += f"## 📝 브리핑 내용\n\n"
-                text_content += briefing_data['text_content']
-
-            # 분석 결과
-            if briefing_data.get('analysis'):
-                text_content += f"\n\n## 🔍 화제 원인 분석\n\n"
-                text_content += briefing_data['analysis']
-
-            contents = [TextContent(type="text", text=text_content)]
-
-            # 이미지 포함
-            if include_image and briefing_data.get('image_path'):
-                try:
-                    image_path = briefing_data['image_path']
-                    if os.path.exists(image_path):
-                        with open(image_path, 'rb') as f:
-                            image_data = base64.b64encode(f.read()).decode('utf-8')
-                        contents.append(ImageContent(
-                            type="image",
-                            data=image_data,
-                            mimeType="image/png"
-                        ))
-                        logger.info(f"브리핑 이미지 포함됨: {image_path}")
-                except Exception as e:
-                    logger.error(f"이미지 로드 실패: {str(e)}")
-
-            return contents
+            # 동시에 여러 번 요청돼도 워크플로우는 한 번만 실행
+            return await runner.run(_daily_briefing_contents, include_image, key=(name, include_image))
 
         elif name == "analyze_stock_trending_reason":
-            from gemini_briefing import analyze_why_trending
-            from yahooquery import Ticker
-            from exa_news import search_and_summarize_news
-
             symbol = arguments["symbol"].upper()
             include_news = arguments.get("include_news", True)
 
             logger.info(f"종목 분석 시작: {symbol}")
 
-            # 종목 정보 가져오기
-            ticker = Ticker(symbol)
-            quotes = ticker.quotes
-
-            if symbol not in quotes:
-                return [TextContent(type="text", text=f"종목 {symbol}을(를) 찾을 수 없습니다.")]
-
-            stock_data = quotes[symbol]
-
-            # 뉴스 수집
-            news_summary = ""
-            if include_news:
-                try:
-                    news_result = search_and_summarize_news(
-                        company_name=stock_data.get('shortName', symbol),
-                        num_results=5
-                    )
-                    if news_result and news_result.get('summary'):
-                        news_summary = news_result['summary']
-                except Exception as e:
-                    logger.error(f"뉴스 수집 실패: {str(e)}")
-                    news_summary = "뉴스를 가져올 수 없습니다."
-
-            # AI 분석
-            try:
-                analysis = analyze_why_trending(stock_data, news_summary)
-            except Exception as e:
-                logger.error(f"AI 분석 실패: {str(e)}")
-                analysis = "분석을 수행할 수 없습니다."
-
-            # 결과 포맷팅
-            result_text = f"# {symbol} - 화제 원인 분석\n\n"
-            result_text += f"## 📊 종목 정보\n"
-            result_text += f"- **회사명**: {stock_data.get('shortName', '')}\n"
-            result_text += f"- **현재가**: ${stock_data.get('regularMarketPrice', 0):.2f}\n"
-            result_text += f"- **변동률**: {stock_data.get('regularMarketChangePercent', 0):.2f}%\n"
-            result_text += f"- **거래량**: {stock_data.get('regularMarketVolume', 0):,}\n\n"
-
-            if news_summary:
-                result_text += f"## 📰 관련 뉴스 요약\n\n{news_summary}\n\n"
-
-            result_text += f"## 🔍 AI 분석 결과\n\n{analysis}\n"
-
-            return [TextContent(type="text", text=result_text)]
+            result_text = await runner.run(
+                _trending_reason_text, symbol, include_news,
+                key=(name, symbol, include_news), ttl=TOOL_RESULT_TTL
+            )
 
         elif name == "get_stock_news":
-            from exa_news import search_and_summarize_news
-            from yahooquery import Ticker
-
             symbol = arguments["symbol"].upper()
             limit = arguments.get("limit", 5)
 
             logger.info(f"뉴스 수집: {symbol}, limit={limit}")
 
-            # 회사명 가져오기
-            ticker = Ticker(symbol)
-            quotes = ticker.quotes
-
-            if symbol not in quotes:
-                return [TextContent(type="text", text=f"종목 {symbol}을(를) 찾을 수 없습니다.")]
-
-            company_name = quotes[symbol].get('shortName', symbol)
-
-            # 뉴스 검색
-            try:
-                news_result = search_and_summarize_news(
-                    company_name=company_name,
-                    num_results=limit
-                )
-
-                if not news_result:
-                    return [TextContent(type="text", text=f"{symbol}에 대한 뉴스를 찾을 수 없습니다.")]
-
-                result_text = f"# {symbol} - 최신 뉴스\n\n"
-                result_text += f"**검색어**: {company_name}\n"
-                result_text += f"**수집 뉴스 수**: {limit}개\n\n"
-
-                if news_result.get('summary'):
-                    result_text += f"## 📝 뉴스 요약\n\n{news_result['summary']}\n\n"
-
-                if news_result.get('articles'):
-                    result_text += f"## 📰 뉴스 목록\n\n"
-                    for idx, article in enumerate(news_result['articles'], 1):
-                        result_text += f"### {idx}. {article.get('title', '제목 없음')}\n"
-                        result_text += f"- **출처**: {article.get('url', '')}\n"
-                        if article.get('published_date'):
-                            result_text += f"- **날짜**: {article.get('published_date')}\n"
-                        if article.get('snippet'):
-                            result_text += f"- **내용**: {article.get('snippet')[:200]}...\n"
-                        result_text += "\n"
-
-                return [TextContent(type="text", text=result_text)]
-
-            except Exception as e:
-                logger.error(f"뉴스 수집 실패: {str(e)}")
-                return [TextContent(type="text", text=f"뉴스 수집 중 오류 발생: {str(e)}")]
+            result_text = await runner.run(
+                _stock_news_text, symbol, limit, key=(name, symbol, limit), ttl=TOOL_RESULT_TTL
+            )
 
         else:
-            return [TextContent(type="text", text=f"알 수 없는 도구: {name}")]
+            result_text = f"알 수 없는 도구: {name}"
+
+        return [TextContent(type="text", text=result_text)]
 
     except Exception as e:
         logger.error(f"도구 실행 오류: {str(e)}")
@@ -258,10 +289,13 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent | ImageConte
 
 
 async def main():
-    """MCP 서버 실행"""
+    """MCP 서버 실행 (세션 동안 프로세스 하나로 유지, 캐시와 스레드 풀 공유)"""
     logger.info("브리핑 생성 MCP 서버 시작...")
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        get_runner().shutdown()
 
 
 if __name__ == "__main__":
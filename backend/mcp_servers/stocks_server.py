@@ -13,7 +13,11 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 import logging
+from typing import Optional
+import resilience
 from get_trending_stocks import get_trending_stocks, get_top_trending_stock, format_stock_data
+from symbol_master import get_symbol_master, looks_like_symbol
+from mcp_servers.tool_runtime import check_cancelled, get_runner
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -22,6 +26,9 @@ logger = logging.getLogger(__name__)
 # MCP 서버 생성
 app = Server("stocks-server")
 
+# 같은 인자로 다시 호출된 조회 도구의 결과 재사용 시간 (초)
+TOOL_RESULT_TTL = float(os.getenv('MCP_TOOL_RESULT_TTL', '60'))
+
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
@@ -71,13 +78,13 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="get_stock_info",
-            description="특정 종목의 상세 정보를 조회합니다. Yahoo Finance에서 실시간 데이터를 가져옵니다.",
+            description="특정 종목의 상세 정보를 조회합니다. 티커 대신 회사명이나 한글 이름으로도 찾을 수 있습니다. Yahoo Finance에서 실시간 데이터를 가져옵니다.",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "symbol": {
                         "type": "string",
-                        "description": "종목 심볼 (예: AAPL, TSLA, MSFT)",
+                        "description": "종목 심볼 또는 회사명 (예: AAPL, 애플, Tesla)",
                     }
                 },
                 "required": ["symbol"]
@@ -86,9 +93,129 @@ async def list_tools() -> list[Tool]:
     ]
 
 
+def _trending_stocks_text(screener_types: list, count: int) -> str:
+    """화제 종목 목록 (스크리너 스냅샷 캐시 사용)"""
+    stocks_data = get_trending_stocks(screener_types=screener_types, count=count)
+
+    # 결과 포맷팅
+    result_text = "# 화제 종목 목록\n\n"
+    total_count = 0
+
+    for screener_type, quotes in stocks_data.items():
+        if quotes:
+            result_text += f"## {screener_type}\n\n"
+            for quote in quotes:
+                stock = format_stock_data(quote)
+                result_text += f"### {stock['symbol']} - {stock['name']}\n"
+                result_text += f"- 현재가: ${stock['price']:.2f}\n"
+                result_text += f"- 변동률: {stock['change_percent']:.2f}%\n"
+                result_text += f"- 거래량: {stock['volume']:,}\n"
+                result_text += f"- 시가총액: ${stock['market_cap']:,}\n\n"
+                total_count += 1
+
+    result_text += f"\n**총 {total_count}개 종목 조회 완료**"
+    return result_text
+
+
+def _top_trending_stock_text(screener_types: list, count: int) -> str:
+    """TOP 1 화제 종목"""
+    top_stock = get_top_trending_stock(screener_types=screener_types, count=count)
+
+    if not top_stock:
+        return "화제 종목을 찾을 수 없습니다."
+
+    stock = format_stock_data(top_stock)
+    result_text = f"# 🔥 오늘의 화제 종목 TOP 1\n\n"
+    result_text += f"## {stock['symbol']} - {stock['name']}\n\n"
+    result_text += f"- **현재가**: ${stock['price']:.2f}\n"
+    result_text += f"- **변동**: ${stock['change']:.2f} ({stock['change_percent']:.2f}%)\n"
+    result_text += f"- **거래량**: {stock['volume']:,}\n"
+    result_text += f"- **시가총액**: ${stock['market_cap']:,}\n"
+    result_text += f"- **데이터 수집 시간**: {stock['timestamp']}\n"
+    return result_text
+
+
+def _symbol_not_found_text(query: str) -> str:
+    """종목을 찾지 못했거나 이름으로 하나로 정하지 못했을 때 후보 목록"""
+    candidates = get_symbol_master().search(query, limit=5)
+    if not candidates:
+        return f"'{query}'에 해당하는 종목을 찾을 수 없습니다."
+
+    result_text = f"'{query}'에 해당하는 종목을 하나로 정할 수 없습니다. 다음 중 심볼로 다시 조회해 주세요.\n\n"
+    for candidate in candidates:
+        result_text += f"- {candidate['symbol']} - {candidate['name']}\n"
+    return result_text
+
+
+def _stock_info_text(symbol: str, query: Optional[str] = None) -> str:
+    """
+    종목 상세 정보 (API와 같은 Yahoo 서킷 브레이커 사용)
+
+    Args:
+        symbol: resolve()로 정한 티커
+        query: 사용자 입력 (시세가 없는 티커일 때 이름으로 다시 찾는 데 사용)
+    """
+    from yahooquery import Ticker
+
+    ticker = Ticker(symbol)
+    quotes = resilience.call('yahoo', lambda: ticker.quotes, hedge=True)
+
+    # 없는 티커는 시세 대신 'Quote not found ...' 문자열이 옴
+    if not isinstance(quotes, dict) or not isinstance(quotes.get(symbol), dict):
+        # 티커로 시세가 없을 때만 이름으로 다시 찾음 (대문자 티커 입력은 정확한 회사명/별칭만 인정)
+        query = query or symbol
+        fallback = get_symbol_master().resolve_name(query, allow_partial=not looks_like_symbol(query))
+        if fallback is not None and fallback != symbol:
+            check_cancelled()
+            return _stock_info_text(fallback)
+        # 마스터에 없는 티커 형식 입력 (예: 'micro' → MICRO)이면 이름 후보 안내
+        return _symbol_not_found_text(query)
+
+    quote = quotes[symbol]
+    check_cancelled()
+    summary = resilience.call('yahoo', lambda: ticker.summary_detail, hedge=True).get(symbol, {})
+    profile = resilience.call('yahoo', lambda: ticker.summary_profile, hedge=True).get(symbol, {})
+
+    result_text = f"# {symbol} - {quote.get('shortName', '')}\n\n"
+    result_text += f"## 기본 정보\n"
+    result_text += f"- **회사명**: {quote.get('longName', quote.get('shortName', ''))}\n"
+    result_text += f"- **섹터**: {profile.get('sector', 'N/A')}\n"
+    result_text += f"- **산업**: {profile.get('industry', 'N/A')}\n\n"
+
+    result_text += f"## 가격 정보\n"
+    result_text += f"- **현재가**: ${quote.get('regularMarketPrice', 0):.2f}\n"
+    result_text += f"- **전일종가**: ${quote.get('regularMarketPreviousClose', 0):.2f}\n"
+    result_text += f"- **변동**: ${quote.get('regularMarketChange', 0):.2f} ({quote.get('regularMarketChangePercent', 0):.2f}%)\n"
+    result_text += f"- **시가**: ${quote.get('regularMarketOpen', 0):.2f}\n"
+    result_text += f"- **고가**: ${quote.get('regularMarketDayHigh', 0):.2f}\n"
+    result_text += f"- **저가**: ${quote.get('regularMarketDayLow', 0):.2f}\n\n"
+
+    result_text += f"## 거래 정보\n"
+    result_text += f"- **거래량**: {quote.get('regularMarketVolume', 0):,}\n"
+    result_text += f"- **평균거래량**: {summary.get('averageVolume', 0):,}\n"
+    result_text += f"- **시가총액**: ${quote.get('marketCap', 0):,}\n\n"
+
+    if summary.get('fiftyTwoWeekHigh') and summary.get('fiftyTwoWeekLow'):
+        result_text += f"## 52주 범위\n"
+        result_text += f"- **52주 최고**: ${summary.get('fiftyTwoWeekHigh', 0):.2f}\n"
+        result_text += f"- **52주 최저**: ${summary.get('fiftyTwoWeekLow', 0):.2f}\n\n"
+
+    if profile.get('longBusinessSummary'):
+        result_text += f"## 회사 설명\n"
+        result_text += f"{profile.get('longBusinessSummary')[:500]}...\n"
+
+    return result_text
+
+
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
-    """도구 실행"""
+    """
+    도구 실행
+
+    블로킹 조회는 도구 실행기 스레드 풀에서 실행하므로 여러 도구 호출이 동시에 처리되고,
+    같은 인자의 호출은 TOOL_RESULT_TTL초 동안 결과를 재사용합니다.
+    """
+    runner = get_runner()
     try:
         if name == "get_trending_stocks":
             screener_types = arguments.get("screener_types", ["most_actives", "day_gainers"])
@@ -96,27 +223,10 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
             logger.info(f"화제 종목 조회: screener_types={screener_types}, count={count}")
 
-            stocks_data = get_trending_stocks(screener_types=screener_types, count=count)
-
-            # 결과 포맷팅
-            result_text = "# 화제 종목 목록\n\n"
-            total_count = 0
-
-            for screener_type, quotes in stocks_data.items():
-                if quotes:
-                    result_text += f"## {screener_type}\n\n"
-                    for quote in quotes:
-                        stock = format_stock_data(quote)
-                        result_text += f"### {stock['symbol']} - {stock['name']}\n"
-                        result_text += f"- 현재가: ${stock['price']:.2f}\n"
-                        result_text += f"- 변동률: {stock['change_percent']:.2f}%\n"
-                        result_text += f"- 거래량: {stock['volume']:,}\n"
-                        result_text += f"- 시가총액: ${stock['market_cap']:,}\n\n"
-                        total_count += 1
-
-            result_text += f"\n**총 {total_count}개 종목 조회 완료**"
-
-            return [TextContent(type="text", text=result_text)]
+            result_text = await runner.run(
+                _trending_stocks_text, screener_types, count,
+                key=(name, tuple(screener_types), count), ttl=TOOL_RESULT_TTL
+            )
 
         elif name == "get_top_trending_stock":
             screener_types = arguments.get("screener_types", ["most_actives", "day_gainers"])
@@ -124,70 +234,27 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
             logger.info(f"TOP 1 종목 조회: screener_types={screener_types}, count={count}")
 
-            top_stock = get_top_trending_stock(screener_types=screener_types, count=count)
-
-            if top_stock:
-                stock = format_stock_data(top_stock)
-                result_text = f"# 🔥 오늘의 화제 종목 TOP 1\n\n"
-                result_text += f"## {stock['symbol']} - {stock['name']}\n\n"
-                result_text += f"- **현재가**: ${stock['price']:.2f}\n"
-                result_text += f"- **변동**: ${stock['change']:.2f} ({stock['change_percent']:.2f}%)\n"
-                result_text += f"- **거래량**: {stock['volume']:,}\n"
-                result_text += f"- **시가총액**: ${stock['market_cap']:,}\n"
-                result_text += f"- **데이터 수집 시간**: {stock['timestamp']}\n"
-            else:
-                result_text = "화제 종목을 찾을 수 없습니다."
-
-            return [TextContent(type="text", text=result_text)]
+            result_text = await runner.run(
+                _top_trending_stock_text, screener_types, count,
+                key=(name, tuple(screener_types), count), ttl=TOOL_RESULT_TTL
+            )
 
         elif name == "get_stock_info":
-            from yahooquery import Ticker
-            symbol = arguments["symbol"].upper()
+            query = arguments["symbol"].strip()
+            symbol = get_symbol_master().resolve(query)
+            if symbol is None:
+                return [TextContent(type="text", text=_symbol_not_found_text(query))]
 
-            logger.info(f"종목 상세 정보 조회: {symbol}")
+            logger.info(f"종목 상세 정보 조회: {symbol} (입력: {query})")
 
-            ticker = Ticker(symbol)
-            quotes = ticker.quotes
-
-            if symbol not in quotes or not quotes[symbol]:
-                return [TextContent(type="text", text=f"종목 {symbol}을(를) 찾을 수 없습니다.")]
-
-            quote = quotes[symbol]
-            summary = ticker.summary_detail.get(symbol, {})
-            profile = ticker.summary_profile.get(symbol, {})
-
-            result_text = f"# {symbol} - {quote.get('shortName', '')}\n\n"
-            result_text += f"## 기본 정보\n"
-            result_text += f"- **회사명**: {quote.get('longName', quote.get('shortName', ''))}\n"
-            result_text += f"- **섹터**: {profile.get('sector', 'N/A')}\n"
-            result_text += f"- **산업**: {profile.get('industry', 'N/A')}\n\n"
-
-            result_text += f"## 가격 정보\n"
-            result_text += f"- **현재가**: ${quote.get('regularMarketPrice', 0):.2f}\n"
-            result_text += f"- **전일종가**: ${quote.get('regularMarketPreviousClose', 0):.2f}\n"
-            result_text += f"- **변동**: ${quote.get('regularMarketChange', 0):.2f} ({quote.get('regularMarketChangePercent', 0):.2f}%)\n"
-            result_text += f"- **시가**: ${quote.get('regularMarketOpen', 0):.2f}\n"
-            result_text += f"- **고가**: ${quote.get('regularMarketDayHigh', 0):.2f}\n"
-            result_text += f"- **저가**: ${quote.get('regularMarketDayLow', 0):.2f}\n\n"
-
-            result_text += f"## 거래 정보\n"
-            result_text += f"- **거래량**: {quote.get('regularMarketVolume', 0):,}\n"
-            result_text += f"- **평균거래량**: {summary.get('averageVolume', 0):,}\n"
-            result_text += f"- **시가총액**: ${quote.get('marketCap', 0):,}\n\n"
-
-            if summary.get('fiftyTwoWeekHigh') and summary.get('fiftyTwoWeekLow'):
-                result_text += f"## 52주 범위\n"
-                result_text += f"- **52주 최고**: ${summary.get('fiftyTwoWeekHigh', 0):.2f}\n"
-                result_text += f"- **52주 최저**: ${summary.get('fiftyTwoWeekLow', 0):.2f}\n\n"
-
-            if profile.get('longBusinessSummary'):
-                result_text += f"## 회사 설명\n"
-                result_text += f"{profile.get('longBusinessSummary')[:500]}...\n"
-
-            return [TextContent(type="text", text=result_text)]
+            result_text = await runner.run(
+                _stock_info_text, symbol, query, key=(name, symbol, query), ttl=TOOL_RESULT_TTL
+            )
 
         else:
-            return [TextContent(type="text", text=f"알 수 없는 도구: {name}")]
+            result_text = f"알 수 없는 도구: {name}"
+
+        return [TextContent(type="text", text=result_text)]
 
     except Exception as e:
         logger.error(f"도구 실행 오류: {str(e)}")
@@ -195,10 +262,13 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
 
 async def main():
-    """MCP 서버 실행"""
+    """MCP 서버 실행 (세션 동안 프로세스 하나로 유지, 캐시와 스레드 풀 공유)"""
     logger.info("화제 종목 MCP 서버 시작...")
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        get_runner().shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,158 @@
+"""
+MCP 도구 실행기
+
+도구 핸들러는 async지만 yahooquery / Exa / Gemini 호출은 동기 코드라서, 그대로 부르면
+이벤트 루프가 막혀 동시에 들어온 도구 호출이 한 줄로 처리됩니다.
+- 블로킹 작업은 스레드 풀에서 실행 (MCP_MAX_WORKERS, 기본값 8)
+- 같은 인자로 동시에 들어온 호출은 한 번만 실행하고 결과 공유
+- 조회 도구 결과는 짧게 (ttl초) 프로세스 메모리에 보관
+- 클라이언트가 요청을 취소하면 대기 중인 작업은 실행하지 않고, 실행 중인 작업에는 취소 신호 전달
+  (작업 안에서 check_cancelled()를 부르는 지점부터 중단)
+
+스크리너 스냅샷 / 뉴스 / LLM 응답 캐시는 API 서버와 같은 SQLite 캐시(output/cache.db)를 사용합니다.
+"""
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS = int(os.getenv('MCP_MAX_WORKERS', '8'))
+
+# 결과 캐시 최대 항목 수
+MAX_CACHED_RESULTS = 256
+
+# 실행 중인 작업의 취소 신호 (작업 스레드에서 조회)
+_cancel_event: contextvars.ContextVar[Optional[threading.Event]] = contextvars.ContextVar(
+    'mcp_tool_cancel_event', default=None
+)
+
+
+class ToolCancelled(Exception):
+    """클라이언트가 도구 호출을 취소함"""
+
+
+def current_cancel_event() -> Optional[threading.Event]:
+    """현재 작업의 취소 신호 (도구 실행기 밖에서는 None)"""
+    return _cancel_event.get()
+
+
+def check_cancelled() -> None:
+    """취소된 작업이면 ToolCancelled (긴 작업의 단계 사이에서 호출)"""
+    event = _cancel_event.get()
+    if event is not None and event.is_set():
+        raise ToolCancelled("도구 호출이 취소되었습니다.")
+
+
+class _Flight:
+    """실행 중인 작업 하나 (같은 키로 들어온 호출이 공유)"""
+
+    def __init__(self, future: asyncio.Future, cancel_event: threading.Event):
+        self.future = future
+        self.cancel_event = cancel_event
+        self.waiters = 0
+
+
+class ToolRunner:
+    """블로킹 도구 작업 실행기 (스레드 풀 + 중복 호출 병합 + 결과 캐시)"""
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='mcp-tool')
+        self._inflight: Dict[Hashable, _Flight] = {}
+        self._results: Dict[Hashable, Tuple[float, Any]] = {}
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args,
+        key: Optional[Hashable] = None,
+        ttl: float = 0,
+        **kwargs
+    ) -> Any:
+        """
+        func(*args, **kwargs)를 스레드 풀에서 실행
+
+        Args:
+            func: 블로킹 함수
+            key: 중복 호출 병합/결과 캐시 키 (None이면 매번 따로 실행)
+            ttl: 결과 캐시 유지 시간 (초, 0이면 캐시하지 않음)
+
+        Returns:
+            func의 반환값
+
+        Raises:
+            asyncio.CancelledError: 호출한 쪽이 취소됨
+            func가 던진 예외
+        """
+        if key is not None and ttl > 0:
+            cached = self._results.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+        flight = self._inflight.get(key) if key is not None else None
+        if flight is None:
+            flight = self._start(func, args, kwargs)
+            if key is not None:
+                self._inflight[key] = flight
+                flight.future.add_done_callback(functools.partial(self._finish, key, flight, ttl))
+
+        flight.waiters += 1
+        try:
+            # shield: 한 호출자가 취소돼도 같은 작업을 기다리는 다른 호출자는 계속 기다림
+            return await asyncio.shield(flight.future)
+        except asyncio.CancelledError:
+            if flight.waiters == 1:
+                # 마지막 대기자가 취소: 대기 중이면 실행하지 않고, 실행 중이면 취소 신호
+                flight.cancel_event.set()
+                flight.future.cancel()
+                logger.info(f"도구 작업 취소: {getattr(func, '__name__', func)}")
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _start(self, func: Callable, args: tuple, kwargs: dict) -> _Flight:
+        cancel_event = threading.Event()
+
+        def call():
+            if cancel_event.is_set():
+                raise ToolCancelled("도구 호출이 취소되었습니다.")
+            _cancel_event.set(cancel_event)
+            return func(*args, **kwargs)
+
+        # 호출한 쪽의 컨텍스트(계측 span 등)를 작업 스레드로 전달
+        context = contextvars.copy_context()
+        future = asyncio.get_running_loop().run_in_executor(self._executor, context.run, call)
+        return _Flight(future, cancel_event)
+
+    def _finish(self, key: Hashable, flight: _Flight, ttl: float, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        if ttl <= 0 or future.cancelled() or future.exception() is not None:
+            return
+        if len(self._results) >= MAX_CACHED_RESULTS:
+            now = time.monotonic()
+            self._results = {k: v for k, v in self._results.items() if v[0] > now}
+            if len(self._results) >= MAX_CACHED_RESULTS:
+                self._results.pop(next(iter(self._results)))
+        self._results[key] = (time.monotonic() + ttl, future.result())
+
+    def shutdown(self) -> None:
+        """대기 중인 작업은 버리고 스레드 풀 종료"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_default_runner: Optional[ToolRunner] = None
+
+
+def get_runner() -> ToolRunner:
+    """기본 도구 실행기 (서버 프로세스당 하나)"""
+    global _default_runner
+    if _default_runner is None:
+        _default_runner = ToolRunner()
+    return _default_runner
@@ -1,7 +1,8 @@
 """
 Pydantic 스키마 정의
 """
-from pydantic import BaseModel, Field
+from email.headerregistry import Address
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional
 from datetime import datetime
 
@@ -181,6 +182,22 @@ class SendChannel(BaseModel):
     slack_webhook_url: Optional[str] = None
     slack_channel: Optional[str] = "#general"
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, value: Optional[str]) -> Optional[str]:
+        """이메일 주소 1개만 허용 (CR/LF 등으로 헤더를 덧붙이는 입력 거부)"""
+        if value is None:
+            return value
+        if "\r" in value or "\n" in value:
+            raise ValueError("이메일 주소에 줄바꿈 문자를 포함할 수 없습니다")
+        try:
+            address = Address(addr_spec=value.strip())
+        except Exception:
+            raise ValueError("올바른 이메일 주소 형식이 아닙니다")
+        if not address.username or not address.domain:
+            raise ValueError("올바른 이메일 주소 형식이 아닙니다")
+        return address.addr_spec
+
 
 class SendBriefingRequest(BaseModel):
     """브리핑 발송 요청"""
@@ -197,6 +214,8 @@ class SendChannelResult(BaseModel):
     status: str
     sent_at: Optional[str] = None
     message_id: Optional[str] = None
+    attempts: int = 0
+    error: Optional[str] = None
 
 
 class SendBriefingData(BaseModel):
@@ -207,6 +226,8 @@ class SendBriefingData(BaseModel):
     channels: List[SendChannelResult]
     total_sent: int = 0
     total_failed: int = 0
+    pending: int = 0
+    duplicates: int = 0
 
 
 class SendBriefingResponse(BaseModel):
@@ -215,6 +236,26 @@ class SendBriefingResponse(BaseModel):
     data: SendBriefingData
 
 
+class SendJobData(BaseModel):
+    """발송 작업 상태 데이터"""
+    send_job_id: str
+    briefing_id: str
+    status: str
+    created_at: str
+    channels: List[SendChannelResult]
+    total: int = 0
+    total_sent: int = 0
+    total_failed: int = 0
+    pending: int = 0
+    duplicates: int = 0
+
+
+class SendJobResponse(BaseModel):
+    """발송 작업 상태 응답"""
+    success: bool = True
+    data: SendJobData
+
+
 # ============= 브리핑 히스토리 스키마 =============
 
 class BriefingListItem(BaseModel):
@@ -251,6 +292,78 @@ class BriefingListResponse(BaseModel):
     data: BriefingListData
 
 
+# ============= 검색 스키마 =============
+
+class SearchHit(BaseModel):
+    """검색 결과 항목"""
+    type: str
+    briefing_id: Optional[str] = None
+    symbol: str
+    published_at: str
+    title: str
+    snippet: str
+    url: Optional[str] = None
+    score: float
+
+
+class SearchData(BaseModel):
+    """검색 결과 데이터"""
+    query: str
+    results: List[SearchHit]
+    count: int
+    took_ms: float
+
+
+class SearchResponse(BaseModel):
+    """검색 응답"""
+    success: bool = True
+    data: SearchData
+
+
+class SymbolHit(BaseModel):
+    """종목 검색 결과 항목"""
+    symbol: str
+    name: str
+    exchange: str
+    type: str
+    aliases: List[str] = []
+    match: str
+    score: float
+
+
+class SymbolSearchData(BaseModel):
+    """종목 검색 결과 데이터"""
+    query: str
+    results: List[SymbolHit]
+    count: int
+    took_ms: float
+
+
+class SymbolSearchResponse(BaseModel):
+    """종목 검색 응답"""
+    success: bool = True
+    data: SymbolSearchData
+
+
+# ============= 스크리너 스키마 =============
+
+class ScreenRunRequest(BaseModel):
+    """스크린 실행 요청 (expression 또는 저장된 스크린 name)"""
+    expression: Optional[str] = Field(None, max_length=500)
+    name: Optional[str] = None
+    sort_by: Optional[str] = None
+    order: Optional[str] = Field(None, pattern="^(asc|desc)$")
+    limit: int = Field(50, ge=1, le=500)
+
+
+class ScreenSaveRequest(BaseModel):
+    """스크린 저장 요청"""
+    expression: str = Field(..., min_length=1, max_length=500)
+    description: str = ""
+    sort_by: str = "score"
+    order: str = Field("desc", pattern="^(asc|desc)$")
+
+
 # ============= 인증 관련 스키마 =============
 
 class LoginRequest(BaseModel):
@@ -0,0 +1,218 @@
+"""
+Exa 뉴스 검색 결과 캐시
+
+search_stock_news의 검색 기간은 호출 시각 기준이라 몇 분 차이의 동일한 요청도
+매번 외부 API를 호출합니다. 검색 기간을 날짜 단위 창(window)으로 정규화하여
+(종목, 시작일, 종료일, 검색 유형) 키로 중복 제거된 기사 목록을 보관합니다.
+- 최근 창일수록 짧은 TTL (1일 창: 10분, 30일 창: 4시간)
+- 좁은 창 요청은 같은 종료일의 더 넓은 캐시 창을 발행일로 걸러서 응답
+"""
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from cache_db import get_connection, pack, unpack
+
+logger = logging.getLogger(__name__)
+
+# 검색 유형
+KIND_STOCK_NEWS = 'stock_news'
+
+# 창 길이(일)별 TTL (초): 가장 작은 상한부터 적용
+_TTL_BY_WINDOW_DAYS = (
+    (1, 10 * 60),
+    (3, 30 * 60),
+    (7, 60 * 60),
+    (30, 4 * 60 * 60),
+)
+_MAX_TTL_SECONDS = 12 * 60 * 60
+
+
+def normalize_window(days_back: int, now: Optional[datetime] = None) -> Tuple[str, str]:
+    """
+    검색 기간을 날짜 단위 창으로 정규화합니다. (Exa 요청도 날짜 단위로 전송)
+
+    Args:
+        days_back: 며칠 전까지 검색할지
+        now: 기준 시각 (기본값: 현재)
+
+    Returns:
+        (시작일, 종료일) YYYY-MM-DD 튜플
+    """
+    end = now or datetime.now()
+    start = end - timedelta(days=days_back)
+    return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+
+def ttl_for_window(window: Tuple[str, str]) -> int:
+    """창 길이에 따른 TTL (초)"""
+    start, end = (datetime.strptime(day, '%Y-%m-%d') for day in window)
+    days = (end - start).days
+    for max_days, ttl in _TTL_BY_WINDOW_DAYS:
+        if days <= max_days:
+            return ttl
+    return _MAX_TTL_SECONDS
+
+
+class NewsCache:
+    """뉴스 검색 결과 캐시 (SQLite)"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Args:
+            db_path: 캐시 DB 경로 (기본값: output/cache.db)
+        """
+        self.db_path = db_path
+        self._schema_ready = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self):
+        conn = get_connection(self.db_path)
+        if not self._schema_ready:
+            with self._lock, conn:
+                conn.executescript("""
+                    CREATE TABLE IF NOT EXISTS news_cache (
+                        ticker     TEXT NOT NULL,
+                        kind       TEXT NOT NULL,
+                        start_day  TEXT NOT NULL,
+                        end_day    TEXT NOT NULL,
+                        fetched_at REAL NOT NULL,
+                        requested  INTEGER NOT NULL,
+                        exhausted  INTEGER NOT NULL,
+                        articles   BLOB NOT NULL,
+                        PRIMARY KEY (ticker, kind, end_day, start_day)
+                    );
+                """)
+            self._schema_ready = True
+        return conn
+
+    def get(
+        self,
+        ticker: str,
+        window: Tuple[str, str],
+        limit: int,
+        kind: str = KIND_STOCK_NEWS,
+        record_stats: bool = True
+    ) -> Optional[List[Dict]]:
+        """
+        캐시된 기사 조회
+
+        같은 종료일에 요청 창을 포함하는 유효한 캐시 창이 있으면 사용합니다.
+        넓은 창의 결과는 발행일로 거르며, limit개를 채울 수 있을 때만 응답합니다.
+
+        Args:
+            ticker: 종목 심볼
+            window: normalize_window()로 만든 (시작일, 종료일)
+            limit: 필요한 기사 수
+            kind: 검색 유형
+            record_stats: 적중 통계 반영 여부 (준비 상태 점검 시 False)
+
+        Returns:
+            기사 리스트 (최대 limit개) 또는 None (캐시 미스)
+        """
+        start_day, end_day = window
+        oldest_fresh = time.time() - ttl_for_window(window)
+
+        try:
+            rows = self._connect().execute(
+                """
+                SELECT start_day, requested, exhausted, articles FROM news_cache
+                WHERE ticker = ? AND kind = ? AND end_day = ? AND start_day <= ? AND fetched_at >= ?
+                ORDER BY start_day DESC
+                """,
+                (ticker.upper(), kind, end_day, start_day, oldest_fresh)
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"뉴스 캐시 조회 실패: {str(e)}")
+            rows = []
+
+        for row in rows:
+            articles = unpack(row['articles'])
+            if row['start_day'] != start_day:
+                articles = [
+                    article for article in articles
+                    if (article.get('published_date') or '')[:10] >= start_day
+                ]
+            # 외부 API가 요청보다 적게 돌려준 창(exhausted)은 다시 요청해도 늘지 않음
+            if len(articles) >= limit or row['exhausted']:
+                if not record_stats:
+                    return articles[:limit]
+                self.hits += 1
+                logger.info(f"뉴스 캐시 적중: {ticker} {start_day}~{end_day} (캐시 창 시작 {row['start_day']})")
+                return articles[:limit]
+
+        if record_stats:
+            self.misses += 1
+        return None
+
+    def put(
+        self,
+        ticker: str,
+        window: Tuple[str, str],
+        articles: List[Dict],
+        requested: int,
+        exhausted: bool,
+        kind: str = KIND_STOCK_NEWS
+    ) -> None:
+        """
+        검색 결과 저장
+
+        Args:
+            ticker: 종목 심볼
+            window: (시작일, 종료일)
+            articles: 중복 제거된 기사 리스트 (limit으로 자르기 전)
+            requested: 외부 API에 요청한 결과 수
+            exhausted: 외부 API가 요청보다 적은 결과를 돌려줬는지 여부
+            kind: 검색 유형
+        """
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO news_cache
+                        (ticker, kind, start_day, end_day, fetched_at, requested, exhausted, articles)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (ticker.upper(), kind, window[0], window[1], time.time(),
+                     requested, int(exhausted), pack(articles))
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"뉴스 캐시 저장 실패: {str(e)}")
+
+    def purge_expired(self) -> int:
+        """최대 TTL이 지난 항목 삭제"""
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                'DELETE FROM news_cache WHERE fetched_at < ?',
+                (time.time() - _MAX_TTL_SECONDS,)
+            )
+        return cursor.rowcount
+
+    def stats(self) -> Dict:
+        """캐시 적중 통계"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+# 기본 캐시 인스턴스
+_default_cache: Optional[NewsCache] = None
+
+
+def get_news_cache() -> NewsCache:
+    """기본 뉴스 캐시 반환"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = NewsCache()
+    return _default_cache
@@ -0,0 +1,233 @@
+"""
+뉴스 중복 제거 및 유사 기사 클러스터링
+
+Exa 검색 결과에는 같은 기사가 여러 매체에 재배포된 사본이 섞여 있습니다.
+LLM 요약/분석/번역 전에 한 번 실행하여 대표 기사만 남깁니다.
+- URL 정규화 (추적 파라미터, www, 끝 슬래시 제거)로 완전 중복 제거
+- 제목+본문 SimHash(64비트)로 유사 기사 탐지
+- 해시를 16비트 밴드 4개로 나눈 버킷(LSH)으로 후보쌍만 비교하여 선형 시간에 클러스터링
+"""
+import hashlib
+import logging
+import math
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from text_tokens import tokenize
+
+logger = logging.getLogger(__name__)
+
+# SimHash 설정
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+# 밴드 수보다 작은 해밍 거리는 비둘기집 원리에 의해 반드시 같은 버킷에서 발견됨
+MAX_HAMMING_DISTANCE = SIMHASH_BANDS - 1
+SHINGLE_SIZE = 3
+
+# 뉴스를 입력으로 사용하는 LLM 단계 (요약, 화제 원인 분석, 번역)
+NEWS_LLM_STAGES = 3
+
+# 제거할 추적 파라미터 (utm_*만 접두어, 나머지는 정확히 같은 키만 - reference=, src_id= 등 실제 파라미터는 유지)
+_TRACKING_PARAM_PREFIX = 'utm_'
+_TRACKING_PARAMS = frozenset({
+    'mc_cid', 'mc_eid', 'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'ocid', 'cmpid',
+    'ref', 'ref_src', 'ref_url', 'src', 'guccounter', 'guce_referrer', 'guce_referrer_sig', '_ga',
+})
+
+
+def _is_tracking_param(key: str) -> bool:
+    key = key.lower()
+    return key.startswith(_TRACKING_PARAM_PREFIX) or key in _TRACKING_PARAMS
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    중복 비교용 URL 정규화
+
+    Args:
+        url: 원본 URL
+
+    Returns:
+        스킴/www/추적 파라미터/프래그먼트/끝 슬래시를 제거한 URL
+
+    Example:
+        >>> canonicalize_url("https://www.Reuters.com/markets/nvda/?utm_source=x")
+        'reuters.com/markets/nvda'
+    """
+    if not url:
+        return ''
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if host.startswith('m.'):
+        host = host[2:]
+    path = parts.path.rstrip('/')
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query)
+        if not _is_tracking_param(key)
+    ))
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+def simhash(text: str) -> int:
+    """
+    텍스트의 64비트 SimHash 계산 (토큰 3-gram shingle 기준)
+
+    Args:
+        text: 제목+본문
+
+    Returns:
+        64비트 정수 해시
+    """
+    tokens = tokenize(text)
+    if len(tokens) >= SHINGLE_SIZE:
+        shingles = [' '.join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)]
+    else:
+        shingles = [' '.join(tokens)] if tokens else []
+
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        value = int.from_bytes(
+            hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big'
+        )
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    result = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            result |= 1 << bit
+    return result
+
+
+def estimate_tokens(text: str) -> int:
+    """LLM 입력 토큰 수 근사치 (한글 1자≈1토큰, 그 외 4자≈1토큰)"""
+    if not text:
+        return 0
+    hangul = sum(1 for ch in text if '가' <= ch <= '힣')
+    return hangul + math.ceil((len(text) - hangul) / 4)
+
+
+def _article_text(article: Dict) -> str:
+    return f"{article.get('title', '')}\n{article.get('summary', '')}"
+
+
+class _UnionFind:
+    """경로 압축 union-find"""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # 먼저 나온(검색 순위가 높은) 기사를 대표로 유지
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+def deduplicate_articles(
+    articles: List[Dict],
+    max_distance: int = MAX_HAMMING_DISTANCE
+) -> Tuple[List[Dict], Dict]:
+    """
+    뉴스 기사 중복 제거
+
+    Args:
+        articles: 검색 순위 순서의 기사 리스트 (title, url, summary, source)
+        max_distance: 유사 기사로 볼 최대 SimHash 해밍 거리
+
+    Returns:
+        (대표 기사 리스트, 통계)
+        대표 기사에는 source_count, duplicate_urls, duplicate_tokens가 추가됩니다.
+    """
+    total = len(articles)
+    if total == 0:
+        return [], {'input_count': 0, 'output_count': 0, 'removed_count': 0, 'removed_tokens': 0}
+
+    union_find = _UnionFind(total)
+    hashes = [simhash(_article_text(article)) for article in articles]
+
+    # 1) 정규화 URL 완전 일치
+    seen_urls: Dict[str, int] = {}
+    for index, article in enumerate(articles):
+        key = canonicalize_url(article.get('url', ''))
+        if not key:
+            continue
+        if key in seen_urls:
+            union_find.union(seen_urls[key], index)
+        else:
+            seen_urls[key] = index
+
+    # 2) SimHash 밴드 버킷 내 후보쌍만 비교
+    band_mask = (1 << BAND_BITS) - 1
+    buckets: Dict[Tuple[int, int], List[int]] = {}
+    for index, value in enumerate(hashes):
+        for band in range(SIMHASH_BANDS):
+            key = (band, value >> (band * BAND_BITS) & band_mask)
+            for other in buckets.setdefault(key, []):
+                if bin(hashes[other] ^ value).count('1') <= max_distance:
+                    union_find.union(other, index)
+            buckets[key].append(index)
+
+    # 3) 클러스터별 대표 기사 선정
+    clusters: Dict[int, List[int]] = {}
+    for index in range(total):
+        clusters.setdefault(union_find.find(index), []).append(index)
+
+    representatives = []
+    removed_tokens = 0
+    for root in sorted(clusters):
+        members = clusters[root]
+        representative = dict(articles[root])
+        duplicates = [articles[index] for index in members if index != root]
+        duplicate_tokens = sum(estimate_tokens(_article_text(article)) for article in duplicates)
+        removed_tokens += duplicate_tokens
+
+        representative['source_count'] = len(members)
+        representative['duplicate_urls'] = [article.get('url', '') for article in duplicates]
+        representative['duplicate_tokens'] = duplicate_tokens
+        representatives.append(representative)
+
+    stats = {
+        'input_count': total,
+        'output_count': len(representatives),
+        'removed_count': total - len(representatives),
+        'removed_tokens': removed_tokens,
+    }
+    if stats['removed_count']:
+        logger.info(
+            f"뉴스 중복 제거: {total}개 → {len(representatives)}개 "
+            f"(입력 토큰 약 {removed_tokens}개 절감)"
+        )
+    return representatives, stats
+
+
+def dedup_report(articles: List[Dict]) -> Dict:
+    """
+    중복 제거된 기사 리스트로 브리핑 단위 절감 효과를 계산합니다.
+
+    Args:
+        articles: deduplicate_articles()를 거친 기사 리스트
+
+    Returns:
+        제거된 기사 수, 절감된 번역 호출 수, 절감된 LLM 입력 토큰 추정치
+    """
+    removed = sum(max(article.get('source_count', 1) - 1, 0) for article in articles)
+    removed_tokens = sum(article.get('duplicate_tokens', 0) for article in articles)
+    return {
+        'articles_kept': len(articles),
+        'articles_removed': removed,
+        'translation_calls_saved': removed,
+        'estimated_tokens_saved': removed_tokens * NEWS_LLM_STAGES,
+    }
@@ -0,0 +1,307 @@
+"""
+아침 브리핑 사전 준비(pre-warm) 스케줄러
+
+미국 장 마감 무렵부터 07:00 브리핑 전까지 20분 간격으로 캐시를 미리 채웁니다.
+- 스크리너 스냅샷 갱신 (get_trending_stocks.get_screener_snapshot)
+- 유력 후보 종목 뉴스 수집 (news_cache) 및 헤드라인 번역 (llm_cache)
+- 장 마감 후에는 TOP 1 후보의 Step 2 분석(요약/종목 분석/화제 원인)까지 미리 생성
+07:00 실행은 같은 입력으로 같은 캐시 키를 조회하므로 대부분 캐시에서 바로 응답합니다.
+"""
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from cache_db import get_connection, pack, unpack
+
+logger = logging.getLogger(__name__)
+
+# 사전 준비 작업 시각 (KST): 05:10 ~ 06:50, 20분 간격
+PREWARM_HOURS = '5-6'
+PREWARM_MINUTES = '10,30,50'
+# 미국 거래일(월~금) 다음 날 아침 (KST)
+PREWARM_DAYS = 'tue-sat'
+
+# 후보 종목 설정 (Step 1과 같은 스크리너/개수)
+CANDIDATE_SCREENERS = ['most_actives', 'day_gainers']
+CANDIDATE_COUNT = 5
+CANDIDATES_PER_SCREENER = 3
+
+# Step 2와 같은 뉴스 검색 조건 (같은 캐시 키를 쓰기 위함)
+NEWS_LIMIT = 5
+NEWS_DAYS_BACK = 7
+
+_STATUS_KEY = 'prewarm'
+_run_lock = threading.Lock()
+
+
+# ============================================================================
+# 실행 상태 저장 (API 프로세스와 스케줄러 프로세스가 공유)
+# ============================================================================
+
+def _status_connection() -> sqlite3.Connection:
+    conn = get_connection()
+    with conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS job_status (
+                job_key    TEXT PRIMARY KEY,
+                updated_at REAL NOT NULL,
+                payload    BLOB NOT NULL
+            )
+        """)
+    return conn
+
+
+def _save_status(status: Dict) -> None:
+    try:
+        conn = _status_connection()
+        with conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO job_status VALUES (?, ?, ?)',
+                (_STATUS_KEY, time.time(), pack(status))
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"사전 준비 상태 저장 실패: {str(e)}")
+
+
+def load_last_status() -> Optional[Dict]:
+    """마지막 사전 준비 실행 결과"""
+    try:
+        row = _status_connection().execute(
+            'SELECT payload FROM job_status WHERE job_key = ?', (_STATUS_KEY,)
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    return unpack(row['payload']) if row else None
+
+
+# ============================================================================
+# 사전 준비 작업
+# ============================================================================
+
+def is_us_market_closed(now: Optional[datetime] = None) -> bool:
+    """미국 정규장이 마감(16:00 ET 이후 또는 주말)되었는지 여부"""
+    from zoneinfo import ZoneInfo
+
+    now_et = (now or datetime.now(ZoneInfo('Asia/Seoul'))).astimezone(ZoneInfo('America/New_York'))
+    if now_et.weekday() >= 5:
+        return True
+    return now_et.hour >= 16 or now_et.hour < 9 or (now_et.hour == 9 and now_et.minute < 30)
+
+
+def select_candidates(snapshot: Dict[str, List[Dict]]) -> List[Dict]:
+    """
+    스크리너 스냅샷에서 07:00 브리핑에 선정될 가능성이 높은 종목을 고릅니다.
+    Step 1의 TOP 1 선정 규칙(most_actives 1위 우선)을 따르므로 첫 번째 후보가 가장 유력합니다.
+    """
+    candidates = []
+    seen = set()
+    for screener_type in CANDIDATE_SCREENERS:
+        for quote in snapshot.get(screener_type, [])[:CANDIDATES_PER_SCREENER]:
+            symbol = quote.get('symbol')
+            if symbol and symbol not in seen:
+                seen.add(symbol)
+                candidates.append(quote)
+    return candidates
+
+
+def run_prewarm_cycle(warm_analysis: Optional[bool] = None) -> Dict:
+    """
+    사전 준비 1회 실행
+
+    Args:
+        warm_analysis: TOP 1 후보의 Step 2 분석까지 생성할지 여부
+                       (기본값: 미국 장 마감 후에만 - 마감 전에는 가격이 바뀌어 캐시 키가 달라짐)
+
+    Returns:
+        실행 결과 (후보별 뉴스/번역 수, 단계별 소요 시간)
+    """
+    from get_trending_stocks import get_screener_snapshot, format_stock_data
+    from exa_news import search_stock_news
+    from gemini_briefing import translate_news_to_korean
+
+    if not _run_lock.acquire(blocking=False):
+        logger.info("사전 준비 작업이 이미 실행 중입니다.")
+        return {'skipped': True}
+
+    started = time.time()
+    status = {
+        'started_at': datetime.now().isoformat(),
+        'candidates': [],
+        'timings_ms': {},
+        'errors': [],
+        'skipped': False,
+    }
+
+    try:
+        if warm_analysis is None:
+            warm_analysis = is_us_market_closed()
+
+        # 1) 스크리너 스냅샷 강제 갱신
+        step_started = time.time()
+        snapshot = get_screener_snapshot(CANDIDATE_SCREENERS, count=CANDIDATE_COUNT, max_age=None)
+        status['timings_ms']['screener'] = round((time.time() - step_started) * 1000)
+
+        candidates = select_candidates(snapshot)
+        logger.info(f"사전 준비 후보: {[quote.get('symbol') for quote in candidates]}")
+
+        # 2) 후보별 뉴스 수집 및 헤드라인 번역
+        step_started = time.time()
+        for quote in candidates:
+            symbol = quote['symbol']
+            entry = {'symbol': symbol, 'news': 0, 'translated': 0}
+            try:
+                news_articles = search_stock_news(
+                    symbol,
+                    stock_name=quote.get('shortName', ''),
+                    limit=NEWS_LIMIT,
+                    days_back=NEWS_DAYS_BACK
+                )
+                entry['news'] = len(news_articles)
+                if news_articles:
+                    translated = translate_news_to_korean(news_articles)
+                    entry['translated'] = sum(1 for article in translated if 'title_en' in article)
+            except Exception as e:
+                status['errors'].append(f"{symbol}: {str(e)}")
+            status['candidates'].append(entry)
+        status['timings_ms']['news'] = round((time.time() - step_started) * 1000)
+
+        # 3) 장 마감 후: TOP 1 후보의 Step 2 LLM 결과 미리 생성
+        if warm_analysis and candidates:
+            from daily_briefing_workflow import step2_collect_stock_info
+
+            step_started = time.time()
+            try:
+                step2_collect_stock_info(format_stock_data(candidates[0]))
+                status['analysis_warmed'] = candidates[0]['symbol']
+            except Exception as e:
+                status['errors'].append(f"analysis: {str(e)}")
+            status['timings_ms']['analysis'] = round((time.time() - step_started) * 1000)
+
+    except Exception as e:
+        logger.error(f"사전 준비 작업 실패: {str(e)}")
+        status['errors'].append(str(e))
+
+    finally:
+        status['duration_ms'] = round((time.time() - started) * 1000)
+        status['finished_at'] = datetime.now().isoformat()
+        _save_status(status)
+        _run_lock.release()
+
+    logger.info(f"사전 준비 완료: {len(status['candidates'])}개 후보, {status['duration_ms']}ms")
+    return status
+
+
+# ============================================================================
+# 스케줄 등록 및 상태 보고
+# ============================================================================
+
+def run_prewarm_job() -> Optional[Dict]:
+    """여러 프로세스 중 하나만 사전 준비를 실행 (잠금을 얻지 못하면 건너뜀)"""
+    from job_lock import run_exclusive
+
+    return run_exclusive('briefing_prewarm', run_prewarm_cycle, lease_seconds=120)
+
+
+def register_prewarm_jobs(scheduler) -> None:
+    """
+    APScheduler 스케줄러에 사전 준비 작업 등록
+
+    Args:
+        scheduler: BackgroundScheduler 또는 BlockingScheduler (timezone='Asia/Seoul')
+    """
+    from apscheduler.triggers.cron import CronTrigger
+
+    scheduler.add_job(
+        func=run_prewarm_job,
+        trigger=CronTrigger(
+            day_of_week=PREWARM_DAYS,
+            hour=PREWARM_HOURS,
+            minute=PREWARM_MINUTES,
+            timezone='Asia/Seoul'
+        ),
+        id='briefing_prewarm_job',
+        name='브리핑 캐시 사전 준비',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True
+    )
+
+
+def get_prewarm_report(scheduler=None) -> Dict:
+    """
+    사전 준비 스케줄과 캐시 준비 상태 보고서
+
+    Args:
+        scheduler: 실행 중인 스케줄러 (있으면 다음 실행 시각 포함)
+
+    Returns:
+        schedule, last_run, recent_runs, readiness를 담은 딕셔너리
+    """
+    from get_trending_stocks import get_snapshot_ages, SCREENER_SNAPSHOT_TTL
+    from news_cache import get_news_cache, normalize_window
+    from llm_cache import get_llm_cache
+
+    schedule = {
+        'timezone': 'Asia/Seoul',
+        'prewarm': f"{PREWARM_DAYS} {PREWARM_HOURS}시 {PREWARM_MINUTES}분",
+        'briefing': '매일 07:00',
+        'jobs': [],
+    }
+    if scheduler is not None:
+        for job in scheduler.get_jobs():
+            schedule['jobs'].append({
+                'id': job.id,
+                'name': job.name,
+                'next_run_time': job.next_run_time.isoformat() if job.next_run_time else None,
+            })
+
+    last_run = load_last_status()
+
+    # 스크리너 스냅샷 신선도
+    snapshot_ages = get_snapshot_ages()
+    screeners_ready = all(
+        snapshot_ages.get(screener_type, float('inf')) <= SCREENER_SNAPSHOT_TTL
+        for screener_type in CANDIDATE_SCREENERS
+    )
+
+    # 후보별 뉴스 캐시 신선도 (통계에 반영하지 않고 확인)
+    news_cache = get_news_cache()
+    window = normalize_window(NEWS_DAYS_BACK)
+    candidates = []
+    for entry in (last_run or {}).get('candidates', []):
+        cached = news_cache.get(entry['symbol'], window, NEWS_LIMIT, record_stats=False)
+        candidates.append({**entry, 'news_ready': cached is not None})
+
+    # 최근 예약 실행 기록 (어느 프로세스가 실행했는지)
+    try:
+        from job_lock import get_job_lock_backend
+        recent_runs = get_job_lock_backend().recent(limit=10)
+    except Exception as e:
+        logger.warning(f"작업 실행 기록 조회 실패: {str(e)}")
+        recent_runs = []
+
+    return {
+        'schedule': schedule,
+        'last_run': last_run,
+        'recent_runs': recent_runs,
+        'readiness': {
+            'screener_snapshot_ages_sec': snapshot_ages,
+            'screeners_ready': screeners_ready,
+            'candidates': candidates,
+            'news_ready': bool(candidates) and all(entry['news_ready'] for entry in candidates),
+            'news_cache': news_cache.stats(),
+            'llm_cache': {'hits': get_llm_cache().hits, 'misses': get_llm_cache().misses},
+        },
+        'generated_at': datetime.now().isoformat(),
+    }
+
+
+if __name__ == "__main__":
+    import json
+
+    logging.basicConfig(level=logging.INFO)
+    result = run_prewarm_cycle()
+    print(json.dumps(result, ensure_ascii=False, indent=2))
@@ -0,0 +1,273 @@
+"""
+실시간 시세 팬아웃 (WebSocket 구독자 공용 폴러)
+
+클라이언트마다 /v1/stocks/{symbol}을 다시 부르면 구독자 수만큼 Yahoo를 호출합니다.
+- 프로세스에 폴러 하나: 모든 구독자가 구독한 종목 합집합을 BATCH_SIZE개씩 묶어 다종목 quotes 요청
+- 직전 스냅샷과 비교해서 바뀐 필드만 해당 종목 구독자에게 전달
+- 느린 구독자는 보내지 못한 변경을 종목별로 합쳐 두었다가 한 번에 전송 (대기열이 구독 종목 수 이상 커지지 않음)
+
+사용 예:
+    hub = get_quote_hub()
+    subscriber = QuoteSubscriber()
+    hub.subscribe(subscriber, ['AAPL', 'NVDA'])
+    while True:
+        changes = await subscriber.next_batch()   # {symbol: {field: value}}
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Protocol, Set
+
+import resilience
+from instrumentation import span
+
+logger = logging.getLogger(__name__)
+
+# 폴링 간격 (초)
+POLL_INTERVAL = float(os.getenv('QUOTE_POLL_SECONDS', '5'))
+
+# 새 종목 구독으로 앞당겨 폴링할 때도 지킬 최소 간격 (초)
+MIN_POLL_GAP = float(os.getenv('QUOTE_MIN_POLL_GAP_SECONDS', '1'))
+
+# 다종목 quotes 요청 1번에 넣을 종목 수
+BATCH_SIZE = 100
+
+# 구독자에게 보내는 필드 (Yahoo quote 키 → 응답 키, get_trending_stocks.format_stock_data와 같은 이름)
+QUOTE_FIELDS = {
+    'shortName': 'name',
+    'regularMarketPrice': 'price',
+    'regularMarketChange': 'change',
+    'regularMarketChangePercent': 'change_percent',
+    'regularMarketVolume': 'volume',
+    'marketCap': 'market_cap',
+}
+
+
+class QuoteSource(Protocol):
+    """시세 조회 (블로킹, 스레드에서 호출됨)"""
+
+    def fetch(self, symbols: List[str]) -> Dict[str, Dict]:
+        """{symbol: {응답 키: 값}} (찾지 못한 종목은 빠짐)"""
+
+
+class YahooQuoteSource:
+    """yahooquery 다종목 quotes 요청"""
+
+    def fetch(self, symbols: List[str]) -> Dict[str, Dict]:
+        from yahooquery import Ticker
+
+        ticker = Ticker(symbols)
+        with span('yahoo.ticker.quotes_batch'):
+            quotes = resilience.call('yahoo', lambda: ticker.quotes, hedge=True)
+        if not isinstance(quotes, dict):
+            return {}
+        return {
+            symbol: {key: quote.get(field) for field, key in QUOTE_FIELDS.items()}
+            for symbol, quote in quotes.items()
+            if isinstance(quote, dict)
+        }
+
+
+def diff_quote(previous: Optional[Dict], current: Dict) -> Dict:
+    """바뀐 필드만 (이전 스냅샷이 없으면 전체)"""
+    if not previous:
+        return dict(current)
+    return {key: value for key, value in current.items() if previous.get(key) != value}
+
+
+# ============================================================================
+# 구독자
+# ============================================================================
+
+class QuoteSubscriber:
+    """
+    구독자 1명 (WebSocket 연결 1개)
+
+    폴러는 push()로 변경을 넣기만 하고 기다리지 않습니다.
+    보내는 쪽이 next_batch()를 늦게 부르면 그동안의 변경이 종목별로 합쳐집니다.
+    """
+
+    def __init__(self):
+        self.symbols: Set[str] = set()
+        self._pending: Dict[str, Dict] = {}
+        self._ready = asyncio.Event()
+        # 전송 전에 덮어쓴 변경 수 (느린 구독자 지표)
+        self.coalesced = 0
+
+    def push(self, symbol: str, changes: Dict) -> None:
+        """변경 추가 (아직 보내지 않은 같은 종목 변경이 있으면 합침)"""
+        pending = self._pending.get(symbol)
+        if pending is None:
+            self._pending[symbol] = dict(changes)
+        else:
+            pending.update(changes)
+            self.coalesced += 1
+        self._ready.set()
+
+    async def next_batch(self) -> Dict[str, Dict]:
+        """보낼 변경이 생길 때까지 기다렸다가 모아 둔 변경 전체를 꺼냄"""
+        await self._ready.wait()
+        self._ready.clear()
+        batch, self._pending = self._pending, {}
+        return batch
+
+
+# ============================================================================
+# 허브 (공용 폴러)
+# ============================================================================
+
+class QuoteHub:
+    """종목별 구독자 관리 + 폴러 1개"""
+
+    def __init__(
+        self,
+        source: Optional[QuoteSource] = None,
+        interval: float = POLL_INTERVAL,
+        min_gap: float = MIN_POLL_GAP,
+        batch_size: int = BATCH_SIZE
+    ):
+        self.source = source or YahooQuoteSource()
+        self.interval = interval
+        self.min_gap = min_gap
+        self.batch_size = batch_size
+        self._subscribers: Dict[str, Set[QuoteSubscriber]] = {}
+        self._snapshots: Dict[str, Dict] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self.stats = {'polls': 0, 'upstream_requests': 0, 'failures': 0, 'published': 0}
+
+    @property
+    def symbols(self) -> List[str]:
+        """구독 중인 종목 (합집합)"""
+        return sorted(self._subscribers)
+
+    def subscribe(self, subscriber: QuoteSubscriber, symbols: Iterable[str]) -> None:
+        """
+        종목 구독 (이미 스냅샷이 있는 종목은 전체 값을 바로 전달)
+
+        이벤트 루프 안에서 호출해야 합니다 (폴러가 없으면 시작).
+        """
+        new_symbol = False
+        for symbol in symbols:
+            if symbol in subscriber.symbols:
+                continue
+            subscriber.symbols.add(symbol)
+            self._subscribers.setdefault(symbol, set()).add(subscriber)
+            snapshot = self._snapshots.get(symbol)
+            if snapshot is not None:
+                subscriber.push(symbol, snapshot)
+            else:
+                new_symbol = True
+
+        self._ensure_poller()
+        if new_symbol:
+            self._wake.set()
+
+    def unsubscribe(self, subscriber: QuoteSubscriber, symbols: Optional[Iterable[str]] = None) -> None:
+        """종목 구독 해제 (symbols가 None이면 전체, 구독자가 없는 종목은 폴링 대상에서 빠짐)"""
+        for symbol in list(subscriber.symbols if symbols is None else symbols):
+            subscriber.symbols.discard(symbol)
+            subscribers = self._subscribers.get(symbol)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._subscribers[symbol]
+                self._snapshots.pop(symbol, None)
+
+    async def poll_once(self) -> int:
+        """
+        구독 종목 전체를 한 번 조회해서 바뀐 필드를 구독자에게 전달
+
+        Returns:
+            바뀐 종목 수
+        """
+        symbols = self.symbols
+        if not symbols:
+            return 0
+        batches = [symbols[i:i + self.batch_size] for i in range(0, len(symbols), self.batch_size)]
+        self.stats['polls'] += 1
+        self.stats['upstream_requests'] += len(batches)
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.source.fetch, batch) for batch in batches),
+            return_exceptions=True
+        )
+
+        changed = 0
+        for batch, result in zip(batches, results):
+            if isinstance(result, BaseException):
+                self.stats['failures'] += 1
+                logger.warning(f"시세 조회 실패 ({len(batch)}개 종목): {str(result)}")
+                continue
+            for symbol, quote in result.items():
+                subscribers = self._subscribers.get(symbol)
+                if not subscribers:
+                    # 조회 중에 구독이 모두 해제됨
+                    continue
+                changes = diff_quote(self._snapshots.get(symbol), quote)
+                if not changes:
+                    continue
+                self._snapshots[symbol] = quote
+                changed += 1
+                for subscriber in subscribers:
+                    subscriber.push(symbol, changes)
+                self.stats['published'] += len(subscribers)
+        return changed
+
+    async def close(self) -> None:
+        """폴러 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _ensure_poller(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        # 이벤트는 처음 기다린 루프에 묶이므로 폴러를 새로 띄울 때마다 다시 만듦
+        self._wake = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        logger.info("시세 폴러 시작")
+        while self._subscribers:
+            started = time.monotonic()
+            self._wake.clear()
+            try:
+                await self.poll_once()
+            except Exception as e:
+                self.stats['failures'] += 1
+                logger.warning(f"시세 폴링 실패: {str(e)}")
+
+            # 다음 간격까지 기다리되, 새 종목이 구독되면 최소 간격만 지키고 앞당김
+            remaining = self.interval - (time.monotonic() - started)
+            if remaining > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    pass
+            gap = self.min_gap - (time.monotonic() - started)
+            if gap > 0:
+                await asyncio.sleep(gap)
+        logger.info("시세 폴러 중지 (구독자 없음)")
+
+
+_default_hub: Optional[QuoteHub] = None
+
+
+def get_quote_hub() -> QuoteHub:
+    """기본 시세 허브 반환"""
+    global _default_hub
+    if _default_hub is None:
+        _default_hub = QuoteHub()
+    return _default_hub
+
+
+async def close_quote_hub() -> None:
+    """기본 시세 허브의 폴러 중지 (서버 종료 시)"""
+    if _default_hub is not None:
+        await _default_hub.close()
@@ -0,0 +1,351 @@
+"""
+외부 서비스 호출 보호 계층 (Yahoo / Exa / Gemini)
+
+- 서비스별 서킷 브레이커: 연속 실패가 쌓이면 일정 시간 호출하지 않고 바로 실패 (기존 대체 문구로 빠르게 전환)
+- 적응형 타임아웃: 최근 응답 시간 백분위수 기반 (고정 30초 대신)
+- 헤지 요청: 멱등 조회가 p95보다 늦으면 같은 요청을 한 번 더 보내고 먼저 온 응답 사용
+- 벌크헤드: 서비스별 전용 실행 풀 (느린 서비스가 다른 서비스의 스레드를 차지하지 않음)
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# 브레이커 상태
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+# 적응형 타임아웃 계산에 필요한 최소 표본 수
+MIN_SAMPLES = 20
+LATENCY_WINDOW = 200
+
+# 헤지 요청을 허용할 서비스 (기본값: 무료 조회인 Yahoo만)
+HEDGE_PROVIDERS = {
+    name.strip() for name in os.getenv('HEDGE_PROVIDERS', 'yahoo').split(',') if name.strip()
+}
+
+
+class CircuitOpenError(Exception):
+    """브레이커가 열려 있어 호출하지 않음"""
+
+    def __init__(self, provider: str, retry_in: float):
+        super().__init__(f"{provider} 서킷 브레이커 열림 ({retry_in:.0f}초 후 재시도)")
+        self.provider = provider
+        self.retry_in = retry_in
+
+
+class UpstreamTimeoutError(TimeoutError):
+    """적응형 타임아웃 초과"""
+
+
+@dataclass
+class ProviderPolicy:
+    """서비스별 보호 정책"""
+    # 연속 실패 몇 번에 열지
+    failure_threshold: int = 5
+    # 처음 열린 뒤 반열림까지 대기 (초), 반열림 실패 시 두 배씩 증가
+    reset_timeout: float = 30.0
+    max_reset_timeout: float = 300.0
+    # 적응형 타임아웃 = clamp(p99 * multiplier, min, max)
+    min_timeout: float = 2.0
+    max_timeout: float = 30.0
+    default_timeout: float = 15.0
+    timeout_multiplier: float = 2.0
+    # 헤지 요청 지연 하한 (초)
+    min_hedge_delay: float = 0.2
+    # 벌크헤드: 이 서비스 전용 실행 풀 크기 (동시 호출 상한)
+    max_concurrency: int = 8
+
+
+DEFAULT_POLICIES = {
+    'yahoo': ProviderPolicy(min_timeout=2.0, max_timeout=20.0, default_timeout=10.0, max_concurrency=16),
+    'exa': ProviderPolicy(min_timeout=3.0, max_timeout=30.0, default_timeout=15.0, max_concurrency=8),
+    'gemini': ProviderPolicy(min_timeout=5.0, max_timeout=60.0, default_timeout=30.0, max_concurrency=4),
+}
+
+
+class LatencyTracker:
+    """최근 성공 응답 시간 (초) 백분위수"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < MIN_SAMPLES:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class CircuitBreaker:
+    """연속 실패 기반 서킷 브레이커 (closed → open → half_open → closed)"""
+
+    def __init__(self, provider: str, policy: ProviderPolicy):
+        self.provider = provider
+        self.policy = policy
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.open_timeout = policy.reset_timeout
+        self.total_failures = 0
+        self.total_rejected = 0
+        self.last_error: Optional[str] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> None:
+        """호출 허용 여부 확인 (열려 있으면 CircuitOpenError)"""
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return
+            elapsed = time.monotonic() - self.opened_at
+            if self.state == STATE_OPEN and elapsed >= self.open_timeout:
+                self.state = STATE_HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == STATE_HALF_OPEN and not self._trial_in_flight:
+                # 반열림 상태에서는 시험 호출 1건만 통과
+                self._trial_in_flight = True
+                return
+            self.total_rejected += 1
+            raise CircuitOpenError(self.provider, max(0.0, self.open_timeout - elapsed))
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != STATE_CLOSED:
+                logger.info(f"{self.provider} 서킷 브레이커 닫힘 (복구 확인)")
+            self.state = STATE_CLOSED
+            self.consecutive_failures = 0
+            self.open_timeout = self.policy.reset_timeout
+            self._trial_in_flight = False
+
+    def record_failure(self, error: BaseException) -> None:
+        with self._lock:
+            self.total_failures += 1
+            self.consecutive_failures += 1
+            self.last_error = f"{type(error).__name__}: {error}"[:200]
+            if self.state == STATE_HALF_OPEN:
+                # 시험 호출 실패: 대기 시간을 늘려 다시 열기
+                self.open_timeout = min(self.open_timeout * 2, self.policy.max_reset_timeout)
+                self._open()
+            elif self.state == STATE_CLOSED and self.consecutive_failures >= self.policy.failure_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        self.state = STATE_OPEN
+        self.opened_at = time.monotonic()
+        self._trial_in_flight = False
+        logger.warning(
+            f"{self.provider} 서킷 브레이커 열림: 연속 실패 {self.consecutive_failures}회, "
+            f"{self.open_timeout:.0f}초 동안 호출 차단 ({self.last_error})"
+        )
+
+
+class Upstream:
+    """서비스 하나의 브레이커 + 응답 시간 추적 + 전용 실행 풀 (벌크헤드)"""
+
+    def __init__(self, provider: str, policy: Optional[ProviderPolicy] = None):
+        self.provider = provider
+        self.policy = policy or DEFAULT_POLICIES.get(provider, ProviderPolicy())
+        self.breaker = CircuitBreaker(provider, self.policy)
+        self.latency = LatencyTracker()
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        # 타임아웃/헤지용 실행 풀 (타임아웃된 호출은 풀에서 끝까지 실행된 뒤 버려짐)
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.policy.max_concurrency, thread_name_prefix=f"upstream-{provider}"
+        )
+        self.in_flight = 0
+        self._in_flight_lock = threading.Lock()
+
+    def submit(self, func: Callable[[], T]) -> Future:
+        """전용 풀에 호출 제출 (실행 중/대기 중인 호출 수 추적)"""
+        with self._in_flight_lock:
+            self.in_flight += 1
+        future = self.executor.submit(func)
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future: Future) -> None:
+        with self._in_flight_lock:
+            self.in_flight -= 1
+
+    def saturated(self) -> bool:
+        """풀의 스레드가 모두 사용 중인지 (이때는 헤지 요청을 보내지 않음)"""
+        return self.in_flight >= self.policy.max_concurrency
+
+    def timeout(self) -> float:
+        """현재 적응형 타임아웃 (초)"""
+        p99 = self.latency.percentile(0.99)
+        if p99 is None:
+            return self.policy.default_timeout
+        return min(self.policy.max_timeout, max(self.policy.min_timeout, p99 * self.policy.timeout_multiplier))
+
+    def hedge_delay(self) -> Optional[float]:
+        """헤지 요청을 보낼 시점 (p95, 표본이 부족하면 None)"""
+        p95 = self.latency.percentile(0.95)
+        return None if p95 is None else max(self.policy.min_hedge_delay, p95)
+
+    def status(self) -> Dict:
+        breaker = self.breaker
+        p50 = self.latency.percentile(0.50)
+        p95 = self.latency.percentile(0.95)
+        return {
+            'state': breaker.state,
+            'consecutive_failures': breaker.consecutive_failures,
+            'total_failures': breaker.total_failures,
+            'total_rejected': breaker.total_rejected,
+            'retry_in_sec': (
+                round(max(0.0, breaker.open_timeout - (time.monotonic() - breaker.opened_at)), 1)
+                if breaker.state == STATE_OPEN else 0
+            ),
+            'last_error': breaker.last_error,
+            'timeout_sec': round(self.timeout(), 2),
+            'latency_p50_ms': round(p50 * 1000, 1) if p50 is not None else None,
+            'latency_p95_ms': round(p95 * 1000, 1) if p95 is not None else None,
+            'samples': len(self.latency),
+            'hedging': self.provider in HEDGE_PROVIDERS,
+            'hedges_sent': self.hedges_sent,
+            'hedges_won': self.hedges_won,
+            'in_flight': self.in_flight,
+            'max_concurrency': self.policy.max_concurrency,
+        }
+
+
+# ============================================================================
+# 호출
+# ============================================================================
+
+_upstreams: Dict[str, Upstream] = {}
+_upstreams_lock = threading.Lock()
+
+
+def get_upstream(provider: str) -> Upstream:
+    upstream = _upstreams.get(provider)
+    if upstream is None:
+        with _upstreams_lock:
+            upstream = _upstreams.setdefault(provider, Upstream(provider))
+    return upstream
+
+
+def get_timeout(provider: str) -> float:
+    """provider의 현재 적응형 타임아웃 (초) - 클라이언트 자체 timeout 인자에 사용"""
+    return get_upstream(provider).timeout()
+
+
+def _counts_as_failure(error: BaseException) -> bool:
+    """요청 자체가 잘못된 4xx(키 오류 등)는 서비스 장애로 보지 않음 (408/429 제외)"""
+    status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+    if isinstance(status_code, int) and 400 <= status_code < 500 and status_code not in (408, 429):
+        return False
+    return not isinstance(error, ValueError)
+
+
+def call(
+    provider: str,
+    func: Callable[[], T],
+    hedge: bool = False,
+    timeout: Optional[float] = None
+) -> T:
+    """
+    보호 계층을 거쳐 외부 호출 실행
+
+    Args:
+        provider: 서비스 이름 ('yahoo', 'exa', 'gemini')
+        func: 인자 없는 호출 함수
+        hedge: 멱등 조회이면 True (HEDGE_PROVIDERS에 포함된 서비스만 실제로 헤지)
+        timeout: 타임아웃 (초, 기본값: 적응형)
+
+    Returns:
+        func의 반환값
+
+    Raises:
+        CircuitOpenError: 브레이커가 열려 있음 (호출하지 않음)
+        UpstreamTimeoutError: 타임아웃 초과
+        func가 던진 예외
+    """
+    upstream = get_upstream(provider)
+    upstream.breaker.allow()
+
+    timeout = timeout or upstream.timeout()
+    started = time.monotonic()
+    futures = [upstream.submit(func)]
+
+    try:
+        hedge_delay = upstream.hedge_delay() if hedge and provider in HEDGE_PROVIDERS else None
+        if hedge_delay is not None and hedge_delay < timeout:
+            done, _ = wait(futures, timeout=hedge_delay)
+            # 풀이 가득 찼으면 헤지 요청이 대기열만 늘리므로 보내지 않음
+            if not done and not upstream.saturated():
+                upstream.hedges_sent += 1
+                futures.append(upstream.submit(func))
+
+        done, _ = wait(futures, timeout=max(0.0, timeout - (time.monotonic() - started)), return_when=FIRST_COMPLETED)
+        if not done:
+            raise UpstreamTimeoutError(f"{provider} 응답 시간 초과 ({timeout:.1f}초)")
+
+        # 먼저 끝난 응답 중 성공한 것 우선
+        winner = next((future for future in done if future.exception() is None), None)
+        if winner is None:
+            # 헤지 중 하나가 실패했으면 나머지를 남은 시간만큼 기다림
+            pending = [future for future in futures if future not in done]
+            if pending:
+                more, _ = wait(pending, timeout=max(0.0, timeout - (time.monotonic() - started)))
+                winner = next((future for future in more if future.exception() is None), None)
+        if winner is None:
+            raise next(iter(done)).exception()
+
+        if len(futures) > 1 and winner is futures[1]:
+            upstream.hedges_won += 1
+        result = winner.result()
+
+    except CircuitOpenError:
+        raise
+    except BaseException as e:
+        if _counts_as_failure(e):
+            upstream.breaker.record_failure(e)
+        else:
+            upstream.breaker.record_success()
+        raise
+    finally:
+        for future in futures:
+            future.cancel()
+
+    upstream.latency.record(time.monotonic() - started)
+    upstream.breaker.record_success()
+    return result
+
+
+def get_breaker_states() -> Dict[str, Dict]:
+    """서비스별 브레이커/타임아웃 상태 (/health 용)"""
+    return {provider: get_upstream(provider).status() for provider in sorted({*DEFAULT_POLICIES, *_upstreams})}
+
+
+def reset(provider: Optional[str] = None) -> None:
+    """브레이커와 응답 시간 기록 초기화 (테스트/수동 복구용)"""
+    with _upstreams_lock:
+        if provider is None:
+            removed = list(_upstreams.values())
+            _upstreams.clear()
+        else:
+            removed = [upstream for upstream in [_upstreams.pop(provider, None)] if upstream]
+    # 실행 중인 호출은 끝까지 실행되고 풀 스레드는 그 뒤 정리됨
+    for upstream in removed:
+        upstream.executor.shutdown(wait=False)
@@ -61,13 +61,30 @@ def run_briefing_job():
         raise
 
 
-def start_scheduler(hour: int = 7, minute: int = 0):
+def run_briefing_job_exclusive():
+    """
+    여러 프로세스/레플리카 중 하나만 브리핑 작업을 실행합니다.
+    잠금을 얻지 못한 프로세스는 실행 중인 프로세스의 결과를 기다렸다가 반환합니다.
+    """
+    from job_lock import run_exclusive
+    
+    return run_exclusive(
+        'daily_briefing',
+        run_briefing_job,
+        lease_seconds=300,
+        wait_timeout=30 * 60,
+        poll_interval=15
+    )
+
+
+def start_scheduler(hour: int = 7, minute: int = 0, prewarm: bool = True):
     """
     스케줄러 시작
     
     Args:
         hour: 실행 시간 (기본값: 7)
         minute: 실행 분 (기본값: 0)
+        prewarm: 실행 전 캐시 사전 준비 작업 등록 여부 (기본값: True)
     """
     logger.info("=" * 80)
     logger.info("브리핑 스케줄러 시작")
@@ -82,13 +99,19 @@ def start_scheduler(hour: int = 7, minute: int = 0):
     
     # 매일 지정된 시간에 작업 등록
     scheduler.add_job(
-        func=run_briefing_job,
+        func=run_briefing_job_exclusive,
         trigger=CronTrigger(hour=hour, minute=minute),
         id='daily_briefing_job',
         name='매일 아침 브리핑 생성',
         replace_existing=True
     )
     
+    # 장 마감 후 캐시 사전 준비 작업 등록
+    if prewarm:
+        from prewarm_scheduler import register_prewarm_jobs
+        register_prewarm_jobs(scheduler)
+        logger.info("캐시 사전 준비: 화~토 05:10~06:50, 20분 간격")
+    
     logger.info("스케줄러가 시작되었습니다. 종료하려면 Ctrl+C를 누르세요.")
     
     try:
@@ -130,12 +153,26 @@ if __name__ == "__main__":
         help='실행 분 (기본값: 0)'
     )
     
+    parser.add_argument(
+        '--no-prewarm',
+        action='store_true',
+        help='캐시 사전 준비 작업 비활성화'
+    )
+    parser.add_argument(
+        '--prewarm-now',
+        action='store_true',
+        help='캐시 사전 준비를 즉시 한 번 실행'
+    )
+    
     args = parser.parse_args()
     
-    if args.run_once:
+    if args.prewarm_now:
+        from prewarm_scheduler import run_prewarm_cycle
+        run_prewarm_cycle()
+    elif args.run_once:
         # 즉시 실행 모드
         run_once_now()
     else:
         # 스케줄러 모드
-        start_scheduler(hour=args.hour, minute=args.minute)
+        start_scheduler(hour=args.hour, minute=args.minute, prewarm=not args.no_prewarm)
 
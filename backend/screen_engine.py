@@ -0,0 +1,478 @@
+"""
+로컬 종목 스크리너 (조건식 → NumPy 마스크)
+
+Yahoo 스크리너 3종(most_actives, day_gainers, day_losers) 대신 공유 시장 스냅샷(shared_snapshot) 전체에
+사용자 조건식을 적용합니다. 외부 API를 호출하지 않고 수천 종목을 수 ms 안에 거릅니다.
+
+조건식은 파이썬 식 문법의 일부만 허용합니다 (ast로 파싱한 뒤 허용 목록 밖의 구문은 거부).
+- 필드: FIELDS (스냅샷 컬럼 + rel_volume 같은 파생 필드)
+- 숫자, True/False, 산술(+ - * /), 비교(< <= > >= == !=, 1e9 < market_cap < 1e11 같은 연쇄 비교)
+- and / or / not, abs()
+
+사용 예:
+    result = run_screen("rel_volume > 2 and change_percent > 5 and market_cap > 1e9", sort_by='change_percent')
+"""
+import ast
+import logging
+import math
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from shared_snapshot import COLUMNS, MAX_AGE, TEXT_COLUMNS, SnapshotUnavailable, SnapshotView, read_snapshot
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SCREENS_DB_PATH = Path(__file__).parent / 'output' / 'screens.db'
+
+# 조건식 길이 / 구문 노드 수 상한
+MAX_EXPRESSION_LENGTH = 500
+MAX_EXPRESSION_NODES = 200
+
+# 조건식 정수 상수 절댓값 상한 (SQLite INTEGER / int64)
+MAX_CONSTANT_INT = 2 ** 63 - 1
+
+# 결과 종목 수 상한
+MAX_LIMIT = 500
+
+SCREEN_NAME_PATTERN = re.compile(r'^[\w-]{1,64}$')
+
+
+class ScreenError(ValueError):
+    """조건식 오류 (position: 식 안의 위치, 0부터)"""
+
+    def __init__(self, message: str, position: Optional[int] = None):
+        super().__init__(message)
+        self.position = position
+
+
+# ============================================================================
+# 필드
+# ============================================================================
+
+def _relative_volume(columns: 'ScreenColumns') -> 'np.ndarray':
+    import numpy as np
+
+    volume = columns['volume'].astype('f8')
+    average = columns['avg_volume'].astype('f8')
+    # 평균 거래량이 없는 종목은 NaN (어떤 비교도 참이 아님)
+    return np.divide(volume, average, out=np.full(len(volume), np.nan), where=average > 0)
+
+
+def _dollar_volume(columns: 'ScreenColumns') -> 'np.ndarray':
+    return columns['price'] * columns['volume']
+
+
+# 파생 필드: 이름 → (설명, 계산 함수)
+DERIVED_FIELDS: Dict[str, Tuple[str, Callable[['ScreenColumns'], 'np.ndarray']]] = {
+    'rel_volume': ('상대 거래량 (거래량 / 3개월 평균 거래량)', _relative_volume),
+    'dollar_volume': ('거래대금 (가격 x 거래량, 달러)', _dollar_volume),
+}
+
+_COLUMN_DESCRIPTIONS = {
+    'price': '현재가 (달러)',
+    'change': '전일 대비 변동 (달러)',
+    'change_percent': '전일 대비 변동률 (%)',
+    'volume': '거래량',
+    'avg_volume': '3개월 평균 거래량',
+    'market_cap': '시가총액 (달러)',
+    'score': '화제성 점수 (화제 종목 API와 같은 계산)',
+}
+
+# 조건식/정렬에 쓸 수 있는 필드: 이름 → 설명
+FIELDS: Dict[str, str] = {
+    **{
+        name: _COLUMN_DESCRIPTIONS.get(name, f"Yahoo 스크리너 {name[len('rank_'):]} 순위 (없으면 0)")
+        for name, _ in COLUMNS if name not in TEXT_COLUMNS
+    },
+    **{name: description for name, (description, _) in DERIVED_FIELDS.items()},
+}
+
+
+class ScreenColumns:
+    """스냅샷 뷰 + 파생 필드 (한 번 평가하는 동안 계산 결과 재사용)"""
+
+    def __init__(self, view: SnapshotView):
+        self.view = view
+        self._derived: Dict[str, 'np.ndarray'] = {}
+
+    def __getitem__(self, name: str) -> 'np.ndarray':
+        if name in DERIVED_FIELDS:
+            if name not in self._derived:
+                self._derived[name] = DERIVED_FIELDS[name][1](self)
+            return self._derived[name]
+        return self.view[name]
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+
+# ============================================================================
+# 조건식 컴파일
+# ============================================================================
+
+_COMPARE_OPS = {
+    ast.Lt: 'less', ast.LtE: 'less_equal', ast.Gt: 'greater', ast.GtE: 'greater_equal',
+    ast.Eq: 'equal', ast.NotEq: 'not_equal',
+}
+_ARITHMETIC_OPS = {ast.Add: 'add', ast.Sub: 'subtract', ast.Mult: 'multiply', ast.Div: 'divide'}
+
+# 노드 종류: 'bool' (조건) / 'num' (숫자)
+_Node = Tuple[str, Callable[[ScreenColumns], object]]
+
+
+class CompiledScreen:
+    """컴파일된 조건식"""
+
+    def __init__(self, expression: str, fields: FrozenSet[str], evaluate: Callable[[ScreenColumns], object]):
+        self.expression = expression
+        self.fields = fields
+        self._evaluate = evaluate
+
+    def mask(self, columns: ScreenColumns) -> 'np.ndarray':
+        """조건을 만족하는 행 (bool 배열)"""
+        import numpy as np
+
+        result = self._evaluate(columns)
+        return np.broadcast_to(np.asarray(result, dtype=bool), (len(columns),))
+
+
+class _Compiler:
+    """ast 노드 → 배열 연산 클로저 (허용 목록 밖의 구문은 ScreenError)"""
+
+    def __init__(self, expression: str = ''):
+        import numpy as np
+
+        self.np = np
+        self.expression = expression
+        self.fields = set()
+        self.nodes = 0
+
+    def compile(self, node: ast.AST) -> _Node:
+        self.nodes += 1
+        if self.nodes > MAX_EXPRESSION_NODES:
+            raise ScreenError(f"조건식이 너무 복잡합니다 (구문 노드 최대 {MAX_EXPRESSION_NODES}개)")
+
+        handler = getattr(self, f'_{type(node).__name__}', None)
+        if handler is None:
+            raise ScreenError(f"지원하지 않는 구문: {type(node).__name__}", getattr(node, 'col_offset', None))
+        return handler(node)
+
+    def _expect(self, node: ast.AST, kind: str) -> Callable:
+        actual, func = self.compile(node)
+        if actual != kind:
+            expected = '조건(비교식)' if kind == 'bool' else '숫자'
+            raise ScreenError(f"{expected}이 와야 하는 자리입니다: {ast.unparse(node)}", node.col_offset)
+        return func
+
+    def _Constant(self, node: ast.Constant) -> _Node:
+        value = node.value
+        if isinstance(value, bool):
+            return 'bool', lambda columns: value
+        if isinstance(value, (int, float)):
+            # 1e400(inf), 30자리 정수처럼 SQLite/NumPy 정수·실수 범위를 넘는 값은 거부
+            if (isinstance(value, int) and abs(value) > MAX_CONSTANT_INT) or \
+                    (isinstance(value, float) and not math.isfinite(value)):
+                literal = ast.get_source_segment(self.expression, node) or ast.unparse(node)
+                raise ScreenError(f"숫자가 허용 범위를 벗어났습니다: {literal}", node.col_offset)
+            return 'num', lambda columns: value
+        raise ScreenError(f"숫자만 사용할 수 있습니다: {value!r}", node.col_offset)
+
+    def _Name(self, node: ast.Name) -> _Node:
+        name = node.id
+        if name not in FIELDS:
+            raise ScreenError(f"알 수 없는 필드: {name}", node.col_offset)
+        self.fields.add(name)
+        return 'num', lambda columns: columns[name]
+
+    def _BoolOp(self, node: ast.BoolOp) -> _Node:
+        parts = [self._expect(value, 'bool') for value in node.values]
+        reduce = (self.np.logical_and if isinstance(node.op, ast.And) else self.np.logical_or).reduce
+        return 'bool', lambda columns: reduce([part(columns) for part in parts])
+
+    def _UnaryOp(self, node: ast.UnaryOp) -> _Node:
+        if isinstance(node.op, ast.Not):
+            operand = self._expect(node.operand, 'bool')
+            logical_not = self.np.logical_not
+            return 'bool', lambda columns: logical_not(operand(columns))
+        if isinstance(node.op, (ast.USub, ast.UAdd)):
+            operand = self._expect(node.operand, 'num')
+            if isinstance(node.op, ast.UAdd):
+                return 'num', operand
+            return 'num', lambda columns: -operand(columns)
+        raise ScreenError(f"지원하지 않는 연산자: {type(node.op).__name__}", node.col_offset)
+
+    def _BinOp(self, node: ast.BinOp) -> _Node:
+        op = _ARITHMETIC_OPS.get(type(node.op))
+        if op is None:
+            raise ScreenError(f"지원하지 않는 연산자: {type(node.op).__name__}", node.col_offset)
+        left, right = self._expect(node.left, 'num'), self._expect(node.right, 'num')
+        ufunc = getattr(self.np, op)
+        np = self.np
+
+        def evaluate(columns):
+            # 0으로 나누기는 inf/NaN으로 두고 경고 없이 진행
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return ufunc(left(columns), right(columns))
+        return 'num', evaluate
+
+    def _Compare(self, node: ast.Compare) -> _Node:
+        operands = [self._expect(node.left, 'num')] + [self._expect(value, 'num') for value in node.comparators]
+        comparisons = []
+        for index, op in enumerate(node.ops):
+            name = _COMPARE_OPS.get(type(op))
+            if name is None:
+                raise ScreenError(f"지원하지 않는 비교: {type(op).__name__}", node.col_offset)
+            comparisons.append((getattr(self.np, name), operands[index], operands[index + 1]))
+
+        if len(comparisons) == 1:
+            ufunc, left, right = comparisons[0]
+            return 'bool', lambda columns: ufunc(left(columns), right(columns))
+        logical_and = self.np.logical_and.reduce
+        return 'bool', lambda columns: logical_and([
+            ufunc(left(columns), right(columns)) for ufunc, left, right in comparisons
+        ])
+
+    def _Call(self, node: ast.Call) -> _Node:
+        if not (isinstance(node.func, ast.Name) and node.func.id == 'abs') or len(node.args) != 1 or node.keywords:
+            raise ScreenError("함수는 abs(필드)만 사용할 수 있습니다", node.col_offset)
+        operand = self._expect(node.args[0], 'num')
+        absolute = self.np.abs
+        return 'num', lambda columns: absolute(operand(columns))
+
+
+@lru_cache(maxsize=256)
+def compile_screen(expression: str) -> CompiledScreen:
+    """
+    조건식 컴파일 (같은 식은 캐시에서 재사용)
+
+    Args:
+        expression: 조건식 (예: "rel_volume > 2 and change_percent > 5")
+
+    Returns:
+        CompiledScreen
+
+    Raises:
+        ScreenError: 문법 오류, 알 수 없는 필드, 허용하지 않는 구문, 범위를 벗어난 숫자, 조건이 아닌 식
+    """
+    expression = (expression or '').strip()
+    if not expression:
+        raise ScreenError("조건식이 비어 있습니다")
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise ScreenError(f"조건식은 최대 {MAX_EXPRESSION_LENGTH}자까지 허용됩니다")
+
+    try:
+        tree = ast.parse(expression, mode='eval')
+    except SyntaxError as e:
+        raise ScreenError(f"문법 오류: {e.msg}", (e.offset or 1) - 1)
+
+    compiler = _Compiler(expression)
+    kind, evaluate = compiler.compile(tree.body)
+    if kind != 'bool':
+        raise ScreenError("조건식은 비교 결과여야 합니다 (예: volume > 1000000)", 0)
+    return CompiledScreen(expression, frozenset(compiler.fields), evaluate)
+
+
+# ============================================================================
+# 실행
+# ============================================================================
+
+def evaluate_screen(
+    compiled: CompiledScreen,
+    view: SnapshotView,
+    sort_by: str = 'score',
+    descending: bool = True,
+    limit: int = 50
+) -> Dict:
+    """
+    스냅샷 뷰 하나에 조건식 적용 (SnapshotView.read 안에서 호출)
+
+    Returns:
+        matched(조건을 만족한 종목 수), universe(전체 종목 수), results(정렬 후 limit개, 파생 필드 포함)
+    """
+    import numpy as np
+
+    columns = ScreenColumns(view)
+    matched = np.flatnonzero(compiled.mask(columns))
+
+    key = np.asarray(columns[sort_by][matched], dtype='f8')
+    # NaN은 방향과 관계없이 마지막
+    key = np.where(np.isnan(key), np.inf, -key if descending else key)
+    top = matched[np.argsort(key, kind='stable')[:limit]]
+
+    results = view.records(top)
+    for name in DERIVED_FIELDS:
+        for record, value in zip(results, columns[name][top].tolist()):
+            record[name] = None if value != value else round(value, 4)
+
+    return {
+        'matched': int(len(matched)),
+        'universe': len(view),
+        'results': results,
+        'snapshot_version': view.version,
+        'snapshot_updated_at': datetime.fromtimestamp(view.updated_at).isoformat(),
+    }
+
+
+def run_screen(
+    expression: str,
+    sort_by: str = 'score',
+    order: str = 'desc',
+    limit: int = 50,
+    max_age: float = MAX_AGE
+) -> Dict:
+    """
+    공유 시장 스냅샷에 조건식 적용
+
+    Args:
+        expression: 조건식
+        sort_by: 정렬 필드 (FIELDS)
+        order: 정렬 순서 (asc, desc)
+        limit: 최대 결과 수
+        max_age: 허용할 스냅샷 나이 (초)
+
+    Returns:
+        스크린 결과 (expression, matched, universe, results, snapshot_version, snapshot_updated_at, took_ms)
+
+    Raises:
+        ScreenError: 조건식 또는 정렬 필드 오류
+        SnapshotUnavailable: 스냅샷이 없거나 max_age보다 오래됨
+    """
+    started = time.perf_counter()
+    compiled = compile_screen(expression)
+    if sort_by not in FIELDS:
+        raise ScreenError(f"알 수 없는 정렬 필드: {sort_by}")
+    limit = max(1, min(limit, MAX_LIMIT))
+
+    result = read_snapshot(
+        lambda view: evaluate_screen(compiled, view, sort_by, order != 'asc', limit),
+        max_age=max_age
+    )
+    if result is None:
+        raise SnapshotUnavailable("시장 스냅샷이 없거나 오래되었습니다 (ENABLE_MARKET_SNAPSHOT=true 또는 shared_snapshot.py 갱신 프로세스 필요)")
+
+    return {
+        'expression': compiled.expression,
+        'sort_by': sort_by,
+        'order': order,
+        **result,
+        'count': len(result['results']),
+        'took_ms': round((time.perf_counter() - started) * 1000, 3),
+    }
+
+
+# ============================================================================
+# 저장된 스크린
+# ============================================================================
+
+class ScreenStore:
+    """이름 붙인 조건식 저장소 (output/screens.db)"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (기본값: output/screens.db)
+        """
+        self.db_path = Path(db_path) if db_path else SCREENS_DB_PATH
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 반환"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS screens (
+                    name        TEXT PRIMARY KEY,
+                    expression  TEXT NOT NULL,
+                    description TEXT NOT NULL DEFAULT '',
+                    sort_by     TEXT NOT NULL DEFAULT 'score',
+                    sort_order  TEXT NOT NULL DEFAULT 'desc',
+                    created_at  TEXT NOT NULL,
+                    updated_at  TEXT NOT NULL
+                )
+            """)
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict:
+        return {
+            'name': row['name'],
+            'expression': row['expression'],
+            'description': row['description'],
+            'sort_by': row['sort_by'],
+            'order': row['sort_order'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at'],
+        }
+
+    def save(self, name: str, expression: str, description: str = '', sort_by: str = 'score', order: str = 'desc') -> Dict:
+        """
+        스크린 저장 (같은 이름이 있으면 덮어씀)
+
+        Raises:
+            ScreenError: 이름 형식, 조건식, 정렬 필드 오류
+        """
+        if not SCREEN_NAME_PATTERN.match(name or ''):
+            raise ScreenError("스크린 이름은 문자, 숫자, _, - 로 64자까지 허용됩니다")
+        compiled = compile_screen(expression)
+        if sort_by not in FIELDS:
+            raise ScreenError(f"알 수 없는 정렬 필드: {sort_by}")
+
+        now = datetime.now().isoformat()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO screens (name, expression, description, sort_by, sort_order, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    expression = excluded.expression, description = excluded.description,
+                    sort_by = excluded.sort_by, sort_order = excluded.sort_order, updated_at = excluded.updated_at
+                """,
+                (name, compiled.expression, description, sort_by, order, now, now)
+            )
+        return self.get(name)
+
+    def get(self, name: str) -> Optional[Dict]:
+        """스크린 조회"""
+        row = self._connect().execute('SELECT * FROM screens WHERE name = ?', (name,)).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def list(self) -> List[Dict]:
+        """전체 스크린 (이름 순)"""
+        rows = self._connect().execute('SELECT * FROM screens ORDER BY name').fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def delete(self, name: str) -> bool:
+        """스크린 삭제"""
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute('DELETE FROM screens WHERE name = ?', (name,))
+        return cursor.rowcount > 0
+
+
+_default_store: Optional[ScreenStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_screen_store() -> ScreenStore:
+    """기본 스크린 저장소 반환"""
+    global _default_store
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = ScreenStore()
+    return _default_store
@@ -0,0 +1,429 @@
+"""
+브리핑/뉴스 전문 검색 인덱스
+
+SQLite FTS5 역색인 위에 한국어 bigram 토큰화를 적용하여
+브리핑 섹션, 요약, 화제 원인 분석과 Exa 뉴스 제목/요약을 BM25로 검색합니다.
+- 한글 연속 구간은 2글자 단위(bigram)와 구간 마지막 1글자로, 영문/숫자는 단어 단위로 색인
+  (한 글자 검색어는 접두어 검색 '삼*'으로 해당 글자로 시작하는 bigram과 구간 끝 글자를 모두 찾음)
+- save_briefing_data / JSON 가져오기 시 해당 브리핑 문서만 증분 갱신, 브리핑 삭제 시 함께 제거
+- 인덱스가 비어 있으면 첫 검색 때 브리핑 저장소로 한 번 전체 색인
+"""
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from instrumentation import timed
+from text_tokens import TOKEN_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 경로 설정
+INDEX_PATH = Path(__file__).parent / 'output' / 'search_index.db'
+
+DOC_TYPE_BRIEFING = 'briefing'
+DOC_TYPE_NEWS = 'news'
+
+# BM25 컬럼 가중치 (title, body)
+_BM25_WEIGHTS = (2.0, 1.0)
+
+
+def _index_tokens(text: Optional[str]) -> List[str]:
+    """
+    색인용 토큰화 (text_tokens.tokenize + 2글자 이상 한글 구간의 마지막 글자)
+
+    마지막 글자로 시작하는 bigram이 없으므로 한 글자 접두어 검색('아*')이
+    구간 끝 글자('엔비디아'의 '아')도 찾을 수 있도록 따로 넣습니다.
+    """
+    if not text:
+        return []
+
+    tokens = []
+    for hangul, word in TOKEN_PATTERN.findall(text):
+        if hangul:
+            tokens.extend(hangul[i:i + 2] for i in range(len(hangul) - 1))
+            tokens.append(hangul[-1])
+        else:
+            tokens.append(word.lower())
+    return tokens
+
+
+def _query_phrase(word: str) -> Optional[str]:
+    """
+    검색어 단어 1개를 FTS5 구문으로 변환
+
+    색인과 같은 위치에 토큰이 오도록 한글 구간 끝 글자는 뒤에 다른 토큰이 이어질 때만 넣고,
+    단어가 한 글자 한글 구간으로 끝나면 마지막 토큰을 접두어로 검색합니다 ('삼' → "삼" *).
+    """
+    runs = TOKEN_PATTERN.findall(word)
+    tokens = []
+    prefix = False
+    for position, (hangul, other) in enumerate(runs):
+        last = position == len(runs) - 1
+        if not hangul:
+            tokens.append(other.lower())
+        elif len(hangul) == 1:
+            tokens.append(hangul)
+            prefix = last
+        else:
+            tokens.extend(hangul[i:i + 2] for i in range(len(hangul) - 1))
+            if not last:
+                tokens.append(hangul[-1])
+    if not tokens:
+        return None
+    phrase = '"' + ' '.join(tokens) + '"'
+    return f"{phrase} *" if prefix else phrase
+
+
+def build_match_query(query: str) -> str:
+    """
+    사용자 검색어를 FTS5 MATCH 식으로 변환합니다.
+    단어마다 토큰 구문(phrase)을 만들고 모든 단어를 AND로 연결합니다.
+
+    Example:
+        >>> build_match_query("엔비디아 칩")
+        '"엔비 비디 디아" AND "칩" *'
+    """
+    phrases = [phrase for phrase in map(_query_phrase, query.split()) if phrase]
+    return ' AND '.join(phrases)
+
+
+class SearchIndex:
+    """브리핑/뉴스 역색인"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Args:
+            db_path: 인덱스 SQLite 파일 경로 (기본값: output/search_index.db)
+        """
+        self.db_path = Path(db_path) if db_path else INDEX_PATH
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._backfilled = False
+
+    # ========================================================================
+    # 연결 관리
+    # ========================================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 반환 (최초 연결 시 스키마 생성)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS search_docs (
+                    doc_id       INTEGER PRIMARY KEY,
+                    doc_key      TEXT NOT NULL UNIQUE,
+                    doc_type     TEXT NOT NULL,
+                    briefing_id  TEXT,
+                    symbol       TEXT NOT NULL DEFAULT '',
+                    published_at TEXT NOT NULL DEFAULT '',
+                    title        TEXT NOT NULL DEFAULT '',
+                    snippet      TEXT NOT NULL DEFAULT '',
+                    url          TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_search_docs_briefing
+                    ON search_docs (briefing_id);
+                CREATE INDEX IF NOT EXISTS idx_search_docs_symbol_published
+                    ON search_docs (symbol, published_at);
+                CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+                    title, body, tokenize = 'unicode61 remove_diacritics 2'
+                );
+            """)
+            self._local.conn = conn
+        return conn
+
+    # ========================================================================
+    # 색인
+    # ========================================================================
+
+    def _upsert(self, conn: sqlite3.Connection, doc: Dict) -> None:
+        """문서 1건 추가 또는 교체 (메타데이터 + 토큰화된 본문)"""
+        row = conn.execute(
+            'SELECT doc_id FROM search_docs WHERE doc_key = ?', (doc['doc_key'],)
+        ).fetchone()
+        if row is not None:
+            conn.execute('DELETE FROM search_fts WHERE rowid = ?', (row['doc_id'],))
+            conn.execute('DELETE FROM search_docs WHERE doc_id = ?', (row['doc_id'],))
+
+        cursor = conn.execute(
+            """
+            INSERT INTO search_docs (doc_key, doc_type, briefing_id, symbol, published_at, title, snippet, url)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                doc['doc_key'],
+                doc['doc_type'],
+                doc.get('briefing_id'),
+                (doc.get('symbol') or '').upper(),
+                doc.get('published_at') or '',
+                doc.get('title') or '',
+                (doc.get('body') or '')[:300],
+                doc.get('url'),
+            )
+        )
+        conn.execute(
+            'INSERT INTO search_fts (rowid, title, body) VALUES (?, ?, ?)',
+            (
+                cursor.lastrowid,
+                ' '.join(_index_tokens(doc.get('title'))),
+                ' '.join(_index_tokens(doc.get('body'))),
+            )
+        )
+
+    @staticmethod
+    def _briefing_documents(briefing_id: str, briefing_data: Dict, stock_data: Dict) -> List[Dict]:
+        """브리핑 1건을 검색 문서(브리핑 본문 1건 + 뉴스 기사 n건)로 변환"""
+        briefing_data = briefing_data or {}
+        stock_data = stock_data or {}
+        symbol = stock_data.get('symbol') or briefing_data.get('stock_symbol') or ''
+        generated_at = briefing_data.get('generated_at') or ''
+
+        body_parts = [briefing_data.get('summary', '')]
+        for section in briefing_data.get('sections', []):
+            body_parts.append(section.get('title', ''))
+            body_parts.append(section.get('content', ''))
+        # 화제 원인 분석이 섹션에 이미 포함되어 있으면 중복 색인하지 않음
+        why_trending = stock_data.get('why_trending', '')
+        if why_trending and why_trending not in body_parts:
+            body_parts.append(why_trending)
+        body_parts.append(stock_data.get('news_summary', ''))
+
+        documents = [{
+            'doc_key': f"briefing:{briefing_id}",
+            'doc_type': DOC_TYPE_BRIEFING,
+            'briefing_id': briefing_id,
+            'symbol': symbol,
+            'published_at': generated_at,
+            'title': briefing_data.get('title', ''),
+            'body': '\n'.join(part for part in body_parts if part),
+            'url': None,
+        }]
+
+        for index, article in enumerate(stock_data.get('news_articles', [])):
+            url = article.get('url', '')
+            documents.append({
+                # 같은 기사가 여러 브리핑에 포함되어도 한 번만 색인
+                'doc_key': f"news:{url}" if url else f"news:{briefing_id}:{index}",
+                'doc_type': DOC_TYPE_NEWS,
+                'briefing_id': briefing_id,
+                'symbol': symbol,
+                'published_at': article.get('published_date') or generated_at,
+                'title': ' '.join(filter(None, [article.get('title'), article.get('title_en')])),
+                'body': article.get('summary', ''),
+                'url': url,
+            })
+
+        return documents
+
+    @timed('serialize.search_index')
+    def index_briefing(self, briefing_id: str, briefing_data: Dict, stock_data: Dict) -> int:
+        """
+        브리핑 1건을 증분 색인합니다. (같은 브리핑의 기존 문서는 교체)
+
+        Args:
+            briefing_id: 브리핑 ID
+            briefing_data: 브리핑 데이터
+            stock_data: 종목 데이터 (news_articles 포함)
+
+        Returns:
+            색인된 문서 수
+        """
+        documents = self._briefing_documents(briefing_id, briefing_data, stock_data)
+        conn = self._connect()
+        with self._write_lock, conn:
+            self._delete_briefing(conn, briefing_id)
+            for doc in documents:
+                self._upsert(conn, doc)
+        return len(documents)
+
+    def remove_briefing(self, briefing_id: str) -> int:
+        """
+        삭제된 브리핑의 문서 제거 (브리핑 본문 + 이 브리핑으로 마지막 색인된 뉴스)
+
+        Returns:
+            제거된 문서 수
+        """
+        conn = self._connect()
+        with self._write_lock, conn:
+            conn.execute(
+                'DELETE FROM search_fts WHERE rowid IN (SELECT doc_id FROM search_docs WHERE briefing_id = ?)',
+                (briefing_id,)
+            )
+            cursor = conn.execute('DELETE FROM search_docs WHERE briefing_id = ?', (briefing_id,))
+        return cursor.rowcount
+
+    @staticmethod
+    def _delete_briefing(conn: sqlite3.Connection, briefing_id: str) -> None:
+        """브리핑 본문 문서 삭제 (뉴스 문서는 다른 브리핑과 공유될 수 있어 유지)"""
+        conn.execute(
+            """
+            DELETE FROM search_fts WHERE rowid IN (
+                SELECT doc_id FROM search_docs WHERE doc_key = ?
+            )
+            """,
+            (f"briefing:{briefing_id}",)
+        )
+        conn.execute('DELETE FROM search_docs WHERE doc_key = ?', (f"briefing:{briefing_id}",))
+
+    def rebuild(self, records: Iterable[Dict]) -> int:
+        """
+        전체 인덱스를 다시 만듭니다.
+
+        Args:
+            records: BriefingStore.iter_all() 형식의 레코드 이터러블
+
+        Returns:
+            색인된 문서 수
+        """
+        conn = self._connect()
+        total = 0
+        with self._write_lock, conn:
+            conn.execute('DELETE FROM search_fts')
+            conn.execute('DELETE FROM search_docs')
+            for record in records:
+                for doc in self._briefing_documents(
+                    record['briefing_id'], record.get('briefing', {}), record.get('stock_data', {})
+                ):
+                    self._upsert(conn, doc)
+                    total += 1
+            conn.execute("INSERT INTO search_fts (search_fts) VALUES ('optimize')")
+        return total
+
+    def count(self) -> int:
+        """색인된 문서 수"""
+        return self._connect().execute('SELECT COUNT(*) FROM search_docs').fetchone()[0]
+
+    def _backfill_if_empty(self) -> None:
+        """인덱스가 비어 있고 저장된 브리핑이 있으면 한 번 전체 색인 (인덱스 도입 전 데이터, 인덱스 파일 삭제 등)"""
+        if self._backfilled:
+            return
+        self._backfilled = True
+        if self.count() > 0:
+            return
+        from briefing_store import get_briefing_store
+
+        store = get_briefing_store()
+        if store.count() > 0:
+            total = self.rebuild(store.iter_all())
+            logger.info(f"빈 검색 인덱스를 브리핑 저장소로 다시 만들었습니다: {total}개 문서")
+
+    # ========================================================================
+    # 검색
+    # ========================================================================
+
+    def search(
+        self,
+        query: str,
+        doc_type: Optional[str] = None,
+        symbol: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[Dict]:
+        """
+        BM25 순위로 검색합니다.
+
+        Args:
+            query: 검색어 (공백으로 구분된 단어는 모두 포함되어야 함)
+            doc_type: 문서 유형 필터 (briefing, news)
+            symbol: 종목 필터
+            start_date: 발행/생성일 시작 (ISO 8601)
+            end_date: 발행/생성일 종료 (ISO 8601)
+            limit: 최대 결과 수
+            offset: 건너뛸 결과 수
+
+        Returns:
+            검색 결과 리스트 (score가 높을수록 관련도 높음)
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+        self._backfill_if_empty()
+
+        conditions = ['search_fts MATCH ?']
+        params: List = [match]
+        if doc_type:
+            conditions.append('d.doc_type = ?')
+            params.append(doc_type)
+        if symbol:
+            conditions.append('d.symbol = ?')
+            params.append(symbol.upper())
+        if start_date:
+            conditions.append('d.published_at >= ?')
+            params.append(start_date)
+        if end_date:
+            conditions.append('d.published_at <= ?')
+            params.append(end_date)
+
+        rows = self._connect().execute(
+            f"""
+            SELECT d.doc_type, d.briefing_id, d.symbol, d.published_at, d.title, d.snippet, d.url,
+                   bm25(search_fts, {_BM25_WEIGHTS[0]}, {_BM25_WEIGHTS[1]}) AS rank
+            FROM search_fts
+            JOIN search_docs AS d ON d.doc_id = search_fts.rowid
+            WHERE {' AND '.join(conditions)}
+            ORDER BY rank
+            LIMIT ? OFFSET ?
+            """,
+            params + [limit, offset]
+        ).fetchall()
+
+        return [
+            {
+                'type': row['doc_type'],
+                'briefing_id': row['briefing_id'],
+                'symbol': row['symbol'],
+                'published_at': row['published_at'],
+                'title': row['title'],
+                'snippet': row['snippet'],
+                'url': row['url'],
+                # FTS5 bm25()는 관련도가 높을수록 작은(음수) 값을 반환
+                'score': round(-row['rank'], 6),
+            }
+            for row in rows
+        ]
+
+
+# 기본 인덱스 인스턴스 (지연 생성)
+_default_index: Optional[SearchIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_search_index() -> SearchIndex:
+    """기본 검색 인덱스 반환"""
+    global _default_index
+    if _default_index is None:
+        with _default_index_lock:
+            if _default_index is None:
+                _default_index = SearchIndex()
+    return _default_index
+
+
+def rebuild_from_store() -> int:
+    """브리핑 저장소 전체로 인덱스 재생성"""
+    from briefing_store import get_briefing_store
+    return get_search_index().rebuild(get_briefing_store().iter_all())
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='브리핑/뉴스 검색 인덱스')
+    parser.add_argument('--rebuild', action='store_true', help='브리핑 저장소로 인덱스 재생성')
+    parser.add_argument('query', nargs='?', help='검색어')
+    args = parser.parse_args()
+
+    if args.rebuild:
+        print(f"색인된 문서: {rebuild_from_store()}개")
+    if args.query:
+        for hit in get_search_index().search(args.query):
+            print(f"[{hit['score']:.2f}] {hit['type']} {hit['symbol']} {hit['title']}")
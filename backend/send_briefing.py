@@ -1,12 +1,17 @@
 """
-브리핑 자동 발송 모듈 (샘플 구현)
-실제 발송 기능은 구현하지 않고 구조만 제공합니다.
+브리핑 자동 발송 모듈
+DELIVERY_MODE=live일 때만 실제로 발송하고, 기본값(simulate)에서는 발송 없이 결과만 기록합니다.
+실제 발송은 delivery.DeliveryEngine (SMTP 연결 재사용, 슬랙 동시 발송, 재시도, 속도 제한)을 사용하고,
+메시지는 delivery_templates로 브리핑당 한 번만 렌더링합니다.
 """
 from typing import Dict, List, Optional
 import logging
 import os
 from pathlib import Path
 
+from delivery import DeliveryEngine, RetryPolicy, SmtpConfig
+from delivery_templates import render_briefing
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -20,13 +25,52 @@ try:
 except ImportError:
     pass
 
-# 환경 변수에서 발송 설정 가져오기 (샘플)
+# 환경 변수에서 발송 설정 가져오기
 EMAIL_SMTP_SERVER = os.getenv('EMAIL_SMTP_SERVER', 'smtp.gmail.com')
 EMAIL_SMTP_PORT = int(os.getenv('EMAIL_SMTP_PORT', '587'))
 EMAIL_USERNAME = os.getenv('EMAIL_USERNAME', '')
 EMAIL_PASSWORD = os.getenv('EMAIL_PASSWORD', '')
+EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', 'true').lower() == 'true'
+EMAIL_FROM = os.getenv('EMAIL_FROM', EMAIL_USERNAME) or 'briefing@localhost'
 SLACK_WEBHOOK_URL = os.getenv('SLACK_WEBHOOK_URL', '')
 
+# 발송 모드: simulate (기본값, 실제 발송 안 함) / live
+DELIVERY_MODE = os.getenv('DELIVERY_MODE', 'simulate').lower()
+
+# 채널별 초당 발송 수 제한
+EMAIL_RATE_PER_SEC = float(os.getenv('EMAIL_RATE_PER_SEC', '10'))
+SLACK_RATE_PER_SEC = float(os.getenv('SLACK_RATE_PER_SEC', '1'))
+SLACK_CONCURRENCY = int(os.getenv('SLACK_CONCURRENCY', '8'))
+
+
+def is_live_delivery() -> bool:
+    """실제 발송 모드 여부"""
+    return DELIVERY_MODE == 'live'
+
+
+def get_delivery_engine() -> DeliveryEngine:
+    """환경 변수 설정으로 발송 엔진 생성"""
+    smtp_config = None
+    if EMAIL_SMTP_SERVER:
+        smtp_config = SmtpConfig(
+            host=EMAIL_SMTP_SERVER,
+            port=EMAIL_SMTP_PORT,
+            username=EMAIL_USERNAME,
+            password=EMAIL_PASSWORD,
+            use_tls=EMAIL_USE_TLS
+        )
+    return DeliveryEngine(
+        smtp_config=smtp_config,
+        email_rate=EMAIL_RATE_PER_SEC,
+        slack_rate=SLACK_RATE_PER_SEC,
+        slack_workers=SLACK_CONCURRENCY,
+        retry_policy=RetryPolicy()
+    )
+
+
+# ============================================================================
+# 발송
+# ============================================================================
 
 def send_email_briefing(
     recipient: str,
@@ -34,7 +78,7 @@ def send_email_briefing(
     image_path: Optional[str] = None
 ) -> Dict[str, any]:
     """
-    이메일로 브리핑을 발송합니다. (샘플 구현)
+    이메일로 브리핑을 발송합니다.
     
     Args:
         recipient: 수신자 이메일 주소
@@ -44,58 +88,17 @@ def send_email_briefing(
     Returns:
         발송 결과 딕셔너리 {success: bool, message: str, message_id: str}
     """
-    logger.info(f"이메일 발송 시뮬레이션: {recipient}")
-    
-    # 실제 구현 예시 (주석 처리)
-    # import smtplib
-    # from email.mime.multipart import MIMEMultipart
-    # from email.mime.text import MIMEText
-    # from email.mime.image import MIMEImage
-    #
-    # try:
-    #     msg = MIMEMultipart('related')
-    #     msg['From'] = EMAIL_USERNAME
-    #     msg['To'] = recipient
-    #     msg['Subject'] = briefing_data.get('title', '주식 브리핑')
-    #
-    #     # HTML 본문 생성
-    #     html_body = create_html_body(briefing_data)
-    #     msg.attach(MIMEText(html_body, 'html'))
-    #
-    #     # 이미지 첨부
-    #     if image_path and os.path.exists(image_path):
-    #         with open(image_path, 'rb') as f:
-    #             img = MIMEImage(f.read())
-    #             img.add_header('Content-ID', '<briefing_image>')
-    #             msg.attach(img)
-    #
-    #     # SMTP 서버 연결 및 발송
-    #     server = smtplib.SMTP(EMAIL_SMTP_SERVER, EMAIL_SMTP_PORT)
-    #     server.starttls()
-    #     server.login(EMAIL_USERNAME, EMAIL_PASSWORD)
-    #     server.send_message(msg)
-    #     server.quit()
-    #
-    #     return {
-    #         'success': True,
-    #         'message': f'이메일 발송 완료: {recipient}',
-    #         'message_id': f'email_{recipient}_{int(time.time())}'
-    #     }
-    # except Exception as e:
-    #     logger.error(f"이메일 발송 실패: {str(e)}")
-    #     return {
-    #         'success': False,
-    #         'message': f'이메일 발송 실패: {str(e)}',
-    #         'message_id': None
-    #     }
-    
-    # 샘플 구현: 실제 발송 없이 로그만 기록
-    return {
-        'success': True,
-        'message': f'이메일 발송 시뮬레이션 완료: {recipient}',
-        'message_id': f'sample_email_{recipient}',
-        'note': '실제 발송 기능은 구현되지 않았습니다. 샘플 코드만 제공됩니다.'
-    }
+    if not is_live_delivery():
+        logger.info(f"이메일 발송 시뮬레이션: {recipient}")
+        return {
+            'success': True,
+            'message': f'이메일 발송 시뮬레이션 완료: {recipient}',
+            'message_id': f'sample_email_{recipient}',
+            'note': 'DELIVERY_MODE=live가 아니므로 실제로 발송하지 않았습니다.'
+        }
+    
+    rendered = render_briefing(briefing_data, image_path, from_addr=EMAIL_FROM)
+    return get_delivery_engine().send_emails([recipient], rendered.email_for)[0]
 
 
 def send_slack_briefing(
@@ -105,71 +108,31 @@ def send_slack_briefing(
     image_path: Optional[str] = None
 ) -> Dict[str, any]:
     """
-    슬랙으로 브리핑을 발송합니다. (샘플 구현)
+    슬랙으로 브리핑을 발송합니다.
     
     Args:
         webhook_url: Slack Webhook URL
         channel: 슬랙 채널명 (예: '#stock-briefing')
         briefing_data: 브리핑 데이터
-        image_path: 브리핑 이미지 파일 경로 (선택)
+        image_path: 브리핑 이미지 파일 경로 (선택, 웹훅은 파일 업로드를 지원하지 않아 사용하지 않음)
     
     Returns:
         발송 결과 딕셔너리 {success: bool, message: str, message_ts: str}
     """
-    logger.info(f"슬랙 발송 시뮬레이션: {channel}")
-    
-    # 실제 구현 예시 (주석 처리)
-    # import requests
-    # import base64
-    #
-    # try:
-    #     # 슬랙 메시지 구성
-    #     blocks = create_slack_blocks(briefing_data)
-    #     payload = {
-    #         "channel": channel,
-    #         "blocks": blocks
-    #     }
-    #
-    #     # 이미지가 있으면 파일 업로드 API 사용
-    #     if image_path and os.path.exists(image_path):
-    #         files = {'file': open(image_path, 'rb')}
-    #         data = {
-    #             'channels': channel,
-    #             'initial_comment': briefing_data.get('title', '주식 브리핑')
-    #         }
-    #         response = requests.post(
-    #             'https://slack.com/api/files.upload',
-    #             headers={'Authorization': f'Bearer {SLACK_BOT_TOKEN}'},
-    #             files=files,
-    #             data=data
-    #         )
-    #     else:
-    #         # Webhook으로 메시지 발송
-    #         response = requests.post(webhook_url, json=payload)
-    #
-    #     response.raise_for_status()
-    #     result = response.json()
-    #
-    #     return {
-    #         'success': True,
-    #         'message': f'슬랙 발송 완료: {channel}',
-    #         'message_ts': result.get('ts', '')
-    #     }
-    # except Exception as e:
-    #     logger.error(f"슬랙 발송 실패: {str(e)}")
-    #     return {
-    #         'success': False,
-    #         'message': f'슬랙 발송 실패: {str(e)}',
-    #         'message_ts': None
-    #     }
-    
-    # 샘플 구현: 실제 발송 없이 로그만 기록
-    return {
-        'success': True,
-        'message': f'슬랙 발송 시뮬레이션 완료: {channel}',
-        'message_ts': 'sample_ts_1234567890',
-        'note': '실제 발송 기능은 구현되지 않았습니다. 샘플 코드만 제공됩니다.'
-    }
+    if not is_live_delivery():
+        logger.info(f"슬랙 발송 시뮬레이션: {channel}")
+        return {
+            'success': True,
+            'message': f'슬랙 발송 시뮬레이션 완료: {channel}',
+            'message_ts': 'sample_ts_1234567890',
+            'note': 'DELIVERY_MODE=live가 아니므로 실제로 발송하지 않았습니다.'
+        }
+    
+    rendered = render_briefing(briefing_data, from_addr=EMAIL_FROM)
+    return get_delivery_engine().send_slack(
+        [{'webhook_url': webhook_url or SLACK_WEBHOOK_URL, 'channel': channel}],
+        lambda info: rendered.slack_payload_for(info['channel'])
+    )[0]
 
 
 def send_briefing_to_channels(
@@ -188,7 +151,7 @@ def send_briefing_to_channels(
         slack_channels: 슬랙 채널 리스트 [{'webhook_url': str, 'channel': str}]
     
     Returns:
-        발송 결과 딕셔너리
+        발송 결과 딕셔너리 (email/slack: 수신자별 결과 리스트, total_sent, total_failed)
     """
     results = {
         'email': [],
@@ -197,30 +160,42 @@ def send_briefing_to_channels(
         'total_failed': 0
     }
     
-    # 이메일 발송
-    if email_recipients:
-        for recipient in email_recipients:
-            result = send_email_briefing(recipient, briefing_data, image_path)
-            results['email'].append(result)
-            if result['success']:
-                results['total_sent'] += 1
-            else:
-                results['total_failed'] += 1
+    if is_live_delivery():
+        engine = get_delivery_engine()
+        # 본문/블록은 한 번만 렌더링하고 수신자별로는 헤더와 채널만 덧붙임
+        rendered = render_briefing(briefing_data, image_path, from_addr=EMAIL_FROM)
+        # 이메일은 SMTP 연결 1개로 순차 발송, 슬랙은 풀에서 동시 발송
+        results['email'] = engine.send_emails(email_recipients or [], rendered.email_for)
+        results['slack'] = engine.send_slack(
+            [
+                {**info, 'webhook_url': info.get('webhook_url') or SLACK_WEBHOOK_URL}
+                for info in (slack_channels or [])
+            ],
+            lambda info: rendered.slack_payload_for(info.get('channel', '#general'))
+        )
+    else:
+        results['email'] = [
+            {'recipient': recipient, **send_email_briefing(recipient, briefing_data, image_path)}
+            for recipient in (email_recipients or [])
+        ]
+        results['slack'] = [
+            {
+                'channel': info.get('channel', '#general'),
+                **send_slack_briefing(
+                    info.get('webhook_url', ''),
+                    info.get('channel', '#general'),
+                    briefing_data,
+                    image_path
+                )
+            }
+            for info in (slack_channels or [])
+        ]
     
-    # 슬랙 발송
-    if slack_channels:
-        for channel_info in slack_channels:
-            result = send_slack_briefing(
-                channel_info.get('webhook_url', ''),
-                channel_info.get('channel', '#general'),
-                briefing_data,
-                image_path
-            )
-            results['slack'].append(result)
-            if result['success']:
-                results['total_sent'] += 1
-            else:
-                results['total_failed'] += 1
+    for result in results['email'] + results['slack']:
+        if result['success']:
+            results['total_sent'] += 1
+        else:
+            results['total_failed'] += 1
     
     logger.info(f"발송 완료: 성공 {results['total_sent']}개, 실패 {results['total_failed']}개")
     return results
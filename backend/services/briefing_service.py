@@ -4,15 +4,84 @@
 from typing import Dict, List, Optional
 from datetime import datetime
 from pathlib import Path
-import json
 import logging
 import os
 
+from briefing_store import get_briefing_store
+
 logger = logging.getLogger(__name__)
 
-# 출력 디렉토리 설정
+# 출력 디렉토리 설정 (이미지/DOCX 파일 위치, 생성은 main.py 시작 시점에)
 OUTPUT_DIR = Path(__file__).parent.parent / 'output'
-OUTPUT_DIR.mkdir(exist_ok=True)
+
+FILES_URL_PREFIX = "/api/briefings/files"
+FILES_BASE_URL = f"http://localhost:8000{FILES_URL_PREFIX}"
+
+# 즉시 발송 시 API 요청 안에서 기다리는 최대 시간 (초, 나머지는 아웃박스 워커가 처리)
+SEND_WAIT_SECONDS = 10
+
+
+def _find_image_url(briefing_id: str, image_path: Optional[str]) -> Optional[str]:
+    """브리핑 이미지 URL 찾기 (저장된 경로 우선, 없으면 파일명 패턴으로 탐색)"""
+    # 절대 경로인 경우 처리
+    if image_path and os.path.exists(image_path):
+        try:
+            rel_path = os.path.relpath(image_path, OUTPUT_DIR)
+            return f"{FILES_BASE_URL}/{rel_path.replace(os.sep, '/')}"
+        except ValueError:
+            # OUTPUT_DIR 밖에 있는 경우 절대 경로 사용 불가
+            pass
+
+    # 패턴 1: briefing_ID.png
+    image_file = OUTPUT_DIR / f"{briefing_id}.png"
+    if not image_file.exists():
+        # 패턴 2: briefing_card_ID.png
+        pattern = briefing_id.replace('briefing_', 'briefing_card_')
+        image_file = OUTPUT_DIR / f"{pattern}.png"
+    if not image_file.exists():
+        # 패턴 3: 브리핑 ID와 1초 차이 나는 PNG 파일
+        # briefing_NVDA_20251226_194439 -> briefing_NVDA_20251226_194438
+        parts = briefing_id.split('_')
+        if len(parts) >= 3:
+            try:
+                last_num = int(parts[-1])
+                new_parts = parts[:-1] + [str(last_num - 1).zfill(len(parts[-1]))]
+                image_file = OUTPUT_DIR / f"{'_'.join(new_parts)}.png"
+            except ValueError:
+                pass
+    if image_file.exists():
+        rel_path = os.path.relpath(image_file, OUTPUT_DIR)
+        return f"{FILES_BASE_URL}/{rel_path.replace(os.sep, '/')}"
+    return None
+
+
+def _find_docx_url(briefing_id: str) -> Optional[str]:
+    """브리핑 DOCX 리포트 URL 찾기"""
+    docx_file = OUTPUT_DIR / 'reports' / f"briefing_report_{briefing_id}.docx"
+    if not docx_file.exists():
+        docx_file = OUTPUT_DIR / f"{briefing_id}.docx"
+    if docx_file.exists():
+        rel_path = os.path.relpath(docx_file, OUTPUT_DIR)
+        return f"{FILES_URL_PREFIX}/{rel_path.replace(os.sep, '/')}"
+    return None
+
+
+def _build_content(record: Dict, image_url: Optional[str]) -> Dict:
+    """브리핑 콘텐츠 응답 구성"""
+    return {
+        "text": {
+            "title": record.get('title') or '오늘의 화제 종목 브리핑',
+            "summary": record.get('summary', ''),
+            "sections": record.get('sections', [])
+        },
+        "image": {
+            "url": image_url,
+            "thumbnail_url": image_url,
+            "width": 1200,
+            "height": 1600,
+            "format": "png"
+        } if image_url else None
+    }
 
 
 class BriefingService:
@@ -50,12 +119,11 @@ class BriefingService:
         briefing_data = result['briefing_data']
         top_stock = result.get('stock_data', {})
 
-        # 브리핑 ID 생성
-        briefing_id = f"brf_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # 브리핑 ID (저장소에 저장된 ID, 저장 실패 시 타임스탬프 기반)
+        briefing_id = result.get('briefing_id') or f"brf_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
         # 이미지 처리
-        image_path = briefing_data.get('image_path', '')
-        image_url = f"http://localhost:8000/briefings/images/{briefing_id}.png" if image_path else ""
+        image_url = _find_image_url(briefing_id, briefing_data.get('image_path')) or ""
 
         logger.info(f"브리핑 생성 완료: {briefing_id}")
 
@@ -77,7 +145,7 @@ class BriefingService:
         status: Optional[str] = None
     ) -> Dict:
         """
-        브리핑 목록 조회 - output 폴더의 파일들을 스캔
+        브리핑 목록 조회 - 브리핑 저장소의 인덱스 컬럼으로 필터링
 
         Args:
             page: 페이지 번호
@@ -93,143 +161,40 @@ class BriefingService:
         logger.info(f"브리핑 목록 조회: page={page}, limit={limit}")
 
         try:
-            # output 폴더에서 JSON 파일 찾기
-            json_files = list(OUTPUT_DIR.glob("briefing_*.json"))
-            
+            records, total = get_briefing_store().list(
+                page=page,
+                limit=limit,
+                start_date=start_date,
+                end_date=end_date,
+                stock_symbol=stock_symbol,
+                status=status
+            )
+
             briefings = []
-            
-            for json_file in sorted(json_files, key=lambda x: x.stat().st_mtime, reverse=True):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    briefing_data = data.get('briefing', {})
-                    stock_data = data.get('stock_data', {})
-                    
-                    # 브리핑 ID 생성 (파일명 기반)
-                    briefing_id = json_file.stem
-                    
-                    # 생성 시간
-                    generated_at = briefing_data.get('generated_at') or data.get('created_at', '')
-                    
-                    # 날짜 필터링
-                    if start_date and generated_at < start_date:
-                        continue
-                    if end_date and generated_at > end_date:
-                        continue
-                    
-                    # 종목 필터링
-                    if stock_symbol:
-                        stock_sym = stock_data.get('symbol', '') or briefing_data.get('stock_symbol', '')
-                        if stock_sym.upper() != stock_symbol.upper():
-                            continue
-                    
-                    # 이미지 경로 찾기
-                    image_url = None
-                    image_path = briefing_data.get('image_path', '')
-                    
-                    # 절대 경로인 경우 처리
-                    if image_path and os.path.exists(image_path):
-                        try:
-                            # 상대 경로로 변환
-                            rel_path = os.path.relpath(image_path, OUTPUT_DIR)
-                            image_url = f"http://localhost:8000/api/briefings/files/{rel_path.replace(os.sep, '/')}"
-                        except ValueError:
-                            # OUTPUT_DIR 밖에 있는 경우 절대 경로 사용 불가
-                            pass
-                    
-                    # 이미지 파일 찾기 (여러 패턴 시도)
-                    if not image_url:
-                        # 패턴 1: briefing_ID.png
-                        image_file = json_file.parent / f"{briefing_id}.png"
-                        if not image_file.exists():
-                            # 패턴 2: briefing_card_ID.png
-                            pattern = briefing_id.replace('briefing_', 'briefing_card_')
-                            image_file = json_file.parent / f"{pattern}.png"
-                        if not image_file.exists():
-                            # 패턴 3: JSON 파일명과 유사한 PNG 파일 찾기
-                            base_name = json_file.stem
-                            # briefing_NVDA_20251226_194439 -> briefing_NVDA_20251226_194438
-                            if '_' in base_name:
-                                parts = base_name.split('_')
-                                if len(parts) >= 3:
-                                    # 마지막 숫자 부분을 하나 줄여서 찾기
-                                    try:
-                                        last_num = int(parts[-1])
-                                        new_parts = parts[:-1] + [str(last_num - 1).zfill(len(parts[-1]))]
-                                        alt_name = '_'.join(new_parts)
-                                        image_file = json_file.parent / f"{alt_name}.png"
-                                    except ValueError:
-                                        pass
-                        if image_file.exists():
-                            rel_path = os.path.relpath(image_file, OUTPUT_DIR)
-                            image_url = f"http://localhost:8000/api/briefings/files/{rel_path.replace(os.sep, '/')}"
-                    
-                    # DOCX 파일 찾기
-                    docx_file = json_file.parent / 'reports' / f"briefing_report_{briefing_id}.docx"
-                    if not docx_file.exists():
-                        docx_file = json_file.parent / f"{briefing_id.replace('briefing_', 'briefing_')}.docx"
-                    docx_url = None
-                    if docx_file.exists():
-                        rel_path = os.path.relpath(docx_file, OUTPUT_DIR)
-                        docx_url = f"/api/briefings/files/{rel_path.replace(os.sep, '/')}"
-                    
-                    # 종목 정보 추출
-                    stocks_included = []
-                    if stock_data:
-                        stocks_included.append({
-                            "symbol": stock_data.get('symbol', ''),
-                            "name": stock_data.get('name', ''),
-                            "price": stock_data.get('price', 0),
-                            "change_percent": stock_data.get('change_percent', 0),
-                            "volume": stock_data.get('volume', 0)
-                        })
-                    
-                    # 브리핑 항목 구성
-                    briefing_item = {
-                        "briefing_id": briefing_id,
-                        "generated_at": generated_at,
-                        "status": "completed",
-                        "stocks_count": len(stocks_included),
-                        "stocks": stocks_included,
-                        "content": {
-                            "text": {
-                                "title": briefing_data.get('title', '오늘의 화제 종목 브리핑'),
-                                "summary": briefing_data.get('summary', ''),
-                                "sections": briefing_data.get('sections', [])
-                            },
-                            "image": {
-                                "url": image_url,
-                                "thumbnail_url": image_url,
-                                "width": 1200,
-                                "height": 1600,
-                                "format": "png"
-                            } if image_url else None
-                        },
-                        "metadata": {
-                            "template_used": "default_v1",
-                            "ai_model": "gemini-pro",
-                            "language": "ko",
-                            "docx_url": docx_url
-                        },
-                        "sent_channels": [],
-                        "view_count": 0
-                    }
-                    
-                    briefings.append(briefing_item)
-                    
-                except Exception as e:
-                    logger.warning(f"브리핑 파일 읽기 실패: {json_file.name}, 오류: {str(e)}")
-                    continue
-            
-            # 페이지네이션
-            total = len(briefings)
-            start_idx = (page - 1) * limit
-            end_idx = start_idx + limit
-            paginated_briefings = briefings[start_idx:end_idx]
-            
+            for record in records:
+                briefing_id = record['briefing_id']
+                image_url = _find_image_url(briefing_id, record.get('image_path'))
+
+                briefings.append({
+                    "briefing_id": briefing_id,
+                    "generated_at": record['generated_at'],
+                    "status": record['status'],
+                    "stocks_count": len(record['stocks']),
+                    "stocks": record['stocks'],
+                    "content": _build_content(record, image_url),
+                    "metadata": {
+                        "template_used": "default_v1",
+                        "ai_model": "gemini-pro",
+                        "language": record['language'],
+                        "docx_url": _find_docx_url(briefing_id)
+                    },
+                    "sent_channels": [],
+                    "view_count": 0
+                })
+
+            end_idx = page * limit
             return {
-                "briefings": paginated_briefings,
+                "briefings": briefings,
                 "pagination": {
                     "page": page,
                     "limit": limit,
@@ -239,7 +204,7 @@ class BriefingService:
                     "has_prev": page > 1
                 }
             }
-            
+
         except Exception as e:
             logger.error(f"브리핑 목록 조회 중 오류: {str(e)}")
             return {
@@ -257,149 +222,85 @@ class BriefingService:
     @staticmethod
     def get_briefing_by_id(briefing_id: str) -> Dict:
         """
-        브리핑 상세 조회 - output 폴더에서 JSON 파일 읽기
+        브리핑 상세 조회 - 브리핑 저장소에서 기본키로 조회
 
         Args:
             briefing_id: 브리핑 ID
 
         Returns:
             브리핑 상세 정보
+
+        Raises:
+            ValueError: 브리핑을 찾을 수 없음
         """
         logger.info(f"브리핑 상세 조회: {briefing_id}")
 
         try:
-            # JSON 파일 찾기
-            json_file = OUTPUT_DIR / f"{briefing_id}.json"
-            
-            if not json_file.exists():
-                raise ValueError(f"브리핑을 찾을 수 없습니다: {briefing_id}")
-            
-            # JSON 파일 읽기
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            briefing_data = data.get('briefing', {})
-            stock_data = data.get('stock_data', {})
-            
-            # 이미지 경로 찾기
-            image_url = None
-            image_path = briefing_data.get('image_path', '')
-            
-            # 절대 경로인 경우 처리
-            if image_path and os.path.exists(image_path):
-                try:
-                    rel_path = os.path.relpath(image_path, OUTPUT_DIR)
-                    image_url = f"http://localhost:8000/api/briefings/files/{rel_path.replace(os.sep, '/')}"
-                except ValueError:
-                    pass
-            
-            # 이미지 파일 찾기 (여러 패턴 시도)
-            if not image_url:
-                json_file = OUTPUT_DIR / f"{briefing_id}.json"
-                # 패턴 1: briefing_ID.png
-                image_file = OUTPUT_DIR / f"{briefing_id}.png"
-                if not image_file.exists():
-                    # 패턴 2: briefing_card_ID.png
-                    pattern = briefing_id.replace('briefing_', 'briefing_card_')
-                    image_file = OUTPUT_DIR / f"{pattern}.png"
-                if not image_file.exists() and json_file.exists():
-                    # 패턴 3: JSON 파일명과 유사한 PNG 파일 찾기
-                    base_name = json_file.stem
-                    if '_' in base_name:
-                        parts = base_name.split('_')
-                        if len(parts) >= 3:
-                            try:
-                                last_num = int(parts[-1])
-                                new_parts = parts[:-1] + [str(last_num - 1).zfill(len(parts[-1]))]
-                                alt_name = '_'.join(new_parts)
-                                image_file = OUTPUT_DIR / f"{alt_name}.png"
-                            except ValueError:
-                                pass
-                if image_file.exists():
-                    rel_path = os.path.relpath(image_file, OUTPUT_DIR)
-                    image_url = f"http://localhost:8000/api/briefings/files/{rel_path.replace(os.sep, '/')}"
-            
-            # DOCX 파일 찾기
-            docx_file = OUTPUT_DIR / 'reports' / f"briefing_report_{briefing_id}.docx"
-            if not docx_file.exists():
-                docx_file = OUTPUT_DIR / f"{briefing_id.replace('briefing_', 'briefing_')}.docx"
-            docx_url = None
-            if docx_file.exists():
-                rel_path = os.path.relpath(docx_file, OUTPUT_DIR)
-                docx_url = f"/api/briefings/files/{rel_path.replace(os.sep, '/')}"
-            
-            # 종목 정보 추출
-            stocks_included = []
-            if stock_data:
-                stocks_included.append({
-                    "symbol": stock_data.get('symbol', ''),
-                    "name": stock_data.get('name', ''),
-                    "price": stock_data.get('price', 0),
-                    "change_percent": stock_data.get('change_percent', 0),
-                    "volume": stock_data.get('volume', 0)
-                })
-            
-            return {
-                "briefing_id": briefing_id,
-                "generated_at": briefing_data.get('generated_at') or data.get('created_at', ''),
-                "status": "completed",
-                "stocks_included": stocks_included,
-                "content": {
-                    "text": {
-                        "title": briefing_data.get('title', '오늘의 화제 종목 브리핑'),
-                        "summary": briefing_data.get('summary', ''),
-                        "sections": briefing_data.get('sections', [])
-                    },
-                    "image": {
-                        "url": image_url,
-                        "thumbnail_url": image_url,
-                        "width": 1200,
-                        "height": 1600,
-                        "format": "png"
-                    } if image_url else None
-                },
-                "metadata": {
-                    "template_used": "default_v1",
-                    "generation_time_ms": 0,
-                    "ai_model": "gemini-pro",
-                    "language": "ko",
-                    "docx_url": docx_url
-                }
-            }
-            
-        except ValueError:
-            raise
+            record = get_briefing_store().get(briefing_id)
         except Exception as e:
             logger.error(f"브리핑 상세 조회 중 오류: {str(e)}")
             raise ValueError(f"브리핑을 찾을 수 없습니다: {briefing_id}")
 
+        if record is None:
+            raise ValueError(f"브리핑을 찾을 수 없습니다: {briefing_id}")
+
+        image_url = _find_image_url(briefing_id, record.get('image_path'))
+
+        return {
+            "briefing_id": briefing_id,
+            "generated_at": record['generated_at'],
+            "status": record['status'],
+            "stocks_included": record['stocks'],
+            "content": _build_content(record, image_url),
+            "metadata": {
+                "template_used": "default_v1",
+                "generation_time_ms": record['briefing'].get('generation_time_ms', 0),
+                "ai_model": "gemini-pro",
+                "language": record['language'],
+                "docx_url": _find_docx_url(briefing_id)
+            }
+        }
+
     @staticmethod
     def send_briefing(
         briefing_id: str,
         channels: List[Dict],
-        send_immediately: bool = True
+        send_immediately: bool = True,
+        scheduled_at: Optional[datetime] = None,
+        wait_timeout: float = SEND_WAIT_SECONDS
     ) -> Dict:
         """
         브리핑 발송
 
+        발송 아웃박스에 등록한 뒤 즉시 발송이면 wait_timeout 동안 직접 처리합니다.
+        그 안에 끝나지 않은 항목(재시도 대기, 예약 발송)은 아웃박스 워커가 처리하며
+        진행 상황은 get_send_job()으로 조회합니다.
+
         Args:
             briefing_id: 브리핑 ID
             channels: 발송 채널 목록
-            send_immediately: 즉시 발송 여부
+            send_immediately: 즉시 발송 여부 (False면 워커에 맡기고 바로 반환)
+            scheduled_at: 예약 발송 시각
+            wait_timeout: 즉시 발송 시 최대 대기 시간 (초)
 
         Returns:
-            발송 결과
+            발송 작업 상태 (send_job_id, status, total_sent, total_failed, pending, items)
+
+        Raises:
+            ValueError: 브리핑을 찾을 수 없음
         """
-        from send_briefing import send_briefing_to_channels
+        from delivery_outbox import get_outbox
 
         logger.info(f"브리핑 발송: {briefing_id}, channels={len(channels)}")
 
-        # TODO: 실제 브리핑 데이터 조회
-        briefing_data = {
-            "title": "오늘의 화제 종목 브리핑",
-            "summary": "테스트 브리핑입니다.",
-            "sections": []
-        }
+        # 저장소에서 브리핑 데이터 조회
+        record = get_briefing_store().get(briefing_id)
+        if record is None:
+            raise ValueError(f"브리핑을 찾을 수 없습니다: {briefing_id}")
+        briefing_data = record['briefing']
+        image_path = record.get('image_path')
+        if image_path and not os.path.exists(image_path):
+            image_path = None
 
         # 채널별 발송
         email_recipients = []
@@ -414,22 +315,81 @@ class BriefingService:
                     'channel': channel.get('slack_channel', '#general')
                 })
 
-        # 발송 실행
-        results = send_briefing_to_channels(
-            briefing_data=briefing_data,
-            image_path=None,
+        # 아웃박스 등록 (이미 받은 수신자는 건너뜀)
+        outbox = get_outbox()
+        queued = outbox.enqueue(
+            briefing_id,
+            briefing_data,
+            image_path=image_path,
             email_recipients=email_recipients,
-            slack_channels=slack_channels
+            slack_channels=slack_channels,
+            not_before=scheduled_at.timestamp() if scheduled_at else None
         )
 
-        send_job_id = f"job_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        if send_immediately and scheduled_at is None:
+            outbox.drain(queued['job_id'], timeout=wait_timeout)
 
-        logger.info(f"브리핑 발송 완료: {results['total_sent']}개 성공, {results['total_failed']}개 실패")
+        job = outbox.get_job(queued['job_id'], include_items=True)
+
+        logger.info(
+            f"브리핑 발송 완료: {job['sent']}개 성공, {job['failed']}개 실패, {job['pending']}개 대기"
+        )
 
         return {
-            "send_job_id": send_job_id,
-            "status": "sent" if send_immediately else "scheduled",
-            "total_sent": results['total_sent'],
-            "total_failed": results['total_failed'],
-            "results": results
+            "send_job_id": job['job_id'],
+            "status": "scheduled" if scheduled_at and job['pending'] else job['status'],
+            "total_sent": job['sent'],
+            "total_failed": job['failed'],
+            "pending": job['pending'],
+            "duplicates": job['duplicates'],
+            "items": job['items']
         }
+
+    @staticmethod
+    def get_send_job(send_job_id: str) -> Dict:
+        """
+        발송 작업 상태 조회
+
+        Args:
+            send_job_id: 발송 작업 ID
+
+        Returns:
+            발송 작업 상태 (수신자별 items 포함)
+
+        Raises:
+            ValueError: 발송 작업을 찾을 수 없음
+        """
+        from delivery_outbox import get_outbox
+
+        job = get_outbox().get_job(send_job_id, include_items=True)
+        if job is None:
+            raise ValueError(f"발송 작업을 찾을 수 없습니다: {send_job_id}")
+        return job
+
+    @staticmethod
+    def export_history_excel(
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        stock_symbol: Optional[str] = None
+    ) -> str:
+        """
+        브리핑 종목 이력 Excel 내보내기 (저장소를 스트리밍으로 읽어 write-only 모드로 저장)
+
+        Args:
+            start_date: 시작 날짜 (ISO 8601)
+            end_date: 종료 날짜 (ISO 8601)
+            stock_symbol: 특정 종목만
+
+        Returns:
+            생성된 Excel 파일 경로
+        """
+        from excel_generator import create_briefing_history_excel
+
+        rows = get_briefing_store().iter_stock_rows(
+            start_date=start_date,
+            end_date=end_date,
+            stock_symbol=stock_symbol
+        )
+        suffix = f"_{stock_symbol.upper()}" if stock_symbol else ''
+        filename = f"briefing_history{suffix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        return create_briefing_history_excel(rows, output_dir=str(OUTPUT_DIR / 'data'), filename=filename)
@@ -6,12 +6,15 @@
 2. 함수 분리 - 채널 처리 로직 별도 메서드로 추출
 3. 타입 힌트 개선
 4. 페이지네이션 로직 메서드 분리
+5. 브리핑 저장소(SQLite) 연동 - 목록/상세/발송 모두 저장소에서 조회
 """
 from typing import Dict, List, Optional
 from datetime import datetime
 import logging
 import os
 
+from briefing_store import get_briefing_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +44,14 @@ class BriefingService:
     CHANNEL_TYPE_SLACK = 'slack'
     SLACK_DEFAULT_CHANNEL = '#general'
 
+    # 즉시 발송 시 API 요청 안에서 기다리는 최대 시간 (초, 나머지는 아웃박스 워커가 처리)
+    SEND_WAIT_SECONDS = 10
+
+    # 응답 메타데이터 기본값
+    DEFAULT_TITLE = "오늘의 화제 종목 브리핑"
+    DEFAULT_TEMPLATE = "default_v1"
+    AI_MODEL = "gemini-pro"
+
     # ========================================================================
     # Public Methods - Briefing Creation
     # ========================================================================
@@ -81,8 +92,8 @@ class BriefingService:
         briefing_data = result['briefing_data']
         top_stock = result.get('stock_data', {})
 
-        # 브리핑 ID 생성
-        briefing_id = BriefingService._generate_briefing_id()
+        # 브리핑 ID (저장소에 저장된 ID 우선)
+        briefing_id = result.get('briefing_id') or BriefingService._generate_briefing_id()
 
         # 이미지 URL 생성
         image_path = briefing_data.get('image_path', '')
@@ -130,10 +141,15 @@ class BriefingService:
         # Limit 검증
         limit = min(limit, BriefingService.MAX_LIMIT)
 
-        # TODO: 실제로는 데이터베이스에서 조회
-        # briefings = db.query(Briefing).filter(...).offset((page-1)*limit).limit(limit).all()
-        briefings = []
-        total = 0
+        records, total = get_briefing_store().list(
+            page=page,
+            limit=limit,
+            start_date=start_date,
+            end_date=end_date,
+            stock_symbol=stock_symbol,
+            status=status
+        )
+        briefings = [BriefingService._build_list_item(record) for record in records]
 
         # 페이지네이션 정보 구성
         pagination = BriefingService._build_pagination(page, limit, total)
@@ -159,12 +175,23 @@ class BriefingService:
         """
         logger.info(f"브리핑 상세 조회: {briefing_id}")
 
-        # TODO: 실제로는 데이터베이스에서 조회
-        # briefing = db.query(Briefing).filter(Briefing.id == briefing_id).first()
-        # if not briefing:
-        #     raise ValueError(f"브리핑을 찾을 수 없습니다: {briefing_id}")
+        record = get_briefing_store().get(briefing_id)
+        if record is None:
+            raise ValueError(f"브리핑을 찾을 수 없습니다: {briefing_id}")
 
-        raise ValueError(f"브리핑을 찾을 수 없습니다: {briefing_id}")
+        return {
+            "briefing_id": record['briefing_id'],
+            "generated_at": record['generated_at'],
+            "status": record['status'],
+            "stocks_included": record['stocks'],
+            "content": BriefingService._build_content(record),
+            "metadata": {
+                "template_used": BriefingService.DEFAULT_TEMPLATE,
+                "generation_time_ms": record['briefing'].get('generation_time_ms', 0),
+                "ai_model": BriefingService.AI_MODEL,
+                "language": record['language']
+            }
+        }
 
     # ========================================================================
     # Public Methods - Briefing Sending
@@ -174,54 +201,100 @@ class BriefingService:
     def send_briefing(
         briefing_id: str,
         channels: List[Dict],
-        send_immediately: bool = True
+        send_immediately: bool = True,
+        scheduled_at: Optional[datetime] = None,
+        wait_timeout: Optional[float] = None
     ) -> Dict:
         """
         브리핑 발송
 
+        발송 아웃박스에 등록한 뒤 즉시 발송이면 wait_timeout 동안 직접 처리합니다.
+        남은 항목(재시도 대기, 예약 발송)은 아웃박스 워커가 처리합니다.
+
         Args:
             briefing_id: 브리핑 ID
             channels: 발송 채널 목록 [{"type": "email", "email": "..."}, ...]
-            send_immediately: 즉시 발송 여부
+            send_immediately: 즉시 발송 여부 (False면 워커에 맡기고 바로 반환)
+            scheduled_at: 예약 발송 시각
+            wait_timeout: 즉시 발송 시 최대 대기 시간 (초, 기본값: SEND_WAIT_SECONDS)
 
         Returns:
-            발송 결과
+            발송 작업 상태 (send_job_id, status, total_sent, total_failed, pending, items)
+
+        Raises:
+            ValueError: 브리핑을 찾을 수 없음
 
         Channel Format:
             Email: {"type": "email", "email": "user@example.com"}
             Slack: {"type": "slack", "slack_webhook_url": "...", "slack_channel": "#general"}
         """
-        from send_briefing import send_briefing_to_channels
+        from delivery_outbox import get_outbox
 
         logger.info(f"브리핑 발송: {briefing_id}, channels={len(channels)}")
 
-        # TODO: 실제 브리핑 데이터 조회
-        briefing_data = BriefingService._get_test_briefing_data()
+        # 저장소에서 브리핑 데이터 조회
+        record = get_briefing_store().get(briefing_id)
+        if record is None:
+            raise ValueError(f"브리핑을 찾을 수 없습니다: {briefing_id}")
+        briefing_data = record['briefing']
+        image_path = record.get('image_path')
+        if image_path and not os.path.exists(image_path):
+            image_path = None
 
         # 채널별 수신자 추출
         email_recipients, slack_channels = BriefingService._extract_channel_recipients(channels)
 
-        # 발송 실행
-        results = send_briefing_to_channels(
-            briefing_data=briefing_data,
-            image_path=None,
+        # 아웃박스 등록 (이미 받은 수신자는 건너뜀)
+        outbox = get_outbox()
+        queued = outbox.enqueue(
+            briefing_id,
+            briefing_data,
+            image_path=image_path,
             email_recipients=email_recipients,
-            slack_channels=slack_channels
+            slack_channels=slack_channels,
+            not_before=scheduled_at.timestamp() if scheduled_at else None
         )
 
-        # 발송 Job ID 생성
-        send_job_id = BriefingService._generate_send_job_id()
+        if send_immediately and scheduled_at is None:
+            outbox.drain(queued['job_id'], timeout=wait_timeout or BriefingService.SEND_WAIT_SECONDS)
+
+        job = outbox.get_job(queued['job_id'], include_items=True)
 
-        logger.info(f"브리핑 발송 완료: {results['total_sent']}개 성공, {results['total_failed']}개 실패")
+        logger.info(
+            f"브리핑 발송 완료: {job['sent']}개 성공, {job['failed']}개 실패, {job['pending']}개 대기"
+        )
 
         return {
-            "send_job_id": send_job_id,
-            "status": "sent" if send_immediately else "scheduled",
-            "total_sent": results['total_sent'],
-            "total_failed": results['total_failed'],
-            "results": results
+            "send_job_id": job['job_id'],
+            "status": "scheduled" if scheduled_at and job['pending'] else job['status'],
+            "total_sent": job['sent'],
+            "total_failed": job['failed'],
+            "pending": job['pending'],
+            "duplicates": job['duplicates'],
+            "items": job['items']
         }
 
+    @staticmethod
+    def get_send_job(send_job_id: str) -> Dict:
+        """
+        발송 작업 상태 조회
+
+        Args:
+            send_job_id: 발송 작업 ID
+
+        Returns:
+            발송 작업 상태 (수신자별 items 포함)
+
+        Raises:
+            ValueError: 발송 작업을 찾을 수 없음
+        """
+        from delivery_outbox import get_outbox
+
+        job = get_outbox().get_job(send_job_id, include_items=True)
+        if job is None:
+            raise ValueError(f"발송 작업을 찾을 수 없습니다: {send_job_id}")
+        return job
+
     # ========================================================================
     # Private Helper Methods - ID Generation
     # ========================================================================
@@ -231,11 +304,6 @@ class BriefingService:
         """브리핑 ID 생성 (타임스탬프 기반)"""
         return f"brf_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-    @staticmethod
-    def _generate_send_job_id() -> str:
-        """발송 Job ID 생성 (타임스탬프 기반)"""
-        return f"job_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-
     @staticmethod
     def _generate_image_url(briefing_id: str) -> str:
         """브리핑 이미지 URL 생성"""
@@ -298,11 +366,41 @@ class BriefingService:
 
         return email_recipients, slack_channels
 
+    # ========================================================================
+    # Private Helper Methods - Response Building
+    # ========================================================================
+
+    @staticmethod
+    def _build_content(record: Dict) -> Dict:
+        """저장소 레코드로 브리핑 콘텐츠 구성"""
+        image_url = (
+            BriefingService._generate_image_url(record['briefing_id'])
+            if record.get('image_path') else None
+        )
+
+        return {
+            "text": {
+                "title": record.get('title') or BriefingService.DEFAULT_TITLE,
+                "summary": record.get('summary', ''),
+                "sections": record.get('sections', [])
+            },
+            "image": {
+                "url": image_url,
+                "thumbnail_url": image_url,
+                "format": "png"
+            } if image_url else None
+        }
+
     @staticmethod
-    def _get_test_briefing_data() -> Dict:
-        """테스트용 브리핑 데이터 반환"""
+    def _build_list_item(record: Dict) -> Dict:
+        """저장소 레코드로 목록 항목 구성"""
         return {
-            "title": "오늘의 화제 종목 브리핑",
-            "summary": "테스트 브리핑입니다.",
-            "sections": []
+            "briefing_id": record['briefing_id'],
+            "generated_at": record['generated_at'],
+            "status": record['status'],
+            "stocks_count": len(record['stocks']),
+            "stocks": record['stocks'],
+            "content": BriefingService._build_content(record),
+            "sent_channels": [],
+            "view_count": 0
         }
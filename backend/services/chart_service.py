@@ -0,0 +1,72 @@
+"""
+주가 차트 관련 비즈니스 로직
+"""
+from typing import Dict, Optional, Tuple
+from datetime import datetime
+import logging
+
+import charts
+
+logger = logging.getLogger(__name__)
+
+# 프론트엔드 차트 기본 점 개수
+DEFAULT_POINTS = 200
+
+# API 구간 파라미터 검증용 (예: ^(1d|5d|1mo|...)$)
+RANGE_PATTERN = f"^({'|'.join(charts.RANGES)})$"
+
+
+class ChartService:
+    """주가 차트 데이터 / 스파크라인 서비스"""
+
+    @staticmethod
+    def get_chart(symbol: str, range_: str = charts.DEFAULT_RANGE, points: int = DEFAULT_POINTS) -> Dict:
+        """
+        LTTB로 줄인 OHLCV 시계열 조회
+
+        Args:
+            symbol: 종목 심볼
+            range_: 구간 (charts.RANGES)
+            points: 목표 봉 개수
+
+        Returns:
+            차트 데이터 (bars: date/open/high/low/close/volume)
+
+        Raises:
+            ValueError: 지원하지 않는 구간
+            charts.ChartDataNotFound: 가격 이력이 없음
+        """
+        fingerprint, bars = charts.get_bars(symbol, range_)
+        reduced = charts.downsample_ohlcv(bars, points)
+        return {
+            "symbol": symbol,
+            "range": range_,
+            "interval": charts.RANGES[range_][0],
+            "source_points": int(len(bars['t'])),
+            "points": int(len(reduced['t'])),
+            "version": fingerprint,
+            "bars": charts.to_records(reduced),
+            "generated_at": datetime.now().isoformat()
+        }
+
+    @staticmethod
+    def get_sparkline(symbol: str, range_: str, width: int, height: int) -> Tuple[str, bytes]:
+        """
+        스파크라인 PNG
+
+        Returns:
+            (캐시 버전 = 마지막 봉 지문, PNG 바이트)
+        """
+        return charts.get_sparkline(symbol, range_, width, height)
+
+    @staticmethod
+    def get_sparkline_path(
+        symbol: str,
+        range_: str = charts.DEFAULT_RANGE,
+        width: int = 480,
+        height: int = 120
+    ) -> Optional[str]:
+        """
+        DOCX 리포트 / 브리핑 카드에 넣을 스파크라인 파일 경로 (가격 이력이 없으면 None)
+        """
+        return charts.sparkline_file(symbol, range_, width, height)
@@ -0,0 +1,36 @@
+"""
+시장 전체 집계 비즈니스 로직
+"""
+from typing import Dict
+import logging
+
+from market_sectors import get_sector_overview
+
+logger = logging.getLogger(__name__)
+
+
+class MarketService:
+    """시장 집계 서비스 (공유 시장 스냅샷 + 종목 프로필 캐시, 외부 API 호출 없음)"""
+
+    @staticmethod
+    def get_sectors(group_by: str = "sector", movers: int = 3) -> Dict:
+        """
+        섹터/산업별 집계
+
+        Args:
+            group_by: 집계 기준 (sector, industry)
+            movers: 그룹별 상승/하락 상위 종목 수
+
+        Returns:
+            그룹별 시가총액 가중 수익률, 거래량, 상승/하락 종목 수, 상위 종목
+
+        Raises:
+            SnapshotUnavailable: 시장 스냅샷 없음
+        """
+        overview = get_sector_overview(group_by=group_by, movers=movers)
+        if not overview['cached']:
+            logger.info(
+                f"{group_by}별 집계: {len(overview['groups'])}개 그룹, "
+                f"{overview['universe']}개 종목 (프로필 {overview['profiled']}개), 스냅샷 v{overview['snapshot_version']}"
+            )
+        return overview
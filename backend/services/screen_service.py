@@ -0,0 +1,83 @@
+"""
+로컬 스크리너 비즈니스 로직
+"""
+from typing import Dict, List, Optional
+import logging
+
+from screen_engine import FIELDS, ScreenError, get_screen_store, run_screen
+
+logger = logging.getLogger(__name__)
+
+
+class ScreenService:
+    """조건식 스크린 실행 / 저장 서비스 (공유 시장 스냅샷 사용, 외부 API 호출 없음)"""
+
+    @staticmethod
+    def run(
+        expression: Optional[str] = None,
+        name: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        order: Optional[str] = None,
+        limit: int = 50
+    ) -> Dict:
+        """
+        조건식 또는 저장된 스크린 실행
+
+        Args:
+            expression: 조건식 (name이 없을 때 필수)
+            name: 저장된 스크린 이름 (정렬은 저장된 값이 기본)
+            sort_by: 정렬 필드
+            order: 정렬 순서 (asc, desc)
+            limit: 최대 결과 수
+
+        Returns:
+            스크린 결과
+
+        Raises:
+            LookupError: 저장된 스크린 없음
+            ScreenError: 조건식 오류
+            SnapshotUnavailable: 시장 스냅샷 없음
+        """
+        saved = None
+        if name:
+            saved = get_screen_store().get(name)
+            if saved is None:
+                raise LookupError(f"스크린을 찾을 수 없습니다: {name}")
+            expression = saved['expression']
+        if not expression:
+            raise ScreenError("expression 또는 name이 필요합니다")
+
+        result = run_screen(
+            expression,
+            sort_by=sort_by or (saved['sort_by'] if saved else 'score'),
+            order=order or (saved['order'] if saved else 'desc'),
+            limit=limit
+        )
+        result['name'] = name
+        logger.info(f"스크린 실행: {name or expression} → {result['matched']}/{result['universe']}개 ({result['took_ms']}ms)")
+        return result
+
+    @staticmethod
+    def save(name: str, expression: str, description: str = '', sort_by: str = 'score', order: str = 'desc') -> Dict:
+        """스크린 저장 (같은 이름은 덮어씀)"""
+        return get_screen_store().save(name, expression, description, sort_by, order)
+
+    @staticmethod
+    def get(name: str) -> Optional[Dict]:
+        """저장된 스크린 조회"""
+        return get_screen_store().get(name)
+
+    @staticmethod
+    def list() -> List[Dict]:
+        """저장된 스크린 목록"""
+        return get_screen_store().list()
+
+    @staticmethod
+    def delete(name: str) -> bool:
+        """저장된 스크린 삭제"""
+        return get_screen_store().delete(name)
+
+    @staticmethod
+    def fields() -> Dict[str, str]:
+        """조건식에 쓸 수 있는 필드와 설명"""
+        return dict(FIELDS)
@@ -0,0 +1,62 @@
+"""
+브리핑/뉴스 검색 비즈니스 로직
+"""
+from typing import Dict, Optional
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class SearchService:
+    """전문 검색 서비스"""
+
+    @staticmethod
+    def search(
+        query: str,
+        doc_type: Optional[str] = None,
+        symbol: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> Dict:
+        """
+        브리핑/뉴스 검색
+
+        Args:
+            query: 검색어
+            doc_type: 문서 유형 필터 (briefing, news)
+            symbol: 종목 필터
+            start_date: 시작일 (YYYY-MM-DD)
+            end_date: 종료일 (YYYY-MM-DD)
+            limit: 최대 결과 수
+            offset: 건너뛸 결과 수
+
+        Returns:
+            검색 결과 데이터
+        """
+        from search_index import get_search_index
+
+        # 종료일은 해당 날짜 전체를 포함하도록 확장
+        if end_date and len(end_date) == 10:
+            end_date = f"{end_date}T23:59:59.999999"
+
+        started = time.perf_counter()
+        results = get_search_index().search(
+            query,
+            doc_type=doc_type,
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            offset=offset
+        )
+        took_ms = (time.perf_counter() - started) * 1000
+
+        return {
+            "query": query,
+            "results": results,
+            "count": len(results),
+            "took_ms": round(took_ms, 2)
+        }
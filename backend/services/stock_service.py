@@ -5,6 +5,10 @@ from typing import List, Dict, Optional
 from datetime import datetime
 import logging
 
+import resilience
+from instrumentation import span
+from symbol_master import looks_like_symbol
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,20 +44,24 @@ class StockService:
 
         logger.info(f"화제 종목 조회 시작: screener_types={screener_types}, count={count}")
 
-        # 데이터 가져오기
-        stocks_data = get_trending_stocks(
-            screener_types=screener_types,
-            count=count
-        )
-
-        # 데이터 포맷팅
-        formatted_stocks = []
-        for screener_type, quotes in stocks_data.items():
-            for quote in quotes:
-                stock = format_stock_data(quote)
-                stock['screener_types'] = [screener_type]
-                stock['score'] = StockService._calculate_stock_score(stock)
-                formatted_stocks.append(stock)
+        # 워커 간 공유 스냅샷이 있으면 업스트림 조회 없이 사용
+        formatted_stocks = StockService._trending_from_snapshot(screener_types, count)
+
+        if formatted_stocks is None:
+            # 데이터 가져오기
+            stocks_data = get_trending_stocks(
+                screener_types=screener_types,
+                count=count
+            )
+
+            # 데이터 포맷팅
+            formatted_stocks = []
+            for screener_type, quotes in stocks_data.items():
+                for quote in quotes:
+                    stock = format_stock_data(quote)
+                    stock['screener_types'] = [screener_type]
+                    stock['score'] = StockService._calculate_stock_score(stock)
+                    formatted_stocks.append(stock)
 
         # 필터링
         if min_volume:
@@ -77,6 +85,46 @@ class StockService:
             "generated_at": datetime.now().isoformat()
         }
 
+    @staticmethod
+    def _trending_from_snapshot(screener_types: List[str], count: int) -> Optional[List[Dict]]:
+        """
+        공유 시장 스냅샷에서 스크리너별 상위 count개 종목 (get_trending_stocks 결과와 같은 형식)
+
+        Returns:
+            종목 리스트 또는 None (스냅샷이 없거나 오래됐거나 담지 않은 스크리너/개수)
+        """
+        import shared_snapshot
+
+        if count > shared_snapshot.SCREENER_COUNT or any(
+            screener_type not in shared_snapshot.SCREENERS for screener_type in screener_types
+        ):
+            return None
+
+        def select(view) -> List[Dict]:
+            import numpy as np
+
+            timestamp = datetime.fromtimestamp(view.updated_at).isoformat()
+            stocks = []
+            for screener_type in screener_types:
+                rank = view[f'rank_{screener_type}']
+                indices = np.flatnonzero((rank > 0) & (rank <= count))
+                for record in view.records(indices[np.argsort(rank[indices])]):
+                    stocks.append({
+                        'symbol': record['symbol'],
+                        'name': record['name'],
+                        'price': record['price'],
+                        'change': record['change'],
+                        'change_percent': record['change_percent'],
+                        'volume': record['volume'],
+                        'market_cap': record['market_cap'],
+                        'timestamp': timestamp,
+                        'screener_types': [screener_type],
+                        'score': record['score'],
+                    })
+            return stocks
+
+        return shared_snapshot.read_snapshot(select)
+
     @staticmethod
     def _calculate_stock_score(stock: Dict) -> float:
         """
@@ -136,13 +184,16 @@ class StockService:
         ticker = Ticker(symbol)
 
         # 기본 정보
-        quotes = ticker.quotes
+        with span('yahoo.ticker.quotes'):
+            quotes = resilience.call('yahoo', lambda: ticker.quotes, hedge=True)
         if symbol not in quotes or not quotes[symbol]:
             raise ValueError(f"종목을 찾을 수 없습니다: {symbol}")
 
         quote = quotes[symbol]
-        summary = ticker.summary_detail.get(symbol, {})
-        profile = ticker.summary_profile.get(symbol, {})
+        with span('yahoo.ticker.summary_detail'):
+            summary = resilience.call('yahoo', lambda: ticker.summary_detail, hedge=True).get(symbol, {})
+        with span('yahoo.ticker.summary_profile'):
+            profile = resilience.call('yahoo', lambda: ticker.summary_profile, hedge=True).get(symbol, {})
 
         result = {
             "symbol": symbol,
@@ -195,4 +246,4 @@ class StockService:
         Returns:
             유효 여부
         """
-        return symbol.isalpha() and symbol.isupper()
+        return looks_like_symbol(symbol)
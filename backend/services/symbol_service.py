@@ -0,0 +1,40 @@
+"""
+종목 검색 비즈니스 로직
+"""
+from typing import Dict, Optional
+import logging
+import time
+
+from symbol_master import get_symbol_master
+
+logger = logging.getLogger(__name__)
+
+
+class SymbolService:
+    """종목 마스터 검색 서비스 (외부 API 호출 없음)"""
+
+    @staticmethod
+    def search(query: str, limit: int = 10, symbol_type: Optional[str] = None) -> Dict:
+        """
+        티커/회사명/한글 별칭 자동완성 검색
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+            symbol_type: 종목 유형 필터 (EQUITY, ETF)
+
+        Returns:
+            검색 결과 데이터
+        """
+        master = get_symbol_master()
+
+        started = time.perf_counter()
+        results = master.search(query, limit=limit, type_=symbol_type)
+        took_ms = (time.perf_counter() - started) * 1000
+
+        return {
+            "query": query,
+            "results": results,
+            "count": len(results),
+            "took_ms": round(took_ms, 3)
+        }
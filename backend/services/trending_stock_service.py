@@ -6,6 +6,9 @@ from typing import Dict, List, Optional
 from datetime import datetime
 import logging
 
+import resilience
+from instrumentation import span, timed
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,7 +53,10 @@ class TrendingStockService:
             screener = Screener()
 
             # 스크리너 데이터 조회
-            data = screener.get_screeners([screener_type], count=count)
+            with span('yahoo.screener'):
+                data = resilience.call(
+                    'yahoo', lambda: screener.get_screeners([screener_type], count=count), hedge=True
+                )
 
             # 결과 확인 (DataFrame 또는 dict 처리)
             if data is None:
@@ -120,6 +126,7 @@ class TrendingStockService:
             raise Exception(f"Failed to get trending stock: {str(e)}")
 
     @staticmethod
+    @timed('yahoo.ticker_modules')
     def get_stock_detail(symbol: str) -> Dict:
         """
         종목 상세 정보 조회
@@ -271,7 +278,10 @@ class TrendingStockService:
             screener = Screener()
 
             # 스크리너 데이터 조회
-            data = screener.get_screeners(screener_types, count=count_per_screener)
+            with span('yahoo.screener'):
+                data = resilience.call(
+                    'yahoo', lambda: screener.get_screeners(screener_types, count=count_per_screener), hedge=True
+                )
 
             if data is None:
                 raise Exception("No data returned from screeners")
@@ -8,14 +8,28 @@ yahooquery Screener를 사용하여 화제 종목을 수집하고 Top1 종목의
 3. 상수 정의 - 매직 넘버 제거
 4. 타입 힌트 추가 - 가독성 향상
 """
-from typing import Dict, List, Optional, Any, Union
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Union
 from datetime import datetime
 import logging
-import pandas as pd
+import sys
+
+import resilience
+from instrumentation import span, timed
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 
+def _is_dataframe(data: Any) -> bool:
+    """pandas DataFrame 여부 (yahooquery가 pandas를 불러온 경우에만 DataFrame일 수 있음)"""
+    pandas = sys.modules.get('pandas')
+    return pandas is not None and isinstance(data, pandas.DataFrame)
+
+
 class TrendingStockService:
     """yahooquery Screener를 사용한 화제 종목 수집 서비스"""
 
@@ -65,7 +79,10 @@ class TrendingStockService:
 
             # Screener 데이터 조회
             screener = Screener()
-            data = screener.get_screeners([screener_type], count=count)
+            with span('yahoo.screener'):
+                data = resilience.call(
+                    'yahoo', lambda: screener.get_screeners([screener_type], count=count), hedge=True
+                )
 
             # Top1 종목 추출
             symbol, top_stock = TrendingStockService._extract_top_stock(data, screener_type)
@@ -166,7 +183,10 @@ class TrendingStockService:
 
             # Screener 데이터 조회
             screener = Screener()
-            data = screener.get_screeners(screener_types, count=count_per_screener)
+            with span('yahoo.screener'):
+                data = resilience.call(
+                    'yahoo', lambda: screener.get_screeners(screener_types, count=count_per_screener), hedge=True
+                )
 
             if data is None:
                 raise Exception("No data returned from screeners")
@@ -230,7 +250,7 @@ class TrendingStockService:
             (symbol, stock_data) 튜플
         """
         # DataFrame 처리
-        if isinstance(data, pd.DataFrame):
+        if _is_dataframe(data):
             return TrendingStockService._extract_from_dataframe(data, screener_type)
 
         # Dict 처리
@@ -290,9 +310,10 @@ class TrendingStockService:
     # ========================================================================
 
     @staticmethod
+    @timed('yahoo.ticker.quotes')
     def _get_ticker_quotes(ticker: Any, symbol: str) -> Dict:
         """Ticker에서 quotes 데이터 추출"""
-        quotes = ticker.quotes
+        quotes = resilience.call('yahoo', lambda: ticker.quotes, hedge=True)
 
         if not isinstance(quotes, dict):
             raise Exception(f"Invalid quotes data type: {type(quotes)}")
@@ -308,26 +329,32 @@ class TrendingStockService:
         return quote
 
     @staticmethod
+    @timed('yahoo.ticker.summary_detail')
     def _get_ticker_summary(ticker: Any, symbol: str) -> Dict:
         """Ticker에서 summary_detail 데이터 추출"""
-        if isinstance(ticker.summary_detail, dict) and symbol in ticker.summary_detail:
-            summary_data = ticker.summary_detail[symbol]
+        modules = resilience.call('yahoo', lambda: ticker.summary_detail, hedge=True)
+        if isinstance(modules, dict) and symbol in modules:
+            summary_data = modules[symbol]
             return summary_data if isinstance(summary_data, dict) else {}
         return {}
 
     @staticmethod
+    @timed('yahoo.ticker.summary_profile')
     def _get_ticker_profile(ticker: Any, symbol: str) -> Dict:
         """Ticker에서 summary_profile 데이터 추출"""
-        if isinstance(ticker.summary_profile, dict) and symbol in ticker.summary_profile:
-            profile_data = ticker.summary_profile[symbol]
+        modules = resilience.call('yahoo', lambda: ticker.summary_profile, hedge=True)
+        if isinstance(modules, dict) and symbol in modules:
+            profile_data = modules[symbol]
             return profile_data if isinstance(profile_data, dict) else {}
         return {}
 
     @staticmethod
+    @timed('yahoo.ticker.financial_data')
     def _get_ticker_financial(ticker: Any, symbol: str) -> Dict:
         """Ticker에서 financial_data 추출"""
-        if isinstance(ticker.financial_data, dict) and symbol in ticker.financial_data:
-            financial_data = ticker.financial_data[symbol]
+        modules = resilience.call('yahoo', lambda: ticker.financial_data, hedge=True)
+        if isinstance(modules, dict) and symbol in modules:
+            financial_data = modules[symbol]
             return financial_data if isinstance(financial_data, dict) else {}
         return {}
 
@@ -420,7 +447,7 @@ class TrendingStockService:
     def _process_multiple_screeners_data(data: Any, screener_types: List[str]) -> Dict:
         """여러 스크리너 데이터 처리"""
         # DataFrame 처리
-        if isinstance(data, pd.DataFrame):
+        if _is_dataframe(data):
             return TrendingStockService._process_dataframe_screeners(data, screener_types)
 
         # Dict 처리
@@ -0,0 +1,630 @@
+"""
+워커 간 공유 시장 스냅샷 (multiprocessing.shared_memory)
+
+uvicorn 워커를 여러 개 띄우면 프로세스마다 스크리너/시세를 따로 조회하고 따로 들고 있습니다.
+- 종목별 시세(가격, 변동률, 거래량, 시가총액, 점수, 스크리너 순위)를 고정 레이아웃 컬럼 버퍼로 공유 메모리에 둠
+- 잠금 파일(output/locks/market_snapshot.lock)을 잡은 프로세스 하나만 조회해서 기록
+  (그 프로세스가 죽으면 OS가 잠금을 풀고 다른 워커가 이어받음)
+- 나머지 워커는 복사 없이 NumPy 뷰로 읽음
+
+쓰기는 슬롯 2개를 번갈아 쓰는 이중 버퍼 + 시퀀스 잠금(seqlock)입니다.
+    seq 홀수로 증가 → 비활성 슬롯에 기록 → 활성 슬롯 전환 → seq 짝수로 증가
+읽기는 시작할 때의 seq와 끝난 뒤의 seq를 비교해서, 읽는 동안 자기 슬롯에 다음 쓰기가 시작됐으면 다시 읽습니다.
+(바로 다음 갱신은 다른 슬롯에 쓰므로, 갱신 주기 안에 끝나는 읽기는 재시도하지 않음)
+
+사용 예:
+    n = read_snapshot(lambda view: int((view['change_percent'] > 5).sum()))
+    if n is None:
+        ...  # 스냅샷 없음 / 오래됨 → 기존 조회 경로
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import zlib
+from datetime import datetime
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# 공유 메모리 이름 / 최대 종목 수
+SNAPSHOT_NAME = os.getenv('MARKET_SNAPSHOT_NAME', 'syr_market_snapshot')
+CAPACITY = int(os.getenv('MARKET_SNAPSHOT_CAPACITY', '8192'))
+
+# 갱신 주기 (초) / 이보다 오래된 스냅샷은 읽지 않음 (스크리너 스냅샷 유효 시간과 같음)
+REFRESH_INTERVAL = float(os.getenv('MARKET_SNAPSHOT_REFRESH_SECONDS', '60'))
+MAX_AGE = 15 * 60
+
+# 스냅샷에 담을 스크리너 / 스크리너당 종목 수 (API count 최대값 이상)
+SCREENERS = ('most_actives', 'day_gainers', 'day_losers')
+SCREENER_COUNT = 100
+
+# 추가 종목 다종목 quotes 요청 1번에 넣을 종목 수
+QUOTE_BATCH_SIZE = 100
+
+# 다른 워커가 아직 스냅샷을 만들지 않았을 때 다시 연결해 볼 간격 (초)
+ATTACH_RETRY_SECONDS = 5.0
+
+LOCK_PATH = Path(__file__).parent / 'output' / 'locks' / 'market_snapshot.lock'
+
+# 컬럼 (이름, NumPy dtype) - 바꾸면 LAYOUT_ID가 달라져서 기존 세그먼트를 다시 만듦
+COLUMNS = (
+    ('symbol', 'S16'),
+    ('name', 'S64'),
+    ('price', '<f8'),
+    ('change', '<f8'),
+    ('change_percent', '<f8'),
+    ('volume', '<i8'),
+    ('avg_volume', '<i8'),
+    ('market_cap', '<i8'),
+    ('score', '<f8'),
+) + tuple((f'rank_{screener_type}', '<i2') for screener_type in SCREENERS)
+
+TEXT_COLUMNS = ('symbol', 'name')
+
+MAGIC = b'SYRSNAP1'
+LAYOUT_ID = zlib.crc32(repr(COLUMNS).encode())
+
+_HEADER_SIZE = 128
+_ALIGN = 64
+
+
+class SnapshotUnavailable(RuntimeError):
+    """스냅샷이 없거나 레이아웃이 맞지 않거나 계속 갱신 중이라 읽지 못함"""
+
+
+def _header_dtype():
+    import numpy as np
+
+    return np.dtype([
+        ('magic', 'S8'),
+        ('layout', '<u4'),
+        ('capacity', '<u4'),
+        ('seq', '<u8'),
+        ('version', '<u8'),
+        ('active', '<u4'),
+        ('writer_pid', '<u4'),
+        ('count', '<u8', (2,)),
+        ('updated_at', '<f8', (2,)),
+        ('heartbeat', '<f8'),
+    ])
+
+
+def _aligned(size: int) -> int:
+    return (size + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _column_offsets(capacity: int):
+    """슬롯 안 컬럼별 오프셋, 슬롯 크기"""
+    import numpy as np
+
+    offsets, position = {}, 0
+    for name, dtype in COLUMNS:
+        offsets[name] = position
+        position += _aligned(np.dtype(dtype).itemsize * capacity)
+    return offsets, position
+
+
+def segment_size(capacity: int = CAPACITY) -> int:
+    """공유 메모리 세그먼트 크기 (바이트)"""
+    return _HEADER_SIZE + 2 * _column_offsets(capacity)[1]
+
+
+def _unlink_segment(segment: shared_memory.SharedMemory) -> None:
+    """세그먼트 삭제 (_open_segment로 추적을 끈 세그먼트용)"""
+    try:
+        from multiprocessing import resource_tracker
+
+        # Python 3.12 이하의 unlink()는 추적 해제를 함께 요청하므로 다시 등록해 둠
+        if getattr(segment, '_track', True):
+            resource_tracker.register(segment._name, 'shared_memory')
+    except Exception:
+        pass
+    segment.unlink()
+
+
+def _open_segment(name: str, create: bool, size: int = 0) -> shared_memory.SharedMemory:
+    """
+    세그먼트 생성/연결 (resource_tracker에 등록하지 않음)
+
+    등록하면 만든 프로세스나 연결한 프로세스가 끝날 때 세그먼트가 지워져서 다른 워커가 읽던 스냅샷이 사라집니다.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, create=create, size=size, track=False)
+    except TypeError:
+        # Python 3.12 이하: track 인자가 없어서 등록 후 해제
+        from multiprocessing import resource_tracker
+
+        segment = shared_memory.SharedMemory(name=name, create=create, size=size)
+        try:
+            resource_tracker.unregister(segment._name, 'shared_memory')
+        except Exception:
+            pass
+        return segment
+
+
+# ============================================================================
+# 읽기 뷰
+# ============================================================================
+
+class SnapshotView:
+    """
+    스냅샷 한 버전의 컬럼 뷰 (공유 메모리를 그대로 가리키는 읽기 전용 NumPy 배열)
+
+    read()에 넘긴 함수 안에서만 유효합니다. 결과에 뷰를 그대로 담지 말고 계산 결과나 records()로 꺼낸 값을 반환하세요.
+    """
+
+    def __init__(self, columns: Dict[str, 'np.ndarray'], version: int, updated_at: float):
+        self.columns = columns
+        self.version = version
+        self.updated_at = updated_at
+
+    def __getitem__(self, name: str) -> 'np.ndarray':
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return len(self.columns['symbol'])
+
+    def records(self, indices: Optional[Iterable[int]] = None) -> List[Dict]:
+        """행을 파이썬 값 딕셔너리로 복사 (indices가 None이면 전체)"""
+        import numpy as np
+
+        if indices is None:
+            rows = slice(None)
+        else:
+            rows = np.asarray(indices if hasattr(indices, '__len__') else list(indices), dtype=np.intp)
+
+        # 컬럼별로 한 번에 꺼낸 뒤 행으로 묶음 (값마다 .item() 호출하는 것보다 훨씬 빠름)
+        names = [name for name, _ in COLUMNS]
+        values = []
+        for name in names:
+            column = self.columns[name][rows].tolist()
+            if name in TEXT_COLUMNS:
+                column = [value.decode('utf-8', errors='ignore') for value in column]
+            values.append(column)
+        return [dict(zip(names, row)) for row in zip(*values)]
+
+
+# ============================================================================
+# 공유 메모리 스냅샷
+# ============================================================================
+
+class MarketSnapshot:
+    """공유 메모리에 놓인 이중 버퍼 컬럼 스냅샷"""
+
+    def __init__(self, segment: shared_memory.SharedMemory):
+        import numpy as np
+
+        self.segment = segment
+        self._header = np.ndarray((), dtype=_header_dtype(), buffer=segment.buf)
+        if self._header['magic'] != MAGIC or int(self._header['layout']) != LAYOUT_ID:
+            raise SnapshotUnavailable(f"스냅샷 레이아웃이 다름: {segment.name}")
+        self.capacity = int(self._header['capacity'])
+        offsets, slot_size = _column_offsets(self.capacity)
+        if segment.size < _HEADER_SIZE + 2 * slot_size:
+            raise SnapshotUnavailable(f"스냅샷 크기가 다름: {segment.name}")
+
+        # 슬롯별 전체 용량 컬럼 뷰 (읽기 전용 사본은 _read_views)
+        self._slots = []
+        self._read_views = []
+        for slot in range(2):
+            base = _HEADER_SIZE + slot * slot_size
+            views, read_views = {}, {}
+            for name, dtype in COLUMNS:
+                array = np.ndarray((self.capacity,), dtype=dtype, buffer=segment.buf, offset=base + offsets[name])
+                views[name] = array
+                read_views[name] = array.view()
+                read_views[name].flags.writeable = False
+            self._slots.append(views)
+            self._read_views.append(read_views)
+
+    @classmethod
+    def create(cls, name: str = SNAPSHOT_NAME, capacity: int = CAPACITY) -> 'MarketSnapshot':
+        """
+        세그먼트 생성 (이미 있고 레이아웃이 같으면 그대로 이어서 사용)
+
+        갱신 프로세스만 호출합니다 (잠금을 잡은 상태에서).
+        """
+        size = segment_size(capacity)
+        try:
+            segment = _open_segment(name, create=True, size=size)
+        except FileExistsError:
+            segment = _open_segment(name, create=False)
+            try:
+                snapshot = cls(segment)
+            except SnapshotUnavailable:
+                snapshot = None
+            if snapshot is not None and snapshot.capacity == capacity:
+                return snapshot
+            logger.warning(f"기존 스냅샷 세그먼트 레이아웃이 달라 다시 만듭니다: {name}")
+            if snapshot is not None:
+                snapshot.close()
+            else:
+                segment.close()
+            _unlink_segment(segment)
+            segment = _open_segment(name, create=True, size=size)
+
+        import numpy as np
+
+        header = np.ndarray((), dtype=_header_dtype(), buffer=segment.buf)
+        header['magic'] = MAGIC
+        header['layout'] = LAYOUT_ID
+        header['capacity'] = capacity
+        return cls(segment)
+
+    @classmethod
+    def attach(cls, name: str = SNAPSHOT_NAME) -> 'MarketSnapshot':
+        """
+        기존 세그먼트에 연결 (읽기 워커)
+
+        Raises:
+            FileNotFoundError: 아직 만들어지지 않음
+            SnapshotUnavailable: 레이아웃이 다름
+        """
+        return cls(_open_segment(name, create=False))
+
+    @property
+    def version(self) -> int:
+        """기록된 버전 수 (0이면 아직 한 번도 기록되지 않음)"""
+        return int(self._header['version'])
+
+    def info(self) -> Dict:
+        """현재 활성 슬롯 정보"""
+        active = int(self._header['active'])
+        updated_at = float(self._header['updated_at'][active])
+        return {
+            'name': self.segment.name,
+            'version': self.version,
+            'count': int(self._header['count'][active]),
+            'capacity': self.capacity,
+            'updated_at': datetime.fromtimestamp(updated_at).isoformat() if updated_at else None,
+            'age_seconds': round(time.time() - updated_at, 1) if updated_at else None,
+            'writer_pid': int(self._header['writer_pid']),
+            'size_bytes': self.segment.size,
+        }
+
+    def publish(self, rows: Sequence[Dict]) -> int:
+        """
+        행 목록을 비활성 슬롯에 기록하고 활성 슬롯으로 전환 (갱신 프로세스 전용)
+
+        Args:
+            rows: COLUMNS 이름을 키로 가진 딕셔너리 목록 (없는 값은 0 / 빈 문자열)
+
+        Returns:
+            새 버전
+        """
+        import numpy as np
+
+        if len(rows) > self.capacity:
+            logger.warning(f"스냅샷 용량 초과: {len(rows)}개 중 {self.capacity}개만 기록")
+            rows = rows[:self.capacity]
+        count = len(rows)
+
+        header = self._header
+        target = 1 - int(header['active'])
+        views = self._slots[target]
+
+        header['seq'] += 1  # 홀수: 쓰기 시작
+        for name, dtype in COLUMNS:
+            if name in TEXT_COLUMNS:
+                width = np.dtype(dtype).itemsize
+                values = [str(row.get(name) or '').encode('utf-8')[:width] for row in rows]
+            else:
+                values = [row.get(name) or 0 for row in rows]
+            if count:
+                views[name][:count] = np.asarray(values, dtype=dtype)
+            views[name][count:] = 0
+        header['count'][target] = count
+        header['updated_at'][target] = time.time()
+        header['writer_pid'] = os.getpid()
+        header['heartbeat'] = time.time()
+        header['active'] = target
+        header['version'] += 1
+        header['seq'] += 1  # 짝수: 쓰기 끝
+        return int(header['version'])
+
+    def read(self, func: Callable[[SnapshotView], T], retries: int = 5) -> T:
+        """
+        현재 버전 뷰로 func 실행 (읽는 동안 같은 슬롯에 쓰기가 시작됐으면 다시 실행)
+
+        Raises:
+            SnapshotUnavailable: 아직 기록된 버전이 없거나 재시도 후에도 일관된 읽기 실패
+        """
+        header = self._header
+        for _ in range(retries):
+            start = int(header['seq'])
+            active = int(header['active'])
+            version = int(header['version'])
+            count = int(header['count'][active])
+            updated_at = float(header['updated_at'][active])
+            if version == 0:
+                raise SnapshotUnavailable("스냅샷이 아직 기록되지 않음")
+
+            views = self._read_views[active]
+            result = func(SnapshotView({name: views[name][:count] for name, _ in COLUMNS}, version, updated_at))
+
+            # 활성 슬롯은 seq가 (start // 2) * 2 + 3이 되는 쓰기부터 덮어써짐
+            if int(header['seq']) <= start // 2 * 2 + 2:
+                return result
+        raise SnapshotUnavailable("스냅샷 갱신 중이라 일관된 읽기 실패")
+
+    def close(self) -> None:
+        """이 프로세스의 매핑 해제 (세그먼트는 남음)"""
+        self._slots = self._read_views = []
+        self._header = None
+        try:
+            self.segment.close()
+        except BufferError:
+            # 아직 남아 있는 뷰가 있으면 프로세스 종료 때 해제됨
+            pass
+
+    def unlink(self) -> None:
+        """세그먼트 삭제 (운영 정리용, 읽던 워커는 다시 연결해야 함)"""
+        _unlink_segment(self.segment)
+
+
+# ============================================================================
+# 스냅샷 데이터 수집
+# ============================================================================
+
+def _row_from_quote(quote: Dict) -> Dict:
+    """Yahoo quote → 스냅샷 행 (화제 종목 API와 같은 필드/점수)"""
+    from get_trending_stocks import format_stock_data
+    from services.stock_service import StockService
+
+    stock = format_stock_data(quote)
+    stock.pop('timestamp', None)
+    stock['avg_volume'] = quote.get('averageDailyVolume3Month') or quote.get('averageDailyVolume10Day') or 0
+    stock['score'] = StockService._calculate_stock_score(stock)
+    return stock
+
+
+def _fetch_quotes(symbols: List[str]) -> Dict[str, Dict]:
+    import resilience
+    from instrumentation import span
+    from yahooquery import Ticker
+
+    ticker = Ticker(symbols)
+    with span('yahoo.ticker.quotes_batch'):
+        quotes = resilience.call('yahoo', lambda: ticker.quotes, hedge=True)
+    if not isinstance(quotes, dict):
+        return {}
+    return {symbol: quote for symbol, quote in quotes.items() if isinstance(quote, dict)}
+
+
+def collect_rows(symbols: Iterable[str] = ()) -> List[Dict]:
+    """
+    스냅샷에 기록할 행 수집 (스크리너 3종 + 추가 종목)
+
+    Args:
+        symbols: 스크리너에 없더라도 포함할 종목 (다종목 quotes로 조회)
+
+    Returns:
+        스냅샷 행 목록 (rank_<스크리너>: 해당 스크리너 순위, 없으면 0)
+    """
+    from get_trending_stocks import get_screener_snapshot
+
+    rows: Dict[str, Dict] = {}
+    screeners = get_screener_snapshot(list(SCREENERS), count=SCREENER_COUNT, max_age=None)
+    for screener_type in SCREENERS:
+        for rank, quote in enumerate(screeners.get(screener_type, []), start=1):
+            symbol = quote.get('symbol')
+            if not symbol:
+                continue
+            if symbol not in rows:
+                rows[symbol] = _row_from_quote(quote)
+            rows[symbol][f'rank_{screener_type}'] = rank
+
+    extra = [symbol for symbol in dict.fromkeys(symbols) if symbol not in rows]
+    for start in range(0, len(extra), QUOTE_BATCH_SIZE):
+        batch = extra[start:start + QUOTE_BATCH_SIZE]
+        try:
+            quotes = _fetch_quotes(batch)
+        except Exception as e:
+            logger.warning(f"스냅샷 추가 종목 조회 실패 ({len(batch)}개): {str(e)}")
+            continue
+        for symbol, quote in quotes.items():
+            rows[symbol] = _row_from_quote({'symbol': symbol, **quote})
+
+    return list(rows.values())
+
+
+# ============================================================================
+# 갱신 프로세스 / 읽기 진입점
+# ============================================================================
+
+def _try_lock(path: Path):
+    """잠금 파일 비차단 획득 (프로세스가 끝나면 OS가 해제, 실패하면 None)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle = open(path, 'a+b')
+    try:
+        try:
+            import fcntl
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except ImportError:
+            import msvcrt
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
+
+class SnapshotRefresher(threading.Thread):
+    """
+    스냅샷 갱신 스레드
+
+    모든 워커에서 띄워도 잠금 파일을 잡은 프로세스 하나만 조회/기록하고,
+    나머지는 갱신 주기마다 잠금을 다시 시도합니다 (갱신 프로세스가 죽으면 이어받음).
+    """
+
+    def __init__(
+        self,
+        interval: float = REFRESH_INTERVAL,
+        name: str = SNAPSHOT_NAME,
+        capacity: int = CAPACITY,
+        symbols: Optional[Callable[[], Iterable[str]]] = None,
+        lock_path: Path = LOCK_PATH
+    ):
+        super().__init__(name='market-snapshot-refresher', daemon=True)
+        self.interval = interval
+        self.segment_name = name
+        self.capacity = capacity
+        self.symbols = symbols
+        self.lock_path = lock_path
+        self.stopped = threading.Event()
+        self.snapshot: Optional[MarketSnapshot] = None
+        self._lock_handle = None
+
+    @property
+    def is_writer(self) -> bool:
+        return self._lock_handle is not None
+
+    def refresh_once(self) -> int:
+        """한 번 수집해서 기록 (새 버전 반환)"""
+        started = time.perf_counter()
+        rows = collect_rows(self.symbols() if self.symbols else ())
+        # 섹터 집계용 종목 프로필 (없거나 오래된 종목만, 기록 전에 채워서 새 버전과 함께 반영)
+        try:
+            from market_sectors import refresh_profiles
+            refresh_profiles(row['symbol'] for row in rows)
+        except Exception as e:
+            logger.warning(f"종목 프로필 갱신 실패: {str(e)}")
+        version = self.snapshot.publish(rows)
+        logger.info(
+            f"시장 스냅샷 갱신: v{version}, {len(rows)}개 종목 ({(time.perf_counter() - started) * 1000:.0f}ms)"
+        )
+        return version
+
+    def run(self) -> None:
+        wait = 0.0
+        while not self.stopped.wait(wait):
+            wait = self.interval
+            if self._lock_handle is None:
+                self._lock_handle = _try_lock(self.lock_path)
+                if self._lock_handle is None:
+                    continue
+                try:
+                    self.snapshot = MarketSnapshot.create(self.segment_name, self.capacity)
+                except Exception as e:
+                    logger.error(f"시장 스냅샷 세그먼트 생성 실패: {str(e)}")
+                    self._release()
+                    continue
+                logger.info(f"시장 스냅샷 갱신 프로세스: pid={os.getpid()} ({self.segment_name})")
+                _set_attached(self.snapshot)
+            try:
+                self.refresh_once()
+            except Exception as e:
+                logger.warning(f"시장 스냅샷 갱신 실패: {str(e)}")
+
+    def stop(self) -> None:
+        """갱신 중지 및 잠금 해제 (세그먼트는 다른 워커가 계속 읽도록 남김)"""
+        self.stopped.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout=5)
+        self._release()
+
+    def _release(self) -> None:
+        if self._lock_handle is not None:
+            self._lock_handle.close()
+            self._lock_handle = None
+
+
+_attached: Optional[MarketSnapshot] = None
+_attach_attempted_at = 0.0
+_attach_lock = threading.Lock()
+
+
+def _set_attached(snapshot: MarketSnapshot) -> None:
+    global _attached
+    with _attach_lock:
+        _attached = snapshot
+
+
+def get_snapshot() -> Optional[MarketSnapshot]:
+    """
+    이 프로세스의 스냅샷 연결 (없으면 ATTACH_RETRY_SECONDS 간격으로 다시 연결 시도)
+
+    Returns:
+        MarketSnapshot 또는 None (아직 갱신 프로세스가 만들지 않음)
+    """
+    global _attached, _attach_attempted_at
+    with _attach_lock:
+        if _attached is not None:
+            return _attached
+        now = time.monotonic()
+        if now - _attach_attempted_at < ATTACH_RETRY_SECONDS:
+            return None
+        _attach_attempted_at = now
+        try:
+            _attached = MarketSnapshot.attach(SNAPSHOT_NAME)
+        except (FileNotFoundError, SnapshotUnavailable) as e:
+            logger.debug(f"시장 스냅샷 연결 실패: {str(e)}")
+            return None
+        return _attached
+
+
+def read_snapshot(func: Callable[[SnapshotView], T], max_age: float = MAX_AGE) -> Optional[T]:
+    """
+    공유 스냅샷으로 func 실행
+
+    Args:
+        func: SnapshotView를 받아 결과를 반환하는 함수 (뷰를 결과에 담지 말 것)
+        max_age: 허용할 스냅샷 나이 (초)
+
+    Returns:
+        func 결과 또는 None (스냅샷이 없거나, max_age보다 오래됐거나, 읽기 실패 - 호출한 쪽에서 기존 경로 사용)
+    """
+    snapshot = get_snapshot()
+    if snapshot is None:
+        return None
+
+    def guarded(view: SnapshotView):
+        if time.time() - view.updated_at > max_age:
+            return None
+        return func(view)
+
+    try:
+        return snapshot.read(guarded)
+    except SnapshotUnavailable as e:
+        logger.debug(f"시장 스냅샷 읽기 실패: {str(e)}")
+        return None
+
+
+def start_refresher(symbols: Optional[Callable[[], Iterable[str]]] = None) -> SnapshotRefresher:
+    """갱신 스레드 시작 (서버 시작 시, 워커마다 호출해도 기록은 한 프로세스만)"""
+    refresher = SnapshotRefresher(symbols=symbols)
+    refresher.start()
+    return refresher
+
+
+if __name__ == "__main__":
+    # 별도 갱신 프로세스로 실행: python shared_snapshot.py [--unlink]
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    if '--unlink' in sys.argv:
+        try:
+            MarketSnapshot.attach().unlink()
+            print(f"삭제: {SNAPSHOT_NAME}")
+        except FileNotFoundError:
+            print(f"없음: {SNAPSHOT_NAME}")
+        sys.exit(0)
+
+    refresher = SnapshotRefresher()
+    refresher.start()
+    try:
+        while refresher.is_alive():
+            refresher.join(timeout=1)
+    except KeyboardInterrupt:
+        refresher.stop()
@@ -0,0 +1,337 @@
+"""
+종목 마스터 (data/symbols.csv) 및 자동완성 검색 인덱스
+
+- 티커 접두어: 정렬된 키 목록에서 이분 탐색 (AAP → AAPL)
+- 회사명/한글 별칭 접두어: 단어별 키와 공백을 뺀 전체 키 (micro → Microsoft, Micron / 엔비 → 엔비디아)
+- 오타 허용: 회사명/별칭 trigram 역색인 + Dice 계수 (nvidai → NVIDIA, 테슬러 → 테슬라)
+같은 점수면 파일 순서(대형주/인기 종목이 앞쪽)대로 정렬합니다.
+인덱스는 처음 조회할 때 한 번 만들고 프로세스 동안 재사용합니다 (수백~수천 종목 기준 조회 1ms 미만).
+
+사용 예:
+    master = get_symbol_master()
+    master.search("엔비", limit=5)
+    master.resolve("apple")   # 'AAPL'
+"""
+import csv
+import logging
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SYMBOLS_PATH = Path(__file__).parent / 'data' / 'symbols.csv'
+
+# 접두어 검색에서 확인할 최대 키 수 (한 글자 검색어처럼 후보가 많을 때 상한)
+MAX_PREFIX_SCAN = 256
+
+# 오타 허용 검색 최소 Dice 계수 / 이름으로 심볼을 확정할 최소 Dice 계수
+FUZZY_MIN_SIMILARITY = 0.4
+RESOLVE_MIN_SIMILARITY = 0.5
+
+# 점수 (정확 일치 > 티커 접두어 > 이름 일치 > 이름 접두어 > 오타 허용)
+SCORE_SYMBOL = 1.0
+SCORE_NAME = 0.95
+SCORE_SYMBOL_PREFIX = 0.9
+SCORE_NAME_PREFIX = 0.8
+SCORE_FUZZY = 0.7
+
+# 회사명 색인에서 뺄 법인 형태 단어
+_NAME_STOPWORDS = {
+    'inc', 'incorporated', 'corp', 'corporation', 'co', 'company', 'companies', 'ltd', 'limited',
+    'plc', 'holdings', 'holding', 'group', 'class', 'the', 'nv', 'sa', 'ag', 'lp', 'trust', 'and',
+}
+
+_WORD = re.compile(r'[0-9a-z가-힣&]+')
+_SYMBOL_PATTERN = re.compile(r'^[A-Z]{1,10}([.-][A-Z]{1,3})?$')
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화 (전각/호환 문자 통일, 소문자, 기호는 공백)"""
+    text = unicodedata.normalize('NFKC', text or '').lower()
+    return ' '.join(_WORD.findall(text))
+
+
+def symbol_key(symbol: str) -> str:
+    """티커 비교 키 (BRK-B, BRK.B, brkb 모두 'brkb')"""
+    return re.sub(r'[^0-9a-z]', '', (symbol or '').lower())
+
+
+def trigrams(text: str) -> set:
+    """
+    앞뒤 공백을 붙인 3글자 조각
+
+    한글은 자모로 풀어서 자릅니다 (음절 단위로는 '테슬러'와 '테슬라'가 조각을 1개만 공유).
+    """
+    padded = f" {unicodedata.normalize('NFD', text)} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def looks_like_symbol(text: str) -> bool:
+    """티커 형식 여부 (대문자 알파벳, 클래스 구분은 - 또는 .)"""
+    return bool(_SYMBOL_PATTERN.match(text or ''))
+
+
+@dataclass(frozen=True)
+class Listing:
+    """상장 종목 1개"""
+    symbol: str
+    name: str
+    exchange: str
+    type: str
+    aliases: Tuple[str, ...] = ()
+
+    def to_dict(self) -> Dict:
+        return {
+            'symbol': self.symbol,
+            'name': self.name,
+            'exchange': self.exchange,
+            'type': self.type,
+            'aliases': list(self.aliases),
+        }
+
+
+class SymbolMaster:
+    """종목 마스터 + 티커/이름 접두어 인덱스 + trigram 인덱스"""
+
+    def __init__(self, listings: List[Listing]):
+        self.listings = listings
+        self._by_symbol_key: Dict[str, int] = {}
+        self._by_name: Dict[str, int] = {}
+
+        symbol_keys: List[Tuple[str, int]] = []
+        name_keys: List[Tuple[str, int]] = []
+        # 필드(회사명 / 별칭)별 trigram 수, 소속 종목
+        self._field_owner: List[int] = []
+        self._field_size: List[int] = []
+        self._grams: Dict[str, List[int]] = defaultdict(list)
+
+        for index, listing in enumerate(listings):
+            key = symbol_key(listing.symbol)
+            self._by_symbol_key.setdefault(key, index)
+            symbol_keys.append((key, index))
+
+            for text in (listing.name, *listing.aliases):
+                words = [word for word in normalize(text).split() if word not in _NAME_STOPWORDS]
+                if not words:
+                    continue
+                compact = ''.join(words)
+                self._by_name.setdefault(compact, index)
+                name_keys.append((compact, index))
+                name_keys.extend((word, index) for word in words[1:])
+
+                field = len(self._field_owner)
+                grams = trigrams(compact)
+                self._field_owner.append(index)
+                self._field_size.append(len(grams))
+                for gram in grams:
+                    self._grams[gram].append(field)
+
+        symbol_keys.sort()
+        name_keys = sorted(set(name_keys))
+        self._symbol_keys = [key for key, _ in symbol_keys]
+        self._symbol_ids = [index for _, index in symbol_keys]
+        self._name_keys = [key for key, _ in name_keys]
+        self._name_ids = [index for _, index in name_keys]
+
+    @classmethod
+    def load(cls, path: Path = SYMBOLS_PATH) -> 'SymbolMaster':
+        """
+        CSV 로드 (symbol, name, exchange, type, aliases - 별칭은 '|'로 구분)
+
+        Returns:
+            SymbolMaster (파일이 없으면 빈 마스터)
+        """
+        listings: List[Listing] = []
+        seen = set()
+        try:
+            with open(path, encoding='utf-8', newline='') as f:
+                for row in csv.DictReader(f):
+                    symbol = (row.get('symbol') or '').strip().upper()
+                    if not symbol or symbol in seen:
+                        continue
+                    seen.add(symbol)
+                    listings.append(Listing(
+                        symbol=symbol,
+                        name=(row.get('name') or '').strip(),
+                        exchange=(row.get('exchange') or '').strip(),
+                        type=(row.get('type') or 'EQUITY').strip(),
+                        aliases=tuple(alias.strip() for alias in (row.get('aliases') or '').split('|') if alias.strip()),
+                    ))
+        except FileNotFoundError:
+            logger.warning(f"종목 마스터 파일 없음: {path}")
+        logger.info(f"종목 마스터 로드: {len(listings)}개 종목")
+        return cls(listings)
+
+    @property
+    def symbols(self) -> List[str]:
+        """전체 티커"""
+        return [listing.symbol for listing in self.listings]
+
+    def get(self, symbol: str) -> Optional[Listing]:
+        """티커로 종목 조회 (BRK.B / brk-b 등 표기 차이 무시)"""
+        index = self._by_symbol_key.get(symbol_key(symbol))
+        return self.listings[index] if index is not None else None
+
+    # ========================================================================
+    # 검색
+    # ========================================================================
+
+    @staticmethod
+    def _scan_prefix(keys: List[str], ids: List[int], prefix: str):
+        start = bisect_left(keys, prefix)
+        for position in range(start, min(start + MAX_PREFIX_SCAN, len(keys))):
+            key = keys[position]
+            if not key.startswith(prefix):
+                break
+            yield key, ids[position]
+
+    def _fuzzy(self, text: str) -> Dict[int, float]:
+        """종목별 최대 Dice 계수 (회사명/별칭 중 가장 비슷한 필드)"""
+        grams = trigrams(text)
+        counts: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for field in self._grams.get(gram, ()):
+                counts[field] += 1
+
+        similarity: Dict[int, float] = {}
+        for field, common in counts.items():
+            dice = 2 * common / (len(grams) + self._field_size[field])
+            owner = self._field_owner[field]
+            if dice > similarity.get(owner, 0.0):
+                similarity[owner] = dice
+        return similarity
+
+    def search(self, query: str, limit: int = 10, type_: Optional[str] = None) -> List[Dict]:
+        """
+        티커/회사명/한글 별칭 검색
+
+        Args:
+            query: 검색어 (AAP, apple, 애플, nvidai ...)
+            limit: 최대 결과 수
+            type_: 종목 유형 필터 (EQUITY, ETF)
+
+        Returns:
+            점수 순 종목 목록 (match: symbol / symbol_prefix / name / name_prefix / fuzzy)
+        """
+        text = ''.join(normalize(query).split())
+        ticker = symbol_key(query)
+        scores: Dict[int, Tuple[float, str]] = {}
+
+        def offer(index: int, score: float, match: str) -> None:
+            if index not in scores or score > scores[index][0]:
+                scores[index] = (score, match)
+
+        if ticker:
+            exact = self._by_symbol_key.get(ticker)
+            if exact is not None:
+                offer(exact, SCORE_SYMBOL, 'symbol')
+            for _, index in self._scan_prefix(self._symbol_keys, self._symbol_ids, ticker):
+                offer(index, SCORE_SYMBOL_PREFIX, 'symbol_prefix')
+
+        if text:
+            exact = self._by_name.get(text)
+            if exact is not None:
+                offer(exact, SCORE_NAME, 'name')
+            for _, index in self._scan_prefix(self._name_keys, self._name_ids, text):
+                offer(index, SCORE_NAME_PREFIX, 'name_prefix')
+
+            if len(scores) < limit and len(text) >= 2:
+                for index, dice in self._fuzzy(text).items():
+                    if dice >= FUZZY_MIN_SIMILARITY:
+                        offer(index, SCORE_FUZZY * dice, 'fuzzy')
+
+        # 같은 점수면 파일 순서 (대형주/인기 종목이 앞쪽)
+        ranked = sorted(
+            (
+                (score, index, match)
+                for index, (score, match) in scores.items()
+                if type_ is None or self.listings[index].type == type_
+            ),
+            key=lambda item: (-item[0], item[1])
+        )
+        return [
+            {**self.listings[index].to_dict(), 'match': match, 'score': round(score, 3)}
+            for score, index, match in ranked[:limit]
+        ]
+
+    def resolve(self, query: str) -> Optional[str]:
+        """
+        티커 또는 회사명/별칭을 티커로 변환
+
+        대문자로 입력한 티커 형식(ALL, MAT ...)은 마스터에 없어도 그대로 돌려주고
+        이름 접두어/오타 허용 결과로 바꾸지 않습니다 (ALL → WBA 같은 오변환 방지).
+        시세 조회로도 없는 티커일 때의 이름 검색은 resolve_name()으로 따로 합니다.
+
+        Returns:
+            티커 또는 None (찾지 못함)
+        """
+        query = (query or '').strip()
+        if not query:
+            return None
+
+        listing = self.get(query)
+        if listing is not None:
+            return listing.symbol
+        if looks_like_symbol(query):
+            return query
+
+        symbol = self.resolve_name(query)
+        if symbol is not None:
+            return symbol
+
+        if looks_like_symbol(query.upper()):
+            return query.upper()
+        return None
+
+    def resolve_name(self, query: str, allow_partial: bool = True) -> Optional[str]:
+        """
+        회사명/별칭으로 티커 찾기
+
+        Args:
+            query: 회사명 또는 별칭
+            allow_partial: 이름 접두어/오타 허용 결과도 사용 (1위가 분명할 때만)
+
+        Returns:
+            티커 또는 None (찾지 못했거나 하나로 정할 수 없음)
+        """
+        text = ''.join(normalize(query).split())
+        if not text:
+            return None
+        if text in self._by_name:
+            return self.listings[self._by_name[text]].symbol
+        if not allow_partial:
+            return None
+
+        # 이름 접두어/오타 허용 결과는 1위가 분명할 때만 (micro → AMD, MSFT, MU ... 는 확정하지 않음)
+        hits = self.search(query, limit=2)
+        if hits and hits[0]['match'] in ('name_prefix', 'fuzzy'):
+            top = hits[0]
+            unique = len(hits) == 1 or hits[1]['score'] < top['score']
+            if unique and (top['match'] == 'name_prefix' or top['score'] >= SCORE_FUZZY * RESOLVE_MIN_SIMILARITY):
+                return top['symbol']
+        return None
+
+
+_default_master: Optional[SymbolMaster] = None
+_master_lock = threading.Lock()
+
+
+def get_symbol_master() -> SymbolMaster:
+    """기본 종목 마스터 반환 (처음 호출할 때 로드)"""
+    global _default_master
+    if _default_master is None:
+        with _master_lock:
+            if _default_master is None:
+                _default_master = SymbolMaster.load()
+    return _default_master
+
+
+def resolve_symbol(query: str) -> Optional[str]:
+    """티커 또는 회사명/별칭 → 티커 (get_symbol_master().resolve)"""
+    return get_symbol_master().resolve(query)
@@ -0,0 +1,163 @@
+"""
+Pillow 렌더러 공용 텍스트 레이아웃
+
+줄바꿈할 때마다 늘어나는 접두어(line + word)를 다시 재면 한 줄 길이에 대해 제곱 시간이 걸리고,
+공백으로만 나누면 띄어쓰기 없는 긴 한국어 문장이 캔버스 밖으로 넘칩니다.
+- 토큰(영문 단어 / 한글 한 글자 / 공백)마다 폭을 한 번만 재고 폰트별로 캐시
+- 공백과 한글(CJK) 글자 사이에서 줄바꿈 (닫는 문장부호는 앞 글자에 붙여서 줄 첫머리에 오지 않음)
+- 문단 하나를 토큰 순서대로 한 번 훑어서 배치 (O(n))
+
+사용 예:
+    font = load_font(24)
+    lines = wrap_text(text, font, max_width=1100)
+"""
+import re
+import weakref
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 시스템 폰트 후보 (한글 글리프가 있는 폰트 우선)
+DEFAULT_FONT_PATHS = (
+    "C:/Windows/Fonts/malgun.ttf",
+    "C:/Windows/Fonts/arial.ttf",
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+)
+
+# 폰트별 토큰 폭 캐시 최대 항목 수 (넘으면 비움)
+MAX_CACHED_TOKENS = 50_000
+
+_CJK = '\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7a3\uf900-\ufaff'
+_CLOSING = '.,!?;:%)\\]}」』”’、。，．！？'
+
+# 공백 / CJK 한 글자(+닫는 문장부호) / 그 밖의 연속 문자(영문 단어, 숫자, 기호)
+_TOKEN = re.compile(rf'\s+|[{_CJK}][{_CLOSING}]*|[^\s{_CJK}]+')
+
+# 폰트 → {토큰: 폭}
+_advances: "weakref.WeakKeyDictionary[object, Dict[str, float]]" = weakref.WeakKeyDictionary()
+
+
+@lru_cache(maxsize=64)
+def load_font(size: int, font_paths: Sequence[str] = DEFAULT_FONT_PATHS):
+    """
+    크기별 폰트 로드 (한 번 연 폰트는 재사용)
+
+    Args:
+        size: 폰트 크기 (px)
+        font_paths: 시도할 폰트 파일 경로 (앞에서부터)
+
+    Returns:
+        ImageFont (모두 실패하면 Pillow 기본 폰트)
+    """
+    from PIL import ImageFont
+
+    for font_path in font_paths:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        # Pillow 10.1 미만: 크기 인자를 받지 않는 고정 크기 비트맵 폰트
+        return ImageFont.load_default()
+
+
+def token_width(token: str, font) -> float:
+    """토큰 폭 (px, 폰트별 캐시)"""
+    try:
+        widths = _advances[font]
+    except KeyError:
+        widths = _advances[font] = {}
+    width = widths.get(token)
+    if width is None:
+        if len(widths) >= MAX_CACHED_TOKENS:
+            widths.clear()
+        try:
+            width = font.getlength(token)
+        except (UnicodeEncodeError, AttributeError):
+            # 글리프가 없는 비트맵 폰트 등
+            width = len(token) * 10
+        widths[token] = width
+    return width
+
+
+def text_width(text: str, font) -> float:
+    """텍스트 폭 (토큰 폭의 합, 커닝은 무시)"""
+    return sum(token_width(token, font) for token in _TOKEN.findall(text))
+
+
+def _split_long_token(token: str, font, max_width: float) -> Iterable[Tuple[str, float]]:
+    """한 줄보다 긴 토큰(URL, 긴 영문 단어)을 글자 단위로 자르기"""
+    start, width = 0, 0.0
+    for index, char in enumerate(token):
+        char_width = token_width(char, font)
+        if width + char_width > max_width and index > start:
+            yield token[start:index], width
+            start, width = index, 0.0
+        width += char_width
+    yield token[start:], width
+
+
+def wrap_paragraph(paragraph: str, font, max_width: float) -> List[str]:
+    """
+    문단 하나(줄바꿈 문자 없음)를 max_width 안에 들어가는 줄로 나누기
+
+    Returns:
+        줄 목록 (빈 문단이면 [''])
+    """
+    lines: List[str] = []
+    line: List[str] = []
+    width = 0.0
+    space = ''
+    space_width = 0.0
+
+    for token in _TOKEN.findall(paragraph):
+        if token.isspace():
+            if line:
+                space, space_width = ' ', token_width(' ', font)
+            continue
+
+        token_w = token_width(token, font)
+        if line and width + space_width + token_w <= max_width:
+            if space:
+                line.append(space)
+            line.append(token)
+            width += space_width + token_w
+        else:
+            if line:
+                lines.append(''.join(line))
+                line, width = [], 0.0
+            if token_w <= max_width:
+                line, width = [token], token_w
+            else:
+                *pieces, (last, last_width) = _split_long_token(token, font, max_width)
+                lines.extend(piece for piece, _ in pieces)
+                line, width = [last], last_width
+        space, space_width = '', 0.0
+
+    if line:
+        lines.append(''.join(line))
+    return lines or ['']
+
+
+def wrap_text(text: str, font, max_width: float, max_lines: Optional[int] = None) -> List[str]:
+    """
+    텍스트 줄바꿈 (입력의 줄바꿈 문자는 문단 구분으로 유지)
+
+    Args:
+        text: 텍스트
+        font: ImageFont
+        max_width: 줄 최대 폭 (px)
+        max_lines: 최대 줄 수 (넘는 줄은 버림)
+
+    Returns:
+        줄 목록
+    """
+    lines: List[str] = []
+    for paragraph in (text or '').splitlines():
+        lines.extend(wrap_paragraph(paragraph, font, max_width))
+        if max_lines is not None and len(lines) >= max_lines:
+            return lines[:max_lines]
+    return lines
@@ -0,0 +1,41 @@
+"""
+검색/중복 제거 공용 토큰화
+
+한글 연속 구간은 2글자 단위(bigram)로, 영문/숫자는 소문자 단어로 자릅니다.
+검색 인덱스(search_index)와 뉴스 중복 제거(news_dedup)가 같은 토큰을 쓰도록 한 곳에 둡니다.
+"""
+import re
+from typing import List, Optional
+
+# 한글(음절/자모) 연속 구간, 그 외 문자/숫자 단어
+HANGUL_RUN = r'[ᄀ-ᇿ㄰-㆏가-힣]+'
+TOKEN_PATTERN = re.compile(rf'({HANGUL_RUN})|([^\W_]+)', re.UNICODE)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    검색용 토큰화
+
+    Args:
+        text: 원문 텍스트
+
+    Returns:
+        토큰 리스트 (한글은 bigram, 그 외는 소문자 단어)
+
+    Example:
+        >>> tokenize("엔비디아 Blackwell 출시")
+        ['엔비', '비디', '디아', 'blackwell', '출시']
+    """
+    if not text:
+        return []
+
+    tokens = []
+    for hangul, word in TOKEN_PATTERN.findall(text):
+        if hangul:
+            if len(hangul) == 1:
+                tokens.append(hangul)
+            else:
+                tokens.extend(hangul[i:i + 2] for i in range(len(hangul) - 1))
+        else:
+            tokens.append(word.lower())
+    return tokens
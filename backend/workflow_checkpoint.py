@@ -0,0 +1,160 @@
+"""
+브리핑 워크플로우 단계별 체크포인트 저장소
+
+각 단계의 출력을 (실행 날짜, 단계명, 입력 해시) 키로 output/checkpoints 아래에 저장합니다.
+재실행(resume) 시 입력이 동일한 단계는 저장된 출력을 그대로 사용하고,
+실패했거나 입력이 바뀐 단계만 다시 계산합니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# 체크포인트 기본 디렉토리
+CHECKPOINT_DIR = Path(__file__).parent / 'output' / 'checkpoints'
+
+
+def compute_input_hash(inputs: Any) -> str:
+    """
+    단계 입력값의 해시를 계산합니다.
+
+    Args:
+        inputs: JSON 직렬화 가능한 입력값 (dict, list 등)
+
+    Returns:
+        16자리 16진수 해시 문자열
+    """
+    payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class CheckpointStore:
+    """실행 날짜별 단계 체크포인트 저장소"""
+
+    def __init__(self, run_date: Optional[str] = None, base_dir: Optional[Path] = None):
+        """
+        Args:
+            run_date: 실행 날짜 (YYYY-MM-DD, 기본값: 오늘)
+            base_dir: 체크포인트 루트 디렉토리 (기본값: output/checkpoints)
+        """
+        self.run_date = run_date or datetime.now().strftime('%Y-%m-%d')
+        self.base_dir = Path(base_dir) if base_dir else CHECKPOINT_DIR
+        self.run_dir = self.base_dir / self.run_date
+
+    def _path(self, step: str, input_hash: str) -> Path:
+        return self.run_dir / f"{step}__{input_hash}.json"
+
+    def load(self, step: str, input_hash: str) -> Optional[Any]:
+        """
+        저장된 단계 출력을 불러옵니다.
+
+        Args:
+            step: 단계명
+            input_hash: compute_input_hash()로 계산한 입력 해시
+
+        Returns:
+            저장된 출력 또는 None (체크포인트 없음/손상)
+        """
+        path = self._path(step, input_hash)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data.get('output')
+        except (OSError, ValueError) as e:
+            logger.warning(f"체크포인트 읽기 실패, 다시 계산합니다: {path.name} ({str(e)})")
+            return None
+
+    def save(self, step: str, input_hash: str, output: Any) -> Path:
+        """
+        단계 출력을 저장합니다. 같은 단계의 이전 체크포인트(다른 입력)는 무효화됩니다.
+
+        Args:
+            step: 단계명
+            input_hash: 입력 해시
+            output: JSON 직렬화 가능한 단계 출력
+
+        Returns:
+            저장된 체크포인트 파일 경로
+        """
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        self.invalidate(step)
+
+        path = self._path(step, input_hash)
+        tmp_path = path.with_suffix('.tmp')
+        data = {
+            'run_date': self.run_date,
+            'step': step,
+            'input_hash': input_hash,
+            'saved_at': datetime.now().isoformat(),
+            'output': output
+        }
+
+        # 중간에 프로세스가 죽어도 손상된 체크포인트가 남지 않도록 원자적으로 교체
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+
+        logger.info(f"체크포인트 저장: {self.run_date}/{step} ({input_hash})")
+        return path
+
+    def invalidate(self, step: Optional[str] = None) -> int:
+        """
+        체크포인트를 삭제합니다.
+
+        Args:
+            step: 삭제할 단계명 (None이면 해당 날짜의 모든 체크포인트)
+
+        Returns:
+            삭제된 파일 수
+        """
+        if not self.run_dir.exists():
+            return 0
+
+        pattern = f"{step}__*.json" if step else "*.json"
+        removed = 0
+        for path in self.run_dir.glob(pattern):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def list_steps(self) -> list:
+        """해당 실행 날짜에 저장된 단계명 목록"""
+        if not self.run_dir.exists():
+            return []
+        return sorted({path.name.split('__')[0] for path in self.run_dir.glob('*.json')})
+
+
+def prune_checkpoints(keep_days: int = 7, base_dir: Optional[Path] = None) -> int:
+    """
+    오래된 실행 날짜의 체크포인트 디렉토리를 정리합니다.
+
+    Args:
+        keep_days: 보관할 일수
+        base_dir: 체크포인트 루트 디렉토리
+
+    Returns:
+        삭제된 디렉토리 수
+    """
+    root = Path(base_dir) if base_dir else CHECKPOINT_DIR
+    if not root.exists():
+        return 0
+
+    cutoff = (datetime.now() - timedelta(days=keep_days)).strftime('%Y-%m-%d')
+    removed = 0
+    for run_dir in root.iterdir():
+        if run_dir.is_dir() and run_dir.name < cutoff:
+            shutil.rmtree(run_dir, ignore_errors=True)
+            removed += 1
+    return removed
@@ -11,6 +11,15 @@ import pandas as pd
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 주요 미국 주식 티커 리스트 (종목 마스터 data/symbols.csv에도 모두 포함)
+MAJOR_TICKERS = [
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA', 'BRK-B',
+    'V', 'UNH', 'XOM', 'JNJ', 'JPM', 'WMT', 'PG', 'MA', 'HD', 'CVX',
+    'ABBV', 'PFE', 'AVGO', 'COST', 'MRK', 'PEP', 'TMO', 'CSCO', 'ABT',
+    'ACN', 'ADBE', 'NFLX', 'CMCSA', 'NKE', 'DIS', 'VZ', 'INTC', 'TXN',
+    'QCOM', 'AMD', 'CRM', 'HON', 'LIN', 'AMAT', 'INTU', 'AMGN', 'BKNG'
+]
+
 
 def get_trending_stocks_by_volume(limit: int = 10) -> List[Dict]:
     """
@@ -27,19 +36,10 @@ def get_trending_stocks_by_volume(limit: int = 10) -> List[Dict]:
         # 실제로는 Yahoo Finance API를 통해 동적으로 가져와야 하지만,
         # yfinance는 스크리너 기능이 제한적이므로 주요 종목들을 직접 조회합니다.
         
-        # 주요 미국 주식 티커 리스트
-        major_tickers = [
-            'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA', 'BRK-B',
-            'V', 'UNH', 'XOM', 'JNJ', 'JPM', 'WMT', 'PG', 'MA', 'HD', 'CVX',
-            'ABBV', 'PFE', 'AVGO', 'COST', 'MRK', 'PEP', 'TMO', 'CSCO', 'ABT',
-            'ACN', 'ADBE', 'NFLX', 'CMCSA', 'NKE', 'DIS', 'VZ', 'INTC', 'TXN',
-            'QCOM', 'AMD', 'CRM', 'HON', 'LIN', 'AMAT', 'INTU', 'AMGN', 'BKNG'
-        ]
-        
         stocks_data = []
         
         # 각 티커의 정보를 가져옴
-        for ticker_symbol in major_tickers[:limit * 2]:  # 여유있게 가져와서 필터링
+        for ticker_symbol in MAJOR_TICKERS[:limit * 2]:  # 여유있게 가져와서 필터링
             try:
                 ticker = yf.Ticker(ticker_symbol)
                 info = ticker.info
@@ -96,17 +96,9 @@ def get_top_gainers(limit: int = 10) -> List[Dict]:
         종목 정보 리스트
     """
     try:
-        major_tickers = [
-            'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA', 'BRK-B',
-            'V', 'UNH', 'XOM', 'JNJ', 'JPM', 'WMT', 'PG', 'MA', 'HD', 'CVX',
-            'ABBV', 'PFE', 'AVGO', 'COST', 'MRK', 'PEP', 'TMO', 'CSCO', 'ABT',
-            'ACN', 'ADBE', 'NFLX', 'CMCSA', 'NKE', 'DIS', 'VZ', 'INTC', 'TXN',
-            'QCOM', 'AMD', 'CRM', 'HON', 'LIN', 'AMAT', 'INTU', 'AMGN', 'BKNG'
-        ]
-        
         stocks_data = []
         
-        for ticker_symbol in major_tickers[:limit * 2]:
+        for ticker_symbol in MAJOR_TICKERS[:limit * 2]:
             try:
                 ticker = yf.Ticker(ticker_symbol)
                 info = ticker.info